@@ -4,9 +4,11 @@
 """
 
 from backend.services.ontology_service import OntologyService
+from backend.services.filename_mapping_service import FilenameMappingService
 
 # 싱글톤 인스턴스
 _ontology_service: OntologyService | None = None
+_filename_mapping_service: FilenameMappingService | None = None
 
 
 def get_ontology_service() -> OntologyService:
@@ -21,3 +23,15 @@ def get_ontology_service() -> OntologyService:
         _ontology_service = OntologyService()
     return _ontology_service
 
+
+def get_filename_mapping_service() -> FilenameMappingService:
+    """
+    파일명 매핑 서비스 인스턴스 가져오기 (싱글톤 패턴)
+    
+    Returns:
+        FilenameMappingService: 파일명 매핑 서비스 싱글톤 인스턴스
+    """
+    global _filename_mapping_service
+    if _filename_mapping_service is None:
+        _filename_mapping_service = FilenameMappingService()
+    return _filename_mapping_service
@@ -0,0 +1,135 @@
+"""
+일괄 수집 명령행 도구
+입력 폴더의 데이터 파일 전체를 하나의 온톨로지 그래프로 구축하여 Turtle/N-Triples 파일로 기록
+감시 모드(--watch)에서는 폴더를 주기적으로 다시 스캔하여 새 파일과 변경된 파일만 대상 온톨로지에 추가
+
+실행 (app 디렉토리에서):
+    python -m backend.ingest --classes Welding_Robot,CNC_Machine --workers 4 --batch-size 4096
+    python -m backend.ingest --classes Welding_Robot,CNC_Machine --output backend/data/ontology_output/metadata.nt
+    python -m backend.ingest --classes Welding_Robot,CNC_Machine --watch --interval 5 --ontology-id <ID>
+"""
+
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+from backend.services.bulk_ingestion import BulkIngestion, RDF_FORMATS
+from backend.services.folder_watcher import FolderWatcher, WatchScanReport
+from backend.services.ingestion_manifest import IngestionManifest
+from backend.services.ontology_services.config import (
+    DEFAULT_MODEL,
+    INGEST_MANIFEST_PATH,
+    INGEST_WATCH_INTERVAL,
+    INPUT_DATA_FOLDER,
+    OUTPUT_DATA_FOLDER,
+    OUTPUT_FILE,
+    SEMANTIC_BATCH_SIZE,
+    UPLOAD_PROCESS_WORKERS,
+)
+
+# 보고서에 출력할 최대 실패 파일 수
+MAX_REPORTED_FAILURES = 20
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(description="입력 폴더 일괄 온톨로지 수집")
+    parser.add_argument("--classes", required=True, help="온톨로지 클래스 목록 (쉼표로 구분)")
+    parser.add_argument("--input", default=INPUT_DATA_FOLDER, help="입력 폴더")
+    parser.add_argument("--output", default=os.path.join(OUTPUT_DATA_FOLDER, OUTPUT_FILE), help="출력 파일 (.ttl 또는 .nt)")
+    parser.add_argument("--format", choices=sorted(set(RDF_FORMATS.values())), help="출력 형식 (기본값: 출력 확장자로 결정)")
+    parser.add_argument("--workers", type=int, default=UPLOAD_PROCESS_WORKERS, help="파싱 프로세스 수 (0이면 현재 프로세스)")
+    parser.add_argument("--batch-size", type=int, default=SEMANTIC_BATCH_SIZE, help="한 번에 매핑할 파일명 수")
+    parser.add_argument("--target-column", help="타겟 컬럼명 (있으면 파일별로 직접 매핑 먼저 시도)")
+    parser.add_argument("--relation-type", default="isDataOf", help="관계 타입")
+    parser.add_argument("--model-name", default=DEFAULT_MODEL, help="모델명")
+    parser.add_argument("--watch", action="store_true", help="감시 모드 (새 파일/변경된 파일만 저장소의 온톨로지에 추가)")
+    parser.add_argument("--ontology-id", help="감시 모드 대상 온톨로지 ID (없으면 매니페스트에 기록된 ID 또는 새로 생성)")
+    parser.add_argument("--manifest", default=INGEST_MANIFEST_PATH, help="감시 모드 매니페스트 파일")
+    parser.add_argument("--interval", type=float, default=INGEST_WATCH_INTERVAL, help="감시 모드 재스캔 간격 (초)")
+    parser.add_argument("--max-scans", type=int, help="감시 모드 최대 스캔 횟수 (기본값: 중단할 때까지)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    일괄 수집 실행
+    
+    Returns:
+        int: 종료 코드 (입력 폴더가 없으면 1)
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    
+    classes = [cls.strip() for cls in args.classes.split(",") if cls.strip()]
+    if not classes:
+        print("온톨로지 클래스가 필요합니다.", file=sys.stderr)
+        return 1
+    if not os.path.isdir(args.input):
+        print(f"입력 폴더를 찾을 수 없습니다: {args.input}", file=sys.stderr)
+        return 1
+    
+    ingestion = BulkIngestion(
+        classes,
+        model_name=args.model_name,
+        relation_type=args.relation_type,
+        target_column=args.target_column,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+    if args.watch:
+        return watch(ingestion, args)
+    
+    report = ingestion.ingest_folder(args.input, args.output, args.format)
+    
+    print(f"파일 {report.files_found}개: 매핑 {report.files_mapped}개, 실패 {report.files_failed}개, 레코드 {report.records}개")
+    print(f"트리플 {report.triples}개 -> {report.output_path}")
+    print(
+        f"처리 시간 {report.elapsed_seconds:.2f}s (매핑 {report.mapping_seconds:.2f}s), "
+        f"{report.files_per_second:.1f} files/sec"
+    )
+    for file_name, error in report.failures[:MAX_REPORTED_FAILURES]:
+        print(f"  실패: {file_name}: {error}")
+    if len(report.failures) > MAX_REPORTED_FAILURES:
+        print(f"  ... 외 {len(report.failures) - MAX_REPORTED_FAILURES}개")
+    return 0
+
+
+def watch(ingestion: BulkIngestion, args: argparse.Namespace) -> int:
+    """
+    감시 모드 실행 (스캔마다 변경 사항이 있으면 요약 출력)
+    
+    Returns:
+        int: 종료 코드
+    """
+    from backend.services.ontology_storage import get_ontology_storage
+    
+    manifest = IngestionManifest(args.manifest)
+    storage = get_ontology_storage()
+    watcher = FolderWatcher(args.input, ingestion, manifest, ontology_id=args.ontology_id, storage=storage)
+    print(f"폴더 감시 시작: {args.input} (매니페스트 {len(manifest)}개 항목, {args.interval}s 간격)")
+    
+    def report_scan(report: WatchScanReport) -> None:
+        if report.changed:
+            print(
+                f"[{report.ontology_id}] 파일 {report.files_seen}개: 수집 {report.files_ingested}개, "
+                f"실패 {report.files_failed}개, 내용 동일 {report.files_touched}개, 삭제 {report.files_removed}개, "
+                f"관계 {report.relations_added}개 ({report.elapsed_seconds:.2f}s)"
+            )
+    
+    try:
+        watcher.run(args.interval, max_scans=args.max_scans, on_scan=report_scan)
+    finally:
+        manifest.close()
+        storage.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.router.mapping_ontology import router as mapping_ontology_router
 from backend.router.data_upload import router as data_upload_router
+from backend.router.metrics import router as metrics_router
+from backend.router.jobs import router as jobs_router
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,7 +28,13 @@ async def lifespan(app: FastAPI):
         # 예: 저장소 초기화 확인 (이미 모듈 레벨에서 초기화되므로 선택사항)
         from backend.services.ontology_storage import get_ontology_storage
         storage = get_ontology_storage()
-        logger.info("Ontology storage initialized")
+        # 메타데이터만 읽은 상태 (페이로드와 통합 그래프 인덱스는 처음 사용할 때 로드)
+        logger.info(f"Ontology storage initialized: {storage.count()} ontologies")
+        
+        # 디스크 임베딩 캐시 예열 (인덱스 구성 및 페이지 캐시 적재)
+        from backend.services.ontology_services.disk_embedding_cache import get_disk_embedding_cache_manager
+        warmed = get_disk_embedding_cache_manager().warm_up()
+        logger.info(f"Embedding cache warmed up: {warmed}")
         
     except Exception as e:
         # Startup 단계의 예외는 즉시 raise
@@ -47,6 +55,14 @@ async def lifespan(app: FastAPI):
     finally:
         # 정리 작업 (필요시)
         try:
+            # 실행 중인 업로드 작업을 마친 뒤 실행기 종료
+            from backend.services.ingestion_jobs import get_ingestion_job_queue
+            get_ingestion_job_queue().shutdown()
+            from backend.services.executors import get_pipeline_executors
+            get_pipeline_executors().shutdown()
+            # 배치 커밋 대기 중인 저장소 쓰기 반영
+            from backend.services.ontology_storage import get_ontology_storage
+            get_ontology_storage().flush()
             logger.info("Application shutdown complete")
         except Exception as e:
             # finally 블록의 예외도 로깅만 함
@@ -66,6 +82,8 @@ app.add_middleware(
 
 app.include_router(mapping_ontology_router)
 app.include_router(data_upload_router)
+app.include_router(metrics_router)
+app.include_router(jobs_router)
 
 @app.get("/")
 def read_root():
@@ -3,25 +3,115 @@
 파일 업로드 및 온톨로지 관계 추가 처리
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, Depends
-from typing import Optional, List
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException, Request, status, Depends
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.types import Message, Receive
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from backend.dependencies.services import get_ontology_service
 from backend.services.ontology_service import OntologyService
-from backend.services.data_upload_service import DataUploadService
-from backend.schmas.ontology_schma import UploadDataResponse
-from backend.services.ontology_services.config import DEFAULT_MODEL
+from backend.services.archive_reader import ArchiveError, archive_type, read_archive
+from backend.services.data_parser import detect_file_type
+from backend.services.data_upload_service import BatchFile, DataUploadService
+from backend.services.ingestion_jobs import IngestionQueueFullError, get_ingestion_job_queue
+from backend.services.storage_backend import VersionConflictError
+from backend.services.upload_dedup import IdempotencyKeyConflictError
+from backend.services.upload_buffer import UploadBuffer, UploadTooLargeError, read_upload_file
+from backend.schmas.ontology_schma import BatchUploadResponse, UploadDataResponse
+from backend.services.ontology_services.config import (
+    BATCH_UPLOAD_MAX_EXTRACTED_SIZE,
+    BATCH_UPLOAD_MAX_FILES,
+    BATCH_UPLOAD_MAX_REQUEST_SIZE,
+    DEFAULT_MODEL,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["data_upload"])
-
 # 업로드 서비스 인스턴스
 _upload_service = DataUploadService()
 
 # 최대 파일 크기 제한 (500MB)
 MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB in bytes
 
+# 폼 필드와 multipart 경계에 허용하는 여유 크기
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+def _too_large(detail: str) -> HTTPException:
+    """크기 제한 초과 응답"""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=detail
+    )
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    요청 본문 크기를 수신 중에 검사하는 라우트
+    FastAPI가 multipart 본문을 모두 받기 전에 제한 초과 요청을 중단
+    """
+    
+    def size_limit(self) -> Tuple[int, str]:
+        """
+        요청 본문 크기 제한 (파일 하나 + 폼 필드 여유)
+        
+        Returns:
+            (최대 본문 크기, 초과 시 오류 메시지)
+        """
+        return MAX_FILE_SIZE + MULTIPART_OVERHEAD, f"파일 크기는 {MAX_FILE_SIZE / 1024 / 1024}MB 이하여야 합니다."
+    
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+        
+        async def handler(request: Request):
+            limit, detail = self.size_limit()
+            
+            # Content-Length가 있으면 본문을 받기 전에 거부
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > limit:
+                raise _too_large(detail)
+            
+            return await original_handler(Request(request.scope, _limit_receive(request.receive, limit, detail)))
+        
+        return handler
+
+
+class BatchUploadSizeLimitRoute(UploadSizeLimitRoute):
+    """
+    일괄 업로드용 라우트 (여러 파일을 한 요청으로 받으므로 요청 전체 크기로 제한)
+    파일별 크기 제한은 _read_upload에서 적용
+    """
+    
+    def size_limit(self) -> Tuple[int, str]:
+        return (
+            BATCH_UPLOAD_MAX_REQUEST_SIZE + MULTIPART_OVERHEAD,
+            f"일괄 업로드 요청 전체 크기는 {BATCH_UPLOAD_MAX_REQUEST_SIZE / 1024 / 1024}MB 이하여야 합니다."
+        )
+
+
+def _limit_receive(receive: Receive, limit: int, detail: str) -> Receive:
+    """수신한 본문 크기가 limit을 넘으면 413으로 중단하는 receive 래퍼"""
+    received = 0
+    
+    async def limited_receive() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise _too_large(detail)
+        return message
+    
+    return limited_receive
+
+
+router = APIRouter(prefix="/api/v1", tags=["data_upload"], route_class=UploadSizeLimitRoute)
+
+# 일괄 업로드 라우터 (router에 포함되어 같은 prefix/tag를 사용)
+batch_router = APIRouter(route_class=BatchUploadSizeLimitRoute)
+
 
 @router.post("/upload_data", response_model=UploadDataResponse)
 async def upload_data_endpoint(
@@ -32,11 +122,16 @@ async def upload_data_endpoint(
     source_column: Optional[str] = Form(None, description="소스 컬럼명 (선택사항)"),
     target_column: Optional[str] = Form(None, description="타겟 컬럼명 (선택사항)"),
     model_name: str = Form(DEFAULT_MODEL, description="모델명"),
+    count_target_classes: bool = Form(False, description="타겟 컬럼의 클래스별 행 수 집계 여부"),
+    include_graph: bool = Form(True, description="응답에 전체 Turtle 그래프 포함 여부"),
+    job: bool = Form(False, description="작업 모드 (즉시 작업 ID를 반환하고 /api/v1/jobs/{id}로 진행 상황 조회)"),
+    idempotency_key: Optional[str] = Header(None, description="재시도 시 같은 값을 보내면 저장된 결과를 반환"),
     service: OntologyService = Depends(get_ontology_service)
 ):
     """
     데이터 파일 업로드 및 온톨로지 관계 추가
     매핑은 자동으로 처리됩니다: 타겟 컬럼이 있으면 직접 매핑, 없으면 파일명 기반 하이브리드 매핑 사용
+    내용과 요청 인자가 같은 업로드를 다시 보내면 저장된 결과를 반환합니다 (deduplicated=True)
     
     Args:
         file: 업로드할 파일
@@ -46,10 +141,14 @@ async def upload_data_endpoint(
         source_column: 소스 컬럼명 (선택사항)
         target_column: 타겟 컬럼명 (선택사항, 있으면 직접 매핑 사용)
         model_name: 모델명
+        count_target_classes: 타겟 컬럼의 클래스별 행 수 집계 여부 (파일 전체 스캔)
+        include_graph: 응답에 전체 Turtle 그래프 포함 여부 (False면 g는 빈 문자열)
+        job: 작업 모드 여부 (True면 파일 수신 후 202와 작업 상태를 반환하고 작업 큐에서 처리)
+        idempotency_key: Idempotency-Key 헤더 (같은 키로 다른 업로드를 보내면 422)
         service: 온톨로지 서비스 (의존성 주입)
         
     Returns:
-        UploadDataResponse: 업로드 결과
+        UploadDataResponse: 업로드 결과 (작업 모드면 IngestionJobResponse, 202 Accepted)
     """
     try:
         # 파일 타입 확인
@@ -60,57 +159,257 @@ async def upload_data_endpoint(
                 detail="지원하지 않는 파일 형식입니다. (CSV, JSON, Excel만 지원)"
             )
         
-        # 파일 내용 읽기
-        file_content = await file.read()
+        # 온톨로지 클래스 파싱
+        classes_list = _parse_ontology_classes(ontology_classes)
         
-        # 파일 크기 검증
-        file_size = len(file_content)
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"파일 크기는 {MAX_FILE_SIZE / 1024 / 1024}MB 이하여야 합니다. 현재 파일 크기: {file_size / 1024 / 1024:.2f}MB"
+        # 파일 내용을 청크 단위로 읽기 (크기 검증, 임계값 초과 시 임시 파일로 전환)
+        upload_buffer = await _read_upload(file)
+        
+        params = {
+            "file_type": file_type,
+            "ontology_classes": classes_list,
+            "ontology_id": ontology_id,
+            "relation_type": relation_type,
+            "source_column": source_column,
+            "target_column": target_column,
+            "model_name": model_name,
+            "count_target_classes": count_target_classes,
+            "include_graph": include_graph,
+            "content_sha256": upload_buffer.sha256,
+            "idempotency_key": idempotency_key,
+        }
+        logger.info(
+            f"파일 크기 검증 통과: {upload_buffer.size / 1024 / 1024:.2f}MB "
+            f"({'임시 파일' if upload_buffer.spilled else '메모리'})"
+        )
+        
+        if job:
+            # 작업 큐가 버퍼를 넘겨받아 처리 후 닫음
+            return _submit_job(upload_buffer, file.filename, params)
+        
+        with upload_buffer:
+            logger.info(f"데이터 업로드 요청: 파일={file.filename}, 타입={file_type}, 클래스={len(classes_list)}개")
+            
+            # 업로드 서비스 호출 (CPU 작업은 실행기에서 수행하여 이벤트 루프를 막지 않음)
+            result = await _upload_service.upload_and_build_ontology_async(
+                file_content=upload_buffer.source(),
+                file_name=file.filename,
+                **params
             )
         
-        logger.info(f"파일 크기 검증 통과: {file_size / 1024 / 1024:.2f}MB")
+        logger.info(f"데이터 업로드 완료: ontology_id={result.ontology_id}, 관계={result.relations_added}개")
         
-        # 온톨로지 클래스 파싱
-        classes_list = [cls.strip() for cls in ontology_classes.split(",") if cls.strip()]
-        if not classes_list:
+        return result
+        
+    except HTTPException:
+        raise
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except VersionConflictError as e:
+        # 다른 워커의 동시 쓰기로 재시도 횟수를 넘은 경우 (클라이언트가 다시 요청하면 됨)
+        logger.warning(f"데이터 업로드 충돌: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(
+            f"데이터 업로드 실패: {str(e)}",
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"데이터 업로드 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@batch_router.post("/upload_batch", response_model=BatchUploadResponse)
+async def upload_batch_endpoint(
+    files: List[UploadFile] = File(..., description="업로드할 파일 목록 (CSV, JSON, Excel 또는 ZIP/TAR 아카이브)"),
+    ontology_classes: str = Form(..., description="온톨로지 클래스 목록 (쉼표로 구분)"),
+    ontology_id: Optional[str] = Form(None, description="기존 온톨로지 ID (선택사항)"),
+    relation_type: str = Form("isDataOf", description="관계 타입"),
+    target_column: Optional[str] = Form(None, description="타겟 컬럼명 (선택사항)"),
+    model_name: str = Form(DEFAULT_MODEL, description="모델명"),
+    include_graph: bool = Form(True, description="응답에 전체 Turtle 그래프 포함 여부")
+):
+    """
+    여러 데이터 파일 또는 ZIP/TAR 아카이브를 한 번에 업로드하여 온톨로지 관계 추가
+    아카이브 항목은 하나씩 스트리밍하여 읽고, 모든 파일을 한 번의 배치 매핑과 한 번의 저장소 쓰기로 처리
+    
+    Args:
+        files: 업로드할 파일 목록 (아카이브는 안의 CSV/JSON/Excel 항목을 각각 하나의 파일로 처리)
+        ontology_classes: 온톨로지 클래스 목록 (쉼표로 구분)
+        ontology_id: 기존 온톨로지 ID (선택사항)
+        relation_type: 관계 타입
+        target_column: 타겟 컬럼명 (선택사항, 있으면 파일별로 직접 매핑 사용)
+        model_name: 모델명
+        include_graph: 응답에 전체 Turtle 그래프 포함 여부 (False면 g는 빈 문자열)
+        
+    Returns:
+        BatchUploadResponse: 파일별 처리 결과와 전체 요약
+    """
+    buffers: List[UploadBuffer] = []
+    try:
+        classes_list = _parse_ontology_classes(ontology_classes)
+        if len(files) > BATCH_UPLOAD_MAX_FILES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="온톨로지 클래스가 필요합니다."
+                detail=f"파일은 {BATCH_UPLOAD_MAX_FILES}개 이하여야 합니다."
             )
         
-        logger.info(f"데이터 업로드 요청: 파일={file.filename}, 타입={file_type}, 클래스={len(classes_list)}개")
+        batch_files = await _collect_batch_files(files, buffers)
+        logger.info(f"일괄 업로드 요청: 파일={len(files)}개, 항목={len(batch_files)}개, 클래스={len(classes_list)}개")
         
-        # 업로드 서비스 호출
-        result = _upload_service.upload_and_build_ontology(
-            file_content=file_content,
-            file_name=file.filename,
-            file_type=file_type,
-            ontology_classes=classes_list,
+        result = await _upload_service.upload_batch_async(
+            batch_files,
+            classes_list,
             ontology_id=ontology_id,
             relation_type=relation_type,
-            source_column=source_column,
             target_column=target_column,
-            model_name=model_name
+            model_name=model_name,
+            include_graph=include_graph
         )
         
-        logger.info(f"데이터 업로드 완료: ontology_id={result.ontology_id}, 관계={result.relations_added}개")
+        logger.info(f"일괄 업로드 완료: ontology_id={result.ontology_id}, 관계={result.relations_added}개")
         
         return result
         
     except HTTPException:
         raise
+    except ArchiveError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except VersionConflictError as e:
+        logger.warning(f"일괄 업로드 충돌: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(
-            f"데이터 업로드 실패: {str(e)}",
+            f"일괄 업로드 실패: {str(e)}",
             exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"데이터 업로드 중 오류가 발생했습니다: {str(e)}"
+            detail=f"일괄 업로드 중 오류가 발생했습니다: {str(e)}"
+        )
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+
+router.include_router(batch_router)
+
+
+async def _collect_batch_files(files: List[UploadFile], buffers: List[UploadBuffer]) -> List[BatchFile]:
+    """
+    업로드 파일을 일괄 업로드 항목으로 변환 (아카이브는 항목별로 풀어서 추가)
+    
+    Args:
+        files: 업로드 파일 목록
+        buffers: 읽은 버퍼를 추가할 목록 (호출자가 처리 후 close)
+        
+    Returns:
+        List[BatchFile]: 일괄 업로드 항목 (지원하지 않는 형식은 source 없이 포함)
+    """
+    batch_files: List[BatchFile] = []
+    extracted_size = 0
+    for upload in files:
+        kind = archive_type(upload.filename)
+        file_type = _get_file_type(upload.filename)
+        if not kind and not file_type:
+            batch_files.append(BatchFile(file_name=upload.filename or "", file_size=upload.size or 0))
+            continue
+        
+        buffer = await _read_upload(upload)
+        buffers.append(buffer)
+        if not kind:
+            batch_files.append(BatchFile(upload.filename, buffer.size, file_type, buffer.source()))
+            continue
+        
+        # 아카이브 항목을 하나씩 항목별 버퍼로 복사 (블로킹 I/O이므로 스레드에서 실행)
+        entries = await asyncio.to_thread(
+            read_archive, buffer.source(), kind, lambda name: _get_file_type(name) is not None,
+            MAX_FILE_SIZE, BATCH_UPLOAD_MAX_EXTRACTED_SIZE - extracted_size, BATCH_UPLOAD_MAX_FILES - len(batch_files)
         )
+        buffer.close()
+        for entry in entries:
+            if entry.buffer is not None:
+                buffers.append(entry.buffer)
+                extracted_size += entry.size
+            batch_files.append(BatchFile(
+                file_name=entry.name,
+                file_size=entry.size,
+                file_type=_get_file_type(entry.name),
+                source=entry.buffer.source() if entry.buffer is not None else None,
+                error=entry.error
+            ))
+    return batch_files
+
+
+def _parse_ontology_classes(ontology_classes: str) -> List[str]:
+    """
+    쉼표로 구분된 온톨로지 클래스 목록 파싱
+    
+    Returns:
+        List[str]: 클래스 목록 (비어 있으면 400)
+    """
+    classes_list = [cls.strip() for cls in ontology_classes.split(",") if cls.strip()]
+    if not classes_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="온톨로지 클래스가 필요합니다."
+        )
+    return classes_list
+
+
+async def _read_upload(upload: UploadFile) -> UploadBuffer:
+    """
+    업로드 파일을 청크 단위로 읽기 (크기 제한 초과 시 413)
+    
+    Returns:
+        UploadBuffer: 수신한 데이터 (호출자가 close 책임)
+    """
+    try:
+        return await read_upload_file(upload, MAX_FILE_SIZE)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+
+
+def _submit_job(upload_buffer: UploadBuffer, file_name: str, params: Dict[str, Any]) -> JSONResponse:
+    """
+    업로드를 작업 큐에 등록하고 202 응답 생성
+    
+    Returns:
+        JSONResponse: 작업 상태 (Location 헤더에 상태 조회 경로)
+    """
+    job_queue = get_ingestion_job_queue()
+    try:
+        job = job_queue.submit(upload_buffer, file_name, params)
+    except IngestionQueueFullError as e:
+        upload_buffer.close()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
+    
+    logger.info(f"데이터 업로드 작업 등록: job_id={job.job_id}, 파일={file_name}")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=job_queue.get(job.job_id).model_dump(),
+        headers={"Location": f"/api/v1/jobs/{job.job_id}"}
+    )
 
 
 def _get_file_type(filename: str) -> Optional[str]:
@@ -123,17 +422,5 @@ def _get_file_type(filename: str) -> Optional[str]:
     Returns:
         Optional[str]: 파일 타입 (csv, json, excel) 또는 None
     """
-    if not filename:
-        return None
-    
-    filename_lower = filename.lower()
-    
-    if filename_lower.endswith('.csv'):
-        return 'csv'
-    elif filename_lower.endswith('.json'):
-        return 'json'
-    elif filename_lower.endswith(('.xlsx', '.xls')):
-        return 'excel'
-    else:
-        return None
+    return detect_file_type(filename)
 
@@ -0,0 +1,33 @@
+"""
+업로드 작업 라우터
+작업 모드 업로드의 단계별 진행 상황과 결과 조회
+"""
+
+import logging
+from fastapi import APIRouter, HTTPException, status
+from backend.schmas.ontology_schma import IngestionJobResponse
+from backend.services.ingestion_jobs import get_ingestion_job_queue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1", tags=["jobs"])
+
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+async def get_job_endpoint(job_id: str):
+    """
+    업로드 작업 상태 조회
+    
+    Args:
+        job_id: 작업 ID (작업 모드 업로드 응답의 job_id)
+        
+    Returns:
+        IngestionJobResponse: 상태, 단계, 진행 상황, 완료 시 결과
+    """
+    job = get_ingestion_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"작업을 찾을 수 없습니다: {job_id}"
+        )
+    return job
@@ -3,14 +3,24 @@
 HTTP 요청/응답 처리만 담당
 """
 
+import asyncio
+import json
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from backend.dependencies.services import get_ontology_service
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Header, Response
+from fastapi.responses import StreamingResponse
+from backend.dependencies.services import get_ontology_service, get_filename_mapping_service
 from backend.services.ontology_service import OntologyService
+from backend.services.filename_mapping_service import FilenameMappingService
+from backend.services.executors import get_pipeline_executors
+from backend.services.ontology_services.config import MAP_FILENAMES_CHUNK_SIZE, MAP_FILENAMES_STREAM_THRESHOLD
+from backend.services.ontology_services.hybrid_mapper import HybridMapper
 from backend.schmas.ontology_schma import (
     GetHybridOntologyResponse,
     ListOntologiesResponse,
     OntologyGraphResponse,
+    MapFilenamesRequest,
+    MapFilenamesResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -19,6 +29,21 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["mapping_ontology"])
 
 
+def _graph_etag(ontology_id: str, version: int) -> str:
+    """온톨로지 그래프 ETag (저장소 버전 기반)"""
+    return f'"{ontology_id}-v{version}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
 @router.get("/get_hybrid_ontology", response_model=GetHybridOntologyResponse)
 async def get_hybrid_ontology_endpoint(
     ontology_id: str = Query(..., description="온톨로지 ID"),
@@ -36,7 +61,8 @@ async def get_hybrid_ontology_endpoint(
     """
     try:
         logger.info(f"온톨로지 조회 요청: ontology_id={ontology_id}")
-        result = service.get_hybrid_ontology(ontology_id)
+        # Turtle 직렬화와 온톨로지별 쓰기 lock 대기가 이벤트 루프를 막지 않도록 스레드에서 실행
+        result = await asyncio.to_thread(service.get_hybrid_ontology, ontology_id)
         logger.info(f"온톨로지 조회 완료: ontology_id={ontology_id}")
         return result
     except Exception as e:
@@ -52,22 +78,33 @@ async def get_hybrid_ontology_endpoint(
 
 @router.get("/list_ontologies", response_model=ListOntologiesResponse)
 async def list_ontologies_endpoint(
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (없으면 전체)"),
+    after: Optional[str] = Query(None, description="이전 페이지 응답의 next_cursor"),
+    ontology_class: Optional[str] = Query(None, description="이 클래스를 사용한 온톨로지만 조회"),
     service: OntologyService = Depends(get_ontology_service)
 ):
     """
-    온톨로지 목록 조회
+    온톨로지 목록 조회 (생성일시 역순, 커서 페이지네이션)
     
     Args:
+        limit: 페이지 크기
+        after: 다음 페이지 커서
+        ontology_class: 클래스 필터
         service: 온톨로지 서비스 (의존성 주입)
         
     Returns:
         ListOntologiesResponse: 목록 조회 결과
     """
     try:
-        logger.info("온톨로지 목록 조회 요청")
-        result = service.list_ontologies()
-        logger.info(f"온톨로지 목록 조회 완료: {result.total}개")
+        logger.info(f"온톨로지 목록 조회 요청: limit={limit}, after={after}, class={ontology_class}")
+        result = service.list_ontologies(limit=limit, after=after, ontology_class=ontology_class)
+        logger.info(f"온톨로지 목록 조회 완료: {len(result.ontologies)}개 / 전체 {result.total}개")
         return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(
             f"온톨로지 목록 조회 실패: {str(e)}",
@@ -82,21 +119,34 @@ async def list_ontologies_endpoint(
 @router.get("/get_ontology_graph/{ontology_id}", response_model=OntologyGraphResponse)
 async def get_ontology_graph_endpoint(
     ontology_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: OntologyService = Depends(get_ontology_service)
 ):
     """
     온톨로지 그래프 데이터 조회
+    응답에 ETag를 포함하며, If-None-Match가 현재 버전과 같으면 304 Not Modified 반환
     
     Args:
         ontology_id: 온톨로지 ID
+        response: 응답 헤더 설정용
+        if_none_match: 클라이언트가 보관한 ETag
         service: 온톨로지 서비스 (의존성 주입)
         
     Returns:
-        OntologyGraphResponse: 그래프 데이터
+        OntologyGraphResponse: 그래프 데이터 (변경 없으면 304 응답)
     """
     try:
         logger.info(f"온톨로지 그래프 조회 요청: ontology_id={ontology_id}")
-        result = service.get_ontology_graph(ontology_id)
+        # 그래프 투영과 온톨로지별 쓰기 lock 대기가 이벤트 루프를 막지 않도록 스레드에서 실행
+        version, result = await asyncio.to_thread(service.get_ontology_graph_versioned, ontology_id)
+        etag = _graph_etag(ontology_id, version)
+        if _etag_matches(if_none_match, etag):
+            logger.info(f"온톨로지 그래프 변경 없음: ontology_id={ontology_id}, version={version}")
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        # no-cache: 브라우저가 캐시된 응답을 매번 ETag로 재검증하도록 함
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         logger.info(f"온톨로지 그래프 조회 완료: ontology_id={ontology_id}, 노드={len(result.nodes)}개, 엣지={len(result.edges)}개")
         return result
     except Exception as e:
@@ -125,7 +175,8 @@ async def get_merged_ontology_graph_endpoint(
     """
     try:
         logger.info("통합 온톨로지 그래프 조회 요청")
-        result = service.get_merged_ontology_graph()
+        # 다른 워커 변경 동기화와 그래프 조립이 이벤트 루프를 막지 않도록 스레드에서 실행
+        result = await asyncio.to_thread(service.get_merged_ontology_graph)
         logger.info(f"통합 온톨로지 그래프 조회 완료: 노드={len(result.nodes)}개, 엣지={len(result.edges)}개")
         return result
     except Exception as e:
@@ -136,4 +187,93 @@ async def get_merged_ontology_graph_endpoint(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"통합 온톨로지 그래프 조회 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/map_filenames", response_model=MapFilenamesResponse)
+async def map_filenames_endpoint(
+    request: MapFilenamesRequest,
+    service: FilenameMappingService = Depends(get_filename_mapping_service)
+):
+    """
+    파일명 일괄 매핑 (파일 내용 불필요)
+    건수가 많거나 stream=true이면 결과를 NDJSON으로 스트리밍합니다.
+    스트리밍 중 매핑에 실패하면 마지막 줄에 오류 레코드({"error": ..., "offset": ...})를 보내고 종료합니다.
+    
+    Args:
+        request: 파일명 목록, 온톨로지 클래스 목록, 모델명
+        service: 파일명 매핑 서비스 (의존성 주입)
+        
+    Returns:
+        MapFilenamesResponse 또는 NDJSON 스트리밍 응답 (한 줄에 매핑 결과 1개)
+    """
+    classes_list = [cls.strip() for cls in request.ontology_classes if cls.strip()]
+    if not classes_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="온톨로지 클래스가 필요합니다."
+        )
+    
+    stream = request.stream
+    if stream is None:
+        stream = len(request.file_names) > MAP_FILENAMES_STREAM_THRESHOLD
+    
+    try:
+        logger.info(f"파일명 일괄 매핑 요청: {len(request.file_names)}개, 클래스={len(classes_list)}개, 스트리밍={stream}")
+        
+        executors = get_pipeline_executors()
+        if stream:
+            # 매퍼 생성과 모델 로드는 응답 시작 전에 수행 (실패하면 500)
+            mapper = await executors.run_inference(service.create_mapper, classes_list, request.model_name)
+            return StreamingResponse(
+                _stream_mappings(service, mapper, request.file_names),
+                media_type="application/x-ndjson"
+            )
+        
+        mappings = await executors.run_inference(
+            service.map_filenames, request.file_names, classes_list, request.model_name
+        )
+        return MapFilenamesResponse(
+            message="파일명 매핑 완료",
+            total=len(mappings),
+            mappings=mappings,
+        )
+    except Exception as e:
+        logger.error(
+            f"파일명 일괄 매핑 실패: {str(e)}",
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"파일명 매핑 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+async def _stream_mappings(
+    service: FilenameMappingService,
+    mapper: HybridMapper,
+    file_names: List[str]
+) -> AsyncIterator[str]:
+    """
+    파일명을 청크 단위로 추론 실행기에서 매핑하며 NDJSON 줄로 반환
+    응답 상태 코드는 이미 전송되었으므로 실패 시 오류 레코드를 보내고 종료
+    
+    Yields:
+        str: 매핑 결과 1개 또는 오류 레코드 (JSON 한 줄)
+    """
+    executors = get_pipeline_executors()
+    offset = 0
+    try:
+        for offset in range(0, len(file_names), MAP_FILENAMES_CHUNK_SIZE):
+            items = await executors.run_inference(
+                service.map_chunk, mapper, file_names[offset:offset + MAP_FILENAMES_CHUNK_SIZE]
+            )
+            for item in items:
+                yield item.model_dump_json() + "\n"
+        logger.info(f"파일명 스트리밍 매핑 완료: {len(file_names)}개")
+    except Exception as e:
+        logger.error(f"파일명 스트리밍 매핑 실패: offset={offset}, error={str(e)}", exc_info=True)
+        yield json.dumps(
+            {"error": f"파일명 매핑 중 오류가 발생했습니다: {str(e)}", "offset": offset},
+            ensure_ascii=False
+        ) + "\n"
@@ -0,0 +1,56 @@
+"""
+메트릭 라우터
+모델 레지스트리, 임베딩 캐시, 온톨로지 저장소 등 내부 캐시 상태 조회
+"""
+
+import logging
+from fastapi import APIRouter, HTTPException, status
+from backend.schmas.ontology_schma import MetricsResponse
+from backend.dependencies.services import get_ontology_service
+from backend.services.executors import get_pipeline_executors
+from backend.services.ingestion_jobs import get_ingestion_job_queue
+from backend.services.merged_graph_index import get_merged_graph_index
+from backend.services.ontology_storage import get_ontology_storage
+from backend.services.upload_dedup import get_upload_result_cache
+from backend.services.ontology_services.disk_embedding_cache import get_disk_embedding_cache_manager
+from backend.services.ontology_services.embedding_cache import get_class_embedding_cache
+from backend.services.ontology_services.keyword_rules import get_keyword_rule_store
+from backend.services.ontology_services.model_registry import get_model_registry
+from backend.services.ontology_services.schema_mapping_cache import get_schema_mapping_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1", tags=["metrics"])
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics_endpoint():
+    """
+    서비스 메트릭 조회
+    
+    Returns:
+        MetricsResponse: 구성요소별 메트릭
+    """
+    try:
+        return MetricsResponse(
+            message="메트릭 조회 완료",
+            metrics={
+                "model_registry": get_model_registry().stats(),
+                "class_embedding_cache": get_class_embedding_cache().stats(),
+                "schema_mapping_cache": get_schema_mapping_cache().stats(),
+                "disk_embedding_cache": get_disk_embedding_cache_manager().stats(),
+                "keyword_rules": get_keyword_rule_store().stats(),
+                "pipeline_executors": get_pipeline_executors().stats(),
+                "ingestion_jobs": get_ingestion_job_queue().stats(),
+                "upload_dedup": get_upload_result_cache().stats(),
+                "ontology_storage": get_ontology_storage().stats(),
+                "ontology_graph_cache": get_ontology_service().graph_cache_stats(),
+                "merged_graph_index": get_merged_graph_index().stats(),
+            },
+        )
+    except Exception as e:
+        logger.error(f"메트릭 조회 실패: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"메트릭 조회 중 오류가 발생했습니다: {str(e)}"
+        )
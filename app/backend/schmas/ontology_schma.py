@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+from backend.services.ontology_services.config import DEFAULT_MODEL
 
 
 # ============================================================================
@@ -56,8 +57,9 @@ class ListOntologiesResponse(BaseModel):
     """온톨로지 목록 조회 응답 스키마"""
     
     message: str = Field(..., description="응답 메시지")
-    total: int = Field(..., description="전체 개수")
-    ontologies: List[OntologyListItem] = Field(..., description="온톨로지 목록")
+    total: int = Field(..., description="전체 개수 (클래스 필터 적용)")
+    ontologies: List[OntologyListItem] = Field(..., description="온톨로지 목록 (생성일시 역순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (after로 전달, 마지막 페이지면 None)")
 
 
 # ============================================================================
@@ -104,4 +106,93 @@ class UploadDataResponse(BaseModel):
     relations_added: int = Field(..., description="추가된 관계 수")
     mapping_df: List[Dict[str, Any]] = Field(..., description="매핑 결과 DataFrame")
     g: str = Field(..., description="RDF Graph (Turtle 형식)")
+    rule_version: Optional[str] = Field(None, description="매핑에 사용된 키워드 사전 버전")
+    target_class_counts: Optional[Dict[str, int]] = Field(None, description="타겟 컬럼 값의 클래스별 행 수 (요청 시에만)")
+    deduplicated: bool = Field(False, description="같은 업로드의 저장된 결과를 반환했는지 여부 (파이프라인을 다시 실행하지 않음)")
+
+
+class BatchFileResult(BaseModel):
+    """일괄 업로드의 파일별 처리 결과"""
+    
+    file_name: str = Field(..., description="파일명 (아카이브 항목은 아카이브 안의 경로)")
+    file_size: int = Field(..., description="파일 크기 (bytes)")
+    status: str = Field(..., description="처리 상태 (mapped, failed, skipped)")
+    records_processed: Optional[int] = Field(None, description="처리된 레코드 수")
+    target: Optional[str] = Field(None, description="매핑된 온톨로지 클래스")
+    method: Optional[str] = Field(None, description="매핑 방법 (direct, rule, semantic, schema_cache)")
+    confidence: Optional[float] = Field(None, description="매핑 신뢰도")
+    error: Optional[str] = Field(None, description="실패 또는 건너뛴 사유")
+
+
+class BatchUploadResponse(BaseModel):
+    """일괄 업로드 응답 스키마"""
+    
+    message: str = Field(..., description="응답 메시지")
+    ontology_id: Optional[str] = Field(None, description="온톨로지 ID (매핑된 파일이 없고 새 온톨로지 요청이면 None)")
+    files_received: int = Field(..., description="수신한 파일 수 (아카이브 항목 포함)")
+    files_mapped: int = Field(..., description="관계가 추가된 파일 수")
+    files_failed: int = Field(..., description="파싱 또는 매핑에 실패한 파일 수")
+    files_skipped: int = Field(..., description="지원하지 않는 형식이라 건너뛴 파일 수")
+    records_processed: int = Field(..., description="매핑된 파일의 전체 레코드 수")
+    relations_added: int = Field(..., description="추가된 관계 수")
+    files: List[BatchFileResult] = Field(..., description="파일별 처리 결과 (입력 순서)")
+    g: str = Field(..., description="RDF Graph (Turtle 형식)")
+    rule_version: Optional[str] = Field(None, description="매핑에 사용된 키워드 사전 버전")
+
 
+class IngestionJobResponse(BaseModel):
+    """업로드 작업 상태 응답 스키마"""
+    
+    job_id: str = Field(..., description="작업 ID")
+    file_name: str = Field(..., description="업로드된 파일명")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    stage: str = Field(..., description="현재 단계 (queued, parsing, mapping, storing, stored, serializing, done)")
+    progress: Dict[str, Any] = Field(default_factory=dict, description="단계별 진행 상황 (parsed_rows, relations, triples_added 등)")
+    created_at: str = Field(..., description="작업 생성일시")
+    started_at: Optional[str] = Field(None, description="처리 시작일시")
+    finished_at: Optional[str] = Field(None, description="처리 완료일시")
+    wait_seconds: Optional[float] = Field(None, description="큐 대기 시간 (초)")
+    result: Optional[UploadDataResponse] = Field(None, description="완료 시 업로드 결과")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+
+
+# ============================================================================
+# 파일명 매핑 스키마
+# ============================================================================
+
+class MapFilenamesRequest(BaseModel):
+    """파일명 일괄 매핑 요청 스키마"""
+    
+    file_names: List[str] = Field(..., min_length=1, description="매핑할 파일명 목록")
+    ontology_classes: List[str] = Field(..., min_length=1, description="온톨로지 클래스 목록")
+    model_name: str = Field(DEFAULT_MODEL, description="모델명")
+    stream: Optional[bool] = Field(None, description="NDJSON 스트리밍 여부 (None이면 건수 기준 자동 결정)")
+
+
+class FilenameMappingItem(BaseModel):
+    """파일명 매핑 결과 아이템 스키마"""
+    
+    file_name: str = Field(..., description="파일명")
+    mapped_class: str = Field(..., description="매핑된 클래스")
+    confidence: float = Field(..., description="신뢰도")
+    method: str = Field(..., description="매핑 방법 (rule, semantic, unclassified)")
+    interpreted_as: str = Field(..., description="전처리된 파일명")
+
+
+class MapFilenamesResponse(BaseModel):
+    """파일명 일괄 매핑 응답 스키마"""
+    
+    message: str = Field(..., description="응답 메시지")
+    total: int = Field(..., description="전체 개수")
+    mappings: List[FilenameMappingItem] = Field(..., description="매핑 결과 목록")
+
+
+# ============================================================================
+# 메트릭 스키마
+# ============================================================================
+
+class MetricsResponse(BaseModel):
+    """서비스 메트릭 응답 스키마"""
+    
+    message: str = Field(..., description="응답 메시지")
+    metrics: Dict[str, Dict[str, Any]] = Field(..., description="구성요소별 메트릭")
@@ -0,0 +1,167 @@
+"""
+아카이브 읽기 모듈
+ZIP/TAR 아카이브의 항목을 하나씩 스트리밍하여 항목별 업로드 버퍼로 옮김 (아카이브 전체를 메모리에 풀지 않음)
+"""
+
+import io
+import logging
+import posixpath
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
+from backend.services.data_parser import FileSource
+from backend.services.upload_buffer import UploadBuffer, UploadTooLargeError
+from backend.services.ontology_services.config import UPLOAD_CHUNK_SIZE, UPLOAD_SPILL_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# 압축 형식별 확장자 (tar 계열은 tarfile이 압축 방식을 자동 감지)
+ARCHIVE_SUFFIXES = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "tar",
+    ".tgz": "tar",
+    ".tar.bz2": "tar",
+    ".tar.xz": "tar",
+}
+
+
+class ArchiveError(ValueError):
+    """아카이브를 읽을 수 없거나 항목 수 제한 초과"""
+
+
+@dataclass
+class ArchiveEntry:
+    """아카이브 항목 (지원하지 않는 형식이나 크기 초과 항목은 buffer 없이 보고)"""
+    name: str
+    size: int
+    buffer: Optional[UploadBuffer] = None
+    error: Optional[str] = None
+
+
+def archive_type(filename: Optional[str]) -> Optional[str]:
+    """
+    파일명에서 아카이브 형식 추출
+    
+    Args:
+        filename: 파일명
+        
+    Returns:
+        Optional[str]: "zip", "tar" 또는 None (아카이브가 아님)
+    """
+    if not filename:
+        return None
+    filename_lower = filename.lower()
+    for suffix, kind in ARCHIVE_SUFFIXES.items():
+        if filename_lower.endswith(suffix):
+            return kind
+    return None
+
+
+def read_archive(
+    source: FileSource,
+    kind: str,
+    accept: Callable[[str], bool],
+    max_entry_size: int,
+    max_total_size: int,
+    max_entries: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    spill_threshold: int = UPLOAD_SPILL_THRESHOLD
+) -> List[ArchiveEntry]:
+    """
+    아카이브 항목을 순서대로 읽어 항목별 버퍼에 저장
+    항목은 청크 단위로 복사되며 버퍼가 임계값을 넘으면 임시 파일로 전환됨
+    
+    Args:
+        source: 아카이브 내용 (bytes) 또는 파일 경로
+        kind: 아카이브 형식 ("zip", "tar")
+        accept: 읽을 항목인지 판단하는 함수 (False면 내용을 읽지 않고 건너뜀으로 보고)
+        max_entry_size: 항목 하나의 최대 크기 (bytes)
+        max_total_size: 풀어낸 항목 전체의 최대 크기 (bytes)
+        max_entries: 최대 항목 수
+        chunk_size: 한 번에 복사할 크기 (bytes)
+        spill_threshold: 항목별 임시 파일 전환 임계값 (bytes)
+        
+    Returns:
+        List[ArchiveEntry]: 항목 목록 (호출자가 버퍼 close 책임)
+    """
+    entries: List[ArchiveEntry] = []
+    total_size = 0
+    try:
+        for name, size, stream in _iter_members(source, kind):
+            if len(entries) >= max_entries:
+                raise ArchiveError(f"아카이브 항목은 {max_entries}개 이하여야 합니다.")
+            if not accept(name):
+                entries.append(ArchiveEntry(name=name, size=size))
+                continue
+            
+            buffer = UploadBuffer(min(max_entry_size, max_total_size - total_size), spill_threshold=spill_threshold)
+            try:
+                with stream() as member:
+                    while True:
+                        chunk = member.read(chunk_size)
+                        if not chunk:
+                            break
+                        buffer.write(chunk)
+            except UploadTooLargeError as e:
+                # 크기 제한을 넘은 항목만 실패로 보고하고 나머지 항목은 계속 처리
+                buffer.close()
+                entries.append(ArchiveEntry(name=name, size=size, error=str(e)))
+                continue
+            except BaseException:
+                buffer.close()
+                raise
+            
+            total_size += buffer.size
+            entries.append(ArchiveEntry(name=name, size=buffer.size, buffer=buffer))
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        _close_entries(entries)
+        raise ArchiveError(f"아카이브를 읽을 수 없습니다: {str(e)}")
+    except BaseException:
+        _close_entries(entries)
+        raise
+    
+    logger.info(f"아카이브 읽기 완료: {len(entries)}개 항목, {total_size / 1024 / 1024:.2f}MB")
+    return entries
+
+
+def _iter_members(source: FileSource, kind: str) -> Iterator[Tuple[str, int, Callable[[], BinaryIO]]]:
+    """
+    아카이브의 파일 항목 순회 (디렉토리와 운영체제 메타데이터 파일 제외)
+    
+    Yields:
+        (항목 경로, 크기, 항목 스트림을 여는 함수)
+    """
+    fileobj = io.BytesIO(source) if isinstance(source, bytes) else None
+    if kind == "zip":
+        with zipfile.ZipFile(fileobj or source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and not _is_metadata(info.filename):
+                    yield _entry_name(info.filename), info.file_size, lambda info=info: archive.open(info)
+    elif kind == "tar":
+        # 스트림 모드: 항목을 앞에서부터 한 번만 읽음 (gzip/bz2/xz 자동 감지)
+        with tarfile.open(name=None if fileobj else source, fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile() and not _is_metadata(member.name):
+                    yield _entry_name(member.name), member.size, lambda member=member: archive.extractfile(member)
+    else:
+        raise ArchiveError(f"지원하지 않는 아카이브 형식입니다: {kind}")
+
+
+def _entry_name(name: str) -> str:
+    """항목 경로 정규화 (앞의 ./ 와 / 제거)"""
+    return posixpath.normpath(name).lstrip("/")
+
+
+def _is_metadata(name: str) -> bool:
+    """macOS 리소스 포크, 숨김 파일 등 데이터가 아닌 항목인지 여부"""
+    parts = name.split("/")
+    return "__MACOSX" in parts or posixpath.basename(name).startswith(".")
+
+
+def _close_entries(entries: List[ArchiveEntry]) -> None:
+    """읽은 항목의 버퍼 해제"""
+    for entry in entries:
+        if entry.buffer is not None:
+            entry.buffer.close()
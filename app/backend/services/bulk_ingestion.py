@@ -0,0 +1,250 @@
+"""
+일괄 수집 모듈
+입력 폴더의 데이터 파일을 프로세스 풀에서 파싱하고, 파일명을 배치로 매핑하여 하나의 그래프로 구축한 뒤 RDF 파일로 기록
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from backend.services.data_parser import detect_file_type
+from backend.services.pipeline_stages import DatasetScan, scan_dataset
+from backend.services.relation_extractor import relation_row
+from backend.services.ontology_services.config import DEFAULT_MODEL, SEMANTIC_BATCH_SIZE, UPLOAD_PROCESS_WORKERS
+from backend.services.ontology_services.hybrid_mapper import HybridMapper
+from backend.services.ontology_services.ontology_builder import relation_triples, write_triples
+from backend.services.ontology_services.triple_store import CompactTripleStore
+
+logger = logging.getLogger(__name__)
+
+# 출력 파일 확장자별 RDF 형식
+RDF_FORMATS = {".ttl": "turtle", ".nt": "nt"}
+
+
+@dataclass
+class DataFile:
+    """수집 대상 파일"""
+    path: str
+    name: str  # 입력 폴더 기준 상대 경로 (관계의 Source)
+    file_type: str
+    size: int = 0
+    mtime_ns: int = 0
+
+
+@dataclass
+class IngestionReport:
+    """일괄 수집 결과 요약"""
+    files_found: int = 0
+    files_mapped: int = 0
+    files_failed: int = 0
+    records: int = 0
+    triples: int = 0
+    elapsed_seconds: float = 0.0
+    mapping_seconds: float = 0.0
+    output_path: Optional[str] = None
+    failures: List[Tuple[str, str]] = field(default_factory=list)  # (파일명, 오류)
+    
+    @property
+    def files_per_second(self) -> float:
+        """처리량 (초당 파일 수)"""
+        return self.files_found / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def discover_files(input_folder: str) -> List[DataFile]:
+    """
+    입력 폴더를 재귀적으로 순회하여 지원하는 데이터 파일 목록 생성 (숨김 파일/디렉토리 제외)
+    크기와 수정 시각은 디렉토리 순회 중 stat으로 함께 수집 (파일 내용은 읽지 않음)
+    
+    Args:
+        input_folder: 입력 폴더 경로
+        
+    Returns:
+        List[DataFile]: 폴더별 파일 먼저, 이름 순으로 정렬된 파일 목록
+    """
+    files: List[DataFile] = []
+    _scan_folder(input_folder, input_folder, files)
+    return files
+
+
+def _scan_folder(folder: str, input_folder: str, files: List[DataFile]) -> None:
+    """폴더 하나를 순회하여 파일을 추가하고 하위 폴더로 내려감"""
+    with os.scandir(folder) as iterator:
+        entries = sorted(iterator, key=lambda entry: entry.name)
+    
+    subfolders = []
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            subfolders.append(entry.path)
+            continue
+        file_type = detect_file_type(entry.name)
+        if file_type and entry.is_file():
+            stat = entry.stat()
+            name = os.path.relpath(entry.path, input_folder).replace(os.sep, "/")
+            files.append(DataFile(entry.path, name, file_type, stat.st_size, stat.st_mtime_ns))
+    
+    for subfolder in subfolders:
+        _scan_folder(subfolder, input_folder, files)
+
+
+class BulkIngestion:
+    """
+    일괄 수집기
+    - 파싱/타겟 컬럼 직접 매핑: 프로세스 풀 (파일 순서대로 결과를 받아 매핑과 겹쳐 진행)
+    - 파일명 매핑: 부모 프로세스의 매퍼 하나로 batch_size개씩 모아 map_batch (시맨틱 추론 배치)
+    """
+    
+    def __init__(
+        self,
+        ontology_classes: List[str],
+        model_name: str = DEFAULT_MODEL,
+        relation_type: str = "isDataOf",
+        target_column: Optional[str] = None,
+        workers: int = UPLOAD_PROCESS_WORKERS,
+        batch_size: int = SEMANTIC_BATCH_SIZE
+    ):
+        """
+        수집기 초기화
+        
+        Args:
+            ontology_classes: 온톨로지 클래스 목록
+            model_name: 모델명
+            relation_type: 관계 타입
+            target_column: 타겟 컬럼명 (있으면 파일별로 직접 매핑을 먼저 시도)
+            workers: 파싱 프로세스 수 (0이면 현재 프로세스에서 순서대로 처리)
+            batch_size: 한 번의 map_batch로 매핑할 파일명 수
+        """
+        self.ontology_classes = ontology_classes
+        self.model_name = model_name
+        self.relation_type = relation_type
+        self.target_column = target_column
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
+        self._mapper: Optional[HybridMapper] = None
+    
+    @property
+    def mapper(self) -> HybridMapper:
+        """파일명 매퍼 (처음 사용할 때 생성)"""
+        if self._mapper is None:
+            self._mapper = HybridMapper(self.ontology_classes, self.model_name)
+        return self._mapper
+    
+    def build_relations(self, files: List[DataFile]) -> Tuple[List[Dict[str, Any]], IngestionReport]:
+        """
+        파일 목록에서 관계 추출 (매핑에 실패한 파일은 보고서에 기록하고 계속 진행)
+        
+        Args:
+            files: 수집 대상 파일
+            
+        Returns:
+            (관계 행 목록 (Source, Target, Relation, Method, Confidence), 수집 결과 요약)
+        """
+        started = time.perf_counter()
+        report = IngestionReport(files_found=len(files))
+        relations: List[Dict[str, Any]] = []
+        pending: List[DatasetScan] = []
+        
+        for data_file, scan, error in self._scan(files):
+            if error is not None:
+                report.failures.append((data_file.name, error))
+                continue
+            if scan.direct_target is not None:
+                report.records += scan.row_count
+                relations.append(relation_row(scan.file_name, scan.direct_target, self.relation_type, "direct", 1.0))
+                continue
+            pending.append(scan)
+            if len(pending) >= self.batch_size:
+                self._map_pending(pending, relations, report)
+                pending = []
+        if pending:
+            self._map_pending(pending, relations, report)
+        
+        report.files_mapped = len(relations)
+        report.files_failed = len(report.failures)
+        report.elapsed_seconds = time.perf_counter() - started
+        return relations, report
+    
+    def ingest_folder(self, input_folder: str, output_path: str, rdf_format: Optional[str] = None) -> IngestionReport:
+        """
+        입력 폴더 전체를 하나의 그래프로 구축하여 RDF 파일로 기록
+        출력은 임시 파일에 한 번의 순회로 기록한 뒤 교체 (실패 시 기존 출력 유지)
+        
+        Args:
+            input_folder: 입력 폴더 경로
+            output_path: 출력 파일 경로
+            rdf_format: "turtle" 또는 "nt" (None이면 출력 확장자로 결정, 기본 turtle)
+            
+        Returns:
+            IngestionReport: 수집 결과 요약
+        """
+        started = time.perf_counter()
+        rdf_format = rdf_format or RDF_FORMATS.get(os.path.splitext(output_path)[1].lower(), "turtle")
+        files = discover_files(input_folder)
+        logger.info(f"일괄 수집 시작: {input_folder}, {len(files)}개 파일, 워커 {self.workers}개")
+        
+        relations, report = self.build_relations(files)
+        
+        # 하나의 그래프로 모음 (같은 트리플은 한 번만 기록)
+        graph = CompactTripleStore()
+        graph.add(relation_triples(relations, self.relation_type))
+        
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        temp_path = f"{output_path}.part"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as out:
+                report.triples = write_triples(graph, out, rdf_format)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        
+        report.output_path = output_path
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"일괄 수집 완료: 매핑 {report.files_mapped}/{report.files_found}개, 트리플 {report.triples}개, "
+            f"{report.files_per_second:.1f} files/sec"
+        )
+        return report
+    
+    def _scan(self, files: List[DataFile]) -> Iterator[Tuple[DataFile, Optional[DatasetScan], Optional[str]]]:
+        """파일을 파싱하여 입력 순서대로 스캔 결과 반환 (workers가 0이면 현재 프로세스에서 처리)"""
+        tasks = [(f.path, f.name, f.file_type, self.ontology_classes, self.target_column) for f in files]
+        if self.workers <= 0 or len(files) <= 1:
+            for data_file, task in zip(files, tasks):
+                yield (data_file, *_scan_file(task))
+            return
+        
+        # 모델/토크나이저 스레드가 있는 부모를 fork하지 않도록 spawn 사용
+        chunksize = max(1, min(64, len(tasks) // (self.workers * 4)))
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            for data_file, result in zip(files, pool.map(_scan_file, tasks, chunksize=chunksize)):
+                yield (data_file, *result)
+    
+    def _map_pending(self, pending: List[DatasetScan], relations: List[Dict[str, Any]], report: IngestionReport) -> None:
+        """모아 둔 파일명을 한 번의 map_batch로 매핑"""
+        started = time.perf_counter()
+        results = self.mapper.map_batch([scan.file_name for scan in pending], [scan.schema_fingerprint for scan in pending])
+        report.mapping_seconds += time.perf_counter() - started
+        
+        for scan, result in zip(pending, results):
+            if result.mapped_class == "Unclassified":
+                report.failures.append((scan.file_name, "온톨로지 클래스로 매핑할 수 없습니다."))
+            else:
+                report.records += scan.row_count
+                relations.append(relation_row(
+                    scan.file_name, result.mapped_class, self.relation_type, result.method, result.confidence
+                ))
+
+
+def _scan_file(task: Tuple[str, str, str, List[str], Optional[str]]) -> Tuple[Optional[DatasetScan], Optional[str]]:
+    """프로세스 풀 작업 (실패한 파일은 오류 메시지로 반환하여 나머지 파일을 계속 처리)"""
+    try:
+        return scan_dataset(*task), None
+    except Exception as e:
+        return None, str(e)
+
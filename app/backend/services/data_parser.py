@@ -3,23 +3,143 @@
 다양한 형식의 데이터 파일을 파싱하여 관계 데이터 추출
 """
 
+import hashlib
 import logging
+import mmap
+import os
 import polars as pl
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional, Iterator, TypeVar, Union
 from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+# 파싱 대상 (메모리의 bytes 또는 디스크의 파일 경로)
+FileSource = Union[bytes, str]
+
+T = TypeVar("T")
+
+
+@contextmanager
+def open_source(file_content: FileSource) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    파싱 대상을 bytes-like 객체로 제공 (경로는 복사 없이 읽기 전용 메모리 매핑)
+    
+    Args:
+        file_content: 파일 내용 (bytes) 또는 파일 경로
+        
+    Yields:
+        bytes 또는 mmap 객체
+    """
+    if isinstance(file_content, (bytes, bytearray, memoryview)):
+        yield file_content
+        return
+    
+    with open(file_content, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+@dataclass
+class ParsedData:
+    """
+    업로드 파이프라인에 필요한 파싱 결과
+    전체 데이터 대신 행 수, 컬럼명, 타겟 컬럼만 보관 (프로세스 간 전달 비용 최소화)
+    """
+    row_count: int
+    columns: List[str]
+    # 타겟 컬럼만 포함 (타겟 컬럼이 없으면 빈 DataFrame, CSV는 필요할 때 배치로 읽는 LazyFrame)
+    frame: Union[pl.DataFrame, pl.LazyFrame]
+    dtypes: List[str] = field(default_factory=list)  # 컬럼별 dtype (columns와 같은 순서)
+    # CSV 지연 프레임의 원본 (데이터 행이 UTF-8이 아니면 읽는 시점에 전체 파싱으로 전환할 때 사용)
+    source: Optional[FileSource] = None
+    
+    @property
+    def schema_fingerprint(self) -> Optional[str]:
+        """컬럼 구성 지문 (같은 형식으로 내보낸 파일 식별용)"""
+        return schema_fingerprint(self.columns, self.dtypes)
+    
+    def read_target(self, read: Callable[[Union[pl.DataFrame, pl.LazyFrame]], T], file_name: str) -> T:
+        """
+        타겟 컬럼 프레임을 읽는 함수 실행
+        CSV 지연 프레임의 데이터 행이 UTF-8이 아니면 전체 파싱(CP949 시도)한 프레임으로 바꾼 뒤 다시 실행
+        
+        Args:
+            read: 타겟 컬럼 프레임을 받아 결과를 반환하는 함수
+            file_name: 파일명 (로그용)
+            
+        Returns:
+            read 결과
+        """
+        try:
+            return read(self.frame)
+        except Exception as e:
+            if self.source is None or not is_utf8_error(e):
+                raise
+        
+        logger.info(f"CSV 데이터 행을 UTF-8로 읽을 수 없어 전체 파싱으로 전환: {file_name}")
+        columns = self.frame.collect_schema().names()
+        self.frame = CSVParser().parse(self.source, file_name).select(columns)
+        self.source = None
+        return read(self.frame)
+
+
+def is_utf8_error(error: Exception) -> bool:
+    """polars가 UTF-8이 아닌 CSV를 읽다가 발생시킨 오류인지 확인"""
+    return isinstance(error, pl.exceptions.ComputeError) and "utf-8" in str(error).lower()
+
+
+def schema_fingerprint(columns: List[str], dtypes: List[str]) -> Optional[str]:
+    """
+    순서 있는 컬럼명과 dtype으로 스키마 지문 계산
+    
+    Args:
+        columns: 컬럼명 목록
+        dtypes: 컬럼별 dtype 문자열
+        
+    Returns:
+        SHA-256 지문 (hex) 또는 None (컬럼이 없는 경우)
+    """
+    if not columns:
+        return None
+    digest = hashlib.sha256()
+    for column, dtype in zip(columns, dtypes or [""] * len(columns)):
+        digest.update(f"{column}\x1f{dtype}\x1e".encode("utf-8"))
+    return digest.hexdigest()
+
 
 class DataParser:
     """데이터 파서 기본 클래스"""
     
-    def parse(self, file_content: bytes, file_name: str) -> pl.DataFrame:
+    def parse_summary(self, file_content: FileSource, file_name: str, target_column: Optional[str] = None) -> ParsedData:
+        """
+        파일을 파싱하여 파이프라인용 요약 반환
+        
+        Args:
+            file_content: 파일 내용 (bytes) 또는 파일 경로
+            file_name: 파일명
+            target_column: 타겟 컬럼명 (있으면 해당 컬럼만 보관)
+            
+        Returns:
+            ParsedData: 행 수, 컬럼명, 타겟 컬럼 데이터
+        """
+        df = self.parse(file_content, file_name)
+        if target_column and target_column in df.columns:
+            frame = df.select(target_column)
+        else:
+            frame = pl.DataFrame()
+        return ParsedData(row_count=len(df), columns=df.columns, frame=frame, dtypes=[str(dtype) for dtype in df.dtypes])
+    
+    def parse(self, file_content: FileSource, file_name: str) -> pl.DataFrame:
         """
         파일 내용을 파싱하여 DataFrame으로 변환
         
         Args:
-            file_content: 파일 내용 (bytes)
+            file_content: 파일 내용 (bytes) 또는 파일 경로
             file_name: 파일명
             
         Returns:
@@ -31,28 +151,74 @@ class DataParser:
 class CSVParser(DataParser):
     """CSV 파일 파서"""
     
-    def parse(self, file_content: bytes, file_name: str) -> pl.DataFrame:
+    def parse_summary(self, file_content: FileSource, file_name: str, target_column: Optional[str] = None) -> ParsedData:
+        """
+        CSV 지연 파싱 (헤더만 읽고 행 수는 스트리밍으로 계산)
+        타겟 컬럼은 LazyFrame으로 반환하여 직접 매핑 시 필요한 배치만 읽음
+        헤더를 UTF-8로 읽을 수 없으면 전체 파싱(CP949 시도)으로 전환
+        (데이터 행만 UTF-8이 아닌 경우는 ParsedData.read_target이 타겟 컬럼을 읽는 시점에 전환)
+        
+        Args:
+            file_content: CSV 파일 내용 (bytes) 또는 파일 경로
+            file_name: 파일명
+            target_column: 타겟 컬럼명 (있으면 해당 컬럼만 스캔하는 LazyFrame 생성)
+            
+        Returns:
+            ParsedData: 행 수, 컬럼명, 타겟 컬럼 LazyFrame
+        """
+        try:
+            lazy_frame = pl.scan_csv(file_content)
+            schema = lazy_frame.collect_schema()
+            columns = schema.names()
+            if any("\ufffd" in column for column in columns):
+                # 헤더가 UTF-8이 아님 (polars는 헤더를 손실 디코딩함)
+                raise pl.exceptions.ComputeError("invalid utf-8 sequence in header")
+            # 행 수만 필요하므로 값은 디코딩하지 않음
+            row_count = lazy_frame.select(pl.len()).collect(engine="streaming").item()
+            source = None
+            if target_column and target_column in columns:
+                frame = lazy_frame.select(target_column)
+                source = file_content
+            else:
+                frame = pl.DataFrame()
+        except pl.exceptions.ComputeError as e:
+            if not is_utf8_error(e):
+                logger.error(f"CSV 파일 파싱 실패: {file_name}, {str(e)}", exc_info=True)
+                raise ValueError(f"CSV 파일 파싱 중 오류가 발생했습니다: {str(e)}")
+            logger.info(f"UTF-8 지연 파싱 불가, 전체 파싱으로 전환: {file_name}")
+            return super().parse_summary(file_content, file_name, target_column)
+        except pl.exceptions.PolarsError as e:
+            logger.error(f"CSV 파일 파싱 실패: {file_name}, {str(e)}", exc_info=True)
+            raise ValueError(f"CSV 파일 파싱 중 오류가 발생했습니다: {str(e)}")
+        
+        logger.info(f"CSV 파일 지연 파싱 완료: {file_name}, {row_count}개 행, {len(columns)}개 컬럼")
+        return ParsedData(
+            row_count=row_count, columns=columns, frame=frame, dtypes=[str(dtype) for dtype in schema.dtypes()], source=source
+        )
+    
+    def parse(self, file_content: FileSource, file_name: str) -> pl.DataFrame:
         """
-        CSV 파일 파싱
+        CSV 파일 파싱 (경로가 주어지면 polars가 파일을 메모리 매핑하여 읽음)
         
         Args:
-            file_content: CSV 파일 내용 (bytes)
+            file_content: CSV 파일 내용 (bytes) 또는 파일 경로
             file_name: 파일명
             
         Returns:
             DataFrame: 파싱된 데이터
         """
         try:
-            # UTF-8 인코딩 시도
+            # UTF-8로 바로 파싱 (문자열 디코딩 사본을 만들지 않음)
             try:
-                content_str = file_content.decode('utf-8')
-            except UnicodeDecodeError:
+                df = pl.read_csv(file_content)
+            except pl.exceptions.ComputeError as e:
+                if not is_utf8_error(e):
+                    raise
                 # UTF-8 실패 시 CP949 (한글) 시도
-                content_str = file_content.decode('cp949')
-            
-            # StringIO로 변환하여 polars로 읽기
-            from io import StringIO
-            df = pl.read_csv(StringIO(content_str))
+                from io import StringIO
+                with open_source(file_content) as data:
+                    content_str = str(data[:], 'cp949')
+                df = pl.read_csv(StringIO(content_str))
             
             logger.info(f"CSV 파일 파싱 완료: {file_name}, {len(df)}개 행, {len(df.columns)}개 컬럼")
             return df
@@ -65,12 +231,12 @@ class CSVParser(DataParser):
 class JSONParser(DataParser):
     """JSON 파일 파서"""
     
-    def parse(self, file_content: bytes, file_name: str) -> pl.DataFrame:
+    def parse(self, file_content: FileSource, file_name: str) -> pl.DataFrame:
         """
         JSON 파일 파싱
         
         Args:
-            file_content: JSON 파일 내용 (bytes)
+            file_content: JSON 파일 내용 (bytes) 또는 파일 경로
             file_name: 파일명
             
         Returns:
@@ -79,8 +245,8 @@ class JSONParser(DataParser):
         try:
             import json
             
-            content_str = file_content.decode('utf-8')
-            data = json.loads(content_str)
+            with open_source(file_content) as content:
+                data = json.loads(content[:])
             
             # 리스트인 경우
             if isinstance(data, list):
@@ -112,12 +278,12 @@ class JSONParser(DataParser):
 class ExcelParser(DataParser):
     """Excel 파일 파서"""
     
-    def parse(self, file_content: bytes, file_name: str, sheet_name: Optional[str] = None) -> pl.DataFrame:
+    def parse(self, file_content: FileSource, file_name: str, sheet_name: Optional[str] = None) -> pl.DataFrame:
         """
         Excel 파일 파싱
         
         Args:
-            file_content: Excel 파일 내용 (bytes)
+            file_content: Excel 파일 내용 (bytes) 또는 파일 경로
             file_name: 파일명
             sheet_name: 시트명 (None이면 첫 번째 시트)
             
@@ -127,7 +293,8 @@ class ExcelParser(DataParser):
         try:
             # polars는 Excel을 직접 지원하지 않으므로 pandas로 읽은 후 변환
             import pandas as pd
-            df_pd = pd.read_excel(BytesIO(file_content), sheet_name=sheet_name)
+            source = file_content if isinstance(file_content, str) else BytesIO(file_content)
+            df_pd = pd.read_excel(source, sheet_name=sheet_name)
             
             # 여러 시트인 경우 첫 번째 시트 사용
             if isinstance(df_pd, dict):
@@ -165,3 +332,28 @@ def get_parser(file_type: str) -> DataParser:
     else:
         raise ValueError(f"지원하지 않는 파일 타입입니다: {file_type}")
 
+
+
+def detect_file_type(file_name: Optional[str]) -> Optional[str]:
+    """
+    파일명 확장자로 파일 타입 판별
+    
+    Args:
+        file_name: 파일명
+        
+    Returns:
+        Optional[str]: 파일 타입 (csv, json, excel) 또는 None
+    """
+    if not file_name:
+        return None
+    
+    file_name_lower = file_name.lower()
+    
+    if file_name_lower.endswith('.csv'):
+        return 'csv'
+    elif file_name_lower.endswith('.json'):
+        return 'json'
+    elif file_name_lower.endswith(('.xlsx', '.xls')):
+        return 'excel'
+    else:
+        return None
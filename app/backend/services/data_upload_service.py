@@ -3,26 +3,50 @@
 파일 업로드 및 온톨로지 관계 추가 처리
 """
 
+import asyncio
 import logging
+import os
 import uuid
-import urllib.parse
-from typing import Optional, List, Dict, Any
-from rdflib import Graph, Literal, RDF, Namespace
-from backend.services.data_parser import get_parser
+import polars as pl
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, List, Dict, Any, Tuple
+from backend.services.data_parser import FileSource, ParsedData
+from backend.services.executors import PipelineExecutors, get_pipeline_executors
+from backend.services.pipeline_stages import parse_upload
 from backend.services.relation_extractor import RelationExtractor
+from backend.services.upload_dedup import get_upload_result_cache, upload_fingerprint
 from backend.services.ontology_storage import get_ontology_storage
-from backend.services.ontology_services.config import BASE_URI, FACT_URI, DEFAULT_MODEL
-from backend.schmas.ontology_schma import UploadDataResponse
+from backend.services.ontology_services.ontology_builder import relation_triples
+from backend.services.ontology_services.config import DEFAULT_MODEL, UPLOAD_DEDUP_ENABLED
+from backend.schmas.ontology_schma import (
+    BatchFileResult,
+    BatchUploadResponse,
+    BuildHybridOntologyResponse,
+    UploadDataResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+# 단계 진행 콜백: (단계명, 진행 상황 갱신값)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+
+@dataclass
+class BatchFile:
+    """일괄 업로드의 파일 하나 (source가 없으면 파싱하지 않고 error 또는 건너뜀으로 보고)"""
+    file_name: str
+    file_size: int
+    file_type: Optional[str] = None
+    source: Optional[FileSource] = None
+    error: Optional[str] = None
+
 
 class DataUploadService:
     """데이터 업로드 서비스"""
     
     def upload_and_build_ontology(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         file_name: str,
         file_type: str,
         ontology_classes: List[str],
@@ -30,14 +54,16 @@ class DataUploadService:
         relation_type: str = "isDataOf",
         source_column: Optional[str] = None,
         target_column: Optional[str] = None,
-        model_name: str = DEFAULT_MODEL
+        model_name: str = DEFAULT_MODEL,
+        count_target_classes: bool = False,
+        include_graph: bool = True
     ) -> UploadDataResponse:
         """
-        파일 업로드 및 온톨로지 구축
+        파일 업로드 및 온톨로지 구축 (모든 단계를 호출 스레드에서 실행)
         매핑은 자동으로 처리됩니다: 타겟 컬럼이 있으면 직접 매핑, 없으면 파일명 기반 하이브리드 매핑 사용
         
         Args:
-            file_content: 파일 내용 (bytes)
+            file_content: 파일 내용 (bytes) 또는 업로드 임시 파일 경로
             file_name: 파일명
             file_type: 파일 타입 (csv, json, excel)
             ontology_classes: 온톨로지 클래스 목록
@@ -46,6 +72,8 @@ class DataUploadService:
             source_column: 소스 컬럼명 (None이면 자동 감지)
             target_column: 타겟 컬럼명 (None이면 자동 감지, 있으면 직접 매핑 사용)
             model_name: 모델명
+            count_target_classes: 타겟 컬럼의 클래스별 행 수 집계 여부
+            include_graph: 응답에 전체 Turtle 포함 여부 (False면 직렬화하지 않고 빈 문자열)
             
         Returns:
             UploadDataResponse: 업로드 결과
@@ -53,180 +81,428 @@ class DataUploadService:
         try:
             # 1. 파일 파싱
             logger.info(f"파일 파싱 시작: {file_name}, 타입: {file_type}")
-            parser = get_parser(file_type)
-            df = parser.parse(file_content, file_name)
-            
-            if len(df) == 0:
-                raise ValueError("파일이 비어있거나 파싱할 데이터가 없습니다.")
-            
-            logger.info(f"파싱 완료: {len(df)}개 행")
+            parsed = parse_upload(file_content, file_name, file_type, target_column)
+            logger.info(f"파싱 완료: {parsed.row_count}개 행")
             
             # 2. 관계 추출
-            logger.info("관계 추출 시작")
-            extractor = RelationExtractor(ontology_classes, model_name)
-            relations_df = extractor.extract_relations(
-                df=df,
-                file_name=file_name,  # 파일명 전달 (데이터셋 전체를 하나의 클래스로 매핑)
-                relation_type=relation_type,
-                source_column=source_column,
-                target_column=target_column
+            relations_df, rule_version, class_counts = self._extract_relations(
+                parsed, file_name, ontology_classes, relation_type, source_column, target_column, model_name,
+                count_target_classes
             )
             
-            if len(relations_df) == 0:
-                raise ValueError("추출된 관계가 없습니다.")
+            # 3. 저장소 Graph에 새 관계 반영 (새 온톨로지면 생성)
+            ontology_id = self._store_relations(ontology_id, ontology_classes, relations_df, relation_type)
             
-            logger.info(f"관계 추출 완료: {len(relations_df)}개 관계")
+            # 4. 응답 생성 (Turtle은 요청 시에만 직렬화, 캐시 사용)
+            graph_turtle = get_ontology_storage().get_turtle(ontology_id) if include_graph else ""
+            return self._build_response(
+                ontology_id, file_name, _source_size(file_content),
+                parsed, relations_df, graph_turtle, rule_version, class_counts
+            )
             
-            # 3. RDF Graph 생성 또는 병합
-            if ontology_id:
-                # 기존 온톨로지에 관계 추가
-                logger.info(f"기존 온톨로지에 관계 추가: {ontology_id}")
-                g = self._add_relations_to_existing_ontology(
-                    ontology_id=ontology_id,
-                    relations_df=relations_df,
-                    relation_type=relation_type
-                )
-            else:
-                # 새 온톨로지 생성
-                logger.info("새 온톨로지 생성")
-                ontology_id = str(uuid.uuid4())
-                g = self._build_new_ontology(
-                    relations_df=relations_df,
-                    relation_type=relation_type
-                )
+        except Exception as e:
+            logger.error(f"데이터 업로드 실패: {str(e)}", exc_info=True)
+            raise
+    
+    async def upload_and_build_ontology_async(
+        self,
+        file_content: FileSource,
+        file_name: str,
+        file_type: str,
+        ontology_classes: List[str],
+        ontology_id: Optional[str] = None,
+        relation_type: str = "isDataOf",
+        source_column: Optional[str] = None,
+        target_column: Optional[str] = None,
+        model_name: str = DEFAULT_MODEL,
+        count_target_classes: bool = False,
+        include_graph: bool = True,
+        executors: Optional[PipelineExecutors] = None,
+        progress: Optional[ProgressCallback] = None,
+        content_sha256: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> UploadDataResponse:
+        """
+        파일 업로드 및 온톨로지 구축 (이벤트 루프를 막지 않도록 단계별로 실행기에 위임)
+        - 파싱: 프로세스 풀
+        - 관계 추출 (모델 추론): 추론 스레드 풀
+        - 저장소 반영: 스레드 (같은 온톨로지에 대한 추가는 저장소가 직렬화)
+        - 응답용 Turtle 직렬화 (캐시 미스 시): 스레드
+        content_sha256이 있으면 내용 해시와 요청 인자가 같은 업로드의 저장된 결과를 반환 (deduplicated=True)
+        
+        Args:
+            upload_and_build_ontology와 동일
+            executors: 파이프라인 실행기 (None이면 전역 실행기)
+            progress: 단계 시작/완료 시 호출할 콜백 (작업 큐의 진행 상황 보고용)
+            content_sha256: 업로드 내용의 SHA-256 (수신하면서 계산한 값, None이면 중복 제거 안 함)
+            idempotency_key: 클라이언트가 보낸 Idempotency-Key (선택사항)
             
-            # 4. Graph 직렬화
-            graph_turtle = g.serialize(format="turtle")
-            if isinstance(graph_turtle, bytes):
-                graph_turtle = graph_turtle.decode('utf-8')
-            graph_turtle = str(graph_turtle)
+        Returns:
+            UploadDataResponse: 업로드 결과
             
-            # 5. 응답 생성
-            mapping_dict = relations_df.to_dicts()
+        Raises:
+            IdempotencyKeyConflictError: 같은 Idempotency-Key로 다른 업로드를 요청한 경우
+        """
+        params = {
+            "ontology_id": ontology_id,
+            "relation_type": relation_type,
+            "source_column": source_column,
+            "target_column": target_column,
+            "model_name": model_name,
+            "count_target_classes": count_target_classes,
+            "include_graph": include_graph,
+        }
+        
+        def run() -> Awaitable[UploadDataResponse]:
+            return self._upload_async(
+                file_content, file_name, file_type, ontology_classes, executors=executors, progress=progress, **params
+            )
+        
+        if not content_sha256 or not UPLOAD_DEDUP_ENABLED:
+            return await run()
+        
+        # 같은 업로드의 결과가 있으면 (또는 처리 중이면) 파싱/추론/그래프 작업 없이 반환
+        storage = get_ontology_storage()
+        result, reused = await get_upload_result_cache().get_or_run(
+            upload_fingerprint(content_sha256, file_name, ontology_classes, **params),
+            run,
+            idempotency_key=idempotency_key,
+            is_valid=lambda cached: storage.exists(cached.ontology_id)
+        )
+        if not reused:
+            return result
+        
+        logger.info(f"중복 업로드: 저장된 결과 반환 (파일={file_name}, ontology_id={result.ontology_id})")
+        if progress:
+            progress("deduplicated", {"ontology_id": result.ontology_id})
+        return result.model_copy(update={"deduplicated": True})
+    
+    async def _upload_async(
+        self,
+        file_content: FileSource,
+        file_name: str,
+        file_type: str,
+        ontology_classes: List[str],
+        ontology_id: Optional[str],
+        relation_type: str,
+        source_column: Optional[str],
+        target_column: Optional[str],
+        model_name: str,
+        count_target_classes: bool,
+        include_graph: bool,
+        executors: Optional[PipelineExecutors] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> UploadDataResponse:
+        """업로드 파이프라인 실행 (upload_and_build_ontology_async 참고)"""
+        executors = executors or get_pipeline_executors()
+        report = progress or (lambda stage, updates: None)
+        try:
+            # 1. 파일 파싱
+            logger.info(f"파일 파싱 시작: {file_name}, 타입: {file_type}")
+            report("parsing", {})
+            parsed = await executors.run_cpu(parse_upload, file_content, file_name, file_type, target_column)
+            logger.info(f"파싱 완료: {parsed.row_count}개 행")
             
-            response = UploadDataResponse(
-                message="데이터 업로드 및 온톨로지 구축 완료",
-                ontology_id=ontology_id,
-                file_name=file_name,
-                file_size=len(file_content),
-                records_processed=len(df),
-                relations_added=len(relations_df),
-                mapping_df=mapping_dict,
-                g=graph_turtle
+            # 2. 관계 추출
+            report("mapping", {"parsed_rows": parsed.row_count})
+            relations_df, rule_version, class_counts = await executors.run_inference(
+                self._extract_relations,
+                parsed, file_name, ontology_classes, relation_type, source_column, target_column, model_name,
+                count_target_classes
             )
             
-            # 6. 저장소에 저장 (기존 온톨로지 업데이트 또는 새로 저장)
+            # 3. 저장소 Graph에 새 관계 반영 (새 온톨로지면 생성)
+            # 온톨로지별 lock을 기다릴 수 있으므로 스레드에서 실행 (다른 온톨로지의 업로드는 동시에 진행)
+            report("storing", {"mapping_done": True, "relations": len(relations_df)})
             storage = get_ontology_storage()
-            if ontology_id in storage._storage:
-                # 기존 온톨로지 업데이트
-                existing = storage.get(ontology_id)
-                existing["rdf_graph"] = graph_turtle
-                existing["mapping_df"].extend(mapping_dict)
-                existing["mapping_count"] = len(existing["mapping_df"])
-            else:
-                # 새 온톨로지 저장
-                from backend.schmas.ontology_schma import BuildHybridOntologyResponse
-                build_response = BuildHybridOntologyResponse(
-                    message=response.message,
-                    ontology_id=ontology_id,
-                    mapping_df=mapping_dict,
-                    g=graph_turtle
-                )
-                storage.save(build_response, ontology_classes)
-            
-            logger.info(f"데이터 업로드 완료: ontology_id={ontology_id}, 관계={len(relations_df)}개")
+            triples_before = (storage.read_graph(ontology_id, len) or 0) if progress and ontology_id else 0
+            ontology_id = await asyncio.to_thread(
+                self._store_relations, ontology_id, ontology_classes, relations_df, relation_type
+            )
+            if progress:
+                # 같은 온톨로지에 동시에 추가된 트리플이 있으면 함께 집계될 수 있음
+                triples = storage.read_graph(ontology_id, len) or 0
+                report("stored", {"ontology_id": ontology_id, "triples": triples, "triples_added": triples - triples_before})
             
-            return response
+            # 4. 응답 생성 (Turtle은 요청 시에만 직렬화, 캐시 사용)
+            graph_turtle = ""
+            if include_graph:
+                report("serializing", {})
+                graph_turtle = await asyncio.to_thread(storage.get_turtle, ontology_id)
+            return self._build_response(
+                ontology_id, file_name, _source_size(file_content),
+                parsed, relations_df, graph_turtle, rule_version, class_counts
+            )
             
         except Exception as e:
             logger.error(f"데이터 업로드 실패: {str(e)}", exc_info=True)
             raise
     
-    def _build_new_ontology(
+    async def upload_batch_async(
         self,
-        relations_df,
-        relation_type: str
-    ) -> Graph:
+        files: List[BatchFile],
+        ontology_classes: List[str],
+        ontology_id: Optional[str] = None,
+        relation_type: str = "isDataOf",
+        target_column: Optional[str] = None,
+        model_name: str = DEFAULT_MODEL,
+        include_graph: bool = True,
+        executors: Optional[PipelineExecutors] = None
+    ) -> BatchUploadResponse:
         """
-        새 온톨로지 Graph 생성
+        여러 파일을 한 번에 업로드하여 온톨로지 구축
+        - 파싱: 파일별로 프로세스 풀에 동시에 제출
+        - 관계 추출: 매퍼를 한 번만 만들고 파일명 전체를 한 번의 배치 매핑으로 처리
+        - 저장소 반영/Turtle 직렬화: 모든 관계를 모아 한 번씩만 수행
+        파싱이나 매핑에 실패한 파일은 파일별 결과에 오류로 보고하고 나머지 파일은 계속 처리
         
         Args:
-            relations_df: 관계 DataFrame
+            files: 업로드 파일 목록 (아카이브는 항목별로 풀어서 전달)
+            ontology_classes: 온톨로지 클래스 목록
+            ontology_id: 기존 온톨로지 ID (None이면 새로 생성)
             relation_type: 관계 타입
+            target_column: 타겟 컬럼명 (있으면 파일별로 직접 매핑을 먼저 시도)
+            model_name: 모델명
+            include_graph: 응답에 전체 Turtle 포함 여부
+            executors: 파이프라인 실행기 (None이면 전역 실행기)
             
         Returns:
-            Graph: RDF Graph
+            BatchUploadResponse: 파일별 처리 결과와 전체 요약
         """
-        META = Namespace(BASE_URI)
-        FACT = Namespace(FACT_URI)
-        g = Graph()
-        g.bind("meta", META)
-        g.bind("fact", FACT)
-        
-        for row in relations_df.iter_rows(named=True):
-            source = str(row['Source'])
-            target = str(row['Target'])
+        executors = executors or get_pipeline_executors()
+        results = [
+            BatchFileResult(
+                file_name=file.file_name,
+                file_size=file.file_size,
+                status="failed" if file.error else "skipped",
+                error=file.error or (None if file.file_type else "지원하지 않는 파일 형식입니다."),
+            )
+            for file in files
+        ]
+        try:
+            # 1. 파일 파싱 (프로세스 풀이 동시 실행 수를 제한)
+            pending = [index for index, file in enumerate(files) if file.source is not None and file.file_type and not file.error]
+            logger.info(f"일괄 업로드 파싱 시작: {len(pending)}/{len(files)}개 파일")
+            parsed_list = await asyncio.gather(
+                *(
+                    executors.run_cpu(parse_upload, files[index].source, files[index].file_name, files[index].file_type, target_column)
+                    for index in pending
+                ),
+                return_exceptions=True
+            )
+            parsed_items: List[Tuple[int, ParsedData]] = []
+            for index, parsed in zip(pending, parsed_list):
+                if isinstance(parsed, Exception):
+                    results[index].status = "failed"
+                    results[index].error = f"파일 파싱 실패: {str(parsed)}"
+                else:
+                    results[index].records_processed = parsed.row_count
+                    parsed_items.append((index, parsed))
+            
+            # 2. 관계 추출 (한 번의 배치 매핑)
+            relations: List[Optional[Dict[str, Any]]] = []
+            rule_version = None
+            if parsed_items:
+                relations, rule_version = await executors.run_inference(
+                    self._extract_batch_relations,
+                    [(files[index].file_name, parsed) for index, parsed in parsed_items],
+                    ontology_classes, relation_type, target_column, model_name
+                )
+            
+            rows: List[Dict[str, Any]] = []
+            records_processed = 0
+            for (index, parsed), row in zip(parsed_items, relations):
+                result = results[index]
+                if row is None:
+                    result.status = "failed"
+                    result.error = f"데이터셋 '{result.file_name}'을 온톨로지 클래스로 매핑할 수 없습니다."
+                    continue
+                result.status = "mapped"
+                result.target = row["Target"]
+                result.method = row["Method"]
+                result.confidence = row["Confidence"]
+                records_processed += parsed.row_count
+                rows.append(row)
+            
+            # 3. 저장소 반영 (모든 관계를 한 번의 쓰기로)
+            storage = get_ontology_storage()
+            if rows:
+                ontology_id = await asyncio.to_thread(
+                    self._store_relations, ontology_id, ontology_classes, pl.DataFrame(rows), relation_type
+                )
+            else:
+                logger.warning("일괄 업로드에서 매핑된 파일이 없어 저장소를 변경하지 않습니다.")
             
-            # URI 생성
-            source_uri = FACT[urllib.parse.quote(source)]
-            target_uri = FACT[urllib.parse.quote(target)]
+            # 4. 응답 생성 (Turtle 직렬화는 한 번만)
+            graph_turtle = ""
+            if include_graph and ontology_id:
+                graph_turtle = await asyncio.to_thread(storage.get_turtle, ontology_id) or ""
             
-            # 관계 추가
-            relation_predicate = FACT[relation_type]
-            g.add((source_uri, relation_predicate, target_uri))
+            counts = {status: sum(result.status == status for result in results) for status in ("mapped", "failed", "skipped")}
+            logger.info(
+                f"일괄 업로드 완료: ontology_id={ontology_id}, 매핑={counts['mapped']}개, "
+                f"실패={counts['failed']}개, 건너뜀={counts['skipped']}개"
+            )
+            return BatchUploadResponse(
+                message="일괄 업로드 및 온톨로지 구축 완료",
+                ontology_id=ontology_id,
+                files_received=len(files),
+                files_mapped=counts["mapped"],
+                files_failed=counts["failed"],
+                files_skipped=counts["skipped"],
+                records_processed=records_processed,
+                relations_added=len(rows),
+                files=results,
+                g=graph_turtle,
+                rule_version=rule_version
+            )
+            
+        except Exception as e:
+            logger.error(f"일괄 업로드 실패: {str(e)}", exc_info=True)
+            raise
+    
+    def _extract_relations(
+        self,
+        parsed: ParsedData,
+        file_name: str,
+        ontology_classes: List[str],
+        relation_type: str,
+        source_column: Optional[str],
+        target_column: Optional[str],
+        model_name: str,
+        count_target_classes: bool = False
+    ) -> Tuple[pl.DataFrame, str, Optional[Dict[str, int]]]:
+        """
+        관계 추출 단계
+        
+        Returns:
+            (관계 DataFrame, 키워드 사전 버전, 클래스별 행 수 (집계하지 않으면 None))
+        """
+        logger.info("관계 추출 시작")
+        extractor = RelationExtractor(ontology_classes, model_name)
+        relations_df = parsed.read_target(
+            lambda frame: extractor.extract_relations(
+                df=frame,
+                file_name=file_name,  # 파일명 전달 (데이터셋 전체를 하나의 클래스로 매핑)
+                relation_type=relation_type,
+                source_column=source_column,
+                target_column=target_column,
+                schema_fingerprint=parsed.schema_fingerprint
+            ),
+            file_name
+        )
+        
+        if len(relations_df) == 0:
+            raise ValueError("추출된 관계가 없습니다.")
         
-        return g
+        class_counts = None
+        if count_target_classes and target_column and target_column in parsed.columns:
+            class_counts = parsed.read_target(lambda frame: extractor.count_target_classes(frame, target_column), file_name)
+        
+        logger.info(f"관계 추출 완료: {len(relations_df)}개 관계")
+        return relations_df, extractor.rule_version, class_counts
     
-    def _add_relations_to_existing_ontology(
+    def _extract_batch_relations(
         self,
-        ontology_id: str,
-        relations_df,
+        items: List[Tuple[str, ParsedData]],
+        ontology_classes: List[str],
+        relation_type: str,
+        target_column: Optional[str],
+        model_name: str
+    ) -> Tuple[List[Optional[Dict[str, Any]]], str]:
+        """
+        일괄 업로드 관계 추출 단계 (매퍼 하나로 모든 파일 처리)
+        타겟 컬럼 직접 매핑은 파일별로 먼저 수행 (UTF-8이 아닌 CSV는 해당 파일만 전체 파싱으로 전환)
+        
+        Returns:
+            (파일별 관계 행 (매핑 실패는 None), 키워드 사전 버전)
+        """
+        extractor = RelationExtractor(ontology_classes, model_name)
+        direct_targets = [
+            parsed.read_target(lambda frame: extractor.find_direct_target(frame, target_column), file_name)
+            if target_column and target_column in parsed.columns else None
+            for file_name, parsed in items
+        ]
+        relations = extractor.extract_relations_batch(
+            [(file_name, parsed.frame) for file_name, parsed in items], relation_type, target_column,
+            [parsed.schema_fingerprint for _, parsed in items], direct_targets
+        )
+        return relations, extractor.rule_version
+    
+    def _store_relations(
+        self,
+        ontology_id: Optional[str],
+        ontology_classes: List[str],
+        relations_df: pl.DataFrame,
         relation_type: str
-    ) -> Graph:
+    ) -> str:
         """
-        기존 온톨로지에 관계 추가
+        저장소 반영 (기존 온톨로지는 새 트리플만 추가, 없으면 새로 저장)
         
         Args:
-            ontology_id: 온톨로지 ID
+            ontology_id: 기존 온톨로지 ID (None이면 새 온톨로지)
+            ontology_classes: 온톨로지 클래스 목록
             relations_df: 관계 DataFrame
             relation_type: 관계 타입
             
         Returns:
-            Graph: 병합된 RDF Graph
+            str: 온톨로지 ID
         """
         storage = get_ontology_storage()
-        existing = storage.get(ontology_id)
+        mapping_dict: List[Dict[str, Any]] = relations_df.to_dicts()
         
-        if not existing:
-            raise ValueError(f"온톨로지를 찾을 수 없습니다: {ontology_id}")
+        if ontology_id:
+            # 기존 온톨로지 업데이트 (전체 Graph 재파싱/재직렬화 없음)
+            logger.info(f"기존 온톨로지에 관계 추가: {ontology_id}")
+            storage.append_relations(ontology_id, mapping_dict, relation_type)
+            return ontology_id
         
-        # 기존 Graph 로드
-        from rdflib import Graph
-        from backend.services.ontology_services.rdf_parser import parse_rdf_graph
-        
-        existing_graph_str = existing["rdf_graph"]
-        
-        # 기존 Graph가 문자열인 경우 파싱
-        if isinstance(existing_graph_str, str):
-            g = Graph()
-            g.parse(data=existing_graph_str, format="turtle")
-        else:
-            g = existing_graph_str
-        
-        # 새 관계 추가
-        FACT = Namespace(FACT_URI)
+        # 새 온톨로지 저장
+        logger.info("새 온톨로지 생성")
+        ontology_id = str(uuid.uuid4())
+        build_response = BuildHybridOntologyResponse(
+            message="데이터 업로드 및 온톨로지 구축 완료",
+            ontology_id=ontology_id,
+            mapping_df=mapping_dict,
+            g=""
+        )
+        storage.save(build_response, ontology_classes, graph=relation_triples(mapping_dict, relation_type))
+        return ontology_id
+    
+    def _build_response(
+        self,
+        ontology_id: str,
+        file_name: str,
+        file_size: int,
+        parsed: ParsedData,
+        relations_df: pl.DataFrame,
+        graph_turtle: str,
+        rule_version: str,
+        target_class_counts: Optional[Dict[str, int]] = None
+    ) -> UploadDataResponse:
+        """
+        업로드 응답 생성
         
-        for row in relations_df.iter_rows(named=True):
-            source = str(row['Source'])
-            target = str(row['Target'])
-            
-            # URI 생성
-            source_uri = FACT[urllib.parse.quote(source)]
-            target_uri = FACT[urllib.parse.quote(target)]
-            
-            # 관계 추가
-            relation_predicate = FACT[relation_type]
-            g.add((source_uri, relation_predicate, target_uri))
+        Returns:
+            UploadDataResponse: 업로드 결과
+        """
+        logger.info(f"데이터 업로드 완료: ontology_id={ontology_id}, 관계={len(relations_df)}개")
         
-        return g
+        return UploadDataResponse(
+            message="데이터 업로드 및 온톨로지 구축 완료",
+            ontology_id=ontology_id,
+            file_name=file_name,
+            file_size=file_size,
+            records_processed=parsed.row_count,
+            relations_added=len(relations_df),
+            mapping_df=relations_df.to_dicts(),
+            g=graph_turtle,
+            rule_version=rule_version,
+            target_class_counts=target_class_counts
+        )
 
+def _source_size(file_content: FileSource) -> int:
+    """업로드 데이터 크기 (bytes)"""
+    if isinstance(file_content, str):
+        return os.path.getsize(file_content)
+    return len(file_content)
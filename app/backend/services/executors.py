@@ -0,0 +1,150 @@
+"""
+파이프라인 실행기
+업로드 파이프라인의 CPU 작업을 이벤트 루프 밖의 제한된 풀에서 실행
+- 파싱, RDF 구축/직렬화: 프로세스 풀 (GIL 회피)
+- 모델 추론: 전용 스레드 풀 (모델을 프로세스 내에서 공유)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+from backend.services.ontology_services.config import INFERENCE_THREAD_WORKERS, UPLOAD_PROCESS_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineExecutors:
+    """CPU 작업용 프로세스 풀과 추론용 스레드 풀 관리"""
+    
+    def __init__(
+        self,
+        process_workers: int = UPLOAD_PROCESS_WORKERS,
+        inference_workers: int = INFERENCE_THREAD_WORKERS
+    ):
+        """
+        실행기 초기화 (풀은 처음 사용할 때 생성)
+        
+        Args:
+            process_workers: 프로세스 풀 크기 (0이면 프로세스 풀 대신 스레드에서 실행)
+            inference_workers: 추론 스레드 풀 크기
+        """
+        self.process_workers = process_workers
+        self.inference_workers = max(1, inference_workers)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._inference_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._cpu_tasks = 0
+        self._inference_tasks = 0
+    
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        CPU 작업 실행 (파싱, RDF 구축 등)
+        
+        Args:
+            func: 모듈 수준 함수 (프로세스 간 pickle 가능해야 함)
+            
+        Returns:
+            함수 실행 결과
+        """
+        self._cpu_tasks += 1
+        call = functools.partial(func, *args, **kwargs)
+        if self.process_workers <= 0:
+            return await asyncio.to_thread(call)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_process_pool(), call)
+        except BrokenProcessPool:
+            # 워커 프로세스가 비정상 종료되면 풀을 새로 만들어 한 번 재시도
+            logger.warning("프로세스 풀이 손상되어 재생성합니다.")
+            self._reset_process_pool()
+            return await loop.run_in_executor(self._get_process_pool(), call)
+    
+    async def run_inference(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        모델 추론 작업 실행
+        
+        Args:
+            func: 실행할 함수
+            
+        Returns:
+            함수 실행 결과
+        """
+        self._inference_tasks += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_inference_pool(),
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    def shutdown(self) -> None:
+        """모든 풀 종료"""
+        with self._lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True, cancel_futures=True)
+                self._process_pool = None
+            if self._inference_pool is not None:
+                self._inference_pool.shutdown(wait=True, cancel_futures=True)
+                self._inference_pool = None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        실행기 통계
+        
+        Returns:
+            풀 크기와 실행 요청 수
+        """
+        return {
+            "process_workers": self.process_workers,
+            "inference_workers": self.inference_workers,
+            "cpu_tasks": self._cpu_tasks,
+            "inference_tasks": self._inference_tasks,
+        }
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀 조회 (없으면 생성)"""
+        with self._lock:
+            if self._process_pool is None:
+                # 모델/토크나이저 스레드가 있는 부모를 fork하지 않도록 spawn 사용
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(f"프로세스 풀 생성: {self.process_workers}개 워커")
+            return self._process_pool
+    
+    def _reset_process_pool(self) -> None:
+        """손상된 프로세스 풀 폐기"""
+        with self._lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+    
+    def _get_inference_pool(self) -> ThreadPoolExecutor:
+        """추론 스레드 풀 조회 (없으면 생성)"""
+        with self._lock:
+            if self._inference_pool is None:
+                self._inference_pool = ThreadPoolExecutor(
+                    max_workers=self.inference_workers,
+                    thread_name_prefix="inference",
+                )
+            return self._inference_pool
+
+
+# 전역 실행기 인스턴스
+_pipeline_executors = PipelineExecutors()
+
+
+def get_pipeline_executors() -> PipelineExecutors:
+    """
+    파이프라인 실행기 반환
+    
+    Returns:
+        PipelineExecutors 인스턴스
+    """
+    return _pipeline_executors
@@ -0,0 +1,77 @@
+"""
+파일명 매핑 서비스
+파일 내용 없이 파일명만으로 온톨로지 클래스 일괄 매핑
+"""
+
+import logging
+from typing import List
+from backend.services.ontology_services.hybrid_mapper import HybridMapper
+from backend.services.ontology_services.models import MappingResult
+from backend.schmas.ontology_schma import FilenameMappingItem
+
+logger = logging.getLogger(__name__)
+
+
+class FilenameMappingService:
+    """파일명 일괄 매핑 서비스"""
+    
+    def map_filenames(
+        self,
+        file_names: List[str],
+        ontology_classes: List[str],
+        model_name: str
+    ) -> List[FilenameMappingItem]:
+        """
+        파일명 일괄 매핑 (배치 매퍼 경로 사용)
+        
+        Args:
+            file_names: 파일명 목록
+            ontology_classes: 온톨로지 클래스 목록
+            model_name: 모델명
+            
+        Returns:
+            List[FilenameMappingItem]: 입력 순서와 같은 매핑 결과
+        """
+        mapper = HybridMapper(ontology_classes, model_name)
+        results = mapper.map_batch(file_names)
+        logger.info(f"파일명 일괄 매핑 완료: {len(results)}개")
+        return [self._to_item(result) for result in results]
+    
+    def create_mapper(self, ontology_classes: List[str], model_name: str) -> HybridMapper:
+        """
+        스트리밍 매핑용 매퍼 생성 (모델을 미리 로드하여 응답 시작 전에 로드 실패를 드러냄)
+        
+        Args:
+            ontology_classes: 온톨로지 클래스 목록
+            model_name: 모델명
+            
+        Returns:
+            HybridMapper: 모델이 로드된 매퍼
+        """
+        mapper = HybridMapper(ontology_classes, model_name)
+        mapper.semantic_mapper.model  # 최초 접근 시 레지스트리에서 로드
+        return mapper
+    
+    def map_chunk(self, mapper: HybridMapper, file_names: List[str]) -> List[FilenameMappingItem]:
+        """
+        파일명 청크 하나 매핑 (스트리밍 응답에서 청크마다 추론 실행기에서 호출)
+        
+        Args:
+            mapper: create_mapper로 만든 매퍼
+            file_names: 파일명 청크
+            
+        Returns:
+            List[FilenameMappingItem]: 입력 순서와 같은 매핑 결과
+        """
+        return [self._to_item(result) for result in mapper.map_batch(file_names)]
+    
+    @staticmethod
+    def _to_item(result: MappingResult) -> FilenameMappingItem:
+        """MappingResult를 응답 아이템으로 변환"""
+        return FilenameMappingItem(
+            file_name=result.filename,
+            mapped_class=result.mapped_class,
+            confidence=round(result.confidence, 3),
+            method=result.method,
+            interpreted_as=result.interpreted_as,
+        )
@@ -0,0 +1,199 @@
+"""
+폴더 감시 수집 모듈
+입력 폴더를 주기적으로 다시 스캔하여 매니페스트와 비교하고, 새 파일과 내용이 바뀐 파일만 대상 온톨로지에 추가
+"""
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from backend.services.bulk_ingestion import BulkIngestion, DataFile, discover_files
+from backend.services.ingestion_manifest import IngestionManifest, ManifestEntry
+from backend.services.ontology_storage import OntologyStorage, get_ontology_storage
+from backend.services.ontology_services.ontology_builder import relation_triples
+from backend.services.ontology_services.utils import file_sha256
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+
+logger = logging.getLogger(__name__)
+
+# 매니페스트 메타데이터에 기록하는 대상 온톨로지 ID 키
+ONTOLOGY_ID_KEY = "ontology_id"
+
+
+@dataclass
+class WatchScanReport:
+    """재스캔 한 번의 결과"""
+    files_seen: int = 0
+    files_unchanged: int = 0  # 크기/수정 시각이 같아 읽지 않은 파일
+    files_touched: int = 0  # 수정 시각만 바뀌고 내용 해시가 같은 파일
+    files_ingested: int = 0
+    files_failed: int = 0
+    files_removed: int = 0
+    relations_added: int = 0
+    elapsed_seconds: float = 0.0
+    ontology_id: Optional[str] = None
+    
+    @property
+    def changed(self) -> bool:
+        """수집하거나 매니페스트를 갱신한 파일이 있는지 여부"""
+        return bool(self.files_touched or self.files_ingested or self.files_failed or self.files_removed)
+
+
+class FolderWatcher:
+    """
+    폴더 감시 수집기
+    - 크기와 수정 시각이 매니페스트와 같으면 파일을 읽지 않고 건너뜀
+    - 달라진 파일만 SHA-256을 계산하여 내용이 실제로 바뀐 파일만 수집
+    - 관계는 저장소에 한 번 추가한 뒤 매니페스트에 기록 (저장소 쓰기가 실패하면 다음 스캔에서 다시 시도)
+    - 다시 수집한 파일의 기존 관계/매핑 행은 새 결과로 교체 (분류가 바뀐 파일이 이전 클래스를 함께 유지하지 않도록 함,
+      저장 후 매니페스트 기록 전에 중단되어 다시 수집하는 경우에도 중복 행이 생기지 않음)
+    """
+    
+    def __init__(
+        self,
+        input_folder: str,
+        ingestion: BulkIngestion,
+        manifest: IngestionManifest,
+        ontology_id: Optional[str] = None,
+        storage: Optional[OntologyStorage] = None
+    ):
+        """
+        감시 수집기 초기화
+        
+        Args:
+            input_folder: 입력 폴더 경로
+            ingestion: 파싱/매핑을 수행할 일괄 수집기
+            manifest: 수집 매니페스트
+            ontology_id: 대상 온톨로지 ID (None이면 매니페스트에 기록된 ID, 없으면 첫 수집 때 새로 생성)
+            storage: 온톨로지 저장소 (None이면 전역 저장소)
+        """
+        self.input_folder = input_folder
+        self.ingestion = ingestion
+        self.manifest = manifest
+        self.storage = storage or get_ontology_storage()
+        self.ontology_id = ontology_id or manifest.get_meta(ONTOLOGY_ID_KEY)
+        if ontology_id:
+            manifest.set_meta(ONTOLOGY_ID_KEY, ontology_id)
+    
+    def scan_once(self) -> WatchScanReport:
+        """
+        입력 폴더를 한 번 스캔하여 새 파일과 변경된 파일 수집
+        
+        Returns:
+            WatchScanReport: 스캔 결과
+        """
+        started = time.perf_counter()
+        now = datetime.now().isoformat()
+        files = discover_files(self.input_folder)
+        report = WatchScanReport(files_seen=len(files), ontology_id=self.ontology_id)
+        
+        touched: List[ManifestEntry] = []
+        candidates: List[DataFile] = []
+        hashes: Dict[str, str] = {}
+        for data_file in files:
+            entry = self.manifest.get(data_file.name)
+            if entry is not None and entry.size == data_file.size and entry.mtime_ns == data_file.mtime_ns:
+                report.files_unchanged += 1
+                continue
+            
+            try:
+                digest = file_sha256(data_file.path)
+            except OSError as e:
+                # 스캔과 해시 계산 사이에 삭제/이동된 파일은 다음 스캔에서 다시 확인
+                logger.warning(f"파일 해시 계산 실패: {data_file.name}, {str(e)}")
+                continue
+            if entry is not None and entry.sha256 == digest:
+                touched.append(ManifestEntry(data_file.name, data_file.size, data_file.mtime_ns, digest, entry.status, now))
+                continue
+            candidates.append(data_file)
+            hashes[data_file.name] = digest
+        
+        updates = touched
+        if candidates:
+            relations, ingestion_report = self.ingestion.build_relations(candidates)
+            if relations or self.ontology_id:
+                self._store(relations, [data_file.name for data_file in candidates])
+                report.ontology_id = self.ontology_id
+            failed = {name for name, _ in ingestion_report.failures}
+            updates = touched + [
+                ManifestEntry(
+                    data_file.name, data_file.size, data_file.mtime_ns, hashes[data_file.name],
+                    "failed" if data_file.name in failed else "ingested", now
+                )
+                for data_file in candidates
+            ]
+            report.files_ingested = ingestion_report.files_mapped
+            report.files_failed = ingestion_report.files_failed
+            report.relations_added = len(relations)
+        
+        seen = {data_file.name for data_file in files}
+        report.files_touched = len(touched)
+        self.manifest.update(updates)
+        report.files_removed = self.manifest.remove([name for name in self.manifest.names() if name not in seen])
+        
+        report.elapsed_seconds = time.perf_counter() - started
+        if report.changed:
+            logger.info(
+                f"폴더 스캔: {report.files_seen}개 파일, 수집 {report.files_ingested}개, 실패 {report.files_failed}개, "
+                f"내용 동일 {report.files_touched}개, 삭제 {report.files_removed}개 ({report.elapsed_seconds:.2f}s)"
+            )
+        return report
+    
+    def run(
+        self,
+        interval: float,
+        max_scans: Optional[int] = None,
+        on_scan: Optional[Callable[[WatchScanReport], Any]] = None
+    ) -> int:
+        """
+        interval초마다 재스캔 (Ctrl+C 또는 max_scans 도달 시 종료)
+        
+        Args:
+            interval: 스캔 간격 (초)
+            max_scans: 최대 스캔 횟수 (None이면 계속)
+            on_scan: 스캔마다 결과를 받을 콜백
+            
+        Returns:
+            int: 수행한 스캔 횟수
+        """
+        scans = 0
+        try:
+            while max_scans is None or scans < max_scans:
+                if scans:
+                    time.sleep(interval)
+                scans += 1
+                try:
+                    report = self.scan_once()
+                except Exception as e:
+                    # 저장소 쓰기 실패 등은 매니페스트를 갱신하지 않았으므로 다음 스캔에서 다시 시도
+                    logger.error(f"폴더 스캔 실패: {str(e)}", exc_info=True)
+                    continue
+                if on_scan:
+                    on_scan(report)
+        except KeyboardInterrupt:
+            logger.info("폴더 감시 종료")
+        return scans
+    
+    def _store(self, relations: List[Dict[str, Any]], sources: List[str]) -> None:
+        """
+        관계를 대상 온톨로지에 한 번에 추가 (대상이 없으면 새로 생성하고 매니페스트에 기록)
+        sources에 해당하는 기존 관계와 매핑 행은 새 관계로 교체 (새 관계가 없는 파일은 기존 관계만 제거)
+        """
+        relation_type = self.ingestion.relation_type
+        if self.ontology_id:
+            self.storage.append_relations(self.ontology_id, relations, relation_type, replace_sources=sources)
+        else:
+            ontology_id = str(uuid.uuid4())
+            build_response = BuildHybridOntologyResponse(
+                message="폴더 감시 수집으로 온톨로지 구축 완료",
+                ontology_id=ontology_id,
+                mapping_df=relations,
+                g=""
+            )
+            self.storage.save(build_response, self.ingestion.ontology_classes, graph=relation_triples(relations, relation_type))
+            self.manifest.set_meta(ONTOLOGY_ID_KEY, ontology_id)
+            self.ontology_id = ontology_id
+            logger.info(f"폴더 감시 수집 대상 온톨로지 생성: {ontology_id}")
+        self.storage.flush()
@@ -0,0 +1,296 @@
+"""
+업로드 작업 큐
+큰 업로드를 HTTP 연결과 분리하여 제한된 대기 큐와 워커 스레드에서 처리하고 단계별 진행 상황을 보관
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from backend.schmas.ontology_schma import IngestionJobResponse, UploadDataResponse
+from backend.services.data_upload_service import DataUploadService
+from backend.services.upload_buffer import UploadBuffer
+from backend.services.ontology_services.config import (
+    INGESTION_JOB_HISTORY,
+    INGESTION_JOB_QUEUE_SIZE,
+    INGESTION_JOB_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # 워커 종료 신호
+
+
+class IngestionQueueFullError(ValueError):
+    """대기 큐가 가득 차 작업을 받을 수 없음"""
+    
+    def __init__(self, max_queue: int):
+        self.max_queue = max_queue
+        super().__init__(f"업로드 작업 대기열이 가득 찼습니다 (최대 {max_queue}개). 잠시 후 다시 시도하세요.")
+
+
+@dataclass
+class IngestionJob:
+    """업로드 작업 상태"""
+    job_id: str
+    file_name: str
+    status: str = "queued"  # queued, running, succeeded, failed
+    stage: str = "queued"
+    progress: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[UploadDataResponse] = None
+    error: Optional[str] = None
+    
+    def to_response(self) -> IngestionJobResponse:
+        """상태 조회 응답으로 변환"""
+        return IngestionJobResponse(
+            job_id=self.job_id,
+            file_name=self.file_name,
+            status=self.status,
+            stage=self.stage,
+            progress=dict(self.progress),
+            created_at=_isoformat(self.created_at),
+            started_at=_isoformat(self.started_at),
+            finished_at=_isoformat(self.finished_at),
+            wait_seconds=(self.started_at or time.time()) - self.created_at,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class IngestionJobQueue:
+    """
+    업로드 작업 큐
+    - 대기 큐 크기를 제한하여 넘치면 즉시 거부 (backpressure)
+    - 워커 스레드마다 이벤트 루프를 두고 비동기 업로드 파이프라인 실행 (파싱/추론은 파이프라인 실행기 사용)
+    """
+    
+    def __init__(
+        self,
+        workers: int = INGESTION_JOB_WORKERS,
+        max_queue: int = INGESTION_JOB_QUEUE_SIZE,
+        history: int = INGESTION_JOB_HISTORY,
+        service: Optional[DataUploadService] = None
+    ):
+        """
+        작업 큐 초기화 (워커 스레드는 처음 작업을 받을 때 시작)
+        
+        Args:
+            workers: 워커 스레드 수
+            max_queue: 최대 대기 작업 수
+            history: 상태 조회를 위해 보관할 최근 작업 수
+            service: 업로드 서비스 (None이면 새로 생성)
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.history = history
+        self._service = service or DataUploadService()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.max_queue)
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self._started = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+    
+    def submit(self, upload_buffer: UploadBuffer, file_name: str, params: Dict[str, Any]) -> IngestionJob:
+        """
+        작업 등록 (즉시 반환)
+        
+        Args:
+            upload_buffer: 수신한 업로드 (작업이 끝나면 큐가 닫음)
+            file_name: 파일명
+            params: upload_and_build_ontology_async 인자 (file_content, file_name 제외)
+            
+        Returns:
+            IngestionJob: 등록된 작업
+            
+        Raises:
+            IngestionQueueFullError: 대기 큐가 가득 찬 경우 (upload_buffer는 호출자가 닫음)
+        """
+        job = IngestionJob(job_id=str(uuid.uuid4()), file_name=file_name)
+        self._ensure_workers()
+        with self._lock:
+            try:
+                self._queue.put_nowait((job, upload_buffer, params))
+            except queue.Full:
+                self._rejected += 1
+                logger.warning(f"업로드 작업 거부 (대기열 가득 참): 파일={file_name}")
+                raise IngestionQueueFullError(self.max_queue)
+            self._submitted += 1
+            self._jobs[job.job_id] = job
+            self._trim_history()
+        
+        logger.info(f"업로드 작업 등록: job_id={job.job_id}, 파일={file_name}, 대기={self._queue.qsize()}개")
+        return job
+    
+    def get(self, job_id: str) -> Optional[IngestionJobResponse]:
+        """
+        작업 상태 조회
+        
+        Args:
+            job_id: 작업 ID
+            
+        Returns:
+            IngestionJobResponse 또는 None (없거나 보관 기간이 지난 경우)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_response() if job is not None else None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        작업 큐 통계
+        
+        Returns:
+            대기/실행 중 작업 수, 등록/거부/성공/실패 수, 대기/처리 시간
+        """
+        with self._lock:
+            finished = self._started - self._running
+            oldest = next((job for job in self._jobs.values() if job.status == "queued"), None)
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queued": self._queue.qsize(),
+                "running": self._running,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "avg_wait_sec": self._wait_total / self._started if self._started else 0.0,
+                "max_wait_sec": self._wait_max,
+                "oldest_queued_sec": time.time() - oldest.created_at if oldest is not None else 0.0,
+                "avg_run_sec": self._run_total / finished if finished else 0.0,
+            }
+    
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """
+        워커 종료 (실행 중인 작업은 끝까지 처리, 대기 중인 작업은 실패 처리)
+        
+        Args:
+            timeout: 워커별 종료 대기 시간 (초)
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        while True:
+            try:
+                job, upload_buffer, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            upload_buffer.close()
+            self._finish(job, error="서버 종료로 작업이 취소되었습니다.")
+        for _ in threads:
+            self._queue.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+    
+    def _ensure_workers(self) -> None:
+        """워커 스레드 시작 (이미 시작했으면 무시)"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"ingestion-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            logger.info(f"업로드 작업 워커 시작: {self.workers}개, 최대 대기 {self.max_queue}개")
+    
+    def _worker_loop(self) -> None:
+        """큐에서 작업을 꺼내 처리"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._run(*item)
+    
+    def _run(self, job: IngestionJob, upload_buffer: UploadBuffer, params: Dict[str, Any]) -> None:
+        """작업 하나 실행 (워커 스레드의 이벤트 루프에서 업로드 파이프라인 실행, 끝나면 업로드 버퍼를 닫음)"""
+        with self._lock:
+            job.status = "running"
+            job.started_at = time.time()
+            wait = job.started_at - job.created_at
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._started += 1
+            self._running += 1
+        logger.info(f"업로드 작업 시작: job_id={job.job_id}, 대기 {wait:.2f}초")
+        
+        def progress(stage: str, updates: Dict[str, Any]) -> None:
+            with self._lock:
+                job.stage = stage
+                job.progress.update(updates)
+        
+        result, error = None, None
+        try:
+            result = asyncio.run(self._service.upload_and_build_ontology_async(
+                file_content=upload_buffer.source(),
+                file_name=job.file_name,
+                progress=progress,
+                **params
+            ))
+        except Exception as e:
+            logger.error(f"업로드 작업 실패: job_id={job.job_id}, error={str(e)}", exc_info=True)
+            error = str(e)
+        finally:
+            upload_buffer.close()
+        self._finish(job, result=result, error=error)
+    
+    def _finish(self, job: IngestionJob, result: Optional[UploadDataResponse] = None, error: Optional[str] = None) -> None:
+        """작업 완료 처리"""
+        with self._lock:
+            if job.started_at is not None:
+                self._running -= 1
+            job.finished_at = time.time()
+            job.stage = "done"
+            job.result = result
+            job.error = error
+            if error is None:
+                job.status = "succeeded"
+                self._succeeded += 1
+            else:
+                job.status = "failed"
+                self._failed += 1
+            if job.started_at is not None:
+                self._run_total += job.finished_at - job.started_at
+        logger.info(f"업로드 작업 완료: job_id={job.job_id}, 상태={job.status}")
+    
+    def _trim_history(self) -> None:
+        """보관 수를 넘은 오래된 완료 작업 제거 (lock 안에서 호출)"""
+        excess = len(self._jobs) - self.history
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished_at is not None][:excess]:
+            del self._jobs[job_id]
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """epoch 초를 ISO 형식 문자열로 변환"""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+# 전역 작업 큐 인스턴스
+_ingestion_job_queue = IngestionJobQueue()
+
+
+def get_ingestion_job_queue() -> IngestionJobQueue:
+    """
+    업로드 작업 큐 반환
+    
+    Returns:
+        IngestionJobQueue 인스턴스
+    """
+    return _ingestion_job_queue
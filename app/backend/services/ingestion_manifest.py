@@ -0,0 +1,180 @@
+"""
+수집 매니페스트 모듈
+폴더 감시 수집에서 처리한 파일의 (경로, 크기, 수정 시각, 내용 해시)를 SQLite에 보관하여 재시작 후에도 변경된 파일만 수집
+"""
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from backend.services.ontology_services.config import INGEST_MANIFEST_WRITE_BATCH
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """매니페스트 항목 (status: ingested 또는 failed, 실패한 파일도 내용이 바뀔 때까지 다시 시도하지 않음)"""
+    name: str  # 입력 폴더 기준 상대 경로
+    size: int
+    mtime_ns: int
+    sha256: str
+    status: str
+    updated_at: str
+
+
+class IngestionManifest:
+    """
+    SQLite 수집 매니페스트
+    - 항목은 열 때 한 번 읽어 메모리에 유지 (재스캔 시 디스크 조회 없음)
+    - 갱신은 write_batch개씩 executemany로 한 트랜잭션에 기록
+    """
+    
+    def __init__(self, path: str, write_batch: int = INGEST_MANIFEST_WRITE_BATCH):
+        """
+        매니페스트 열기 (파일이 없으면 생성)
+        
+        Args:
+            path: SQLite 파일 경로
+            write_batch: 트랜잭션 하나에 기록할 최대 행 수
+        """
+        self.path = Path(path)
+        self.write_batch = max(1, write_batch)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._transactions = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS manifest_files (
+                name TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                status TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS manifest_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self._entries: Dict[str, ManifestEntry] = {
+            row[0]: ManifestEntry(*row)
+            for row in self._conn.execute(
+                "SELECT name, size, mtime_ns, sha256, status, updated_at FROM manifest_files"
+            )
+        }
+        logger.info(f"수집 매니페스트 열기: {self.path}, {len(self._entries)}개 항목")
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, name: str) -> Optional[ManifestEntry]:
+        """
+        항목 조회
+        
+        Args:
+            name: 입력 폴더 기준 상대 경로
+            
+        Returns:
+            ManifestEntry 또는 None
+        """
+        return self._entries.get(name)
+    
+    def names(self) -> List[str]:
+        """기록된 파일 경로 목록"""
+        return list(self._entries)
+    
+    def update(self, entries: Iterable[ManifestEntry]) -> int:
+        """
+        항목 추가/갱신 (write_batch개씩 한 트랜잭션으로 기록)
+        
+        Args:
+            entries: 기록할 항목
+            
+        Returns:
+            int: 기록한 항목 수
+        """
+        rows = [
+            (entry.name, entry.size, entry.mtime_ns, entry.sha256, entry.status, entry.updated_at)
+            for entry in entries
+        ]
+        self._execute_batches(
+            "INSERT OR REPLACE INTO manifest_files (name, size, mtime_ns, sha256, status, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        for row in rows:
+            self._entries[row[0]] = ManifestEntry(*row)
+        return len(rows)
+    
+    def remove(self, names: Iterable[str]) -> int:
+        """
+        항목 삭제 (입력 폴더에서 사라진 파일)
+        
+        Args:
+            names: 삭제할 파일 경로
+            
+        Returns:
+            int: 삭제한 항목 수
+        """
+        rows = [(name,) for name in names if name in self._entries]
+        self._execute_batches("DELETE FROM manifest_files WHERE name = ?", rows)
+        for (name,) in rows:
+            del self._entries[name]
+        return len(rows)
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """
+        메타데이터 조회 (예: 수집 대상 온톨로지 ID)
+        
+        Returns:
+            값 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM manifest_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str) -> None:
+        """메타데이터 저장"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO manifest_meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        매니페스트 통계
+        
+        Returns:
+            항목 수, 기록한 행 수, 트랜잭션 수
+        """
+        return {
+            "entries": len(self._entries),
+            "writes": self._writes,
+            "transactions": self._transactions,
+        }
+    
+    def close(self) -> None:
+        """매니페스트 닫기"""
+        with self._lock:
+            self._conn.close()
+    
+    def _execute_batches(self, sql: str, rows: List[tuple]) -> None:
+        """행을 write_batch개씩 나누어 트랜잭션마다 executemany로 기록"""
+        with self._lock:
+            for start in range(0, len(rows), self.write_batch):
+                batch = rows[start:start + self.write_batch]
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(sql, batch)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._writes += len(batch)
+                self._transactions += 1
@@ -0,0 +1,148 @@
+"""
+통합 그래프 인덱스
+저장소 변경 이벤트로 온톨로지별 노드/엣지를 증분 유지하여 통합 그래프를 출력 크기에 비례하는 시간에 조립
+"""
+
+import bisect
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from backend.services.ontology_storage import OrderKey, get_ontology_storage
+from backend.services.ontology_services.rdf_parser import store_to_nodes_edges
+from backend.services.ontology_services.triple_store import CompactTripleStore
+
+logger = logging.getLogger(__name__)
+
+
+class MergedGraphIndex:
+    """
+    통합 그래프 인덱스
+    - 노드: 온톨로지별 노드와 노드 ID별 참조 카운트(해당 노드를 포함한 온톨로지 수)를 유지
+    - 엣지: 온톨로지별 엣지 목록을 유지
+    - 통합 뷰는 (생성일시, 온톨로지 ID) 기준 최신 온톨로지부터 이어붙임 (이벤트 도착 순서와 무관)
+    """
+    
+    def __init__(self):
+        """인덱스 초기화"""
+        self._node_refs: Dict[str, int] = {}
+        self._ontology_nodes: Dict[str, Dict[str, Dict[str, str]]] = {}  # 온톨로지 ID -> 노드 ID -> 노드
+        self._ontology_edges: Dict[str, List[Dict[str, str]]] = {}
+        self._order: List[OrderKey] = []  # 생성일시 오름차순
+        self._order_keys: Dict[str, OrderKey] = {}
+        self._edge_count = 0
+        self._version = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def version(self) -> int:
+        """인덱스 버전 (변경 이벤트마다 1씩 증가)"""
+        return self._version
+    
+    def on_storage_event(self, event: str, ontology_id: str, triples: CompactTripleStore, created_at: str) -> None:
+        """
+        저장소 변경 이벤트 처리 (OntologyStorage.subscribe로 등록)
+        
+        Args:
+            event: "save", "append", "delete"
+            ontology_id: 온톨로지 ID
+            triples: 온톨로지 트리플 전체 또는 새로 추가된 트리플
+            created_at: 온톨로지 생성일시 (통합 뷰 정렬 기준)
+        """
+        # 노드/엣지 변환은 이벤트로 받은 트리플에만 비례
+        graph_data = store_to_nodes_edges(triples) if event != "delete" else None
+        
+        with self._lock:
+            if event in ("save", "delete"):
+                self._remove_ontology(ontology_id)
+            if graph_data is not None:
+                self._add_to_ontology(ontology_id, (created_at, ontology_id), graph_data)
+            self._version += 1
+    
+    def snapshot(self) -> Tuple[int, List[Dict[str, str]], List[Dict[str, str]], int]:
+        """
+        통합 그래프 조립 (미리 계산된 노드/엣지를 최신 온톨로지부터 이어붙이기만 함)
+        같은 ID의 노드는 가장 최신 온톨로지의 노드를 사용
+        
+        Returns:
+            (인덱스 버전, 노드 목록, 엣지 목록 (최신 온톨로지부터), 온톨로지 수)
+        """
+        with self._lock:
+            nodes: Dict[str, Dict[str, str]] = {}
+            edges: List[Dict[str, str]] = []
+            for _, ontology_id in reversed(self._order):
+                for node_id, node in self._ontology_nodes[ontology_id].items():
+                    nodes.setdefault(node_id, node)
+                edges.extend(self._ontology_edges[ontology_id])
+            return self._version, list(nodes.values()), edges, len(self._order)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        인덱스 통계
+        
+        Returns:
+            버전, 온톨로지/노드/엣지 수
+        """
+        with self._lock:
+            return {
+                "version": self._version,
+                "ontologies": len(self._order),
+                "nodes": len(self._node_refs),
+                "edges": self._edge_count,
+            }
+    
+    def _add_to_ontology(self, ontology_id: str, key: OrderKey, graph_data: Dict[str, List]) -> None:
+        """온톨로지에 노드/엣지 추가 (lock 안에서 호출, 처음 추가하는 온톨로지는 정렬 위치에 등록)"""
+        if ontology_id not in self._order_keys:
+            self._order_keys[ontology_id] = key
+            bisect.insort(self._order, key)
+            self._ontology_nodes[ontology_id] = {}
+            self._ontology_edges[ontology_id] = []
+        
+        ontology_nodes = self._ontology_nodes[ontology_id]
+        for node in graph_data["nodes"]:
+            node_id = node["id"]
+            if node_id in ontology_nodes:
+                continue
+            ontology_nodes[node_id] = node
+            self._node_refs[node_id] = self._node_refs.get(node_id, 0) + 1
+        
+        self._ontology_edges[ontology_id].extend(graph_data["edges"])
+        self._edge_count += len(graph_data["edges"])
+    
+    def _remove_ontology(self, ontology_id: str) -> None:
+        """온톨로지의 노드 참조와 엣지 제거 (lock 안에서 호출)"""
+        key = self._order_keys.pop(ontology_id, None)
+        if key is None:
+            return
+        del self._order[bisect.bisect_left(self._order, key)]
+        
+        for node_id in self._ontology_nodes.pop(ontology_id):
+            refs = self._node_refs[node_id] - 1
+            if refs:
+                self._node_refs[node_id] = refs
+            else:
+                del self._node_refs[node_id]
+        
+        self._edge_count -= len(self._ontology_edges.pop(ontology_id))
+
+
+# 전역 인덱스 인스턴스 (처음 사용할 때 저장소에 등록)
+_merged_graph_index: Optional[MergedGraphIndex] = None
+_merged_graph_index_lock = threading.Lock()
+
+
+def get_merged_graph_index() -> MergedGraphIndex:
+    """
+    통합 그래프 인덱스 인스턴스 반환 (처음 호출 시 전역 저장소의 변경 이벤트 구독)
+    
+    Returns:
+        MergedGraphIndex 인스턴스
+    """
+    global _merged_graph_index
+    with _merged_graph_index_lock:
+        if _merged_graph_index is None:
+            index = MergedGraphIndex()
+            get_ontology_storage().subscribe(index.on_storage_event)
+            _merged_graph_index = index
+            logger.info("통합 그래프 인덱스 초기화 완료")
+        return _merged_graph_index
@@ -4,10 +4,11 @@
 """
 
 import logging
-from typing import List, Dict, Any
-from rdflib import Graph
+import threading
+from typing import Dict, Any, Optional, Tuple
+from backend.services.merged_graph_index import get_merged_graph_index
 from backend.services.ontology_storage import get_ontology_storage
-from backend.services.ontology_services.rdf_parser import parse_rdf_graph
+from backend.services.ontology_services.rdf_parser import store_to_nodes_edges
 from backend.schmas.ontology_schma import (
     GetHybridOntologyResponse,
     ListOntologiesResponse,
@@ -23,6 +24,13 @@ logger = logging.getLogger(__name__)
 class OntologyService:
     """온톨로지 관련 비즈니스 로직 처리"""
     
+    def __init__(self):
+        """서비스 초기화 (온톨로지별 그래프 투영 캐시: ID -> (저장소 버전, 응답))"""
+        self._graph_cache: Dict[str, Tuple[int, OntologyGraphResponse]] = {}
+        self._graph_cache_lock = threading.Lock()
+        self._graph_cache_hits = 0
+        self._graph_cache_misses = 0
+    
     def get_hybrid_ontology(self, ontology_id: str) -> GetHybridOntologyResponse:
         """
         온톨로지 조회
@@ -49,15 +57,28 @@ class OntologyService:
             g=ontology["rdf_graph"],
         )
     
-    def list_ontologies(self) -> ListOntologiesResponse:
+    def list_ontologies(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        ontology_class: Optional[str] = None
+    ) -> ListOntologiesResponse:
         """
-        온톨로지 목록 조회
+        온톨로지 목록 조회 (커서 페이지네이션, 페이지 크기에 비례하는 시간)
         
+        Args:
+            limit: 페이지 크기 (None이면 전체)
+            after: 이전 응답의 next_cursor
+            ontology_class: 이 클래스를 사용한 온톨로지만 조회
+            
         Returns:
             ListOntologiesResponse: 목록 조회 결과
+            
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
         """
         storage = get_ontology_storage()
-        all_ontologies = storage.list_all()
+        page, total, next_cursor = storage.list_page(limit=limit, after=after, ontology_class=ontology_class)
         
         # 목록 아이템으로 변환
         items = [
@@ -67,13 +88,14 @@ class OntologyService:
                 ontology_classes=ont["ontology_classes"],
                 mapping_count=ont["mapping_count"],
             )
-            for ont in all_ontologies
+            for ont in page
         ]
         
         return ListOntologiesResponse(
             message="온톨로지 목록 조회 완료",
-            total=len(items),
+            total=total,
             ontologies=items,
+            next_cursor=next_cursor,
         )
     
     def get_ontology_graph(self, ontology_id: str) -> OntologyGraphResponse:
@@ -86,26 +108,39 @@ class OntologyService:
         Returns:
             OntologyGraphResponse: 그래프 데이터
         """
-        storage = get_ontology_storage()
-        ontology = storage.get(ontology_id)
+        return self.get_ontology_graph_versioned(ontology_id)[1]
+    
+    def get_ontology_graph_versioned(self, ontology_id: str) -> Tuple[int, OntologyGraphResponse]:
+        """
+        온톨로지 그래프 데이터와 저장소 버전 조회
+        저장소 버전이 바뀌지 않았으면 캐시된 노드/엣지 투영을 그대로 반환
         
-        if not ontology:
-            raise ValueError(f"온톨로지를 찾을 수 없습니다: {ontology_id}")
+        Args:
+            ontology_id: 온톨로지 ID
+            
+        Returns:
+            Tuple[int, OntologyGraphResponse]: (저장소 버전, 그래프 데이터)
+        """
+        storage = get_ontology_storage()
+        version = storage.version(ontology_id)
         
-        # 저장된 rdf_graph 타입 확인
-        rdf_graph = ontology["rdf_graph"]
-        logger.debug(f"저장된 RDF Graph 타입: {type(rdf_graph)}")
+        with self._graph_cache_lock:
+            if version is None:
+                self._graph_cache.pop(ontology_id, None)
+                raise ValueError(f"온톨로지를 찾을 수 없습니다: {ontology_id}")
+            
+            cached = self._graph_cache.get(ontology_id)
+            if cached is not None and cached[0] == version:
+                self._graph_cache_hits += 1
+                return cached
+            self._graph_cache_misses += 1
         
-        # Graph 객체인 경우 직렬화
-        if isinstance(rdf_graph, Graph):
-            logger.warning("저장된 RDF Graph가 Graph 객체입니다. 직렬화합니다.")
-            rdf_graph = rdf_graph.serialize(format="turtle")
-            if isinstance(rdf_graph, bytes):
-                rdf_graph = rdf_graph.decode('utf-8')
-            rdf_graph = str(rdf_graph)
+        # 저장소의 트리플 ID 배열에서 직접 투영 (Turtle 직렬화/파싱 없음)
+        projected = storage.read_graph_versioned(ontology_id, store_to_nodes_edges)
         
-        # RDF Graph 파싱
-        graph_data = parse_rdf_graph(rdf_graph)
+        if projected is None:
+            raise ValueError(f"온톨로지를 찾을 수 없습니다: {ontology_id}")
+        version, graph_data = projected
         
         # 스키마 객체로 변환
         nodes = [
@@ -126,24 +161,48 @@ class OntologyService:
             for edge in graph_data["edges"]
         ]
         
-        return OntologyGraphResponse(
+        result = OntologyGraphResponse(
             message="온톨로지 그래프 조회 완료",
             ontology_id=ontology_id,
             nodes=nodes,
             edges=edges,
         )
+        
+        with self._graph_cache_lock:
+            # 동시에 더 새로운 버전이 캐시되었으면 덮어쓰지 않음
+            cached = self._graph_cache.get(ontology_id)
+            if cached is None or cached[0] < version:
+                self._graph_cache[ontology_id] = (version, result)
+        
+        return version, result
+    
+    def graph_cache_stats(self) -> Dict[str, Any]:
+        """
+        그래프 투영 캐시 통계
+        
+        Returns:
+            캐시 항목 수, 히트/미스 횟수
+        """
+        with self._graph_cache_lock:
+            return {
+                "entries": len(self._graph_cache),
+                "hits": self._graph_cache_hits,
+                "misses": self._graph_cache_misses,
+            }
     
     def get_merged_ontology_graph(self) -> OntologyGraphResponse:
         """
         모든 온톨로지를 통합한 그래프 데이터 조회
+        저장소 변경 시 증분 갱신되는 통합 인덱스에서 조립 (출력 크기에 비례)
         
         Returns:
             OntologyGraphResponse: 통합된 그래프 데이터
         """
-        storage = get_ontology_storage()
-        all_ontologies = storage.list_all()
+        index = get_merged_graph_index()
+        get_ontology_storage().sync()  # 다른 워커의 변경을 인덱스에 반영
+        index_version, nodes, edges, ontology_count = index.snapshot()
         
-        if not all_ontologies:
+        if not ontology_count:
             return OntologyGraphResponse(
                 message="통합 온톨로지 그래프 조회 완료 (온톨로지 없음)",
                 ontology_id="merged",
@@ -151,48 +210,12 @@ class OntologyService:
                 edges=[],
             )
         
-        # 모든 온톨로지의 노드와 엣지를 병합
-        all_nodes: Dict[str, OntologyGraphNode] = {}
-        all_edges: List[OntologyGraphEdge] = []
-        
-        for ontology in all_ontologies:
-            rdf_graph = ontology["rdf_graph"]
-            
-            # Graph 객체인 경우 직렬화
-            if isinstance(rdf_graph, Graph):
-                logger.debug(f"온톨로지 {ontology['ontology_id']}: Graph 객체를 직렬화합니다.")
-                rdf_graph = rdf_graph.serialize(format="turtle")
-                if isinstance(rdf_graph, bytes):
-                    rdf_graph = rdf_graph.decode('utf-8')
-                rdf_graph = str(rdf_graph)
-            
-            # RDF Graph 파싱
-            graph_data = parse_rdf_graph(rdf_graph)
-            
-            # 노드 병합 (중복 제거 - 같은 ID는 하나만 유지)
-            for node in graph_data["nodes"]:
-                node_id = node["id"]
-                if node_id not in all_nodes:
-                    all_nodes[node_id] = OntologyGraphNode(
-                        id=node["id"],
-                        label=node["label"],
-                        type=node["type"]
-                    )
-            
-            # 엣지 추가 (모든 엣지 포함)
-            for edge in graph_data["edges"]:
-                all_edges.append(OntologyGraphEdge(
-                    source=edge["source"],
-                    target=edge["target"],
-                    relation=edge["relation"]
-                ))
-        
-        logger.info(f"통합 그래프 생성 완료: 노드 {len(all_nodes)}개, 엣지 {len(all_edges)}개 (온톨로지 {len(all_ontologies)}개 병합)")
+        logger.info(f"통합 그래프 조립 완료: 노드 {len(nodes)}개, 엣지 {len(edges)}개 (온톨로지 {ontology_count}개, 인덱스 버전 {index_version})")
         
         return OntologyGraphResponse(
             message="통합 온톨로지 그래프 조회 완료",
             ontology_id="merged",
-            nodes=list(all_nodes.values()),
-            edges=all_edges,
+            nodes=[OntologyGraphNode(**node) for node in nodes],
+            edges=[OntologyGraphEdge(**edge) for edge in edges],
         )
 
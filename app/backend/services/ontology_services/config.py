@@ -3,6 +3,8 @@
 온톨로지 매핑 및 구축에 사용되는 설정값들을 중앙 관리
 """
 
+import os
+
 # 신뢰도 임계값 설정
 HIGH_CONFIDENCE = 0.7
 MEDIUM_CONFIDENCE = 0.4
@@ -15,6 +17,77 @@ FACT_URI = "http://factory.org/"
 # 기본 모델 설정
 DEFAULT_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
 
+# 모델 레지스트리 설정 (프로세스당 동시에 유지할 최대 모델 수)
+MODEL_REGISTRY_MAX_MODELS = 2
+
+# 키워드 규칙 사전 설정 (YAML/JSON 파일, 미설정 시 기본 사전 사용)
+KEYWORD_RULES_FILE = os.getenv("KEYWORD_RULES_FILE") or None
+KEYWORD_RULES_RELOAD_INTERVAL = float(os.getenv("KEYWORD_RULES_RELOAD_INTERVAL", "5.0"))  # 파일 변경 확인 주기 (초)
+
+# 시맨틱 배치 매핑 시 한 번에 인코딩할 최대 파일명 수 (유사도 행렬 메모리 상한)
+SEMANTIC_BATCH_SIZE = 4096
+
+# 파일명 일괄 매핑 API 설정
+MAP_FILENAMES_CHUNK_SIZE = 1000  # 스트리밍 시 한 번에 매핑할 파일명 수
+MAP_FILENAMES_STREAM_THRESHOLD = 1000  # 이 건수를 넘으면 NDJSON 스트리밍으로 응답
+
+# 클래스 임베딩 캐시 설정 (모델 + 클래스 집합 조합 수)
+CLASS_EMBEDDING_CACHE_MAX_ENTRIES = 64
+
+# 스키마 지문 매핑 캐시 설정 (컬럼명/dtype이 같은 파일은 이전 매핑 결정을 재사용하여 시맨틱 추론 생략)
+SCHEMA_MAPPING_CACHE_ENABLED = os.getenv("SCHEMA_MAPPING_CACHE_ENABLED", "true").lower() == "true"
+SCHEMA_MAPPING_CACHE_MAX_ENTRIES = int(os.getenv("SCHEMA_MAPPING_CACHE_MAX_ENTRIES", "10000"))
+
+# 파일명 임베딩 디스크 캐시 설정 (memory-mapped, 여러 워커가 공유 가능)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "backend/data/embedding_cache")
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+# 읽기 전용 워커는 캐시를 조회만 하고 기록하지 않음
+EMBEDDING_CACHE_READONLY = os.getenv("EMBEDDING_CACHE_READONLY", "false").lower() == "true"
+
+# 업로드 파이프라인 실행기 설정
+UPLOAD_PROCESS_WORKERS = int(os.getenv("UPLOAD_PROCESS_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))  # 파싱/RDF 구축 프로세스 수 (0이면 스레드 실행)
+INFERENCE_THREAD_WORKERS = int(os.getenv("INFERENCE_THREAD_WORKERS", "2"))  # 모델 추론 스레드 수
+
+# 타겟 컬럼 직접 매핑 시 한 번에 검사할 행 수 (일치하는 클래스가 나오면 스캔 중단)
+DIRECT_MAPPING_BATCH_SIZE = 50000
+
+# 업로드 수신 설정 (청크 단위 수신, 임계값을 넘으면 임시 파일로 전환)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 업로드 스트림을 읽는 단위 (1MB)
+UPLOAD_SPILL_THRESHOLD = int(os.getenv("UPLOAD_SPILL_THRESHOLD", str(8 * 1024 * 1024)))  # 메모리에 유지할 최대 크기
+UPLOAD_TEMP_DIR = os.getenv("UPLOAD_TEMP_DIR") or None  # 임시 파일 디렉토리 (None이면 시스템 기본값)
+
+# 일괄 업로드 설정 (여러 파일 또는 ZIP/TAR 아카이브를 한 번의 매핑/쓰기로 처리)
+BATCH_UPLOAD_MAX_FILES = int(os.getenv("BATCH_UPLOAD_MAX_FILES", "1000"))  # 요청당 최대 파일 수 (아카이브 항목 포함)
+BATCH_UPLOAD_MAX_EXTRACTED_SIZE = int(os.getenv("BATCH_UPLOAD_MAX_EXTRACTED_SIZE", str(2 * 1024 * 1024 * 1024)))  # 아카이브에서 풀어낸 전체 크기 제한
+BATCH_UPLOAD_MAX_REQUEST_SIZE = int(os.getenv("BATCH_UPLOAD_MAX_REQUEST_SIZE", str(2 * 1024 * 1024 * 1024)))  # 요청 본문 전체 크기 제한 (파일별 크기는 500MB 제한 별도 적용)
+
+# 업로드 중복 제거 설정 (내용 해시 + 요청 인자가 같은 업로드는 저장된 결과를 반환)
+UPLOAD_DEDUP_ENABLED = os.getenv("UPLOAD_DEDUP_ENABLED", "true").lower() == "true"
+UPLOAD_DEDUP_TTL = float(os.getenv("UPLOAD_DEDUP_TTL", "600"))  # 결과 보관 시간 (초)
+UPLOAD_DEDUP_MAX_ENTRIES = int(os.getenv("UPLOAD_DEDUP_MAX_ENTRIES", "256"))  # 보관할 최대 결과 수
+
+# 업로드 작업 큐 설정 (job 모드 업로드를 제한된 큐와 워커 스레드에서 처리)
+INGESTION_JOB_WORKERS = int(os.getenv("INGESTION_JOB_WORKERS", "2"))  # 동시에 처리할 작업 수
+INGESTION_JOB_QUEUE_SIZE = int(os.getenv("INGESTION_JOB_QUEUE_SIZE", "16"))  # 대기 작업 수 (넘으면 503으로 거부)
+INGESTION_JOB_HISTORY = 1000  # 상태 조회를 위해 보관할 최근 작업 수
+
+# 온톨로지 저장소 영속화 설정 (sqlite: WAL 모드 SQLite 파일, memory: 프로세스 메모리만 사용)
+ONTOLOGY_STORE_BACKEND = os.getenv("ONTOLOGY_STORE_BACKEND", "sqlite").lower()
+ONTOLOGY_STORE_PATH = os.getenv("ONTOLOGY_STORE_PATH", "backend/data/ontology_store/ontologies.db")
+ONTOLOGY_STORE_COMMIT_BATCH = int(os.getenv("ONTOLOGY_STORE_COMMIT_BATCH", "32"))  # 이 수만큼 쓰기가 쌓이면 커밋
+ONTOLOGY_STORE_COMMIT_INTERVAL = float(os.getenv("ONTOLOGY_STORE_COMMIT_INTERVAL", "0.5"))  # 첫 미커밋 쓰기 후 최대 대기 (초)
+ONTOLOGY_STORE_MAX_CHUNKS = 16  # 온톨로지별 추가 청크가 이 수를 넘으면 로드 시 하나로 압축
+# 여러 워커 프로세스가 같은 SQLite 파일을 공유 (쓰기마다 커밋, 변경 로그로 다른 워커의 캐시 무효화)
+ONTOLOGY_STORE_SHARED = os.getenv("ONTOLOGY_STORE_SHARED", "false").lower() in ("1", "true", "yes")
+ONTOLOGY_STORE_CHANGE_LOG_SIZE = 10000  # 유지할 변경 로그 수 (이보다 뒤처진 워커는 메타데이터 전체를 다시 읽음)
+ONTOLOGY_STORE_BUSY_TIMEOUT_MS = 5000  # 다른 워커의 쓰기 잠금 대기 시간
+
 INPUT_DATA_FOLDER = "backend/data/ontology_input_data"
 OUTPUT_DATA_FOLDER = "backend/data/ontology_output"
-OUTPUT_FILE = "metadata_ontology.ttl"
\ No newline at end of file
+OUTPUT_FILE = "metadata_ontology.ttl"
+
+# 폴더 감시 수집 설정 (매니페스트의 크기/수정 시각/내용 해시로 새 파일과 변경된 파일만 수집)
+INGEST_MANIFEST_PATH = os.getenv("INGEST_MANIFEST_PATH", "backend/data/ingest_manifest/manifest.db")
+INGEST_WATCH_INTERVAL = float(os.getenv("INGEST_WATCH_INTERVAL", "5"))  # 폴더 재스캔 간격 (초)
+INGEST_MANIFEST_WRITE_BATCH = 5000  # 매니페스트 트랜잭션 하나에 기록할 최대 행 수
\ No newline at end of file
@@ -0,0 +1,418 @@
+"""
+디스크 임베딩 캐시 모듈
+(모델, 전처리된 텍스트) 해시 기준 memory-mapped 임베딩 캐시
+
+캐시 디렉토리 구조 (모델별 하위 디렉토리):
+    meta.json    모델명, 차원, 용량
+    keys.bin     (용량, 16) uint8 - 슬롯별 키 해시 (0이면 빈 슬롯)
+    vectors.bin  (용량, 차원) float32 - 슬롯별 L2 정규화 임베딩
+    state.bin    (2,) int64 - [다음 기록 슬롯, 세대 번호]
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.services.ontology_services.config import (
+    EMBEDDING_CACHE_DIR,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_CACHE_READONLY,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 쓰기 잠금 없이 동작
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_KEY_BYTES = 16
+_FORMAT_VERSION = 1
+_EMPTY_KEY = bytes(_KEY_BYTES)
+_CACHE_FILES = ("keys.bin", "vectors.bin", "state.bin", "meta.json")  # 교체 순서 (meta.json이 마지막)
+
+
+def make_cache_key(model_name: str, text: str) -> bytes:
+    """
+    캐시 키 생성 (모델명 + 전처리된 텍스트의 해시)
+    
+    Args:
+        model_name: 모델명
+        text: 전처리된 텍스트
+        
+    Returns:
+        16바이트 키
+    """
+    return hashlib.blake2b(f"{model_name}\x00{text}".encode("utf-8"), digest_size=_KEY_BYTES).digest()
+
+
+class DiskEmbeddingCache:
+    """단일 모델용 memory-mapped 임베딩 캐시 (링 버퍼 방식 제거)"""
+    
+    def __init__(self, directory: Path, model_name: str, max_entries: int, readonly: bool = False):
+        """
+        캐시 초기화 (기존 파일이 있으면 매핑)
+        
+        Args:
+            directory: 캐시 디렉토리
+            model_name: 모델명
+            max_entries: 최대 항목 수 (초과 시 가장 오래 기록된 항목부터 덮어씀)
+            readonly: True면 조회만 수행
+        """
+        self.directory = Path(directory)
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.readonly = readonly
+        
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._indexed_generation = -1
+        self._keys: Optional[np.memmap] = None
+        self._vectors: Optional[np.memmap] = None
+        self._state: Optional[np.memmap] = None
+        
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        
+        self._open_existing()
+    
+    @property
+    def dimension(self) -> Optional[int]:
+        """임베딩 차원 (파일이 아직 없으면 None)"""
+        return None if self._vectors is None else self._vectors.shape[1]
+    
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        여러 텍스트의 임베딩 조회
+        
+        Args:
+            texts: 전처리된 텍스트 목록
+            
+        Returns:
+            텍스트별 임베딩 (없으면 None)
+        """
+        with self._lock:
+            if self._vectors is None:
+                self._open_existing()
+            if self._vectors is None:
+                self._misses += len(texts)
+                return [None] * len(texts)
+            
+            self._refresh_index()
+            results: List[Optional[np.ndarray]] = []
+            for text in texts:
+                key = make_cache_key(self.model_name, text)
+                slot = self._index.get(key)
+                vector = None
+                # 다른 프로세스가 슬롯을 덮어썼을 수 있으므로 키를 확인하고, 복사 후에도 키가 그대로인지 다시 확인
+                # (쓰는 쪽은 키를 지운 뒤 벡터를 기록하므로 복사 중에 덮어쓰였다면 키가 달라짐)
+                if slot is not None and self._keys[slot].tobytes() == key:
+                    vector = np.array(self._vectors[slot])
+                    if self._keys[slot].tobytes() != key:
+                        vector = None
+                results.append(vector)
+                if vector is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            return results
+    
+    def put_many(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """
+        여러 텍스트의 임베딩 저장
+        
+        Args:
+            texts: 전처리된 텍스트 목록
+            embeddings: (N, D) L2 정규화 임베딩
+        """
+        if self.readonly or not texts:
+            return
+        
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        with self._lock:
+            if self._vectors is None:
+                self._create(embeddings.shape[1])
+            if embeddings.shape[1] != self.dimension:
+                logger.warning(
+                    f"임베딩 차원 불일치로 디스크 캐시 저장 생략: {self.model_name} "
+                    f"(캐시={self.dimension}, 입력={embeddings.shape[1]})"
+                )
+                return
+            
+            with self._file_lock():
+                self._refresh_index()
+                cursor = int(self._state[0])
+                capacity = self._keys.shape[0]
+                for text, vector in zip(texts, embeddings):
+                    key = make_cache_key(self.model_name, text)
+                    if key in self._index:
+                        continue
+                    old_key = self._keys[cursor].tobytes()
+                    if old_key != _EMPTY_KEY:
+                        self._index.pop(old_key, None)
+                        self._evictions += 1
+                    # 벡터를 먼저 기록한 뒤 키를 기록 (읽는 쪽이 미완성 벡터를 보지 않도록)
+                    self._keys[cursor] = 0
+                    self._vectors[cursor] = vector
+                    self._keys[cursor] = np.frombuffer(key, dtype=np.uint8)
+                    self._index[key] = cursor
+                    self._writes += 1
+                    cursor = (cursor + 1) % capacity
+                
+                self._state[0] = cursor
+                self._state[1] += 1
+                self._indexed_generation = int(self._state[1])
+                self._vectors.flush()
+                self._keys.flush()
+                self._state.flush()
+    
+    def warm_up(self) -> int:
+        """
+        인덱스를 구성하고 임베딩 페이지를 미리 읽어 페이지 캐시에 올림
+        
+        Returns:
+            캐시된 항목 수
+        """
+        with self._lock:
+            if self._vectors is None:
+                self._open_existing()
+            if self._vectors is None:
+                return 0
+            self._refresh_index()
+            # 모든 페이지를 한 번 읽어 이후 조회 시 디스크 I/O 방지
+            float(np.asarray(self._vectors).sum())
+            return len(self._index)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            항목 수, 히트/미스, 기록/제거 횟수
+        """
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "max_entries": self.max_entries if self._keys is None else self._keys.shape[0],
+                "readonly": self.readonly,
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evictions": self._evictions,
+            }
+    
+    def _open_existing(self) -> None:
+        """기존 캐시 파일 매핑 (lock 보유 상태 또는 초기화 시 호출, 다른 워커의 생성/교체와 겹치지 않도록 파일 잠금 안에서 매핑)"""
+        if not (self.directory / "meta.json").exists():
+            return
+        if self.readonly:
+            # 읽기 전용 디렉토리에는 잠금 파일을 만들 수 없음
+            self._map_existing()
+            return
+        with self._file_lock():
+            self._map_existing()
+    
+    def _map_existing(self) -> None:
+        """meta.json에 기록된 차원/용량으로 기존 캐시 파일 매핑 (없거나 호환되지 않으면 매핑하지 않음)"""
+        meta_path = self.directory / "meta.json"
+        if not meta_path.exists():
+            return
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"디스크 임베딩 캐시 메타 정보를 읽을 수 없습니다: {meta_path}, {str(e)}")
+            return
+        
+        if meta.get("format") != _FORMAT_VERSION or meta.get("model_name") != self.model_name:
+            logger.warning(f"호환되지 않는 디스크 임베딩 캐시 무시: {self.directory}")
+            return
+        if meta.get("capacity") != self.max_entries:
+            # 다른 워커가 매핑 중일 수 있으므로 재생성하지 않고 저장된 용량을 그대로 사용
+            logger.info(
+                f"디스크 임베딩 캐시 용량 설정({self.max_entries})이 기존 캐시와 달라 기존 용량({meta.get('capacity')})을 사용합니다: "
+                f"{self.directory} (용량을 바꾸려면 캐시 디렉토리를 삭제)"
+            )
+        self._map_files(self.directory, meta["dim"], meta["capacity"], mode="r" if self.readonly else "r+")
+    
+    def _create(self, dimension: int) -> None:
+        """
+        새 캐시 파일 생성 (lock 보유 상태에서 호출)
+        그 사이 다른 워커가 만든 캐시가 있으면 그대로 사용하고, 새로 만들 때는 임시 디렉토리에서 만든 파일로 교체
+        (다른 워커가 매핑 중인 파일을 제자리에서 잘라내지 않음)
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._file_lock():
+            self._map_existing()
+            if self._vectors is not None:
+                return
+            
+            staging = Path(tempfile.mkdtemp(prefix=".create-", dir=self.directory))
+            try:
+                self._map_files(staging, dimension, self.max_entries, mode="w+")
+                self._keys.flush()
+                self._vectors.flush()
+                self._state.flush()
+                meta = {
+                    "format": _FORMAT_VERSION,
+                    "model_name": self.model_name,
+                    "dim": dimension,
+                    "capacity": self.max_entries,
+                }
+                (staging / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+                for name in _CACHE_FILES:
+                    os.replace(staging / name, self.directory / name)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+            self._map_files(self.directory, dimension, self.max_entries, mode="r+")
+        self._index = {}
+        self._indexed_generation = -1
+        logger.info(f"디스크 임베딩 캐시 생성: {self.directory} (차원={dimension}, 용량={self.max_entries})")
+    
+    def _map_files(self, directory: Path, dimension: int, capacity: int, mode: str) -> None:
+        """캐시 파일 memory-map"""
+        self._keys = np.memmap(directory / "keys.bin", dtype=np.uint8, mode=mode, shape=(capacity, _KEY_BYTES))
+        self._vectors = np.memmap(directory / "vectors.bin", dtype=np.float32, mode=mode, shape=(capacity, dimension))
+        self._state = np.memmap(directory / "state.bin", dtype=np.int64, mode=mode, shape=(2,))
+    
+    def _refresh_index(self) -> None:
+        """다른 프로세스가 기록한 경우 키 파일을 다시 스캔해 인덱스 재구성"""
+        generation = int(self._state[1])
+        if generation == self._indexed_generation:
+            return
+        occupied = np.nonzero(self._keys.any(axis=1))[0]
+        self._index = {self._keys[slot].tobytes(): int(slot) for slot in occupied}
+        self._indexed_generation = generation
+    
+    @contextmanager
+    def _file_lock(self):
+        """프로세스 간 쓰기 잠금"""
+        if fcntl is None:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "lock", "a+") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class DiskEmbeddingCacheManager:
+    """모델별 디스크 임베딩 캐시 관리"""
+    
+    def __init__(
+        self,
+        cache_dir: str = EMBEDDING_CACHE_DIR,
+        enabled: bool = EMBEDDING_CACHE_ENABLED,
+        readonly: bool = EMBEDDING_CACHE_READONLY,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES
+    ):
+        """
+        관리자 초기화
+        
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            enabled: 캐시 사용 여부
+            readonly: 읽기 전용 여부
+            max_entries: 모델별 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.readonly = readonly
+        self.max_entries = max_entries
+        self._caches: Dict[str, DiskEmbeddingCache] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, model_name: str) -> Optional[DiskEmbeddingCache]:
+        """
+        모델별 캐시 조회
+        
+        Args:
+            model_name: 모델명
+            
+        Returns:
+            DiskEmbeddingCache 또는 None (비활성화된 경우)
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            cache = self._caches.get(model_name)
+            if cache is None:
+                cache = DiskEmbeddingCache(
+                    directory=self.cache_dir / self._directory_name(model_name),
+                    model_name=model_name,
+                    max_entries=self.max_entries,
+                    readonly=self.readonly,
+                )
+                self._caches[model_name] = cache
+            return cache
+    
+    def warm_up(self) -> Dict[str, int]:
+        """
+        캐시 디렉토리에 있는 모든 모델 캐시를 미리 로드
+        
+        Returns:
+            모델명별 캐시 항목 수
+        """
+        if not self.enabled or not self.cache_dir.exists():
+            return {}
+        
+        loaded: Dict[str, int] = {}
+        for meta_path in sorted(self.cache_dir.glob("*/meta.json")):
+            try:
+                model_name = json.loads(meta_path.read_text(encoding="utf-8"))["model_name"]
+            except (OSError, ValueError, KeyError):
+                continue
+            cache = self.get(model_name)
+            if cache is not None:
+                loaded[model_name] = cache.warm_up()
+        return loaded
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        전체 캐시 통계
+        
+        Returns:
+            활성화 여부와 모델별 통계
+        """
+        with self._lock:
+            caches = dict(self._caches)
+        return {
+            "enabled": self.enabled,
+            "cache_dir": str(self.cache_dir),
+            "models": {name: cache.stats() for name, cache in caches.items()},
+        }
+    
+    @staticmethod
+    def _directory_name(model_name: str) -> str:
+        """모델명을 디렉토리명으로 변환"""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", model_name).strip("_")
+        return f"{slug}_{hashlib.sha256(model_name.encode('utf-8')).hexdigest()[:8]}"
+
+
+# 전역 관리자 인스턴스
+_disk_embedding_cache_manager = DiskEmbeddingCacheManager()
+
+
+def get_disk_embedding_cache_manager() -> DiskEmbeddingCacheManager:
+    """
+    디스크 임베딩 캐시 관리자 반환
+    
+    Returns:
+        DiskEmbeddingCacheManager 인스턴스
+    """
+    return _disk_embedding_cache_manager
@@ -0,0 +1,146 @@
+"""
+임베딩 캐시 모듈
+온톨로지 클래스 집합별 정규화 임베딩 행렬 캐시
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from backend.services.ontology_services.config import CLASS_EMBEDDING_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+def l2_normalize(embeddings: Any) -> np.ndarray:
+    """
+    임베딩 행렬을 행 단위로 L2 정규화
+    
+    Args:
+        embeddings: (N, D) 임베딩 (numpy 배열 또는 tensor)
+        
+    Returns:
+        float32 정규화 행렬 (정규화 후 내적 = 코사인 유사도)
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def normalize_class_set(classes: List[str]) -> Tuple[str, ...]:
+    """
+    클래스 목록 정규화 (공백 제거, 중복 제거, 정렬)
+    
+    Args:
+        classes: 온톨로지 클래스 목록
+        
+    Returns:
+        정렬된 클래스 튜플
+    """
+    return tuple(sorted({cls.strip() for cls in classes if cls and cls.strip()}))
+
+
+@dataclass(frozen=True)
+class ClassEmbeddings:
+    """클래스 집합 임베딩 (classes[i] ↔ matrix[i])"""
+    classes: Tuple[str, ...]
+    matrix: np.ndarray  # (클래스 수, 차원), L2 정규화됨
+
+
+class ClassEmbeddingCache:
+    """(모델명, 정규화된 클래스 집합) 기준 클래스 임베딩 LRU 캐시"""
+    
+    def __init__(self, max_entries: int = CLASS_EMBEDDING_CACHE_MAX_ENTRIES):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 캐시 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Tuple[str, ...]], ClassEmbeddings]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, model_name: str, model: Any, classes: List[str]) -> ClassEmbeddings:
+        """
+        클래스 임베딩 조회 (없으면 인코딩 후 저장)
+        
+        Args:
+            model_name: 모델명
+            model: encode 메서드를 가진 모델
+            classes: 온톨로지 클래스 목록
+            
+        Returns:
+            ClassEmbeddings: 정렬된 클래스와 정규화 임베딩 행렬
+        """
+        class_set = normalize_class_set(classes)
+        key = (model_name, class_set)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        
+        # 인코딩은 락 밖에서 수행 (다른 클래스 집합 조회를 막지 않음)
+        if class_set:
+            matrix = l2_normalize(model.encode(list(class_set), show_progress_bar=False))
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        matrix.setflags(write=False)
+        entry = ClassEmbeddings(classes=class_set, matrix=matrix)
+        
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.info(f"클래스 임베딩 캐시 저장: 모델={model_name}, 클래스={len(class_set)}개")
+        return entry
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            항목 수, 히트/미스 횟수
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            }
+
+
+# 전역 캐시 인스턴스
+_class_embedding_cache = ClassEmbeddingCache()
+
+
+def get_class_embedding_cache() -> ClassEmbeddingCache:
+    """
+    클래스 임베딩 캐시 인스턴스 반환
+    
+    Returns:
+        ClassEmbeddingCache 인스턴스
+    """
+    return _class_embedding_cache
@@ -4,13 +4,30 @@
 """
 
 import polars as pl
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from backend.services.ontology_services.config import HIGH_CONFIDENCE, MEDIUM_CONFIDENCE, LOW_CONFIDENCE
+from backend.services.ontology_services.config import (
+    HIGH_CONFIDENCE,
+    MEDIUM_CONFIDENCE,
+    LOW_CONFIDENCE,
+    SCHEMA_MAPPING_CACHE_ENABLED,
+    SEMANTIC_BATCH_SIZE,
+)
+from backend.services.ontology_services.embedding_cache import normalize_class_set
 from backend.services.ontology_services.models import MappingResult
 from backend.services.ontology_services.rule_based_mapper import RuleBasedMapper
+from backend.services.ontology_services.schema_mapping_cache import get_schema_mapping_cache
 from backend.services.ontology_services.semantic_mapper import SemanticMapper
 
+# map_files 결과 스키마
+MAPPING_RESULT_SCHEMA = {
+    "Filename": pl.Utf8,
+    "Interpreted_As": pl.Utf8,
+    "Mapped_Class": pl.Utf8,
+    "Confidence": pl.Float64,
+    "Method": pl.Utf8,
+}
+
 
 class HybridMapper:
     """하이브리드 매핑: 규칙 + 시맨틱 (파일명만 사용)"""
@@ -25,45 +42,97 @@ class HybridMapper:
         self.MEDIUM_CONFIDENCE = MEDIUM_CONFIDENCE
         self.LOW_CONFIDENCE = LOW_CONFIDENCE
     
-    def map_file(self, filename: str) -> MappingResult:
+    def map_file(self, filename: str, schema_fingerprint: Optional[str] = None) -> MappingResult:
         """
         단일 파일 매핑 (하이브리드 로직 - 파일명만 사용)
         
         우선순위:
         1. 규칙 기반 매칭 (고신뢰도)
-        2. 시맨틱 매칭
-        3. Unclassified
+        2. 스키마 지문 캐시 (같은 컬럼 구성의 파일에 내린 결정 재사용)
+        3. 시맨틱 매칭
+        4. Unclassified
         """
-        # Step 1: 규칙 기반 매칭 시도
-        rule_result = self.rule_mapper.match_by_keywords(filename)
-        if rule_result and rule_result[1] >= self.HIGH_CONFIDENCE:
-            return MappingResult(
-                filename=filename,
-                mapped_class=rule_result[0],
-                confidence=rule_result[1],
-                method="rule",
-                interpreted_as=self.rule_mapper.preprocess_filename(filename)
-            )
+        return self.map_batch([filename], [schema_fingerprint])[0]
+    
+    def map_batch(self, filenames: List[str], schema_fingerprints: Optional[List[Optional[str]]] = None) -> List[MappingResult]:
+        """
+        여러 파일 일괄 매핑 (벡터화 배치 경로)
+        
+        1. 모든 파일명에 규칙 기반 매칭 수행
+        2. 규칙으로 확정되지 않은 파일 중 스키마 지문의 결정이 있으면 재사용 (추론 생략)
+        3. 남은 파일명만 모아 한 번에 인코딩하고 유사도 행렬에 대한 벡터화 argmax로 클래스 선택
+        4. 규칙/시맨틱 결정을 스키마 지문별로 기록
+        
+        Args:
+            filenames: 파일명 리스트
+            schema_fingerprints: 파일별 스키마 지문 (filenames와 같은 순서, None이면 캐시 사용 안 함)
+            
+        Returns:
+            입력 순서와 같은 MappingResult 리스트
+        """
+        results: List[Optional[MappingResult]] = [None] * len(filenames)
+        leftovers: Dict[str, List[int]] = {}
+        schema_cache, scope = None, None
+        if SCHEMA_MAPPING_CACHE_ENABLED and schema_fingerprints and any(schema_fingerprints):
+            schema_cache = get_schema_mapping_cache()
+            scope = (self.semantic_mapper.model_name, normalize_class_set(self.ontology_classes), self.rule_mapper.rule_version)
+        
+        # Step 1: 규칙 기반 매칭 (실패하면 스키마 지문 캐시 조회)
+        for i, filename in enumerate(filenames):
+            rule_result = self.rule_mapper.match_by_keywords(filename)
+            if rule_result and rule_result[1] >= self.HIGH_CONFIDENCE:
+                results[i] = MappingResult(
+                    filename=filename,
+                    mapped_class=rule_result[0],
+                    confidence=rule_result[1],
+                    method="rule",
+                    interpreted_as=self.rule_mapper.preprocess_filename(filename)
+                )
+                continue
+            
+            cached = schema_cache.lookup(scope, schema_fingerprints[i]) if schema_cache and schema_fingerprints[i] else None
+            if cached is not None:
+                results[i] = MappingResult(
+                    filename=filename,
+                    mapped_class=cached[0],
+                    confidence=cached[1],
+                    method="schema_cache",
+                    interpreted_as=self.rule_mapper.preprocess_filename(filename)
+                )
+            else:
+                leftovers.setdefault(filename, []).append(i)
+        
+        # Step 2: 남은 파일명(중복 제거)만 시맨틱 매칭
+        unique_leftovers = list(leftovers.keys())
+        for offset in range(0, len(unique_leftovers), SEMANTIC_BATCH_SIZE):
+            chunk = unique_leftovers[offset:offset + SEMANTIC_BATCH_SIZE]
+            semantic_df = self.semantic_mapper.map_semantic(chunk, self.ontology_classes)
+            semantic_rows = {row['Filename']: row for row in semantic_df.iter_rows(named=True)}
+            
+            for filename in chunk:
+                result = self._semantic_or_unclassified(filename, semantic_rows.get(filename))
+                for i in leftovers[filename]:
+                    results[i] = result
         
-        # Step 2: 시맨틱 매칭
-        semantic_df = self.semantic_mapper.map_semantic([filename], self.ontology_classes)
-        semantic_rows = semantic_df.to_dicts()
-        if semantic_rows:
-            semantic_score = semantic_rows[0]['Confidence']
-            semantic_class = semantic_rows[0]['Mapped_Class']
-            interpreted_as = semantic_rows[0]['Interpreted_As']
-        else:
-            semantic_score = 0.0
-            semantic_class = "Unclassified"
-            interpreted_as = filename
+        # Step 4: 새로 내린 결정을 스키마 지문별로 기록
+        if schema_cache:
+            schema_cache.record(scope, [
+                (fingerprint, result.mapped_class, result.confidence)
+                for fingerprint, result in zip(schema_fingerprints, results)
+                if fingerprint and result.method in ("rule", "semantic")
+            ])
         
-        if semantic_score >= self.MEDIUM_CONFIDENCE:
+        return results
+    
+    def _semantic_or_unclassified(self, filename: str, semantic_row: Optional[Dict[str, Any]]) -> MappingResult:
+        """시맨틱 결과를 신뢰도 기준으로 MappingResult로 변환"""
+        if semantic_row and semantic_row['Confidence'] >= self.MEDIUM_CONFIDENCE:
             return MappingResult(
                 filename=filename,
-                mapped_class=semantic_class,
-                confidence=semantic_score,
+                mapped_class=semantic_row['Mapped_Class'],
+                confidence=semantic_row['Confidence'],
                 method="semantic",
-                interpreted_as=interpreted_as
+                interpreted_as=semantic_row['Interpreted_As']
             )
         
         # Step 3: 모든 방법 실패 시 Unclassified
@@ -82,18 +151,12 @@ class HybridMapper:
         Args:
             filenames: 파일명 리스트
         """
-        results = []
+        results = self.map_batch(filenames)
         
-        for filename in filenames:
-            result = self.map_file(filename)
-            
-            results.append({
-                "Filename": result.filename,
-                "Interpreted_As": result.interpreted_as,
-                "Mapped_Class": result.mapped_class,
-                "Confidence": round(result.confidence, 3),
-                "Method": result.method
-            })
-        
-        return pl.DataFrame(results)
-
+        return pl.DataFrame({
+            "Filename": [result.filename for result in results],
+            "Interpreted_As": [result.interpreted_as for result in results],
+            "Mapped_Class": [result.mapped_class for result in results],
+            "Confidence": [round(result.confidence, 3) for result in results],
+            "Method": [result.method for result in results],
+        }, schema=MAPPING_RESULT_SCHEMA)
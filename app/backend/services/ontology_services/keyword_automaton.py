@@ -0,0 +1,114 @@
+"""
+키워드 오토마톤 모듈
+Aho-Corasick 다중 패턴 매칭으로 한 번의 텍스트 순회에서 모든 클래스 키워드 탐색
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class KeywordAutomaton:
+    """클래스별 키워드 사전을 컴파일한 Aho-Corasick 오토마톤 (생성 후 불변)"""
+    
+    def __init__(self, keyword_rules: Dict[str, List[str]]):
+        """
+        오토마톤 컴파일
+        
+        Args:
+            keyword_rules: {클래스명: [키워드, ...]} 사전 (클래스 순서 = 동점 시 우선순위)
+        """
+        self.class_names: Tuple[str, ...] = tuple(keyword_rules.keys())
+        
+        # 상태별 전이/실패 링크/출력 (상태 0 = 루트)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [-1]  # 상태에서 끝나는 패턴 ID (-1이면 없음)
+        self._output_link: List[int] = [0]  # 실패 링크를 따라 가장 가까운 출력 상태
+        
+        # 패턴 ID별 (클래스 인덱스, 등장 횟수) 목록
+        self._pattern_classes: List[List[Tuple[int, int]]] = []
+        pattern_ids: Dict[str, int] = {}
+        
+        for class_idx, keywords in enumerate(keyword_rules.values()):
+            counts: Dict[str, int] = {}
+            for keyword in keywords:
+                if keyword:
+                    counts[keyword] = counts.get(keyword, 0) + 1
+            for keyword, count in counts.items():
+                pattern_id = pattern_ids.get(keyword)
+                if pattern_id is None:
+                    pattern_id = len(self._pattern_classes)
+                    pattern_ids[keyword] = pattern_id
+                    self._pattern_classes.append([])
+                    self._insert(keyword, pattern_id)
+                self._pattern_classes[pattern_id].append((class_idx, count))
+        
+        self.keyword_count = len(pattern_ids)
+        self._build_links()
+    
+    def count_matches(self, text: str) -> Dict[int, int]:
+        """
+        텍스트에 부분 문자열로 포함된 키워드 수를 클래스별로 집계
+        
+        Args:
+            text: 전처리된 텍스트
+            
+        Returns:
+            {클래스 인덱스: 매칭된 키워드 수} (같은 키워드는 여러 번 등장해도 1회)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        output_link = self._output_link
+        
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            
+            match_state = state if output[state] >= 0 else output_link[state]
+            while match_state:
+                found.add(output[match_state])
+                match_state = output_link[match_state]
+        
+        counts: Dict[int, int] = {}
+        for pattern_id in found:
+            for class_idx, count in self._pattern_classes[pattern_id]:
+                counts[class_idx] = counts.get(class_idx, 0) + count
+        return counts
+    
+    def _insert(self, keyword: str, pattern_id: int) -> None:
+        """트라이에 키워드 추가"""
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._output_link.append(0)
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state] = pattern_id
+    
+    def _build_links(self) -> None:
+        """BFS로 실패 링크와 출력 링크 구성"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                fail_state = self._goto[fallback].get(ch, 0)
+                if fail_state == next_state:
+                    fail_state = 0
+                self._fail[next_state] = fail_state
+                self._output_link[next_state] = (
+                    fail_state if self._output[fail_state] >= 0 else self._output_link[fail_state]
+                )
@@ -0,0 +1,240 @@
+"""
+키워드 규칙 사전 모듈
+외부 YAML/JSON 키워드 사전을 불변 인덱스로 컴파일하고 파일 변경 시 무중단 교체
+
+사전 파일 형식 (JSON 예시, YAML도 같은 구조):
+    {
+        "version": "2025-01-15",
+        "rules": {
+            "CNC_Machine": ["cnc", "machining", "nc", "가공"],
+            "Industrial_Pump": ["pump", "펌프", "pressure"]
+        }
+    }
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from backend.services.ontology_services.config import KEYWORD_RULES_FILE, KEYWORD_RULES_RELOAD_INTERVAL
+from backend.services.ontology_services.keyword_automaton import KeywordAutomaton
+
+logger = logging.getLogger(__name__)
+
+# 도메인별 키워드 사전 (실무에서 도메인 지식 반영, 외부 사전이 없을 때 사용)
+DEFAULT_KEYWORD_RULES: Dict[str, List[str]] = {
+    "Injection_Molding_Machine": [
+        "injection", "molding", "moulding", "plastic", "inj", "사출"
+    ],
+    "Welding_Robot": [
+        "welding", "welder", "weld", "robot", "용접"
+    ],
+    "Industrial_Pump": [
+        "pump", "펌프", "pressure"
+    ],
+    "CNC_Machine": [
+        "cnc", "machining", "nc", "가공"
+    ],
+    "Conveyor_Belt": [
+        "conveyor", "belt", "컨베이어", "transport"
+    ],
+    "Motor": [
+        "motor", "curr", "current", "voltage", "volt", "모터"
+    ],
+    "Melting_Machine": [
+        "melting", "melt", "molten", "주석", "주석기",
+    ]
+}
+
+BUILTIN_RULE_VERSION = "builtin"
+
+
+@dataclass(frozen=True)
+class KeywordRuleIndex:
+    """컴파일된 키워드 규칙 인덱스 (생성 후 불변)"""
+    version: str
+    rules: Mapping[str, Tuple[str, ...]]
+    automaton: KeywordAutomaton
+    source: Optional[str] = None
+
+
+def build_rule_index(
+    keyword_rules: Mapping[str, List[str]],
+    version: str,
+    source: Optional[str] = None
+) -> KeywordRuleIndex:
+    """
+    키워드 사전을 불변 인덱스로 컴파일
+    
+    Args:
+        keyword_rules: {클래스명: [키워드, ...]}
+        version: 사전 버전
+        source: 사전 파일 경로
+        
+    Returns:
+        KeywordRuleIndex
+    """
+    rules = MappingProxyType({
+        str(class_name): tuple(str(keyword).lower() for keyword in keywords)
+        for class_name, keywords in keyword_rules.items()
+    })
+    return KeywordRuleIndex(
+        version=str(version),
+        rules=rules,
+        automaton=KeywordAutomaton(rules),
+        source=source,
+    )
+
+
+def load_rule_file(path: str) -> KeywordRuleIndex:
+    """
+    YAML/JSON 사전 파일 로드 및 컴파일
+    
+    Args:
+        path: 사전 파일 경로 (.json, .yaml, .yml)
+        
+    Returns:
+        KeywordRuleIndex
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ValueError("YAML 키워드 사전을 사용하려면 PyYAML이 필요합니다.") from e
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    
+    if not isinstance(data, dict) or "version" not in data or not isinstance(data.get("rules"), dict):
+        raise ValueError(f"키워드 사전 형식이 올바르지 않습니다 (version, rules 필요): {path}")
+    for class_name, keywords in data["rules"].items():
+        if not isinstance(keywords, list):
+            raise ValueError(f"키워드 목록은 리스트여야 합니다: {class_name}")
+    
+    return build_rule_index(data["rules"], version=data["version"], source=path)
+
+
+class KeywordRuleStore:
+    """
+    공유 키워드 규칙 저장소
+    읽기 경로는 잠금 없이 현재 인덱스 참조를 반환하고, 파일이 바뀌면 새 인덱스로 참조를 교체
+    """
+    
+    def __init__(self, path: Optional[str] = KEYWORD_RULES_FILE, reload_interval: float = KEYWORD_RULES_RELOAD_INTERVAL):
+        """
+        저장소 초기화
+        
+        Args:
+            path: 외부 사전 파일 경로 (None이면 기본 사전만 사용)
+            reload_interval: 파일 변경 확인 주기 (초)
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._index = build_rule_index(DEFAULT_KEYWORD_RULES, version=BUILTIN_RULE_VERSION)
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._reload_count = 0
+        self._last_error: Optional[str] = None
+        
+        if path:
+            self.reload(force=True)
+    
+    def current(self) -> KeywordRuleIndex:
+        """
+        현재 규칙 인덱스 반환 (확인 주기가 지났으면 파일 변경 여부 확인)
+        
+        Returns:
+            KeywordRuleIndex
+        """
+        if self.path and time.monotonic() >= self._next_check:
+            # 다른 스레드가 확인 중이면 기다리지 않고 현재 인덱스 사용
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    self._reload_if_changed()
+                finally:
+                    self._reload_lock.release()
+        return self._index
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        사전 파일 다시 로드
+        
+        Args:
+            force: 파일 변경 여부와 관계없이 로드
+            
+        Returns:
+            인덱스가 교체되었는지 여부
+        """
+        with self._reload_lock:
+            if force:
+                self._file_signature = None
+            return self._reload_if_changed()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 상태
+        
+        Returns:
+            현재 버전, 사전 경로, 교체 횟수, 마지막 오류
+        """
+        index = self._index
+        return {
+            "version": index.version,
+            "source": index.source,
+            "classes": len(index.rules),
+            "keywords": index.automaton.keyword_count,
+            "reload_count": self._reload_count,
+            "last_error": self._last_error,
+        }
+    
+    def _reload_if_changed(self) -> bool:
+        """파일 서명(mtime, 크기)이 바뀐 경우에만 로드 (reload lock 보유 상태에서 호출)"""
+        self._next_check = time.monotonic() + self.reload_interval
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            self._last_error = f"키워드 사전 파일을 찾을 수 없습니다: {self.path} ({str(e)})"
+            logger.warning(self._last_error)
+            return False
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._file_signature:
+            return False
+        
+        try:
+            index = load_rule_file(self.path)
+        except Exception as e:
+            # 잘못된 사전은 적용하지 않고 기존 인덱스 유지
+            self._last_error = f"키워드 사전 로드 실패: {self.path} ({str(e)})"
+            logger.error(self._last_error)
+            self._file_signature = signature
+            return False
+        
+        # 참조 교체는 원자적이므로 읽는 쪽은 이전 또는 새 인덱스 중 하나를 온전히 봄
+        self._index = index
+        self._file_signature = signature
+        self._reload_count += 1
+        self._last_error = None
+        logger.info(f"키워드 사전 로드 완료: {self.path} (버전={index.version}, 키워드={index.automaton.keyword_count}개)")
+        return True
+
+
+# 전역 저장소 인스턴스
+_keyword_rule_store = KeywordRuleStore()
+
+
+def get_keyword_rule_store() -> KeywordRuleStore:
+    """
+    키워드 규칙 저장소 반환
+    
+    Returns:
+        KeywordRuleStore 인스턴스
+    """
+    return _keyword_rule_store
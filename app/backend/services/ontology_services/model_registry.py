@@ -0,0 +1,187 @@
+"""
+모델 레지스트리 모듈
+SentenceTransformer 모델을 프로세스 단위로 공유하는 LRU 캐시
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from backend.services.ontology_services.config import MODEL_REGISTRY_MAX_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+def _load_sentence_transformer(model_name: str) -> Any:
+    """SentenceTransformer 모델 로드 (기본 로더)"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+class ModelRegistry:
+    """스레드 안전한 모델 레지스트리 (model_name 기준, LRU 제거)"""
+    
+    def __init__(
+        self,
+        max_models: int = MODEL_REGISTRY_MAX_MODELS,
+        loader: Callable[[str], Any] = _load_sentence_transformer
+    ):
+        """
+        레지스트리 초기화
+        
+        Args:
+            max_models: 동시에 메모리에 유지할 최대 모델 수
+            loader: model_name을 받아 모델을 생성하는 함수
+        """
+        if max_models < 1:
+            raise ValueError("max_models는 1 이상이어야 합니다.")
+        
+        self.max_models = max_models
+        self._loader = loader
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 같은 모델을 동시에 두 번 로드하지 않도록 모델별 로드 락 사용
+        # (락을 기다리거나 잡은 스레드 수를 세어, 로드 중이 아니고 캐시에 없는 모델의 락은 제거)
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._load_waiters: Dict[str, int] = {}
+        
+        self._hits = 0
+        self._misses = 0
+        self._load_count = 0
+        self._evictions = 0
+        self._total_load_time = 0.0
+        self._last_load_time: Dict[str, float] = {}
+    
+    def get(self, model_name: str) -> Any:
+        """
+        모델 조회 (최초 사용 시 로드)
+        
+        Args:
+            model_name: 모델명
+            
+        Returns:
+            로드된 모델 인스턴스
+        """
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is not None:
+                self._models.move_to_end(model_name)
+                self._hits += 1
+                return model
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+            self._load_waiters[model_name] = self._load_waiters.get(model_name, 0) + 1
+        
+        try:
+            return self._load(model_name, load_lock)
+        finally:
+            with self._lock:
+                self._release_load_lock(model_name)
+    
+    def _load(self, model_name: str, load_lock: threading.Lock) -> Any:
+        """모델별 로드 락을 잡고 모델 로드 (다른 스레드가 먼저 로드했으면 그 모델 반환)"""
+        with load_lock:
+            # 다른 스레드가 먼저 로드했는지 다시 확인
+            with self._lock:
+                model = self._models.get(model_name)
+                if model is not None:
+                    self._models.move_to_end(model_name)
+                    self._hits += 1
+                    return model
+                self._misses += 1
+            
+            logger.info(f"모델 로드 시작: {model_name}")
+            started = time.perf_counter()
+            model = self._loader(model_name)
+            elapsed = time.perf_counter() - started
+            logger.info(f"모델 로드 완료: {model_name} ({elapsed:.2f}초)")
+            
+            with self._lock:
+                self._load_count += 1
+                self._total_load_time += elapsed
+                self._last_load_time[model_name] = elapsed
+                self._models[model_name] = model
+                self._models.move_to_end(model_name)
+                self._evict_if_needed()
+            return model
+    
+    def register(self, model_name: str, model: Any) -> None:
+        """
+        이미 생성된 모델 등록 (로더를 거치지 않음)
+        
+        Args:
+            model_name: 모델명
+            model: 모델 인스턴스
+        """
+        with self._lock:
+            self._models[model_name] = model
+            self._models.move_to_end(model_name)
+            self._evict_if_needed()
+    
+    def is_loaded(self, model_name: str) -> bool:
+        """모델이 현재 메모리에 있는지 여부"""
+        with self._lock:
+            return model_name in self._models
+    
+    def clear(self) -> None:
+        """등록된 모든 모델 제거"""
+        with self._lock:
+            self._models.clear()
+            for model_name in list(self._load_locks):
+                if model_name not in self._load_waiters:
+                    del self._load_locks[model_name]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        레지스트리 통계
+        
+        Returns:
+            로드 횟수, 로드 시간, 캐시 히트/미스 등 통계
+        """
+        with self._lock:
+            return {
+                "loaded_models": list(self._models.keys()),
+                "max_models": self.max_models,
+                "hits": self._hits,
+                "misses": self._misses,
+                "load_count": self._load_count,
+                "evictions": self._evictions,
+                "total_load_time_sec": round(self._total_load_time, 3),
+                "last_load_time_sec": {
+                    name: round(elapsed, 3) for name, elapsed in self._last_load_time.items()
+                },
+            }
+    
+    def _evict_if_needed(self) -> None:
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 모델 제거 (lock 보유 상태에서 호출)"""
+        while len(self._models) > self.max_models:
+            evicted_name, _ = self._models.popitem(last=False)
+            self._evictions += 1
+            if evicted_name not in self._load_waiters:
+                self._load_locks.pop(evicted_name, None)
+            logger.info(f"모델 제거 (LRU): {evicted_name}")
+    
+    def _release_load_lock(self, model_name: str) -> None:
+        """로드 대기 수 감소, 마지막 스레드이고 모델이 캐시에 없으면 로드 락 제거 (lock 보유 상태에서 호출)"""
+        waiters = self._load_waiters[model_name] - 1
+        if waiters:
+            self._load_waiters[model_name] = waiters
+            return
+        del self._load_waiters[model_name]
+        if model_name not in self._models:
+            self._load_locks.pop(model_name, None)
+
+
+# 전역 레지스트리 인스턴스
+_model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    모델 레지스트리 인스턴스 반환
+    
+    Returns:
+        ModelRegistry 인스턴스
+    """
+    return _model_registry
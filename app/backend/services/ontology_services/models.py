@@ -12,6 +12,6 @@ class MappingResult:
     filename: str
     mapped_class: str
     confidence: float
-    method: str  # "rule", "semantic", "unclassified"
+    method: str  # "rule", "semantic", "schema_cache", "unclassified"
     interpreted_as: str
 
@@ -4,5 +4,135 @@
 
 참고: build_hybrid_ontology 함수는 제거되었습니다.
 온톨로지 구축은 데이터 업로드 기능을 통해 수행됩니다.
+저장소는 아래 함수로 관계를 트리플로 변환하여 증분으로 추가하고, 직렬화 시 Graph를 만듭니다.
 """
 
+import re
+import urllib.parse
+from typing import Any, Dict, Iterable, List, TextIO, Tuple
+from rdflib import Graph, Namespace, URIRef
+from rdflib.term import Node
+from backend.services.ontology_services.config import BASE_URI, FACT_URI
+
+# 스트리밍 Turtle 출력의 접두사 (긴 네임스페이스부터 검사)
+TURTLE_PREFIXES = [("meta", BASE_URI), ("fact", FACT_URI)]
+
+# 접두사 형태로 축약해도 안전한 지역명 (그 외에는 전체 IRI로 기록)
+_SAFE_LOCAL_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+
+
+def new_ontology_graph() -> Graph:
+    """
+    네임스페이스가 바인딩된 빈 온톨로지 Graph 생성
+    
+    Returns:
+        Graph: RDF Graph
+    """
+    g = Graph()
+    g.bind("meta", Namespace(BASE_URI))
+    g.bind("fact", Namespace(FACT_URI))
+    return g
+
+
+def relation_triples(relations: List[Dict[str, Any]], relation_type: str) -> List[Tuple[URIRef, URIRef, URIRef]]:
+    """
+    관계 목록을 트리플 목록으로 변환
+    
+    Args:
+        relations: 관계 목록 (Source, Target 키 포함)
+        relation_type: 관계 타입
+        
+    Returns:
+        List[Tuple]: (source, relation, target) 트리플 목록
+    """
+    FACT = Namespace(FACT_URI)
+    relation_predicate = FACT[relation_type]
+    
+    triples = []
+    for row in relations:
+        source = str(row['Source'])
+        target = str(row['Target'])
+        
+        # URI 생성 ("/"도 인코딩하여 하위 폴더/아카이브 경로 전체를 하나의 로컬 이름으로 유지,
+        # 인코딩하지 않으면 다른 폴더의 같은 파일명이 같은 노드로 합쳐짐)
+        source_uri = FACT[urllib.parse.quote(source, safe="")]
+        target_uri = FACT[urllib.parse.quote(target, safe="")]
+        
+        triples.append((source_uri, relation_predicate, target_uri))
+    
+    return triples
+
+
+def add_relations_to_graph(g: Graph, relations: List[Dict[str, Any]], relation_type: str) -> List[Tuple[URIRef, URIRef, URIRef]]:
+    """
+    관계 목록을 Graph에 트리플로 추가
+    
+    Args:
+        g: RDF Graph
+        relations: 관계 목록 (Source, Target 키 포함)
+        relation_type: 관계 타입
+        
+    Returns:
+        List[Tuple]: Graph에 새로 추가된 트리플 (이미 있던 트리플 제외)
+    """
+    added = []
+    for triple in relation_triples(relations, relation_type):
+        if triple not in g:
+            g.add(triple)
+            added.append(triple)
+    
+    return added
+
+
+def serialize_turtle(g: Graph) -> str:
+    """
+    Graph를 Turtle 문자열로 직렬화
+    
+    Args:
+        g: RDF Graph
+        
+    Returns:
+        str: Turtle 문자열
+    """
+    graph_turtle = g.serialize(format="turtle")
+    if isinstance(graph_turtle, bytes):
+        graph_turtle = graph_turtle.decode('utf-8')
+    return str(graph_turtle)
+
+
+def write_triples(triples: Iterable[Tuple[Node, Node, Node]], out: TextIO, rdf_format: str = "turtle") -> int:
+    """
+    트리플을 한 번의 순회로 파일에 기록 (Graph나 전체 직렬화 문자열을 만들지 않음)
+    
+    Args:
+        triples: (subject, predicate, object) 트리플
+        out: 텍스트 출력 스트림
+        rdf_format: "turtle" 또는 "nt" (N-Triples)
+        
+    Returns:
+        int: 기록한 트리플 수
+    """
+    if rdf_format == "nt":
+        term = lambda node: node.n3()
+    elif rdf_format == "turtle":
+        for prefix, namespace in TURTLE_PREFIXES:
+            out.write(f"@prefix {prefix}: <{namespace}> .\n")
+        out.write("\n")
+        term = _turtle_term
+    else:
+        raise ValueError(f"지원하지 않는 RDF 형식입니다: {rdf_format}")
+    
+    count = 0
+    for s, p, o in triples:
+        out.write(f"{term(s)} {term(p)} {term(o)} .\n")
+        count += 1
+    return count
+
+
+def _turtle_term(node: Node) -> str:
+    """Turtle 용어 표기 (알려진 네임스페이스의 안전한 지역명은 접두사 형태로 축약)"""
+    if isinstance(node, URIRef):
+        for prefix, namespace in TURTLE_PREFIXES:
+            if node.startswith(namespace) and _SAFE_LOCAL_NAME.match(node[len(namespace):]):
+                return f"{prefix}:{node[len(namespace):]}"
+    return node.n3()
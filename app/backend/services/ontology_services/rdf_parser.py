@@ -4,9 +4,11 @@ Turtle 형식의 RDF Graph를 노드/엣지 구조로 변환
 """
 
 import logging
-from typing import List, Dict, Set
+from typing import Iterable, List, Dict, Set, Tuple
+import numpy as np
 from rdflib import Graph, URIRef, Literal
 from rdflib.namespace import RDF
+from backend.services.ontology_services.triple_store import CompactTripleStore
 
 logger = logging.getLogger(__name__)
 
@@ -84,92 +86,175 @@ def parse_rdf_graph(turtle_string: str) -> Dict[str, List]:
             logger.debug(f"파싱 시도한 데이터 (처음 200자): {turtle_string[:200] if isinstance(turtle_string, str) else str(turtle_string)[:200]}")
             raise ValueError(f"RDF Graph 형식이 올바르지 않습니다: {str(parse_error)}")
         
-        nodes: List[Dict[str, str]] = []
-        edges: List[Dict[str, str]] = []
-        node_ids = set()  # 중복 방지
-        
-        # 노드 ID 생성 함수
-        def get_node_id(uri: URIRef) -> str:
-            """URI에서 노드 ID 추출"""
-            uri_str = str(uri)
-            # 네임스페이스 제거
-            if "#" in uri_str:
-                return uri_str.split("#")[-1]
-            elif "/" in uri_str:
-                return uri_str.split("/")[-1]
-            return uri_str
-        
-        def get_node_label(uri: URIRef) -> str:
-            """URI에서 노드 라벨 추출"""
-            return get_node_id(uri)
-        
-        def get_node_type(uri: URIRef, predicate: URIRef) -> str:
-            """노드 타입 결정"""
-            # 관계 타입에 따라 결정
-            pred_str = str(predicate).lower()
-            if "isdataof" in pred_str or "hasdata" in pred_str:
-                # 데이터셋으로 판단
-                return "dataset"
-            else:
-                # 기본적으로 클래스로 판단
-                return "class"
-        
         # Graph가 비어있는지 확인
         if len(g) == 0:
             logger.warning("RDF Graph가 비어있습니다")
             return {"nodes": [], "edges": []}
         
-        # 모든 트리플 순회
-        for subject, predicate, obj in g:
-            # 주체(Subject) 노드 추가
-            if isinstance(subject, URIRef):
-                subj_id = get_node_id(subject)
-                if subj_id not in node_ids:
-                    nodes.append({
-                        "id": subj_id,
-                        "label": get_node_label(subject),
-                        "type": "dataset"  # 기본적으로 데이터셋
-                    })
-                    node_ids.add(subj_id)
-            
-            # 객체(Object) 노드 추가
-            if isinstance(obj, URIRef):
-                obj_id = get_node_id(obj)
-                if obj_id not in node_ids:
-                    nodes.append({
-                        "id": obj_id,
-                        "label": get_node_label(obj),
-                        "type": "class"  # 기본적으로 클래스
-                    })
-                    node_ids.add(obj_id)
-            
-            # 엣지 추가 (같은 객체가 여러 번 타겟으로 나타나도 모든 관계를 캡처)
-            if isinstance(subject, URIRef) and isinstance(obj, URIRef):
-                subj_id = get_node_id(subject)
-                obj_id = get_node_id(obj)
-                pred_str = str(predicate)
-                # 관계 타입 추출
-                if "#" in pred_str:
-                    relation = pred_str.split("#")[-1]
-                elif "/" in pred_str:
-                    relation = pred_str.split("/")[-1]
-                else:
-                    relation = pred_str
-                
-                edges.append({
-                    "source": subj_id,
-                    "target": obj_id,
-                    "relation": relation
-                })
-        
-        logger.info(f"RDF Graph 파싱 완료: 노드 {len(nodes)}개, 엣지 {len(edges)}개")
-        
-        return {
-            "nodes": nodes,
-            "edges": edges
-        }
+        return graph_to_nodes_edges(g)
         
     except Exception as e:
         logger.error(f"RDF Graph 파싱 실패: {str(e)}", exc_info=True)
         raise ValueError(f"RDF Graph 파싱 중 오류가 발생했습니다: {str(e)}")
 
+
+def graph_to_nodes_edges(g: Graph) -> Dict[str, List]:
+    """
+    RDF Graph 객체를 노드/엣지 구조로 변환 (Turtle 파싱 없이 저장소의 Graph를 직접 순회)
+    
+    Args:
+        g: RDF Graph
+        
+    Returns:
+        {
+            "nodes": [{"id": str, "label": str, "type": str}, ...],
+            "edges": [{"source": str, "target": str, "relation": str}, ...]
+        }
+    """
+    graph_data = triples_to_nodes_edges(g)
+    logger.info(f"RDF Graph 파싱 완료: 노드 {len(graph_data['nodes'])}개, 엣지 {len(graph_data['edges'])}개")
+    return graph_data
+
+
+def triples_to_nodes_edges(triples: Iterable[Tuple]) -> Dict[str, List]:
+    """
+    트리플 목록을 노드/엣지 구조로 변환 (Graph 전체 또는 새로 추가된 트리플만 변환 가능)
+    
+    Args:
+        triples: (subject, predicate, object) 트리플 목록 또는 Graph
+        
+    Returns:
+        {
+            "nodes": [{"id": str, "label": str, "type": str}, ...],
+            "edges": [{"source": str, "target": str, "relation": str}, ...]
+        }
+    """
+    nodes: List[Dict[str, str]] = []
+    edges: List[Dict[str, str]] = []
+    node_ids = set()  # 중복 방지
+    
+    # 노드 ID 생성 함수
+    def get_node_id(uri: URIRef) -> str:
+        """URI에서 노드 ID 추출"""
+        uri_str = str(uri)
+        # 네임스페이스 제거
+        if "#" in uri_str:
+            return uri_str.split("#")[-1]
+        elif "/" in uri_str:
+            return uri_str.split("/")[-1]
+        return uri_str
+    
+    def get_node_label(uri: URIRef) -> str:
+        """URI에서 노드 라벨 추출"""
+        return get_node_id(uri)
+    
+    def get_node_type(uri: URIRef, predicate: URIRef) -> str:
+        """노드 타입 결정"""
+        # 관계 타입에 따라 결정
+        pred_str = str(predicate).lower()
+        if "isdataof" in pred_str or "hasdata" in pred_str:
+            # 데이터셋으로 판단
+            return "dataset"
+        else:
+            # 기본적으로 클래스로 판단
+            return "class"
+    
+    # 모든 트리플 순회
+    for subject, predicate, obj in triples:
+        # 주체(Subject) 노드 추가
+        if isinstance(subject, URIRef):
+            subj_id = get_node_id(subject)
+            if subj_id not in node_ids:
+                nodes.append({
+                    "id": subj_id,
+                    "label": get_node_label(subject),
+                    "type": "dataset"  # 기본적으로 데이터셋
+                })
+                node_ids.add(subj_id)
+        
+        # 객체(Object) 노드 추가
+        if isinstance(obj, URIRef):
+            obj_id = get_node_id(obj)
+            if obj_id not in node_ids:
+                nodes.append({
+                    "id": obj_id,
+                    "label": get_node_label(obj),
+                    "type": "class"  # 기본적으로 클래스
+                })
+                node_ids.add(obj_id)
+        
+        # 엣지 추가 (같은 객체가 여러 번 타겟으로 나타나도 모든 관계를 캡처)
+        if isinstance(subject, URIRef) and isinstance(obj, URIRef):
+            subj_id = get_node_id(subject)
+            obj_id = get_node_id(obj)
+            pred_str = str(predicate)
+            # 관계 타입 추출
+            if "#" in pred_str:
+                relation = pred_str.split("#")[-1]
+            elif "/" in pred_str:
+                relation = pred_str.split("/")[-1]
+            else:
+                relation = pred_str
+            
+            edges.append({
+                "source": subj_id,
+                "target": obj_id,
+                "relation": relation
+            })
+    
+    return {
+        "nodes": nodes,
+        "edges": edges
+    }
+
+
+def store_to_nodes_edges(store: CompactTripleStore) -> Dict[str, List]:
+    """
+    사전 인코딩 트리플 저장소를 노드/엣지 구조로 변환
+    triples_to_nodes_edges와 같은 결과를 용어 ID 배열 연산으로 계산 (URI 문자열 분리는 사전에 캐시됨)
+    
+    Args:
+        store: 트리플 저장소
+        
+    Returns:
+        {
+            "nodes": [{"id": str, "label": str, "type": str}, ...],
+            "edges": [{"source": str, "target": str, "relation": str}, ...]
+        }
+    """
+    dictionary = store.dictionary
+    local_name = dictionary.local_name
+    subjects, predicates, objects = store.subjects, store.predicates, store.objects
+    
+    # 행 순서대로 subject, object를 번갈아 나열 (처음 나온 위치가 노드 순서와 타입을 결정)
+    sequence = np.column_stack((subjects, objects)).ravel()
+    positions = np.nonzero(dictionary.is_uri(sequence))[0]
+    term_ids, first = np.unique(sequence[positions], return_index=True)
+    order = np.argsort(first)
+    
+    nodes: List[Dict[str, str]] = []
+    node_ids: Set[str] = set()  # 중복 방지 (로컬 이름 기준)
+    for term_id, position in zip(term_ids[order].tolist(), positions[first[order]].tolist()):
+        node_id = local_name(term_id)
+        if node_id in node_ids:
+            continue
+        node_ids.add(node_id)
+        nodes.append({
+            "id": node_id,
+            "label": node_id,
+            # 짝수 위치는 subject(데이터셋), 홀수 위치는 object(클래스)
+            "type": "dataset" if position % 2 == 0 else "class"
+        })
+    
+    # 양 끝이 모두 URI인 트리플만 엣지
+    edge_mask = dictionary.is_uri(subjects) & dictionary.is_uri(objects)
+    rows = np.column_stack((subjects, predicates, objects))[edge_mask]
+    edges = [
+        {"source": local_name(s), "target": local_name(o), "relation": local_name(p)}
+        for s, p, o in rows.tolist()
+    ]
+    
+    return {
+        "nodes": nodes,
+        "edges": edges
+    }
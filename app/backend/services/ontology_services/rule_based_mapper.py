@@ -4,37 +4,37 @@
 """
 
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from backend.services.ontology_services.keyword_rules import (
+    KeywordRuleIndex,
+    build_rule_index,
+    get_keyword_rule_store,
+)
 
 
 class RuleBasedMapper:
     """고신뢰도 키워드 기반 규칙 매핑"""
     
-    def __init__(self):
-        # 도메인별 키워드 사전 (실무에서 도메인 지식 반영)
-        self.keyword_rules = {
-            "Injection_Molding_Machine": [
-                "injection", "molding", "moulding", "plastic", "inj", "사출"
-            ],
-            "Welding_Robot": [
-                "welding", "welder", "weld", "robot", "용접"
-            ],
-            "Industrial_Pump": [
-                "pump", "펌프", "pressure"
-            ],
-            "CNC_Machine": [
-                "cnc", "machining", "nc", "가공"
-            ],
-            "Conveyor_Belt": [
-                "conveyor", "belt", "컨베이어", "transport"
-            ],
-            "Motor": [
-                "motor", "curr", "current", "voltage", "volt", "모터"
-            ],
-            "Melting_Machine": [
-                "melting", "melt", "molten", "주석", "주석기",
-            ]
-        }
+    def __init__(self, keyword_rules: Optional[Dict[str, List[str]]] = None):
+        """
+        규칙 매퍼 초기화
+        
+        Args:
+            keyword_rules: 클래스별 키워드 사전 (None이면 공유 저장소의 현재 인덱스 사용)
+        """
+        if keyword_rules is None:
+            # 생성 시점의 인덱스를 고정해 한 요청 안에서는 같은 버전의 규칙 사용
+            self.rule_index: KeywordRuleIndex = get_keyword_rule_store().current()
+        else:
+            self.rule_index = build_rule_index(keyword_rules, version="custom")
+        self.keyword_rules = self.rule_index.rules
+        self.automaton = self.rule_index.automaton
+    
+    @property
+    def rule_version(self) -> str:
+        """사용 중인 키워드 사전 버전"""
+        return self.rule_index.version
     
     def preprocess_text(self, text: str) -> str:
         """텍스트 전처리 (규칙 매칭용)"""
@@ -44,21 +44,21 @@ class RuleBasedMapper:
         return text
     
     def match_by_keywords(self, filename: str) -> Optional[Tuple[str, float]]:
-        """키워드 기반 매칭 (고신뢰도)"""
+        """키워드 기반 매칭 (고신뢰도, 오토마톤으로 한 번만 순회)"""
         clean_name = self.preprocess_filename(filename)
-        words = clean_name.split()
+        class_matches = self.automaton.count_matches(clean_name)
         
         best_match = None
         best_score = 0.0
         
-        for class_name, keywords in self.keyword_rules.items():
-            matches = sum(1 for kw in keywords if kw in clean_name or any(kw in word for word in words))
-            if matches > 0:
-                # 매칭된 키워드 수에 비례한 점수
-                score = min(0.95, 0.7 + (matches * 0.1))
-                if score > best_score:
-                    best_score = score
-                    best_match = class_name
+        # 사전 순서대로 비교해 동점이면 앞선 클래스 유지
+        for class_idx in sorted(class_matches):
+            matches = class_matches[class_idx]
+            # 매칭된 키워드 수에 비례한 점수
+            score = min(0.95, 0.7 + (matches * 0.1))
+            if score > best_score:
+                best_score = score
+                best_match = self.automaton.class_names[class_idx]
         
         return (best_match, best_score) if best_match else None
     
@@ -0,0 +1,117 @@
+"""
+스키마 지문 매핑 캐시 모듈
+컬럼 구성(컬럼명 + dtype)이 같은 파일의 매핑 결정을 기억하여 같은 형식의 파일은 시맨틱 추론 없이 매핑
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from backend.services.ontology_services.config import SCHEMA_MAPPING_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# 같은 지문에서 서로 다른 클래스가 결정된 경우 (스키마만으로 구분할 수 없으므로 재사용하지 않음)
+_AMBIGUOUS = object()
+
+
+class SchemaMappingCache:
+    """
+    (매핑 범위, 스키마 지문) 기준 매핑 결정 LRU 캐시
+    매핑 범위는 모델명, 정규화된 클래스 집합, 키워드 사전 버전 조합 (HybridMapper가 생성)
+    """
+    
+    def __init__(self, max_entries: int = SCHEMA_MAPPING_CACHE_MAX_ENTRIES):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 캐시 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._conflicts = 0
+    
+    def lookup(self, scope: Hashable, fingerprint: str) -> Optional[Tuple[str, float]]:
+        """
+        지문의 매핑 결정 조회
+        
+        Args:
+            scope: 매핑 범위
+            fingerprint: 스키마 지문
+            
+        Returns:
+            (클래스, 신뢰도) 또는 None (처음 보는 지문이거나 결정이 엇갈린 지문)
+        """
+        key = (scope, fingerprint)
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is None or decision is _AMBIGUOUS:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return decision
+    
+    def record(self, scope: Hashable, decisions: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        매핑 결정 기록 (이미 다른 클래스로 결정된 지문은 재사용하지 않도록 표시)
+        
+        Args:
+            scope: 매핑 범위
+            decisions: (스키마 지문, 클래스, 신뢰도) 목록
+        """
+        with self._lock:
+            for fingerprint, mapped_class, confidence in decisions:
+                key = (scope, fingerprint)
+                decision = self._entries.get(key)
+                if decision is None:
+                    self._entries[key] = (mapped_class, confidence)
+                elif decision is not _AMBIGUOUS and decision[0] != mapped_class:
+                    self._entries[key] = _AMBIGUOUS
+                    self._conflicts += 1
+                    logger.info(f"스키마 지문의 매핑 결정이 엇갈려 재사용 중단: {fingerprint[:12]} ({decision[0]}, {mapped_class})")
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            항목 수, 히트/미스 횟수 (규칙 매칭에 실패한 파일 기준), 결정이 엇갈린 지문 수
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "conflicts": self._conflicts,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            }
+
+
+# 전역 캐시 인스턴스
+_schema_mapping_cache = SchemaMappingCache()
+
+
+def get_schema_mapping_cache() -> SchemaMappingCache:
+    """
+    스키마 지문 매핑 캐시 인스턴스 반환
+    
+    Returns:
+        SchemaMappingCache 인스턴스
+    """
+    return _schema_mapping_cache
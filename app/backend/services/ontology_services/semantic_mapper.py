@@ -3,42 +3,88 @@
 임베딩 기반 시맨틱 유사도 매핑 전략
 """
 
+import numpy as np
 import polars as pl
-from sentence_transformers import SentenceTransformer, util
 from typing import List
 
+from backend.services.ontology_services.disk_embedding_cache import get_disk_embedding_cache_manager
+from backend.services.ontology_services.embedding_cache import get_class_embedding_cache, l2_normalize
+from backend.services.ontology_services.model_registry import get_model_registry
+
+# map_semantic 결과 스키마
+_RESULT_SCHEMA = {
+    "Filename": pl.Utf8,
+    "Interpreted_As": pl.Utf8,
+    "Mapped_Class": pl.Utf8,
+    "Confidence": pl.Float64,
+}
+
 
 class SemanticMapper:
     """임베딩 기반 시맨틱 매핑"""
     
     def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2'):
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+    
+    @property
+    def model(self):
+        """공유 레지스트리의 모델 (최초 접근 시 로드)"""
+        return get_model_registry().get(self.model_name)
     
     def preprocess_filename(self, fname: str) -> str:
         """파일명 전처리 (시맨틱 매칭용)"""
         name = fname.replace('.csv', '').replace('_', ' ').replace('-', ' ')
         return name.strip()
     
+    def encode_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        전처리된 텍스트 임베딩 (디스크 캐시 우선, 미스만 한 번에 인코딩)
+        
+        Args:
+            texts: 전처리된 텍스트 목록
+            
+        Returns:
+            (N, D) L2 정규화 임베딩 행렬
+        """
+        disk_cache = get_disk_embedding_cache_manager().get(self.model_name)
+        if disk_cache is None:
+            return l2_normalize(self.model.encode(texts, show_progress_bar=False))
+        
+        cached = disk_cache.get_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+        encoded = {}
+        if missing:
+            missing_embeddings = l2_normalize(self.model.encode(missing, show_progress_bar=False))
+            disk_cache.put_many(missing, missing_embeddings)
+            encoded = dict(zip(missing, missing_embeddings))
+        
+        return np.vstack([
+            vector if vector is not None else encoded[text]
+            for text, vector in zip(texts, cached)
+        ])
+    
     def map_semantic(self, files: List[str], classes: List[str]) -> pl.DataFrame:
         """시맨틱 매핑 수행"""
-        clean_names = [self.preprocess_filename(f) for f in files]
-        embeddings_files = self.model.encode(clean_names, show_progress_bar=False)
-        embeddings_classes = self.model.encode(classes, show_progress_bar=False)
+        if not files:
+            return pl.DataFrame(schema=_RESULT_SCHEMA)
         
-        scores = util.cos_sim(embeddings_files, embeddings_classes)
+        model = self.model
+        # 클래스 임베딩은 (모델, 클래스 집합) 단위로 캐시된 정규화 행렬 사용
+        class_embeddings = get_class_embedding_cache().get(self.model_name, model, classes)
+        if not class_embeddings.classes:
+            return pl.DataFrame(schema=_RESULT_SCHEMA)
         
-        results = []
-        for i, fname in enumerate(files):
-            best_idx = scores[i].argmax().item()
-            best_score = scores[i][best_idx].item()
-            best_class = classes[best_idx]
-            
-            results.append({
-                "Filename": fname,
-                "Interpreted_As": clean_names[i],
-                "Mapped_Class": best_class,
-                "Confidence": round(best_score, 3)
-            })
+        clean_names = [self.preprocess_filename(f) for f in files]
+        embeddings_files = self.encode_texts(clean_names)
         
-        return pl.DataFrame(results)
-
+        # 정규화된 행렬 곱 = 코사인 유사도
+        scores = embeddings_files @ class_embeddings.matrix.T
+        best_indices = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(files)), best_indices]
+        
+        return pl.DataFrame({
+            "Filename": list(files),
+            "Interpreted_As": clean_names,
+            "Mapped_Class": [class_embeddings.classes[idx] for idx in best_indices],
+            "Confidence": [round(float(score), 3) for score in best_scores],
+        }, schema=_RESULT_SCHEMA)
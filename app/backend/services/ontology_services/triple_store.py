@@ -0,0 +1,432 @@
+"""
+사전 인코딩 트리플 저장소
+URI/리터럴을 정수 ID로 인코딩하고 트리플을 NumPy 컬럼(s, p, o)으로 보관
+SPO/POS/OSP 정렬 인덱스로 패턴 조회 지원
+"""
+
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from rdflib import Graph, URIRef
+from rdflib.term import Node
+
+Triple = Tuple[Node, Node, Node]
+
+# 인덱스 없이 선형 검색할 최근 추가분의 최대 크기 (넘으면 인덱스 재구성)
+_MIN_UNINDEXED_ROWS = 1024
+
+ID_DTYPE = np.uint32
+# 트리플 한 행(s, p, o)을 하나의 값으로 보는 키 (정렬/이진 탐색으로 포함 여부 확인)
+_ROW_KEY_DTYPE = np.dtype((np.void, 3 * np.dtype(ID_DTYPE).itemsize))
+
+
+def local_name(term: Node) -> str:
+    """URI에서 네임스페이스를 제거한 이름 (노드 ID/라벨, 관계명)"""
+    term_str = str(term)
+    if "#" in term_str:
+        return term_str.split("#")[-1]
+    elif "/" in term_str:
+        return term_str.split("/")[-1]
+    return term_str
+
+
+class TermDictionary:
+    """
+    용어 사전 (URI/리터럴 <-> 정수 ID)
+    모든 온톨로지가 공유하여 같은 클래스 URI는 한 번만 저장
+    """
+    
+    def __init__(self):
+        """사전 초기화"""
+        self._ids: Dict[Node, int] = {}
+        self._terms: List[Node] = []
+        self._local_names: List[str] = []
+        self._is_uri = bytearray()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._terms)
+    
+    def intern(self, term: Node) -> int:
+        """
+        용어의 ID 반환 (없으면 새로 할당)
+        
+        Args:
+            term: URIRef, Literal, BNode
+            
+        Returns:
+            int: 용어 ID
+        """
+        term_id = self._ids.get(term)
+        if term_id is not None:
+            return term_id
+        
+        with self._lock:
+            term_id = self._ids.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self._terms.append(term)
+                self._local_names.append(local_name(term))
+                self._is_uri.append(isinstance(term, URIRef))
+                self._ids[term] = term_id
+            return term_id
+    
+    def lookup(self, term: Node) -> Optional[int]:
+        """용어 ID 조회 (등록되지 않았으면 None)"""
+        return self._ids.get(term)
+    
+    def term(self, term_id: int) -> Node:
+        """ID의 용어 반환"""
+        return self._terms[term_id]
+    
+    def local_name(self, term_id: int) -> str:
+        """ID의 로컬 이름 반환 (미리 계산됨)"""
+        return self._local_names[term_id]
+    
+    def is_uri(self, term_ids: np.ndarray) -> np.ndarray:
+        """ID 배열의 URIRef 여부 (bool 배열)"""
+        flags = np.frombuffer(self._is_uri, dtype=np.uint8)
+        return flags[term_ids].astype(bool)
+    
+    def nbytes(self) -> int:
+        """ID 조회 테이블 외 부가 배열 크기 (대략적인 값, 용어 문자열 제외)"""
+        return len(self._is_uri)
+
+
+# 전역 용어 사전 인스턴스
+_term_dictionary = TermDictionary()
+
+
+def get_term_dictionary() -> TermDictionary:
+    """
+    용어 사전 인스턴스 반환
+    
+    Returns:
+        TermDictionary 인스턴스
+    """
+    return _term_dictionary
+
+
+class CompactTripleStore:
+    """
+    온톨로지 하나의 트리플 저장소
+    - 트리플: 용어 ID의 s/p/o 컬럼 (uint32, 트리플당 12바이트)
+    - 인덱스: SPO/POS/OSP 정렬 순서 (행 번호 배열) + 중복 확인용 정렬 키
+      최근 추가분은 선형 검색하다가 일정 크기를 넘거나 패턴 조회가 오면 한 번에 반영
+    - 같은 트리플은 한 번만 저장 (rdflib Graph와 동일한 집합 의미)
+    """
+    
+    def __init__(self, dictionary: Optional[TermDictionary] = None, capacity: int = 16):
+        """
+        저장소 초기화
+        
+        Args:
+            dictionary: 용어 사전 (None이면 전역 사전)
+            capacity: 초기 행 용량
+        """
+        self.dictionary = dictionary if dictionary is not None else get_term_dictionary()
+        self._rows = np.empty((max(capacity, 1), 3), dtype=ID_DTYPE)
+        self._size = 0
+        # 정렬 인덱스: "spo"/"pos"/"osp" -> 행 번호 배열
+        self._indexes: Dict[str, np.ndarray] = {}
+        self._sorted_keys = np.empty(0, dtype=_ROW_KEY_DTYPE)
+        self._indexed_size = 0
+    
+    @classmethod
+    def from_triples(cls, triples: Iterable[Triple], dictionary: Optional[TermDictionary] = None) -> "CompactTripleStore":
+        """
+        트리플 목록(또는 rdflib Graph)으로 저장소 생성
+        
+        Args:
+            triples: (subject, predicate, object) 트리플 목록
+            dictionary: 용어 사전 (None이면 전역 사전)
+            
+        Returns:
+            CompactTripleStore: 생성된 저장소
+        """
+        store = cls(dictionary)
+        store.add(triples)
+        return store
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Triple]:
+        """삽입 순서대로 트리플 반환 (rdflib 용어)"""
+        return self._decode_rows(np.arange(self._size))
+    
+    def __contains__(self, triple: Triple) -> bool:
+        encoded = self._lookup_ids(triple)
+        if encoded is None:
+            return False
+        return bool(self._contains_ids(np.array([encoded], dtype=ID_DTYPE))[0])
+    
+    @property
+    def nbytes(self) -> int:
+        """트리플 컬럼과 인덱스의 메모리 크기 (bytes)"""
+        return self._rows.nbytes + self._sorted_keys.nbytes + sum(index.nbytes for index in self._indexes.values())
+    
+    @property
+    def subjects(self) -> np.ndarray:
+        """subject ID 컬럼 (삽입 순서, 읽기 전용으로 사용)"""
+        return self._rows[:self._size, 0]
+    
+    @property
+    def predicates(self) -> np.ndarray:
+        """predicate ID 컬럼 (삽입 순서, 읽기 전용으로 사용)"""
+        return self._rows[:self._size, 1]
+    
+    @property
+    def objects(self) -> np.ndarray:
+        """object ID 컬럼 (삽입 순서, 읽기 전용으로 사용)"""
+        return self._rows[:self._size, 2]
+    
+    def add(self, triples: Iterable[Triple]) -> "CompactTripleStore":
+        """
+        트리플 추가 (이미 있는 트리플과 같은 배치 안의 중복은 제외)
+        
+        Args:
+            triples: (subject, predicate, object) 트리플 목록
+            
+        Returns:
+            CompactTripleStore: 새로 추가된 트리플만 담은 저장소 (같은 사전 공유)
+        """
+        return self._add_encoded(self._encode(triples))
+    
+    def difference(self, triples: Iterable[Triple]) -> "CompactTripleStore":
+        """
+        아직 저장되지 않은 트리플만 계산 (이 저장소는 변경하지 않음)
+        영속화가 성공한 뒤 merge로 반영하여 실패한 쓰기가 메모리에만 남지 않도록 할 때 사용
+        
+        Args:
+            triples: (subject, predicate, object) 트리플 목록
+            
+        Returns:
+            CompactTripleStore: 새 트리플만 담은 저장소 (같은 사전 공유)
+        """
+        return self._delta(self._new_rows(self._encode(triples)))
+    
+    def merge(self, delta: "CompactTripleStore") -> None:
+        """
+        difference 결과 반영 (그 사이 이 저장소에 다른 추가가 없어야 함)
+        
+        Args:
+            delta: 같은 사전을 공유하는 difference 결과
+        """
+        self._append_rows(delta._rows[:delta._size])
+    
+    def without(self, triples: Iterable[Triple]) -> "CompactTripleStore":
+        """
+        주어진 트리플을 뺀 새 저장소 생성 (이 저장소는 변경하지 않음, 기존 관계 교체용)
+        
+        Args:
+            triples: 제외할 (subject, predicate, object) 트리플 목록
+            
+        Returns:
+            CompactTripleStore: 나머지 트리플을 삽입 순서대로 담은 저장소 (같은 사전 공유)
+        """
+        removed = self._delta(self._encode(triples))
+        rows = self._rows[:self._size]
+        return self._delta(rows[~removed._contains_ids(rows)])
+    
+    def add_encoded(self, terms: List[Node], rows: np.ndarray) -> "CompactTripleStore":
+        """
+        지역 용어 목록 기준으로 인코딩된 트리플 추가 (영속 저장소에서 읽은 청크 복원용)
+        
+        Args:
+            terms: 지역 용어 목록
+            rows: (n, 3) 배열, 각 값은 terms의 위치
+            
+        Returns:
+            CompactTripleStore: 새로 추가된 트리플만 담은 저장소
+        """
+        intern = self.dictionary.intern
+        global_ids = np.array([intern(term) for term in terms], dtype=ID_DTYPE)
+        return self._add_encoded(global_ids[np.asarray(rows, dtype=np.int64).reshape(-1, 3)])
+    
+    def export_encoded(self) -> Tuple[List[Node], np.ndarray]:
+        """
+        사용 중인 용어만 담은 지역 용어 목록과 그 기준으로 인코딩한 트리플 반환 (영속 저장용)
+        
+        Returns:
+            (지역 용어 목록, (n, 3) uint32 배열)
+        """
+        rows = self._rows[:self._size]
+        used, local_rows = np.unique(rows, return_inverse=True)
+        term = self.dictionary.term
+        return [term(term_id) for term_id in used.tolist()], local_rows.reshape(-1, 3).astype(ID_DTYPE)
+    
+    def _encode(self, triples: Iterable[Triple]) -> np.ndarray:
+        """트리플을 전역 ID (n, 3) 배열로 인코딩"""
+        intern = self.dictionary.intern
+        return np.array(
+            [(intern(s), intern(p), intern(o)) for s, p, o in triples],
+            dtype=ID_DTYPE
+        ).reshape(-1, 3)
+    
+    def _new_rows(self, encoded: np.ndarray) -> np.ndarray:
+        """배치 안의 중복과 이미 저장된 트리플을 제외한 행 (처음 나온 순서 유지)"""
+        if len(encoded):
+            _, first = np.unique(encoded, axis=0, return_index=True)
+            encoded = encoded[np.sort(first)]
+            encoded = encoded[~self._contains_ids(encoded)]
+        return encoded
+    
+    def _delta(self, encoded: np.ndarray) -> "CompactTripleStore":
+        """주어진 행만 담은 저장소 생성 (같은 사전 공유)"""
+        delta = CompactTripleStore(self.dictionary, capacity=len(encoded))
+        delta._append_rows(encoded)
+        return delta
+    
+    def _add_encoded(self, encoded: np.ndarray) -> "CompactTripleStore":
+        """전역 ID로 인코딩된 트리플 추가 (중복 제외)"""
+        encoded = self._new_rows(encoded)
+        self._append_rows(encoded)
+        return self._delta(encoded)
+    
+    def triples(
+        self,
+        subject: Optional[Node] = None,
+        predicate: Optional[Node] = None,
+        obj: Optional[Node] = None
+    ) -> Iterator[Triple]:
+        """
+        패턴에 맞는 트리플 조회 (None은 와일드카드)
+        
+        Args:
+            subject: subject 용어
+            predicate: predicate 용어
+            obj: object 용어
+            
+        Returns:
+            Iterator[Triple]: 맞는 트리플 (rdflib 용어)
+        """
+        return self._decode_rows(self.match_rows(subject, predicate, obj))
+    
+    def match_rows(
+        self,
+        subject: Optional[Node] = None,
+        predicate: Optional[Node] = None,
+        obj: Optional[Node] = None
+    ) -> np.ndarray:
+        """
+        패턴에 맞는 행 번호 조회 (바인딩된 항목이 앞에 오는 인덱스에서 이진 탐색)
+        
+        Returns:
+            np.ndarray: 행 번호 배열 (인덱스 정렬 순서)
+        """
+        pattern = [subject, predicate, obj]
+        ids: List[Optional[int]] = []
+        for term in pattern:
+            if term is None:
+                ids.append(None)
+                continue
+            term_id = self.dictionary.lookup(term)
+            if term_id is None:
+                return np.empty(0, dtype=np.int64)
+            ids.append(term_id)
+        
+        bound = tuple(term_id is not None for term_id in ids)
+        if not any(bound):
+            return np.arange(self._size)
+        
+        # 바인딩된 위치가 정렬 키 앞부분이 되는 인덱스 선택
+        if bound[0] and (bound[1] or not bound[2]):
+            name, order = "spo", (0, 1, 2)
+        elif bound[1]:
+            name, order = "pos", (1, 2, 0)
+        else:
+            name, order = "osp", (2, 0, 1)
+        
+        self._ensure_indexes()
+        rows = self._indexes[name]
+        for column in order:
+            term_id = ids[column]
+            if term_id is None:
+                break
+            values = self._rows[rows, column]
+            lo = np.searchsorted(values, term_id, side="left")
+            hi = np.searchsorted(values, term_id, side="right")
+            rows = rows[lo:hi]
+        return rows
+    
+    def to_graph(self, graph: Optional[Graph] = None) -> Graph:
+        """
+        rdflib Graph로 변환 (Turtle 직렬화용)
+        
+        Args:
+            graph: 트리플을 추가할 Graph (None이면 새 Graph)
+            
+        Returns:
+            Graph: 변환된 Graph
+        """
+        graph = graph if graph is not None else Graph()
+        for triple in self:
+            graph.add(triple)
+        return graph
+    
+    def _lookup_ids(self, triple: Triple) -> Optional[Tuple[int, int, int]]:
+        """트리플을 ID로 변환 (사전에 없는 용어가 있으면 None)"""
+        ids = tuple(self.dictionary.lookup(term) for term in triple)
+        if any(term_id is None for term_id in ids):
+            return None
+        return ids
+    
+    def _append_rows(self, encoded: np.ndarray) -> None:
+        """인코딩된 행 추가 (용량이 부족하면 두 배로 확장)"""
+        count = len(encoded)
+        if not count:
+            return
+        needed = self._size + count
+        if needed > len(self._rows):
+            rows = np.empty((max(needed, len(self._rows) * 2), 3), dtype=ID_DTYPE)
+            rows[:self._size] = self._rows[:self._size]
+            self._rows = rows
+        self._rows[self._size:needed] = encoded
+        self._size = needed
+    
+    def _ensure_indexes(self) -> None:
+        """인덱스 이후 추가된 행이 있으면 SPO/POS/OSP 인덱스와 정렬 키 재구성"""
+        if self._indexed_size == self._size and self._indexes:
+            return
+        s, p, o = self.subjects, self.predicates, self.objects
+        # np.lexsort는 마지막 키가 1순위
+        self._indexes = {
+            "spo": np.lexsort((o, p, s)).astype(np.int32),
+            "pos": np.lexsort((s, o, p)).astype(np.int32),
+            "osp": np.lexsort((p, s, o)).astype(np.int32),
+        }
+        self._sorted_keys = np.sort(_row_keys(self._rows[:self._size]))
+        self._indexed_size = self._size
+    
+    def _contains_ids(self, encoded: np.ndarray) -> np.ndarray:
+        """인코딩된 트리플들의 저장 여부 (bool 배열)"""
+        found = np.zeros(len(encoded), dtype=bool)
+        if not self._size or not len(encoded):
+            return found
+        
+        # 인덱스 이후 추가분이 크면 인덱스를 먼저 재구성
+        if self._size - self._indexed_size > max(_MIN_UNINDEXED_ROWS, self._indexed_size // 8):
+            self._ensure_indexes()
+        
+        keys = _row_keys(encoded)
+        if self._indexed_size:
+            positions = np.searchsorted(self._sorted_keys, keys)
+            positions = np.minimum(positions, self._indexed_size - 1)
+            found = self._sorted_keys[positions] == keys
+        
+        # 인덱스에 반영되지 않은 최근 추가분
+        if self._indexed_size < self._size:
+            found |= np.isin(keys, _row_keys(self._rows[self._indexed_size:self._size]))
+        return found
+    
+    def _decode_rows(self, rows: np.ndarray) -> Iterator[Triple]:
+        """행 번호를 rdflib 용어 트리플로 변환"""
+        term = self.dictionary.term
+        for s, p, o in self._rows[rows].tolist():
+            yield term(s), term(p), term(o)
+
+
+def _row_keys(rows: np.ndarray) -> np.ndarray:
+    """(n, 3) ID 배열의 각 행을 하나의 비교 가능한 키로 변환"""
+    return np.ascontiguousarray(rows, dtype=ID_DTYPE).view(_ROW_KEY_DTYPE).ravel()
@@ -31,8 +31,7 @@ def generate_dataset_id(
     content = f"{file_base}_{class_prefix}"
     if file_path and os.path.exists(file_path):
         # 파일 내용 기반 해시 추가 (더 정확한 고유성)
-        with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()[:8]
+        file_hash = file_sha256(file_path)[:8]
         content = f"{content}_{file_hash}"
     
     hash_id = hashlib.sha256(content.encode()).hexdigest()[:8]
@@ -42,6 +41,24 @@ def generate_dataset_id(
     return dataset_id
 
 
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일 내용 SHA-256 계산 (청크 단위로 읽어 파일 전체를 메모리에 올리지 않음)
+    
+    Args:
+        file_path: 파일 경로
+        chunk_size: 한 번에 읽을 크기 (bytes)
+    
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def sanitize_filename_for_uri(filename: str) -> str:
     """
     URI에 사용할 수 있도록 파일명 정제
@@ -1,49 +1,237 @@
 """
 온톨로지 저장소
-생성된 온톨로지 메타데이터를 메모리에 저장
+생성된 온톨로지 메타데이터와 온톨로지별 트리플(사전 인코딩 저장소)을 메모리에 저장
 """
 
+import base64
+import bisect
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Iterable, Optional, List, Tuple, TypeVar
+import polars as pl
 from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.ontology_services.ontology_builder import (
+    new_ontology_graph,
+    relation_triples,
+    serialize_turtle,
+)
+from backend.services.ontology_services.triple_store import CompactTripleStore, get_term_dictionary
+from backend.services.storage_backend import (
+    MemoryBackend,
+    StorageBackend,
+    VersionConflictError,
+    create_storage_backend,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 목록 정렬 키: (생성일시, 온톨로지 ID)
+OrderKey = Tuple[str, str]
+
+# 저장소 변경 이벤트 리스너: (이벤트, 온톨로지 ID, 트리플 저장소, 생성일시)
+# - "save": 온톨로지 트리플 전체, "append": 새로 추가된 트리플만, "delete": 빈 저장소
+# - 생성일시는 목록 정렬 키에 쓰이는 값 (이벤트 도착 순서와 무관하게 최신순을 정할 때 사용)
+StorageListener = Callable[[str, str, CompactTripleStore, str], None]
+
 
 class OntologyStorage:
-    """온톨로지 메타데이터 저장소 (메모리 기반)"""
+    """
+    온톨로지 저장소 (메모리 + 영속화 백엔드)
+    온톨로지별 트리플을 사전 인코딩 저장소(CompactTripleStore)로 유지하여 관계 추가 시 새 트리플만 반영하고,
+    Turtle 직렬화는 요청 시에만 수행하여 다음 쓰기 전까지 캐시
+    매핑 결과는 dict 목록 대신 컬럼 형식(polars DataFrame)으로 보관
+    시작 시 백엔드에서 메타데이터만 읽고, 트리플/매핑 페이로드는 처음 사용할 때 읽음
+    쓰기마다 온톨로지별 버전을 올려 파생 캐시(그래프 투영, ETag)가 변경을 감지할 수 있도록 함
+    여러 워커가 백엔드를 공유하면 조회/쓰기 전에 다른 워커의 변경을 반영 (sync)
+    목록 조회용으로 (생성일시, ID) 순서의 메타데이터 인덱스(전체, 클래스별)를 저장/삭제 시 갱신
     
-    def __init__(self):
-        """저장소 초기화"""
-        self._storage: Dict[str, Dict] = {}
-        logger.info("온톨로지 저장소 초기화 완료")
+    동시성:
+    - 온톨로지별 lock: 같은 온톨로지의 쓰기와 트리플 읽기를 직렬화 (다른 온톨로지는 동시에 진행)
+    - 저장소 lock: 메타데이터/캐시 dict와 리스너 호출만 짧게 보호 (항상 온톨로지별 lock 다음에 획득)
+    - 백엔드 쓰기는 기대 버전을 비교(compare-and-swap)하여 다른 워커와 충돌하면 동기화 후 다시 시도
+    """
     
-    def save(self, response: BuildHybridOntologyResponse, ontology_classes: List[str]) -> None:
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        """
+        저장소 초기화 (백엔드의 메타데이터만 읽음)
+        
+        Args:
+            backend: 영속화 백엔드 (None이면 메모리에만 유지)
+        """
+        self._backend = backend or MemoryBackend()
+        self._storage: Dict[str, Dict] = {}  # 메타데이터 (rdf_graph, mapping_df 제외)
+        self._mappings: Dict[str, pl.DataFrame] = {}  # 로드된 페이로드만
+        self._stores: Dict[str, CompactTripleStore] = {}  # 로드된 페이로드만
+        self._turtle_cache: Dict[str, str] = {}
+        self._versions: Dict[str, int] = {}
+        self._order: List[OrderKey] = []  # 생성일시 오름차순
+        self._class_order: Dict[str, List[OrderKey]] = {}  # 클래스 -> 해당 클래스를 사용한 온톨로지 (오름차순)
+        self._listeners: List[StorageListener] = []
+        self._lock = threading.RLock()
+        self._ontology_locks: Dict[str, threading.RLock] = {}
+        self._turtle_hits = 0
+        self._serializations = 0
+        self._write_conflicts = 0
+        
+        for entry in self._backend.load_metadata():
+            self._versions[entry["ontology_id"]] = entry.pop("version")
+            self._storage[entry["ontology_id"]] = entry
+            self._index_add(entry)
+        logger.info(f"온톨로지 저장소 초기화 완료: {len(self._storage)}개 ({type(self._backend).__name__})")
+    
+    def save(
+        self,
+        response: BuildHybridOntologyResponse,
+        ontology_classes: List[str],
+        graph: Optional[Iterable[Tuple]] = None
+    ) -> None:
         """
         온톨로지 저장
         
         Args:
             response: 구축 응답 객체
             ontology_classes: 사용된 온톨로지 클래스 목록
+            graph: 이미 구축된 트리플 목록 또는 Graph (주어지면 response.g를 파싱하지 않음)
         """
         ontology_id = response.ontology_id
         
-        self._storage[ontology_id] = {
+        turtle = None
+        if graph is None:
+            graph = new_ontology_graph()
+            if response.g:
+                graph.parse(data=response.g, format="turtle")
+                turtle = response.g
+        store = CompactTripleStore.from_triples(graph)
+        mapping = _mapping_frame(response.mapping_df)
+        entry = {
             "ontology_id": ontology_id,
             "created_at": datetime.now().isoformat(),
             "ontology_classes": ontology_classes,
-            "mapping_count": len(response.mapping_df),
-            "rdf_graph": response.g,
-            "mapping_df": response.mapping_df,
+            "mapping_count": len(mapping),
             "message": response.message,
         }
         
+        def write() -> None:
+            with self._lock:
+                self._sync()
+                version = self._versions.get(ontology_id, 0)
+            self._backend.write(entry, version + 1, store, mapping, replace=True, expected_version=version)
+            
+            with self._lock:
+                self._index_remove(ontology_id)
+                self._storage[ontology_id] = entry
+                self._index_add(entry)
+                self._mappings[ontology_id] = mapping
+                self._stores[ontology_id] = store
+                self._turtle_cache.pop(ontology_id, None)
+                if turtle is not None:
+                    self._turtle_cache[ontology_id] = turtle
+                self._versions[ontology_id] = version + 1
+                self._notify("save", ontology_id, store, entry["created_at"])
+        
+        self._write(ontology_id, write)
         logger.info(f"온톨로지 저장 완료: ID={ontology_id}, 매핑={len(response.mapping_df)}개")
     
+    def append_relations(
+        self,
+        ontology_id: str,
+        mapping_rows: List[Dict[str, Any]],
+        relation_type: str,
+        replace_sources: Iterable[str] = ()
+    ) -> int:
+        """
+        기존 온톨로지에 관계 추가 (새 트리플만 저장소에 반영, 기존 Turtle 캐시 무효화)
+        같은 온톨로지에 대한 추가는 직렬화되어 트리플/매핑/버전이 함께 반영됨
+        replace_sources의 Source에 대한 기존 관계와 매핑 행이 있으면 먼저 제거하고 전체 페이로드를 다시 기록
+        (내용이 바뀌어 다시 수집한 파일이 이전 분류를 함께 유지하지 않도록 함)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            mapping_rows: 매핑 결과 행 목록 (Source, Target 키 포함)
+            relation_type: 관계 타입
+            replace_sources: 기존 관계를 교체할 Source 목록 (기본값: 교체 없이 추가만)
+            
+        Returns:
+            int: 추가 후 매핑 개수
+        """
+        triples = relation_triples(mapping_rows, relation_type)
+        added_mapping = _mapping_frame(mapping_rows)
+        sources = set(replace_sources)
+        
+        def write() -> int:
+            with self._lock:
+                self._sync()
+                entry = self._storage.get(ontology_id)
+                if entry is None:
+                    raise ValueError(f"온톨로지를 찾을 수 없습니다: {ontology_id}")
+                store, mapping = self._load_payload(ontology_id)
+                version = self._versions[ontology_id]
+            
+            stale = _source_mask(mapping, sources)
+            if not mapping_rows and not stale.any():
+                # 추가하거나 교체할 관계가 없으면 버전을 올리지 않음
+                return len(mapping)
+            if stale.any():
+                # 교체할 Source의 이전 관계를 뺀 전체 트리플/매핑을 다시 기록
+                removed = relation_triples(mapping.filter(stale).to_dicts(), relation_type)
+                store = store.without(removed)
+                store.add(triples)
+                mapping = pl.concat([mapping.filter(~stale), added_mapping], how="diagonal_relaxed")
+                entry = {**entry, "mapping_count": len(mapping)}
+                self._backend.write(entry, version + 1, store, mapping, replace=True, expected_version=version)
+                event, changed = "save", store
+            else:
+                # 새 트리플 계산은 온톨로지별 lock만 잡고 수행 (다른 온톨로지의 읽기/쓰기를 막지 않음)
+                # 캐시된 저장소는 백엔드 기록이 성공한 뒤에만 변경 (실패한 추가가 메모리에만 남으면 재시도 시 누락됨)
+                added = store.difference(triples)
+                mapping = pl.concat([mapping, added_mapping], how="diagonal_relaxed")
+                entry = {**entry, "mapping_count": len(mapping)}
+                self._backend.write(entry, version + 1, added, added_mapping, replace=False, expected_version=version)
+                event, changed = "append", added
+            
+            with self._lock:
+                if event == "append":
+                    store.merge(changed)
+                self._storage[ontology_id] = entry
+                self._stores[ontology_id] = store
+                self._mappings[ontology_id] = mapping
+                self._turtle_cache.pop(ontology_id, None)
+                self._versions[ontology_id] = version + 1
+                self._notify(event, ontology_id, changed, entry["created_at"])
+            return len(mapping)
+        
+        mapping_count = self._write(ontology_id, write)
+        logger.info(f"온톨로지 관계 추가 완료: ID={ontology_id}, 추가={len(mapping_rows)}개")
+        return mapping_count
+    
+    def version(self, ontology_id: str) -> Optional[int]:
+        """
+        온톨로지 버전 조회 (저장/관계 추가마다 1씩 증가)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            
+        Returns:
+            버전 또는 None (온톨로지가 없는 경우)
+        """
+        with self._lock:
+            self._sync()
+            if ontology_id not in self._storage:
+                return None
+            return self._versions[ontology_id]
+    
+    def exists(self, ontology_id: str) -> bool:
+        """온톨로지 존재 여부"""
+        with self._lock:
+            self._sync()
+            return ontology_id in self._storage
+    
     def get(self, ontology_id: str) -> Optional[Dict]:
         """
-        온톨로지 조회
+        온톨로지 조회 (rdf_graph는 캐시된 Turtle 문자열, mapping_df는 dict 목록으로 변환)
         
         Args:
             ontology_id: 온톨로지 ID
@@ -51,19 +239,122 @@ class OntologyStorage:
         Returns:
             온톨로지 메타데이터 또는 None
         """
-        return self._storage.get(ontology_id)
+        with self._ontology_lock(ontology_id):
+            with self._lock:
+                self._sync()
+                entry = self._storage.get(ontology_id)
+                if entry is None:
+                    return None
+                mapping = self._load_payload(ontology_id)[1]
+            return {
+                **entry,
+                "mapping_df": mapping.to_dicts(),
+                "rdf_graph": self.get_turtle(ontology_id),
+            }
+    
+    def get_turtle(self, ontology_id: str) -> Optional[str]:
+        """
+        온톨로지 Turtle 문자열 조회 (마지막 쓰기 이후 처음 요청될 때만 직렬화)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            
+        Returns:
+            Turtle 문자열 또는 None
+        """
+        with self._ontology_lock(ontology_id):
+            with self._lock:
+                self._sync()
+                turtle = self._turtle_cache.get(ontology_id)
+                if turtle is not None:
+                    self._turtle_hits += 1
+                    return turtle
+                
+                if ontology_id not in self._storage:
+                    return None
+                store = self._load_payload(ontology_id)[0]
+                self._serializations += 1
+            
+            # 직렬화는 온톨로지별 lock만 잡고 수행 (다른 온톨로지의 직렬화와 동시에 진행)
+            turtle = serialize_turtle(store.to_graph(new_ontology_graph()))
+            with self._lock:
+                if self._stores.get(ontology_id) is store:
+                    self._turtle_cache[ontology_id] = turtle
+            return turtle
+    
+    def read_graph(self, ontology_id: str, reader: Callable[[CompactTripleStore], T]) -> Optional[T]:
+        """
+        온톨로지 트리플 저장소를 읽기 함수에 전달 (같은 온톨로지의 쓰기와 동시에 순회하지 않도록 온톨로지별 lock 안에서 실행)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            reader: 트리플 저장소를 받아 결과를 반환하는 함수 (저장소를 수정하면 안 됨)
+            
+        Returns:
+            reader 결과 또는 None (온톨로지가 없는 경우)
+        """
+        result = self.read_graph_versioned(ontology_id, reader)
+        return result[1] if result is not None else None
+    
+    def read_graph_versioned(self, ontology_id: str, reader: Callable[[CompactTripleStore], T]) -> Optional[Tuple[int, T]]:
+        """
+        read_graph와 같지만 결과를 만든 시점의 버전을 함께 반환 (파생 캐시용)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            reader: 트리플 저장소를 받아 결과를 반환하는 함수 (저장소를 수정하면 안 됨)
+            
+        Returns:
+            (버전, reader 결과) 또는 None (온톨로지가 없는 경우)
+        """
+        with self._ontology_lock(ontology_id):
+            with self._lock:
+                self._sync()
+                if ontology_id not in self._storage:
+                    return None
+                store = self._load_payload(ontology_id)[0]
+                version = self._versions[ontology_id]
+            return version, reader(store)
     
     def list_all(self) -> List[Dict]:
         """
-        모든 온톨로지 목록 조회
+        모든 온톨로지 목록 조회 (메타데이터만, rdf_graph/mapping_df 제외)
         
         Returns:
             온톨로지 목록 (생성일시 역순 정렬)
         """
-        ontologies = list(self._storage.values())
-        # 생성일시 역순 정렬 (최신순)
-        ontologies.sort(key=lambda x: x["created_at"], reverse=True)
-        return ontologies
+        return self.list_page()[0]
+    
+    def list_page(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        ontology_class: Optional[str] = None
+    ) -> Tuple[List[Dict], int, Optional[str]]:
+        """
+        온톨로지 목록 한 페이지 조회 (생성일시 역순, 정렬된 메타데이터 인덱스에서 페이지 크기만큼만 읽음)
+        
+        Args:
+            limit: 페이지 크기 (None이면 커서 이후 전체)
+            after: 이전 페이지의 next_cursor (None이면 처음부터)
+            ontology_class: 이 클래스를 사용한 온톨로지만 조회 (None이면 전체)
+            
+        Returns:
+            (온톨로지 메타데이터 목록, 필터에 맞는 전체 개수, 다음 페이지 커서 (마지막 페이지면 None))
+            
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+        """
+        cursor = _decode_cursor(after) if after else None
+        with self._lock:
+            self._sync()
+            order = self._order if ontology_class is None else self._class_order.get(ontology_class, [])
+            # 최신순이므로 커서보다 오래된 (앞쪽) 항목을 뒤에서부터 읽음
+            end = bisect.bisect_left(order, cursor) if cursor is not None else len(order)
+            start = max(0, end - limit) if limit is not None else 0
+            page = [dict(self._storage[ontology_id]) for _, ontology_id in reversed(order[start:end])]
+            next_cursor = _encode_cursor(order[start]) if start > 0 and page else None
+            return page, len(order), next_cursor
     
     def delete(self, ontology_id: str) -> bool:
         """
@@ -75,11 +366,20 @@ class OntologyStorage:
         Returns:
             삭제 성공 여부
         """
-        if ontology_id in self._storage:
-            del self._storage[ontology_id]
-            logger.info(f"온톨로지 삭제 완료: ID={ontology_id}")
-            return True
-        return False
+        with self._ontology_lock(ontology_id), self._lock:
+            self._sync()
+            if ontology_id in self._storage:
+                self._index_remove(ontology_id)
+                entry = self._storage.pop(ontology_id)
+                self._mappings.pop(ontology_id, None)
+                self._stores.pop(ontology_id, None)
+                self._turtle_cache.pop(ontology_id, None)
+                self._backend.delete(ontology_id)
+                # 같은 ID로 다시 저장되어도 이전 버전과 겹치지 않도록 버전은 유지
+                self._notify("delete", ontology_id, CompactTripleStore(), entry["created_at"])
+                logger.info(f"온톨로지 삭제 완료: ID={ontology_id}")
+                return True
+            return False
     
     def count(self) -> int:
         """
@@ -88,11 +388,232 @@ class OntologyStorage:
         Returns:
             온톨로지 개수
         """
-        return len(self._storage)
+        with self._lock:
+            self._sync()
+            return len(self._storage)
+    
+    def subscribe(self, listener: StorageListener) -> None:
+        """
+        변경 이벤트 리스너 등록 (등록 시점의 온톨로지는 생성일시 순으로 "save" 이벤트로 재생)
+        리스너는 저장소 lock 안에서 호출되므로 쓰기 순서대로 이벤트를 받음 (리스너에서 저장소를 호출하면 안 됨)
+        
+        Args:
+            listener: (이벤트, 온톨로지 ID, 트리플 저장소, 생성일시)를 받는 함수
+        """
+        with self._lock:
+            self._sync()
+            self._listeners.append(listener)
+            for created_at, ontology_id in self._order:
+                listener("save", ontology_id, self._load_payload(ontology_id)[0], created_at)
+    
+    def _notify(self, event: str, ontology_id: str, triples: CompactTripleStore, created_at: str) -> None:
+        """리스너에 변경 이벤트 전달 (lock 안에서 호출, 리스너 오류는 쓰기를 실패시키지 않음)"""
+        for listener in self._listeners:
+            try:
+                listener(event, ontology_id, triples, created_at)
+            except Exception as e:
+                logger.error(f"저장소 리스너 처리 실패: event={event}, ID={ontology_id}, error={str(e)}", exc_info=True)
+    
+    def sync(self) -> int:
+        """
+        다른 워커가 백엔드에 커밋한 변경 반영
+        변경된 온톨로지의 메타데이터/버전을 다시 읽고 페이로드와 Turtle 캐시를 버린 뒤 리스너에 알림
+        (버전이 바뀌므로 그래프 투영 캐시와 ETag도 무효화됨)
+        
+        Returns:
+            int: 반영한 온톨로지 수
+        """
+        with self._lock:
+            return self._sync()
+    
+    def _sync(self) -> int:
+        """sync 구현 (lock 안에서 호출)"""
+        changes = self._backend.poll_changes()
+        if changes is None:
+            # 변경 로그가 잘린 경우 메타데이터 전체를 비교
+            entries = {entry["ontology_id"]: entry for entry in self._backend.load_metadata()}
+            changed = [
+                ontology_id for ontology_id, entry in entries.items()
+                if self._versions.get(ontology_id) != entry["version"] or ontology_id not in self._storage
+            ]
+            changed += [ontology_id for ontology_id in self._storage if ontology_id not in entries]
+            for ontology_id in changed:
+                self._apply_remote(ontology_id, entries.get(ontology_id))
+            logger.info(f"온톨로지 저장소 전체 동기화: 변경 {len(changed)}개")
+            return len(changed)
+        
+        # 같은 온톨로지의 연속 변경은 마지막 상태만 반영
+        changed_ids = list(dict.fromkeys(ontology_id for _, ontology_id, _ in reversed(changes)))
+        for ontology_id in reversed(changed_ids):
+            self._apply_remote(ontology_id, self._backend.load_entry(ontology_id))
+        if changed_ids:
+            logger.info(f"다른 워커의 변경 반영: {len(changed_ids)}개")
+        return len(changed_ids)
+    
+    def _apply_remote(self, ontology_id: str, entry: Optional[Dict[str, Any]]) -> None:
+        """다른 워커가 변경한 온톨로지의 로컬 상태 교체 (lock 안에서 호출)"""
+        self._stores.pop(ontology_id, None)
+        self._mappings.pop(ontology_id, None)
+        self._turtle_cache.pop(ontology_id, None)
+        
+        self._index_remove(ontology_id)
+        if entry is None:
+            removed = self._storage.pop(ontology_id, None)
+            if removed is not None:
+                self._notify("delete", ontology_id, CompactTripleStore(), removed["created_at"])
+            return
+        
+        # 백엔드 버전이 기준 (쓰기는 이 버전을 기대 버전으로 비교, 그래프 투영 캐시/ETag도 무효화됨)
+        self._versions[ontology_id] = entry.pop("version")
+        self._storage[ontology_id] = entry
+        self._index_add(entry)
+        if self._listeners:
+            try:
+                store = self._load_payload(ontology_id)[0]
+            except ValueError:
+                # 그 사이 다른 워커가 삭제한 경우 (삭제 변경은 다음 sync에서 반영)
+                return
+            self._notify("save", ontology_id, store, entry["created_at"])
+    
+    def flush(self) -> None:
+        """백엔드에 대기 중인 쓰기 커밋"""
+        with self._lock:
+            self._backend.flush()
+    
+    def close(self) -> None:
+        """대기 중인 쓰기를 커밋하고 백엔드 닫기 (애플리케이션 종료 시)"""
+        with self._lock:
+            self._backend.close()
+    
+    def _load_payload(self, ontology_id: str) -> Tuple[CompactTripleStore, pl.DataFrame]:
+        """로드된 페이로드 반환 (없으면 백엔드에서 읽음, lock 안에서 호출)"""
+        store = self._stores.get(ontology_id)
+        if store is None:
+            payload = self._backend.load_payload(ontology_id)
+            if payload is None:
+                raise ValueError(f"온톨로지 페이로드를 찾을 수 없습니다: {ontology_id}")
+            store = self._stores[ontology_id] = payload.store
+            self._mappings[ontology_id] = payload.mapping
+            logger.info(f"온톨로지 페이로드 로드: ID={ontology_id}, 트리플={len(store)}개")
+        return store, self._mappings[ontology_id]
+    
+    def _index_add(self, entry: Dict[str, Any]) -> None:
+        """목록 인덱스에 온톨로지 추가 (lock 안에서 호출)"""
+        key = (entry["created_at"], entry["ontology_id"])
+        bisect.insort(self._order, key)
+        for ontology_class in set(entry["ontology_classes"]):
+            bisect.insort(self._class_order.setdefault(ontology_class, []), key)
+    
+    def _index_remove(self, ontology_id: str) -> None:
+        """목록 인덱스에서 온톨로지 제거 (lock 안에서 호출, 없으면 무시)"""
+        entry = self._storage.get(ontology_id)
+        if entry is None:
+            return
+        key = (entry["created_at"], ontology_id)
+        _remove_sorted(self._order, key)
+        for ontology_class in set(entry["ontology_classes"]):
+            order = self._class_order[ontology_class]
+            _remove_sorted(order, key)
+            if not order:
+                del self._class_order[ontology_class]
+    
+    def _ontology_lock(self, ontology_id: str) -> threading.RLock:
+        """온톨로지별 lock 반환 (없으면 생성)"""
+        with self._lock:
+            lock = self._ontology_locks.get(ontology_id)
+            if lock is None:
+                lock = self._ontology_locks[ontology_id] = threading.RLock()
+            return lock
+    
+    def _write(self, ontology_id: str, write: Callable[[], T]) -> T:
+        """
+        온톨로지별 lock 안에서 쓰기 실행
+        먼저 버전 비교(compare-and-swap)만으로 시도하고, 다른 워커와 충돌하면 로컬 페이로드를 버린 뒤
+        백엔드 쓰기 잠금을 잡은 상태에서 한 번 더 실행 (그 사이 다른 워커가 커밋할 수 없으므로 반드시 반영됨)
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            write: 동기화, 백엔드 기록, 로컬 상태 갱신을 수행하는 함수
+            
+        Returns:
+            write 결과
+        """
+        with self._ontology_lock(ontology_id):
+            try:
+                return write()
+            except VersionConflictError as e:
+                with self._lock:
+                    self._write_conflicts += 1
+                    self._stores.pop(ontology_id, None)
+                    self._mappings.pop(ontology_id, None)
+                    self._turtle_cache.pop(ontology_id, None)
+                logger.warning(f"{str(e)} (쓰기 잠금을 잡고 다시 시도)")
+            
+            with self._lock, self._backend.exclusive():
+                return write()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 통계
+        
+        Returns:
+            온톨로지 수, 트리플 수/메모리, 용어 사전 크기, Turtle 캐시 히트/직렬화 횟수, 버전 충돌 횟수
+        """
+        with self._lock:
+            self._sync()
+            return {
+                "ontologies": len(self._storage),
+                "triples": sum(len(store) for store in self._stores.values()),
+                "triple_bytes": sum(store.nbytes for store in self._stores.values()),
+                "mapping_bytes": sum(mapping.estimated_size() for mapping in self._mappings.values()),
+                "terms": len(get_term_dictionary()),
+                "loaded": len(self._stores),
+                "backend": self._backend.stats(),
+                "turtle_cached": len(self._turtle_cache),
+                "turtle_cache_hits": self._turtle_hits,
+                "turtle_serializations": self._serializations,
+                "write_conflicts": self._write_conflicts,
+            }
+
+
+def _remove_sorted(order: List[OrderKey], key: OrderKey) -> None:
+    """정렬된 목록에서 키 제거"""
+    index = bisect.bisect_left(order, key)
+    if index < len(order) and order[index] == key:
+        del order[index]
+
+
+def _encode_cursor(key: OrderKey) -> str:
+    """목록 정렬 키를 URL에 넣을 수 있는 커서 문자열로 변환"""
+    return base64.urlsafe_b64encode(f"{key[0]}|{key[1]}".encode("utf-8")).decode("ascii")
 
 
-# 전역 저장소 인스턴스
-_ontology_storage = OntologyStorage()
+def _decode_cursor(cursor: str) -> OrderKey:
+    """커서 문자열을 목록 정렬 키로 변환"""
+    try:
+        created_at, ontology_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+    except ValueError:
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return created_at, ontology_id
+
+
+def _source_mask(mapping: pl.DataFrame, sources: Iterable[str]) -> pl.Series:
+    """Source가 주어진 값 중 하나인 매핑 행 (Source 컬럼이 없으면 모두 False)"""
+    sources = list(sources)
+    if not sources or "Source" not in mapping.columns:
+        return pl.Series(values=[False] * len(mapping), dtype=pl.Boolean)
+    return mapping["Source"].cast(pl.Utf8).is_in(sources)
+
+
+def _mapping_frame(mapping_rows: List[Dict[str, Any]]) -> pl.DataFrame:
+    """매핑 결과 행 목록을 컬럼 형식으로 변환"""
+    if not mapping_rows:
+        return pl.DataFrame()
+    return pl.DataFrame(mapping_rows, infer_schema_length=None)
+
+
+# 전역 저장소 인스턴스 (설정된 백엔드의 메타데이터로 시작)
+_ontology_storage = OntologyStorage(create_storage_backend())
 
 
 def get_ontology_storage() -> OntologyStorage:
@@ -103,4 +624,3 @@ def get_ontology_storage() -> OntologyStorage:
         OntologyStorage 인스턴스
     """
     return _ontology_storage
-
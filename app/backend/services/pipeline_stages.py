@@ -0,0 +1,80 @@
+"""
+업로드 파이프라인 단계 함수
+프로세스 풀에서 실행할 수 있도록 모듈 수준 함수로 정의 (모델 등 무거운 의존성 import 금지)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+from backend.services.data_parser import FileSource, ParsedData, get_parser
+from backend.services.relation_extractor import find_direct_target
+
+
+@dataclass
+class DatasetScan:
+    """일괄 수집용 파일 스캔 결과 (프로세스 간 전달을 위해 프레임 없이 요약만 보관)"""
+    file_name: str
+    row_count: int
+    direct_target: Optional[str] = None  # 타겟 컬럼 값으로 직접 매핑된 클래스 (없으면 파일명 매핑 필요)
+    schema_fingerprint: Optional[str] = None  # 컬럼 구성 지문 (파일명 매핑 시 같은 형식의 결정 재사용)
+
+
+def parse_upload(
+    file_content: FileSource,
+    file_name: str,
+    file_type: str,
+    target_column: Optional[str] = None
+) -> ParsedData:
+    """
+    업로드 파일 파싱 단계
+    
+    Args:
+        file_content: 파일 내용 (bytes) 또는 파일 경로 (프로세스 풀에는 경로만 전달됨)
+        file_name: 파일명
+        file_type: 파일 타입 (csv, json, excel)
+        target_column: 타겟 컬럼명
+        
+    Returns:
+        ParsedData: 파싱 결과 요약
+    """
+    parser = get_parser(file_type)
+    parsed = parser.parse_summary(file_content, file_name, target_column)
+    
+    if parsed.row_count == 0:
+        raise ValueError("파일이 비어있거나 파싱할 데이터가 없습니다.")
+    
+    return parsed
+
+
+def scan_dataset(
+    file_path: str,
+    file_name: str,
+    file_type: str,
+    ontology_classes: List[str],
+    target_column: Optional[str] = None
+) -> DatasetScan:
+    """
+    일괄 수집 파일 스캔 단계 (파싱 + 타겟 컬럼 직접 매핑)
+    파일명 매핑은 부모 프로세스에서 배치로 수행하므로 모델을 로드하지 않음
+    
+    Args:
+        file_path: 파일 경로
+        file_name: 파일명 (관계의 Source로 사용)
+        file_type: 파일 타입 (csv, json, excel)
+        ontology_classes: 온톨로지 클래스 목록
+        target_column: 타겟 컬럼명
+        
+    Returns:
+        DatasetScan: 행 수와 직접 매핑된 클래스
+    """
+    parsed = parse_upload(file_path, file_name, file_type, target_column)
+    direct_target = None
+    if target_column and target_column in parsed.columns:
+        direct_target = parsed.read_target(
+            lambda frame: find_direct_target(frame, target_column, ontology_classes), file_name
+        )
+    return DatasetScan(
+        file_name=file_name,
+        row_count=parsed.row_count,
+        direct_target=direct_target,
+        schema_fingerprint=parsed.schema_fingerprint
+    )
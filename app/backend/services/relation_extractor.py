@@ -5,8 +5,10 @@
 
 import logging
 import polars as pl
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from backend.services.data_parser import is_utf8_error
 from backend.services.ontology_services.hybrid_mapper import HybridMapper
+from backend.services.ontology_services.config import DIRECT_MAPPING_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +25,22 @@ class RelationExtractor:
             model_name: SentenceTransformer 모델명
         """
         self.ontology_classes = ontology_classes
+        self.class_set = frozenset(ontology_classes)  # 직접 매핑 시 O(1) 조회
         self.mapper = HybridMapper(ontology_classes, model_name)
     
+    @property
+    def rule_version(self) -> str:
+        """매핑에 사용된 키워드 사전 버전"""
+        return self.mapper.rule_mapper.rule_version
+    
     def extract_relations(
         self,
-        df: pl.DataFrame,
+        df: Union[pl.DataFrame, pl.LazyFrame],
         file_name: str,
         relation_type: str = "isDataOf",
         source_column: Optional[str] = None,
-        target_column: Optional[str] = None
+        target_column: Optional[str] = None,
+        schema_fingerprint: Optional[str] = None
     ) -> pl.DataFrame:
         """
         데이터프레임에서 관계 추출
@@ -40,56 +49,138 @@ class RelationExtractor:
         - 타겟 컬럼이 없으면 파일명 기반 하이브리드 매핑 사용 (규칙 기반 + 시맨틱)
         
         Args:
-            df: 파싱된 데이터프레임
+            df: 파싱된 데이터프레임 (LazyFrame이면 타겟 컬럼을 배치 단위로 스캔)
             file_name: 파일명 (데이터셋 전체를 하나의 클래스로 매핑하기 위해 사용)
             relation_type: 관계 타입 (isDataOf, hasPart, etc.)
             source_column: 소스 컬럼명 (None이면 자동 감지, 현재는 사용하지 않음)
             target_column: 타겟 컬럼명 (None이면 자동 감지, 있으면 직접 매핑 사용)
+            schema_fingerprint: 스키마 지문 (같은 컬럼 구성의 파일에 내린 매핑 결정을 재사용)
             
         Returns:
             DataFrame: 관계 매핑 결과 (파일명 → 온톨로지 클래스, 1개 관계)
         """
         try:
-            # 타겟 컬럼이 있으면 직접 매핑 (기존 로직 유지)
-            if target_column and target_column in df.columns:
-                # 타겟 컬럼의 고유한 값들 확인
-                unique_targets = df[target_column].unique().to_list()
-                for target_value in unique_targets:
-                    if target_value is not None:
-                        target_str = str(target_value).strip()
-                        if target_str and target_str in self.ontology_classes:
-                            # 파일명을 Source로, 타겟 컬럼 값을 Target으로 사용
-                            logger.info(f"타겟 컬럼 기반 직접 매핑: {file_name} → {target_str}")
-                            return pl.DataFrame([{
-                                "Source": file_name,
-                                "Target": target_str,
-                                "Relation": relation_type,
-                                "Method": "direct",
-                                "Confidence": 1.0
-                            }])
+            # 타겟 컬럼이 있으면 직접 매핑 (클래스가 처음 등장하는 배치에서 스캔 중단)
+            if target_column and target_column in _column_names(df):
+                target_str = self.find_direct_target(df, target_column)
+                if target_str is not None:
+                    # 파일명을 Source로, 타겟 컬럼 값을 Target으로 사용
+                    logger.info(f"타겟 컬럼 기반 직접 매핑: {file_name} → {target_str}")
+                    return pl.DataFrame([relation_row(file_name, target_str, relation_type, "direct", 1.0)])
             
             # 타겟 컬럼이 없으면 파일명 기반 하이브리드 매핑 사용
             # (규칙 기반 + 시맨틱 매핑을 자동으로 조합)
             logger.info(f"파일명 기반 하이브리드 매핑 시작: {file_name}")
-            mapping_result = self.mapper.map_file(file_name)
+            mapping_result = self.mapper.map_file(file_name, schema_fingerprint)
             
             if mapping_result.mapped_class != "Unclassified":
                 logger.info(f"매핑 완료: {file_name} → {mapping_result.mapped_class} (신뢰도: {mapping_result.confidence}, 방법: {mapping_result.method})")
-                return pl.DataFrame([{
-                    "Source": file_name,
-                    "Target": mapping_result.mapped_class,
-                    "Relation": relation_type,
-                    "Method": mapping_result.method,
-                    "Confidence": mapping_result.confidence
-                }])
+                return pl.DataFrame([relation_row(
+                    file_name, mapping_result.mapped_class, relation_type, mapping_result.method, mapping_result.confidence
+                )])
             else:
                 logger.warning(f"매핑 실패: {file_name}을 온톨로지 클래스로 매핑할 수 없습니다.")
                 raise ValueError(f"데이터셋 '{file_name}'을 온톨로지 클래스로 매핑할 수 없습니다.")
             
         except Exception as e:
+            if is_utf8_error(e):
+                # CSV 지연 프레임의 인코딩 오류는 호출자가 전체 파싱으로 전환하도록 그대로 전달 (ParsedData.read_target)
+                raise
             logger.error(f"관계 추출 실패: {str(e)}", exc_info=True)
             raise ValueError(f"관계 추출 중 오류가 발생했습니다: {str(e)}")
     
+    def extract_relations_batch(
+        self,
+        items: List[Tuple[str, Union[pl.DataFrame, pl.LazyFrame]]],
+        relation_type: str = "isDataOf",
+        target_column: Optional[str] = None,
+        schema_fingerprints: Optional[List[Optional[str]]] = None,
+        direct_targets: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 데이터셋에서 관계를 한 번에 추출
+        타겟 컬럼으로 직접 매핑되지 않은 파일명은 모아서 한 번의 배치 매핑(map_batch)으로 처리
+        
+        Args:
+            items: (파일명, 파싱된 데이터프레임) 목록
+            relation_type: 관계 타입
+            target_column: 타겟 컬럼명 (있으면 파일별로 직접 매핑을 먼저 시도)
+            schema_fingerprints: 파일별 스키마 지문 (items와 같은 순서, 선택사항)
+            direct_targets: 파일별로 미리 찾은 직접 매핑 클래스 (items와 같은 순서, 주어지면 타겟 컬럼을 다시 스캔하지 않음)
+            
+        Returns:
+            입력 순서와 같은 관계 행 목록 (온톨로지 클래스로 매핑하지 못한 파일은 None)
+        """
+        relations: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: List[int] = []
+        for index, (file_name, df) in enumerate(items):
+            if direct_targets is not None:
+                target_str = direct_targets[index]
+            elif target_column and target_column in _column_names(df):
+                target_str = self.find_direct_target(df, target_column)
+            else:
+                target_str = None
+            if target_str is not None:
+                relations[index] = relation_row(file_name, target_str, relation_type, "direct", 1.0)
+                continue
+            pending.append(index)
+        
+        if pending:
+            logger.info(f"파일명 기반 배치 매핑 시작: {len(pending)}개 파일")
+            filenames = [items[index][0] for index in pending]
+            if schema_fingerprints:
+                results = self.mapper.map_batch(filenames, [schema_fingerprints[index] for index in pending])
+            else:
+                results = self.mapper.map_batch(filenames)
+            for index, result in zip(pending, results):
+                if result.mapped_class != "Unclassified":
+                    relations[index] = relation_row(
+                        items[index][0], result.mapped_class, relation_type, result.method, result.confidence
+                    )
+        
+        logger.info(f"배치 관계 추출 완료: {sum(r is not None for r in relations)}/{len(items)}개 매핑")
+        return relations
+    
+    def find_direct_target(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        target_column: str,
+        batch_size: int = DIRECT_MAPPING_BATCH_SIZE
+    ) -> Optional[str]:
+        """
+        타겟 컬럼에서 온톨로지 클래스와 일치하는 첫 번째 값 탐색
+        배치 단위로 스캔하며 일치하는 값이 나오면 나머지 행은 읽지 않음
+        
+        Args:
+            df: 데이터프레임 또는 LazyFrame
+            target_column: 타겟 컬럼명
+            batch_size: 한 번에 검사할 행 수
+            
+        Returns:
+            Optional[str]: 일치한 클래스명 (없으면 None)
+        """
+        return find_direct_target(df, target_column, self.class_set, batch_size)
+    
+    def count_target_classes(self, df: Union[pl.DataFrame, pl.LazyFrame], target_column: str) -> Dict[str, int]:
+        """
+        파일 전체에서 타겟 컬럼 값이 일치하는 클래스별 행 수 집계 (is_in/value_counts 한 번의 벡터 연산)
+        
+        Args:
+            df: 데이터프레임 또는 LazyFrame
+            target_column: 타겟 컬럼명
+            
+        Returns:
+            Dict[str, int]: {클래스명: 행 수} (행 수 내림차순)
+        """
+        values = _normalized_target(pl.col(target_column))
+        counts = (
+            df.lazy()
+            .select(values.filter(values.is_in(list(self.class_set))).value_counts(sort=True, name="count"))
+            .unnest(target_column)
+            .collect(engine="streaming")
+        )
+        return dict(zip(counts[target_column].to_list(), counts["count"].to_list()))
+    
     def _detect_source_column(self, df: pl.DataFrame) -> str:
         """
         소스 컬럼 자동 감지
@@ -137,3 +228,64 @@ class RelationExtractor:
         
         return None
 
+
+def find_direct_target(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    target_column: str,
+    ontology_classes: Iterable[str],
+    batch_size: int = DIRECT_MAPPING_BATCH_SIZE
+) -> Optional[str]:
+    """
+    타겟 컬럼에서 온톨로지 클래스와 일치하는 첫 번째 값 탐색 (매퍼 없이 프로세스 풀에서도 사용)
+    
+    Args:
+        df: 데이터프레임 또는 LazyFrame
+        target_column: 타겟 컬럼명
+        ontology_classes: 온톨로지 클래스 목록
+        batch_size: 한 번에 검사할 행 수
+        
+    Returns:
+        Optional[str]: 일치한 클래스명 (없으면 None)
+    """
+    classes = list(ontology_classes)
+    for batch in _iter_target_batches(df, target_column, batch_size):
+        values = _normalized_target(batch.to_series())
+        matched = values.filter(values.is_in(classes))
+        if len(matched) > 0:
+            return matched[0]
+    return None
+
+
+def relation_row(source: str, target: str, relation_type: str, method: str, confidence: float) -> Dict[str, Any]:
+    """관계 DataFrame의 한 행"""
+    return {
+        "Source": source,
+        "Target": target,
+        "Relation": relation_type,
+        "Method": method,
+        "Confidence": confidence
+    }
+
+
+def _column_names(df: Union[pl.DataFrame, pl.LazyFrame]) -> List[str]:
+    """컬럼명 조회 (LazyFrame은 스키마만 확인)"""
+    if isinstance(df, pl.LazyFrame):
+        return df.collect_schema().names()
+    return df.columns
+
+
+def _iter_target_batches(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    target_column: str,
+    batch_size: int
+) -> Iterator[pl.DataFrame]:
+    """타겟 컬럼을 배치 단위로 순회 (LazyFrame은 스트리밍 엔진으로 필요한 만큼만 읽음)"""
+    if isinstance(df, pl.LazyFrame):
+        yield from df.select(target_column).collect_batches(chunk_size=batch_size)
+    else:
+        yield from df.select(target_column).iter_slices(n_rows=batch_size)
+
+
+def _normalized_target(values: Union[pl.Series, pl.Expr]) -> Union[pl.Series, pl.Expr]:
+    """타겟 값을 문자열로 변환하고 앞뒤 공백 제거 (기존 str(value).strip()과 동일)"""
+    return values.cast(pl.String).str.strip_chars()
@@ -0,0 +1,506 @@
+"""
+온톨로지 저장소 영속화 백엔드
+OntologyStorage가 메타데이터와 트리플/매핑 페이로드를 기록하는 교체 가능한 백엔드
+
+SQLite 백엔드 테이블 구조 (WAL 모드, 파일은 mmap으로 읽음):
+    ontology_meta    ontology_id, created_at, ontology_classes(JSON), mapping_count, message, version
+    ontology_chunks  (ontology_id, seq) - terms(JSON, N3 용어 목록), triples(uint32 (n, 3) bytes), mapping(Arrow IPC)
+    ontology_changes seq, ontology_id, event, version, writer (쓰기마다 한 행, 최근 ONTOLOGY_STORE_CHANGE_LOG_SIZE개만 유지)
+
+저장은 청크 0을 새로 쓰고, 관계 추가는 새로 추가된 트리플/매핑만 다음 청크로 기록합니다.
+시작 시에는 메타데이터만 읽고, 페이로드는 온톨로지를 처음 사용할 때 읽습니다.
+여러 워커 프로세스가 같은 파일을 열면 각 워커는 변경 로그로 다른 워커가 커밋한 쓰기를 감지합니다.
+"""
+
+import io
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+import polars as pl
+from rdflib.util import from_n3
+
+from backend.services.ontology_services.config import (
+    ONTOLOGY_STORE_BACKEND,
+    ONTOLOGY_STORE_BUSY_TIMEOUT_MS,
+    ONTOLOGY_STORE_CHANGE_LOG_SIZE,
+    ONTOLOGY_STORE_COMMIT_BATCH,
+    ONTOLOGY_STORE_COMMIT_INTERVAL,
+    ONTOLOGY_STORE_MAX_CHUNKS,
+    ONTOLOGY_STORE_PATH,
+    ONTOLOGY_STORE_SHARED,
+)
+from backend.services.ontology_services.triple_store import ID_DTYPE, CompactTripleStore
+
+logger = logging.getLogger(__name__)
+
+_MMAP_SIZE = 256 * 1024 * 1024
+
+_META_COLUMNS = "ontology_id, created_at, ontology_classes, mapping_count, message, version"
+_CHUNKS_QUERY = "SELECT terms, triples, mapping FROM ontology_chunks WHERE ontology_id = ? ORDER BY seq"
+
+# 다른 프로세스가 커밋한 변경: (이벤트, 온톨로지 ID, 버전)
+StorageChange = Tuple[str, str, int]
+
+
+class VersionConflictError(ValueError):
+    """다른 워커가 먼저 온톨로지를 변경하여 기대한 버전과 저장된 버전이 다름"""
+    
+    def __init__(self, ontology_id: str, expected: Optional[int], current: Optional[int]):
+        self.ontology_id = ontology_id
+        self.expected = expected
+        self.current = current
+        super().__init__(f"온톨로지 버전 충돌: ID={ontology_id}, 기대={expected}, 저장={current}")
+
+
+@dataclass
+class StoredPayload:
+    """백엔드에서 읽은 온톨로지 페이로드"""
+    store: CompactTripleStore
+    mapping: pl.DataFrame
+
+
+class StorageBackend:
+    """영속화 백엔드 기본 클래스"""
+    
+    def load_metadata(self) -> List[Dict[str, Any]]:
+        """
+        저장된 모든 온톨로지 메타데이터 조회 (페이로드는 읽지 않음)
+        
+        Returns:
+            메타데이터 목록 (version 키 포함)
+        """
+        raise NotImplementedError("Subclass must implement load_metadata method")
+    
+    def load_entry(self, ontology_id: str) -> Optional[Dict[str, Any]]:
+        """
+        온톨로지 하나의 메타데이터 조회
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            
+        Returns:
+            메타데이터 (version 키 포함) 또는 None (저장되지 않은 경우)
+        """
+        return None
+    
+    def poll_changes(self) -> Optional[List[StorageChange]]:
+        """
+        마지막 조회 이후 다른 프로세스가 커밋한 변경 조회
+        
+        Returns:
+            (이벤트, 온톨로지 ID, 버전) 목록 (커밋 순서) 또는 None (변경 로그가 잘려 메타데이터 전체를 다시 읽어야 하는 경우)
+        """
+        return []
+    
+    def load_payload(self, ontology_id: str) -> Optional[StoredPayload]:
+        """
+        온톨로지 트리플/매핑 페이로드 조회
+        
+        Args:
+            ontology_id: 온톨로지 ID
+            
+        Returns:
+            StoredPayload 또는 None (저장되지 않은 경우)
+        """
+        raise NotImplementedError("Subclass must implement load_payload method")
+    
+    def write(
+        self,
+        entry: Dict[str, Any],
+        version: int,
+        triples: CompactTripleStore,
+        mapping: pl.DataFrame,
+        replace: bool,
+        expected_version: Optional[int] = None
+    ) -> None:
+        """
+        메타데이터와 페이로드 기록
+        
+        Args:
+            entry: 온톨로지 메타데이터
+            version: 온톨로지 버전
+            triples: 기록할 트리플 (replace=False면 새로 추가된 트리플만)
+            mapping: 기록할 매핑 (replace=False면 새로 추가된 행만)
+            replace: True면 기존 페이로드를 대체, False면 이어서 추가
+            expected_version: 저장된 버전이 이 값이어야 기록 (None이면 검사하지 않음, replace=True면 삭제된 경우도 허용)
+            
+        Raises:
+            VersionConflictError: 저장된 버전이 expected_version과 다른 경우 (아무것도 기록하지 않음)
+        """
+        raise NotImplementedError("Subclass must implement write method")
+    
+    def delete(self, ontology_id: str) -> None:
+        """온톨로지 메타데이터와 페이로드 삭제"""
+        raise NotImplementedError("Subclass must implement delete method")
+    
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """블록 안에서 다른 프로세스가 커밋하지 못하도록 쓰기 잠금 유지 (블록 안의 쓰기는 버전 충돌이 없음)"""
+        yield
+    
+    def flush(self) -> None:
+        """대기 중인 쓰기 커밋"""
+    
+    def close(self) -> None:
+        """대기 중인 쓰기를 커밋하고 자원 해제"""
+    
+    def stats(self) -> Dict[str, Any]:
+        """백엔드 통계"""
+        return {"backend": type(self).__name__}
+
+
+class MemoryBackend(StorageBackend):
+    """영속화하지 않는 백엔드 (프로세스 메모리에만 유지)"""
+    
+    def load_metadata(self) -> List[Dict[str, Any]]:
+        return []
+    
+    def load_payload(self, ontology_id: str) -> Optional[StoredPayload]:
+        return None
+    
+    def write(
+        self,
+        entry: Dict[str, Any],
+        version: int,
+        triples: CompactTripleStore,
+        mapping: pl.DataFrame,
+        replace: bool,
+        expected_version: Optional[int] = None
+    ) -> None:
+        pass
+    
+    def delete(self, ontology_id: str) -> None:
+        pass
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    SQLite(WAL) 백엔드
+    쓰기는 commit_batch개가 쌓이거나 첫 미커밋 쓰기 후 commit_interval초가 지나면 한 번에 커밋
+    shared 모드에서는 다른 워커가 바로 볼 수 있도록 쓰기마다 커밋
+    """
+    
+    def __init__(
+        self,
+        path: str = ONTOLOGY_STORE_PATH,
+        commit_batch: int = ONTOLOGY_STORE_COMMIT_BATCH,
+        commit_interval: float = ONTOLOGY_STORE_COMMIT_INTERVAL,
+        max_chunks: int = ONTOLOGY_STORE_MAX_CHUNKS,
+        shared: bool = ONTOLOGY_STORE_SHARED
+    ):
+        """
+        백엔드 초기화 (파일이 없으면 생성)
+        
+        Args:
+            path: SQLite 파일 경로
+            commit_batch: 한 번에 커밋할 최대 쓰기 수 (1이면 쓰기마다 커밋)
+            commit_interval: 미커밋 쓰기를 최대로 유지할 시간 (초)
+            max_chunks: 온톨로지별 청크가 이 수를 넘으면 로드 시 하나로 압축
+            shared: 여러 워커 프로세스가 파일을 공유 (commit_batch를 무시하고 쓰기마다 커밋)
+        """
+        self.path = Path(path)
+        self.shared = shared
+        self.commit_batch = 1 if shared else max(1, commit_batch)
+        self.commit_interval = commit_interval
+        self.max_chunks = max_chunks
+        
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._timer: Optional[threading.Timer] = None
+        self._commits = 0
+        self._writes = 0
+        self._payload_loads = 0
+        self._writer = uuid4().hex  # 변경 로그에서 자신의 쓰기를 구분
+        self._change_seq = 0  # 마지막으로 확인한 변경 로그 seq
+        self._data_version: Optional[int] = None
+        self._remote_changes = 0
+        self._exclusive = False  # exclusive 블록 안에서는 커밋을 미룸
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self._conn.execute(f"PRAGMA busy_timeout={ONTOLOGY_STORE_BUSY_TIMEOUT_MS}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS ontology_meta (
+                ontology_id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                ontology_classes TEXT NOT NULL,
+                mapping_count INTEGER NOT NULL,
+                message TEXT,
+                version INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ontology_meta_created_at ON ontology_meta (created_at);
+            CREATE TABLE IF NOT EXISTS ontology_chunks (
+                ontology_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                terms BLOB NOT NULL,
+                triples BLOB NOT NULL,
+                mapping BLOB,
+                PRIMARY KEY (ontology_id, seq)
+            );
+            CREATE TABLE IF NOT EXISTS ontology_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                ontology_id TEXT NOT NULL,
+                event TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                writer TEXT NOT NULL
+            );
+        """)
+        logger.info(f"SQLite 온톨로지 저장소 열기: {self.path}")
+    
+    def load_metadata(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            # 변경 로그 위치를 먼저 읽음 (그 사이 커밋된 변경은 다음 poll_changes에서 한 번 더 반영될 뿐)
+            self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            self._change_seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM ontology_changes").fetchone()[0]
+            rows = self._conn.execute(f"SELECT {_META_COLUMNS} FROM ontology_meta").fetchall()
+        return [_meta_entry(row) for row in rows]
+    
+    def load_entry(self, ontology_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_META_COLUMNS} FROM ontology_meta WHERE ontology_id = ?", (ontology_id,)
+            ).fetchone()
+        return _meta_entry(row) if row is not None else None
+    
+    def poll_changes(self) -> Optional[List[StorageChange]]:
+        with self._lock:
+            # data_version은 다른 연결이 커밋했을 때만 바뀜 (변경이 없으면 테이블을 읽지 않음)
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return []
+            self._data_version = data_version
+            
+            rows = self._conn.execute(
+                "SELECT seq, event, ontology_id, version, writer FROM ontology_changes WHERE seq > ? ORDER BY seq",
+                (self._change_seq,)
+            ).fetchall()
+            if not rows:
+                return []
+            # seq는 AUTOINCREMENT라 건너뛴 번호가 있으면 정리된 로그
+            truncated = rows[0][0] > self._change_seq + 1
+            self._change_seq = rows[-1][0]
+            if truncated:
+                return None
+            
+            changes = [(event, ontology_id, version) for _, event, ontology_id, version, writer in rows if writer != self._writer]
+            self._remote_changes += len(changes)
+            return changes
+    
+    def load_payload(self, ontology_id: str) -> Optional[StoredPayload]:
+        with self._lock:
+            chunks = self._conn.execute(_CHUNKS_QUERY, (ontology_id,)).fetchall()
+            if not chunks:
+                return None
+            self._payload_loads += 1
+        store, mapping = _decode_chunks(chunks)
+        
+        if len(chunks) > self.max_chunks:
+            # 추가 청크가 많으면 하나로 압축 (다른 워커가 그 사이 추가한 청크를 잃지 않도록 쓰기 트랜잭션 안에서 다시 읽음)
+            with self._lock:
+                self._begin()
+                chunks = self._conn.execute(_CHUNKS_QUERY, (ontology_id,)).fetchall()
+                store, mapping = _decode_chunks(chunks)
+                self._write_chunks(ontology_id, store, mapping, replace=True)
+                self._after_write()
+            logger.info(f"온톨로지 청크 압축: ID={ontology_id}, {len(chunks)}개 -> 1개")
+        
+        return StoredPayload(store=store, mapping=mapping)
+    
+    def write(
+        self,
+        entry: Dict[str, Any],
+        version: int,
+        triples: CompactTripleStore,
+        mapping: pl.DataFrame,
+        replace: bool,
+        expected_version: Optional[int] = None
+    ) -> None:
+        with self._lock:
+            self._begin()
+            if expected_version is not None:
+                self._check_version(entry["ontology_id"], expected_version, replace)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ontology_meta "
+                "(ontology_id, created_at, ontology_classes, mapping_count, message, version) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry["ontology_id"], entry["created_at"], json.dumps(entry["ontology_classes"], ensure_ascii=False),
+                    entry["mapping_count"], entry.get("message"), version,
+                )
+            )
+            self._write_chunks(entry["ontology_id"], triples, mapping, replace)
+            self._log_change("save" if replace else "append", entry["ontology_id"], version)
+            self._after_write()
+    
+    def delete(self, ontology_id: str) -> None:
+        with self._lock:
+            self._begin()
+            self._conn.execute("DELETE FROM ontology_meta WHERE ontology_id = ?", (ontology_id,))
+            self._conn.execute("DELETE FROM ontology_chunks WHERE ontology_id = ?", (ontology_id,))
+            self._log_change("delete", ontology_id, 0)
+            self._after_write()
+    
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._lock:
+            self._begin()
+            self._exclusive = True
+            try:
+                yield
+            finally:
+                # 블록 안의 쓰기는 블록이 끝난 뒤 커밋 조건 확인 (기록하지 않았으면 쓰기 잠금만 해제)
+                self._exclusive = False
+                if self._pending:
+                    self._maybe_commit()
+                elif self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._conn.in_transaction:
+                self._conn.execute("COMMIT")
+                self._commits += 1
+            self._pending = 0
+    
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+        logger.info(f"SQLite 온톨로지 저장소 닫기: {self.path}")
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": type(self).__name__,
+                "path": str(self.path),
+                "writes": self._writes,
+                "commits": self._commits,
+                "pending": self._pending,
+                "payload_loads": self._payload_loads,
+                "shared": self.shared,
+                "change_seq": self._change_seq,
+                "remote_changes": self._remote_changes,
+            }
+    
+    def _begin(self) -> None:
+        """쓰기 트랜잭션 시작 (이미 열려 있으면 이어서 사용, 다른 워커의 쓰기와는 busy_timeout까지 대기)"""
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
+    
+    def _check_version(self, ontology_id: str, expected_version: int, replace: bool) -> None:
+        """쓰기 트랜잭션 안에서 저장된 버전 비교 (compare-and-swap, lock 안에서 호출)"""
+        row = self._conn.execute("SELECT version FROM ontology_meta WHERE ontology_id = ?", (ontology_id,)).fetchone()
+        current = row[0] if row is not None else None
+        if current == expected_version or (current is None and replace):
+            return
+        if not self._pending:
+            # 이 쓰기만을 위해 연 트랜잭션이면 쓰기 잠금을 바로 해제
+            self._conn.execute("ROLLBACK")
+        raise VersionConflictError(ontology_id, expected_version, current)
+    
+    def _log_change(self, event: str, ontology_id: str, version: int) -> None:
+        """변경 로그 기록 및 오래된 로그 정리 (lock 안에서, 트랜잭션 안에서 호출)"""
+        seq = self._conn.execute(
+            "INSERT INTO ontology_changes (ontology_id, event, version, writer) VALUES (?, ?, ?, ?)",
+            (ontology_id, event, version, self._writer)
+        ).lastrowid
+        self._conn.execute("DELETE FROM ontology_changes WHERE seq <= ?", (seq - ONTOLOGY_STORE_CHANGE_LOG_SIZE,))
+    
+    def _write_chunks(self, ontology_id: str, triples: CompactTripleStore, mapping: pl.DataFrame, replace: bool) -> None:
+        """페이로드 청크 기록 (lock 안에서, 트랜잭션 안에서 호출)"""
+        if replace:
+            self._conn.execute("DELETE FROM ontology_chunks WHERE ontology_id = ?", (ontology_id,))
+            seq = 0
+        else:
+            seq = self._conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM ontology_chunks WHERE ontology_id = ?", (ontology_id,)
+            ).fetchone()[0]
+        
+        terms, rows = triples.export_encoded()
+        mapping_bytes = None
+        if len(mapping.columns):
+            buffer = io.BytesIO()
+            mapping.write_ipc(buffer)
+            mapping_bytes = buffer.getvalue()
+        
+        self._conn.execute(
+            "INSERT INTO ontology_chunks (ontology_id, seq, terms, triples, mapping) VALUES (?, ?, ?, ?, ?)",
+            (
+                ontology_id, seq, json.dumps([term.n3() for term in terms], ensure_ascii=False),
+                np.ascontiguousarray(rows, dtype=ID_DTYPE).tobytes(), mapping_bytes,
+            )
+        )
+    
+    def _after_write(self) -> None:
+        """쓰기 후 커밋 조건 확인 (lock 안에서 호출)"""
+        self._writes += 1
+        self._pending += 1
+        if not self._exclusive:
+            self._maybe_commit()
+    
+    def _maybe_commit(self) -> None:
+        """대기 중인 쓰기가 commit_batch개 이상이면 커밋, 아니면 commit_interval 후 커밋 예약 (lock 안에서 호출)"""
+        if self._pending >= self.commit_batch or self.commit_interval <= 0:
+            self.flush()
+        elif self._timer is None:
+            # 더 이상 쓰기가 없어도 commit_interval 안에 커밋
+            self._timer = threading.Timer(self.commit_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+def _decode_chunks(chunks: List[Tuple]) -> Tuple[CompactTripleStore, pl.DataFrame]:
+    """페이로드 청크를 순서대로 하나의 트리플 저장소와 매핑으로 복원"""
+    store = CompactTripleStore()
+    mappings = []
+    for terms, triples, mapping in chunks:
+        rows = np.frombuffer(triples, dtype=ID_DTYPE).reshape(-1, 3)
+        store.add_encoded([from_n3(term) for term in json.loads(terms)], rows)
+        if mapping:
+            mappings.append(pl.read_ipc(io.BytesIO(mapping)))
+    return store, (pl.concat(mappings, how="diagonal_relaxed") if mappings else pl.DataFrame())
+
+
+def _meta_entry(row: Tuple) -> Dict[str, Any]:
+    """ontology_meta 행을 메타데이터 dict로 변환"""
+    ontology_id, created_at, classes, mapping_count, message, version = row
+    return {
+        "ontology_id": ontology_id,
+        "created_at": created_at,
+        "ontology_classes": json.loads(classes),
+        "mapping_count": mapping_count,
+        "message": message,
+        "version": version,
+    }
+
+
+def create_storage_backend(kind: str = ONTOLOGY_STORE_BACKEND, path: str = ONTOLOGY_STORE_PATH) -> StorageBackend:
+    """
+    설정에 맞는 저장소 백엔드 생성
+    
+    Args:
+        kind: 백엔드 종류 (sqlite, memory)
+        path: SQLite 파일 경로
+        
+    Returns:
+        StorageBackend: 백엔드 인스턴스
+    """
+    if kind == "memory":
+        return MemoryBackend()
+    elif kind == "sqlite":
+        return SQLiteBackend(path)
+    else:
+        raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {kind}")
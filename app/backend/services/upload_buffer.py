@@ -0,0 +1,164 @@
+"""
+업로드 버퍼 모듈
+업로드 파일을 청크 단위로 수신하며 크기 제한을 검사하고, 임계값을 넘으면 임시 파일로 전환
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from typing import BinaryIO, List, Optional
+from fastapi import UploadFile
+from backend.services.data_parser import FileSource
+from backend.services.ontology_services.config import UPLOAD_CHUNK_SIZE, UPLOAD_SPILL_THRESHOLD, UPLOAD_TEMP_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 크기 제한 초과"""
+    
+    def __init__(self, max_size: int, received: int):
+        self.max_size = max_size
+        self.received = received
+        super().__init__(
+            f"파일 크기는 {max_size / 1024 / 1024}MB 이하여야 합니다. "
+            f"수신한 크기: {received / 1024 / 1024:.2f}MB 이상"
+        )
+
+
+class UploadBuffer:
+    """크기 제한이 있는 업로드 버퍼 (작은 파일은 메모리, 큰 파일은 임시 파일, 수신하면서 SHA-256 계산)"""
+    
+    def __init__(
+        self,
+        max_size: int,
+        spill_threshold: int = UPLOAD_SPILL_THRESHOLD,
+        temp_dir: Optional[str] = UPLOAD_TEMP_DIR
+    ):
+        """
+        버퍼 초기화
+        
+        Args:
+            max_size: 허용하는 최대 크기 (bytes)
+            spill_threshold: 이 크기를 넘으면 임시 파일로 전환 (bytes)
+            temp_dir: 임시 파일 디렉토리 (None이면 시스템 기본값)
+        """
+        self.max_size = max_size
+        self.spill_threshold = spill_threshold
+        self.temp_dir = temp_dir
+        self.size = 0
+        self._chunks: List[bytes] = []
+        self._file: Optional[BinaryIO] = None
+        self.path: Optional[str] = None
+        self._hash = hashlib.sha256()
+    
+    @property
+    def spilled(self) -> bool:
+        """임시 파일로 전환되었는지 여부"""
+        return self.path is not None
+    
+    @property
+    def sha256(self) -> str:
+        """지금까지 수신한 내용의 SHA-256 (hex, 다시 읽지 않음)"""
+        return self._hash.hexdigest()
+    
+    def write(self, chunk: bytes) -> None:
+        """
+        청크 추가 (크기 제한 초과 시 즉시 중단)
+        
+        Args:
+            chunk: 수신한 데이터
+        """
+        if self.size + len(chunk) > self.max_size:
+            raise UploadTooLargeError(self.max_size, self.size + len(chunk))
+        
+        self.size += len(chunk)
+        self._hash.update(chunk)
+        if self._file is None and self.size > self.spill_threshold:
+            self._spill()
+        
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+    
+    def source(self) -> FileSource:
+        """
+        파서에 전달할 데이터 반환 (임시 파일로 전환된 경우 경로)
+        
+        Returns:
+            FileSource: bytes 또는 임시 파일 경로
+        """
+        if self._file is not None:
+            self._file.flush()
+            return self.path
+        
+        if len(self._chunks) > 1:
+            self._chunks = [b"".join(self._chunks)]
+        return self._chunks[0] if self._chunks else b""
+    
+    def close(self) -> None:
+        """버퍼 해제 (임시 파일 삭제)"""
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+    
+    def __enter__(self) -> "UploadBuffer":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _spill(self) -> None:
+        """메모리의 청크를 임시 파일로 옮김"""
+        fd, path = tempfile.mkstemp(prefix="upload_", suffix=".part", dir=self.temp_dir)
+        self._file = os.fdopen(fd, "wb")
+        self.path = path
+        for buffered in self._chunks:
+            self._file.write(buffered)
+        self._chunks = []
+        logger.info(f"업로드가 임계값({self.spill_threshold / 1024 / 1024:.1f}MB)을 넘어 임시 파일로 전환: {path}")
+
+
+async def read_upload_file(
+    upload: UploadFile,
+    max_size: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    spill_threshold: int = UPLOAD_SPILL_THRESHOLD
+) -> UploadBuffer:
+    """
+    UploadFile을 청크 단위로 읽어 버퍼에 저장
+    
+    Args:
+        upload: FastAPI UploadFile
+        max_size: 허용하는 최대 크기 (bytes)
+        chunk_size: 한 번에 읽을 크기 (bytes)
+        spill_threshold: 임시 파일 전환 임계값 (bytes)
+        
+    Returns:
+        UploadBuffer: 수신한 데이터 (호출자가 close 책임)
+    """
+    buffer = UploadBuffer(max_size, spill_threshold=spill_threshold)
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            if buffer.spilled:
+                # 디스크 쓰기는 이벤트 루프 밖에서 수행
+                await asyncio.to_thread(buffer.write, chunk)
+            else:
+                buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    return buffer
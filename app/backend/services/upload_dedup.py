@@ -0,0 +1,228 @@
+"""
+업로드 중복 제거 모듈
+업로드 내용 해시와 요청 인자로 만든 지문(fingerprint)으로 완료된 업로드 결과를 TTL 캐시에 보관
+같은 업로드를 다시 보내면 (타임아웃 후 재시도 등) 파싱/추론/그래프 작업 없이 저장된 결과를 반환
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from backend.services.ontology_services.embedding_cache import normalize_class_set
+from backend.services.ontology_services.config import UPLOAD_DEDUP_MAX_ENTRIES, UPLOAD_DEDUP_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyConflictError(ValueError):
+    """같은 Idempotency-Key로 다른 업로드를 요청한 경우"""
+    
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+        super().__init__(f"Idempotency-Key '{idempotency_key}'는 다른 업로드 요청에 이미 사용되었습니다.")
+
+
+def upload_fingerprint(content_sha256: str, file_name: str, ontology_classes: List[str], **params: Any) -> str:
+    """
+    업로드 지문 계산 (내용 해시 + 파일명 + 정규화된 클래스 집합 + 결과에 영향을 주는 인자)
+    
+    Args:
+        content_sha256: 업로드 내용의 SHA-256 (hex)
+        file_name: 파일명 (파일명 기반 매핑에 사용되므로 지문에 포함)
+        ontology_classes: 온톨로지 클래스 목록 (순서/중복 무시)
+        **params: 대상 온톨로지 ID, 관계 타입 등 나머지 인자
+        
+    Returns:
+        str: 지문 (hex)
+    """
+    payload = json.dumps(
+        [content_sha256, file_name, normalize_class_set(ontology_classes), sorted(params.items())],
+        ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CachedResult:
+    """캐시 항목"""
+    fingerprint: str
+    result: Any
+    expires_at: float
+
+
+class UploadResultCache:
+    """
+    업로드 결과 TTL 캐시
+    - 지문별 결과를 최대 max_entries개, ttl초 동안 보관 (LRU)
+    - Idempotency-Key가 있으면 키별로도 결과를 보관하고, 같은 키로 다른 지문을 요청하면 거부
+    - 같은 지문의 업로드가 처리 중이면 새로 실행하지 않고 진행 중인 결과를 기다림
+    """
+    
+    def __init__(self, max_entries: int = UPLOAD_DEDUP_MAX_ENTRIES, ttl: float = UPLOAD_DEDUP_TTL):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 캐시 항목 수 (지문과 Idempotency-Key 항목을 각각 제한)
+            ttl: 결과 보관 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._results: "OrderedDict[str, _CachedResult]" = OrderedDict()
+        self._keys: "OrderedDict[str, _CachedResult]" = OrderedDict()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._joined = 0
+        self._evictions = 0
+    
+    async def get_or_run(
+        self,
+        fingerprint: str,
+        run: Callable[[], Awaitable[Any]],
+        idempotency_key: Optional[str] = None,
+        is_valid: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        저장된 결과를 반환하거나 업로드 실행 후 저장
+        
+        Args:
+            fingerprint: 업로드 지문
+            run: 업로드를 실행하는 코루틴 함수
+            idempotency_key: 클라이언트가 보낸 Idempotency-Key (선택사항)
+            is_valid: 저장된 결과를 아직 사용할 수 있는지 확인하는 함수 (예: 온톨로지가 삭제되지 않았는지)
+            
+        Returns:
+            (결과, 저장된 결과 또는 진행 중인 업로드의 결과를 재사용했는지 여부)
+            
+        Raises:
+            IdempotencyKeyConflictError: 같은 Idempotency-Key로 다른 업로드를 요청한 경우
+        """
+        with self._lock:
+            cached = self._lookup(fingerprint, idempotency_key)
+            if cached is not None and is_valid is not None and not is_valid(cached.result):
+                self._drop(cached)
+                cached = None
+            if cached is not None:
+                self._hits += 1
+                return cached.result, True
+            
+            future = self._inflight.get(fingerprint)
+            owner = future is None
+            if owner:
+                self._misses += 1
+                future = concurrent.futures.Future()
+                self._inflight[fingerprint] = future
+            else:
+                self._joined += 1
+        
+        if not owner:
+            # 작업 큐 워커는 스레드마다 이벤트 루프가 다르므로 concurrent Future로 기다림
+            logger.info(f"처리 중인 같은 업로드의 결과를 기다림: {fingerprint[:12]}")
+            return await asyncio.wrap_future(future), True
+        
+        try:
+            result = await run()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[fingerprint]
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 예외를 조회하지 않았다는 경고가 남지 않도록 표시
+            future.exception()
+            raise
+        
+        with self._lock:
+            del self._inflight[fingerprint]
+            self._store(fingerprint, idempotency_key, result)
+        future.set_result(result)
+        return result, False
+    
+    def clear(self) -> None:
+        """캐시 비우기 (처리 중인 업로드는 유지)"""
+        with self._lock:
+            self._results.clear()
+            self._keys.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            항목 수, 히트/미스 횟수, 처리 중 업로드 합류 횟수
+        """
+        with self._lock:
+            total = self._hits + self._joined + self._misses
+            return {
+                "entries": len(self._results),
+                "idempotency_keys": len(self._keys),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "inflight": len(self._inflight),
+                "hits": self._hits,
+                "joined": self._joined,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round((self._hits + self._joined) / total, 3) if total else 0.0,
+            }
+    
+    def _lookup(self, fingerprint: str, idempotency_key: Optional[str]) -> Optional[_CachedResult]:
+        """만료되지 않은 캐시 항목 조회 (lock 안에서 호출)"""
+        now = time.monotonic()
+        if idempotency_key is not None:
+            cached = self._fresh(self._keys, idempotency_key, now)
+            if cached is not None:
+                if cached.fingerprint != fingerprint:
+                    raise IdempotencyKeyConflictError(idempotency_key)
+                return cached
+        return self._fresh(self._results, fingerprint, now)
+    
+    def _fresh(self, entries: "OrderedDict[str, _CachedResult]", key: str, now: float) -> Optional[_CachedResult]:
+        """항목이 있고 만료되지 않았으면 반환 (만료된 항목은 삭제)"""
+        cached = entries.get(key)
+        if cached is None:
+            return None
+        if cached.expires_at <= now:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return cached
+    
+    def _store(self, fingerprint: str, idempotency_key: Optional[str], result: Any) -> None:
+        """결과 저장 후 최대 항목 수를 넘은 오래된 항목 제거 (lock 안에서 호출)"""
+        cached = _CachedResult(fingerprint, result, time.monotonic() + self.ttl)
+        targets = [(self._results, fingerprint)]
+        if idempotency_key is not None:
+            targets.append((self._keys, idempotency_key))
+        for entries, key in targets:
+            entries[key] = cached
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self._evictions += 1
+    
+    def _drop(self, cached: _CachedResult) -> None:
+        """더 이상 사용할 수 없는 결과를 지문/키 항목에서 모두 제거 (lock 안에서 호출)"""
+        for entries in (self._results, self._keys):
+            for key in [key for key, entry in entries.items() if entry is cached]:
+                del entries[key]
+
+
+# 전역 캐시 인스턴스
+_upload_result_cache = UploadResultCache()
+
+
+def get_upload_result_cache() -> UploadResultCache:
+    """
+    업로드 결과 캐시 싱글톤 반환
+    
+    Returns:
+        UploadResultCache: 전역 캐시 인스턴스
+    """
+    return _upload_result_cache
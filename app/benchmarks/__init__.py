@@ -0,0 +1,4 @@
+"""
+성능 벤치마크 모듈
+app 디렉토리에서 python -m benchmarks.<모듈명> 으로 실행
+"""
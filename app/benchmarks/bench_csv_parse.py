@@ -0,0 +1,79 @@
+"""
+CSV 파싱 벤치마크
+전체 파싱(pl.read_csv)과 지연 파싱(pl.scan_csv, 헤더 + 타겟 컬럼만)의 시간과 최대 RSS 비교
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.bench_csv_parse --columns 300 --rows 200000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import polars as pl
+
+from backend.services.data_parser import CSVParser, DataParser
+
+
+def build_wide_csv(path: str, columns: int, rows: int) -> None:
+    """전압/전류 컬럼이 많은 센서 CSV 생성"""
+    header = ["time"] + [f"{'voltage' if i % 2 else 'current'}_{i}" for i in range(columns)] + ["machine"]
+    with open(path, "w") as f:
+        f.write(",".join(header) + "\n")
+        for start in range(0, rows, 10000):
+            lines = []
+            for row in range(start, min(rows, start + 10000)):
+                values = ",".join(f"{(row * (i + 1)) % 1000 * 0.01:.2f}" for i in range(columns))
+                lines.append(f"{row},{values},Welding_Robot\n")
+            f.write("".join(lines))
+
+
+def measure(mode: str, path: str) -> None:
+    """한 가지 방식으로 파싱하고 시간/RSS 증가량 출력 (새 프로세스에서 실행)"""
+    pl.read_csv(b"a\n1\n")  # polars 초기화 비용 제외
+    parser = CSVParser()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    if mode == "lazy":
+        summary = parser.parse_summary(path, "wide.csv", target_column="machine")
+    else:
+        summary = DataParser.parse_summary(parser, path, "wide.csv", target_column="machine")
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"rows": summary.row_count, "sec": elapsed, "peak_delta_mb": (peak - baseline) / 1024}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CSV 지연 파싱 벤치마크")
+    parser.add_argument("--columns", type=int, default=300, help="센서 컬럼 수")
+    parser.add_argument("--rows", type=int, default=200000, help="행 수")
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        measure(*args.measure)
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "wide.csv")
+        build_wide_csv(path, args.columns, args.rows)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"파일: {args.columns + 2}개 컬럼, {args.rows}개 행, {size_mb:.1f}MB")
+        print(f"{'mode':<8} {'rows':>10} {'time (s)':>10} {'peak RSS (MB)':>14}")
+        
+        for mode in ("eager", "lazy"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_csv_parse", "--measure", mode, path],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            result = json.loads(output)
+            print(f"{mode:<8} {result['rows']:>10} {result['sec']:>10.2f} {result['peak_delta_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+키워드 매칭 마이크로 벤치마크
+기존 부분 문자열 검사와 Aho-Corasick 오토마톤의 키워드 수별 매칭 시간 비교
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.bench_keyword_automaton --sizes 100 1000 10000 50000
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Dict, List
+
+from backend.services.ontology_services.rule_based_mapper import RuleBasedMapper
+
+
+def naive_match(keyword_rules: Dict[str, List[str]], clean_name: str):
+    """기존 구현 (클래스 × 키워드 × 단어 부분 문자열 검사)"""
+    words = clean_name.split()
+    best_match = None
+    best_score = 0.0
+    for class_name, keywords in keyword_rules.items():
+        matches = sum(1 for kw in keywords if kw in clean_name or any(kw in word for word in words))
+        if matches > 0:
+            score = min(0.95, 0.7 + (matches * 0.1))
+            if score > best_score:
+                best_score = score
+                best_match = class_name
+    return (best_match, best_score) if best_match else None
+
+
+def build_rules(keyword_count: int, class_count: int, rng: random.Random) -> Dict[str, List[str]]:
+    """랜덤 키워드 사전 생성"""
+    rules: Dict[str, List[str]] = {f"Class_{i}": [] for i in range(class_count)}
+    for i in range(keyword_count):
+        keyword = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+        rules[f"Class_{i % class_count}"].append(keyword)
+    return rules
+
+
+def build_filenames(count: int, rng: random.Random) -> List[str]:
+    """랜덤 파일명 생성"""
+    return [
+        "_".join(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+            for _ in range(rng.randint(2, 5))
+        ) + f"_{i:03d}.csv"
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="키워드 매칭 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000], help="키워드 수")
+    parser.add_argument("--classes", type=int, default=300, help="클래스 수")
+    parser.add_argument("--files", type=int, default=200, help="파일명 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    filenames = build_filenames(args.files, rng)
+    
+    print(f"{'keywords':>10} {'compile(ms)':>12} {'naive(us/file)':>15} {'automaton(us/file)':>19} {'speedup':>8}")
+    for size in args.sizes:
+        rules = build_rules(size, args.classes, rng)
+        
+        started = time.perf_counter()
+        mapper = RuleBasedMapper(keyword_rules=rules)
+        compile_ms = (time.perf_counter() - started) * 1000
+        
+        clean_names = [mapper.preprocess_filename(name) for name in filenames]
+        
+        started = time.perf_counter()
+        expected = [naive_match(rules, name) for name in clean_names]
+        naive_us = (time.perf_counter() - started) / len(filenames) * 1e6
+        
+        started = time.perf_counter()
+        actual = [mapper.match_by_keywords(name) for name in filenames]
+        automaton_us = (time.perf_counter() - started) / len(filenames) * 1e6
+        
+        assert actual == expected, "오토마톤 결과가 기존 구현과 다릅니다."
+        print(f"{size:>10} {compile_ms:>12.1f} {naive_us:>15.1f} {automaton_us:>19.1f} {naive_us / automaton_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
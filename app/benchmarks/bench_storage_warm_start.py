@@ -0,0 +1,83 @@
+"""
+저장소 재시작 벤치마크
+SQLite 백엔드에 온톨로지를 저장한 뒤 새 프로세스에서 재시작 시간(메타데이터만 로드)과
+첫 조회 시간(페이로드 지연 로드)을 측정
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.bench_storage_warm_start --ontologies 200 --triples 2000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.ontology_builder import relation_triples
+from backend.services.storage_backend import SQLiteBackend
+
+CLASSES = ["Injection_Molding_Machine", "Welding_Robot", "CNC_Machine", "Industrial_Pump"]
+
+
+def populate(path: str, ontologies: int, triples: int) -> float:
+    """온톨로지 저장 후 소요 시간 반환"""
+    started = time.perf_counter()
+    storage = OntologyStorage(SQLiteBackend(path))
+    for n in range(ontologies):
+        rows = [
+            {"Source": f"o{n}_sensor_{i}.csv", "Target": CLASSES[i % len(CLASSES)], "Similarity": 0.9, "Method": "rule"}
+            for i in range(triples)
+        ]
+        response = BuildHybridOntologyResponse(message="bench", ontology_id=f"onto-{n}", mapping_df=rows, g="")
+        storage.save(response, CLASSES, graph=relation_triples(rows, "isDataOf"))
+    storage.close()
+    return time.perf_counter() - started
+
+
+def measure(path: str) -> None:
+    """재시작/첫 조회 시간 출력 (새 프로세스에서 실행)"""
+    started = time.perf_counter()
+    storage = OntologyStorage(SQLiteBackend(path))
+    listed = storage.list_all()
+    start_sec = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    storage.get(listed[0]["ontology_id"])
+    first_get_sec = time.perf_counter() - started
+    
+    print(json.dumps({"ontologies": len(listed), "start_sec": start_sec, "first_get_sec": first_get_sec}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장소 재시작 벤치마크")
+    parser.add_argument("--ontologies", type=int, default=200, help="온톨로지 수")
+    parser.add_argument("--triples", type=int, default=2000, help="온톨로지별 트리플 수")
+    parser.add_argument("--measure", metavar="PATH", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        measure(args.measure)
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "ontologies.db")
+        write_sec = populate(path, args.ontologies, args.triples)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_storage_warm_start", "--measure", path],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+    
+    total = args.ontologies * args.triples
+    print(f"온톨로지 {args.ontologies}개 x 트리플 {args.triples}개 = {total}개 ({size_mb:.1f} MB)")
+    print(f"{'write (s)':>10} {'restart (s)':>12} {'first get (s)':>14}")
+    print(f"{write_sec:>10.2f} {result['start_sec']:>12.3f} {result['first_get_sec']:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
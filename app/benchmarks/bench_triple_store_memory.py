@@ -0,0 +1,111 @@
+"""
+트리플 저장소 메모리 벤치마크
+이전 방식(rdflib Graph + Turtle 문자열 + dict 목록 매핑)과 사전 인코딩 저장소(CompactTripleStore + 컬럼 매핑)의
+유지 메모리를 100만 트리플 기준으로 환산하여 비교
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.bench_triple_store_memory --triples 200000
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.ontology_builder import (
+    add_relations_to_graph,
+    new_ontology_graph,
+    relation_triples,
+    serialize_turtle,
+)
+from backend.services.ontology_services.rdf_parser import graph_to_nodes_edges, store_to_nodes_edges
+
+CLASSES = ["Injection_Molding_Machine", "Welding_Robot", "CNC_Machine", "Industrial_Pump"]
+
+
+def build_mapping_rows(triples: int) -> list:
+    """파일 -> 클래스 매핑 결과 (파일마다 관계 하나)"""
+    return [
+        {
+            "Source": f"line{i % 50}_sensor_{i}.csv",
+            "Target": CLASSES[i % len(CLASSES)],
+            "Similarity": 0.9,
+            "Method": "rule",
+        }
+        for i in range(triples)
+    ]
+
+
+def measure(mode: str, triples: int) -> None:
+    """한 가지 방식으로 저장하고 유지 메모리/투영 시간 출력 (새 프로세스에서 실행)"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    
+    rows = build_mapping_rows(triples)
+    if mode == "rdflib":
+        # 이전 방식: 온톨로지별 Graph + 캐시된 Turtle + dict 목록
+        graph = new_ontology_graph()
+        add_relations_to_graph(graph, rows, "isDataOf")
+        kept = {"graph": graph, "turtle": serialize_turtle(graph), "mapping_df": rows}
+        project = lambda: graph_to_nodes_edges(graph)
+    else:
+        storage = OntologyStorage()
+        response = BuildHybridOntologyResponse(message="bench", ontology_id="bench", mapping_df=rows, g="")
+        storage.save(response, CLASSES, graph=relation_triples(rows, "isDataOf"))
+        del response
+        kept = storage
+        project = lambda: storage.read_graph("bench", store_to_nodes_edges)
+    del rows
+    build_sec = time.perf_counter() - started
+    
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    
+    started = time.perf_counter()
+    project()
+    project_sec = time.perf_counter() - started
+    
+    print(json.dumps({
+        "retained_mb": retained / 1024 / 1024,
+        "build_sec": build_sec,
+        "project_sec": project_sec,
+        "kept": type(kept).__name__,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="트리플 저장소 메모리 벤치마크")
+    parser.add_argument("--triples", type=int, default=200000, help="트리플 수")
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "TRIPLES"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        measure(args.measure[0], int(args.measure[1]))
+        return
+    
+    scale = 1_000_000 / args.triples
+    print(f"트리플 {args.triples}개 (100만 트리플 기준으로 환산)")
+    print(f"{'mode':<8} {'retained (MB)':>14} {'MB / 1M triples':>16} {'build (s)':>10} {'project (s)':>12}")
+    
+    for mode in ("rdflib", "compact"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_triple_store_memory", "--measure", mode, str(args.triples)],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        print(
+            f"{mode:<8} {result['retained_mb']:>14.1f} {result['retained_mb'] * scale:>16.1f} "
+            f"{result['build_sec']:>10.2f} {result['project_sec']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+폴더 감시 재스캔 벤치마크
+입력 폴더의 파일 전체를 매니페스트에 기록한 뒤, 재시작 후 변경 없는 폴더를 다시 스캔하는 시간을 측정
+(변경 없는 파일은 stat만 비교하고 내용은 읽지 않음)
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.bench_watch_rescan --files 100000
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from backend.services.bulk_ingestion import BulkIngestion, discover_files
+from backend.services.folder_watcher import FolderWatcher
+from backend.services.ingestion_manifest import IngestionManifest, ManifestEntry
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.utils import file_sha256
+
+CLASSES = ["Injection_Molding_Machine", "Welding_Robot", "CNC_Machine", "Industrial_Pump"]
+
+
+def create_files(folder: Path, files: int) -> None:
+    """라인별 하위 폴더에 작은 CSV 생성"""
+    for i in range(files):
+        line = folder / f"line{i % 100}"
+        line.mkdir(exist_ok=True)
+        (line / f"{CLASSES[i % len(CLASSES)].lower()}_{i}.csv").write_text(f"time,value\n1,{i}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="폴더 감시 재스캔 벤치마크")
+    parser.add_argument("--files", type=int, default=100000, help="파일 수")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "input"
+        folder.mkdir()
+        create_files(folder, args.files)
+        manifest_path = str(Path(tmp) / "manifest.db")
+        
+        # 첫 수집 후 상태와 같은 매니페스트 기록 (해시 계산 + 배치 기록)
+        started = time.perf_counter()
+        now = datetime.now().isoformat()
+        manifest = IngestionManifest(manifest_path)
+        manifest.update(
+            ManifestEntry(f.name, f.size, f.mtime_ns, file_sha256(f.path), "ingested", now)
+            for f in discover_files(str(folder))
+        )
+        manifest.close()
+        populate_sec = time.perf_counter() - started
+        
+        # 재시작: 매니페스트를 다시 열고 변경 없는 폴더 재스캔
+        started = time.perf_counter()
+        manifest = IngestionManifest(manifest_path)
+        open_sec = time.perf_counter() - started
+        watcher = FolderWatcher(str(folder), BulkIngestion(CLASSES, workers=0), manifest, storage=OntologyStorage())
+        report = watcher.scan_once()
+        stats = manifest.stats()
+        manifest.close()
+    
+    print(f"파일 {args.files}개")
+    print(f"{'step':<28} {'seconds':>10}")
+    print(f"{'hash + manifest write':<28} {populate_sec:>10.2f}")
+    print(f"{'manifest open':<28} {open_sec:>10.2f}")
+    print(f"{'rescan (unchanged)':<28} {report.elapsed_seconds:>10.2f}")
+    print(f"unchanged={report.files_unchanged}, ingested={report.files_ingested}, manifest={stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+업로드 부하 테스트
+대용량 업로드가 동시에 진행되는 동안 조회 엔드포인트의 지연 시간(p50/p99) 측정
+
+실행 (app 디렉토리에서):
+    python -m benchmarks.load_upload_latency --size-mb 200 --concurrency 4
+    python -m benchmarks.load_upload_latency --url http://localhost:8000  # 실행 중인 서버 사용
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+import httpx
+
+
+READ_PATH = "/api/v1/list_ontologies"
+UPLOAD_PATH = "/api/v1/upload_data"
+ONTOLOGY_CLASSES = "Injection_Molding_Machine,Welding_Robot,CNC_Machine,Industrial_Pump"
+
+
+def build_csv(path: str, size_mb: int) -> None:
+    """지정한 크기의 센서 CSV 생성"""
+    target = size_mb * 1024 * 1024
+    block = "".join(f"{i},{i * 0.001:.3f},{i % 97},{i % 13 * 1.5:.1f}\n" for i in range(10000)).encode()
+    with open(path, "wb") as f:
+        f.write(b"time,current,voltage,temperature\n")
+        written = 0
+        while written < target:
+            f.write(block)
+            written += len(block)
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """백분위수 (ms)"""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+def free_port() -> int:
+    """사용 가능한 포트 조회"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """uvicorn 서버 실행 후 준비될 때까지 대기"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}{READ_PATH}", timeout=1.0)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+async def poll_reads(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> List[float]:
+    """stop 이벤트까지 조회 엔드포인트 반복 호출"""
+    latencies: List[float] = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(READ_PATH)
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def upload(client: httpx.AsyncClient, path: str, index: int) -> float:
+    """대용량 CSV 업로드 (소요 시간 반환)"""
+    started = time.perf_counter()
+    with open(path, "rb") as f:
+        response = await client.post(
+            UPLOAD_PATH,
+            files={"file": (f"welding_robot_load_{index}.csv", f, "text/csv")},
+            data={"ontology_classes": ONTOLOGY_CLASSES},
+            timeout=None,
+        )
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def run(base_url: str, csv_path: str, concurrency: int, baseline_sec: float, interval: float) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        # 1. 유휴 상태 기준 지연 시간
+        stop = asyncio.Event()
+        reader = asyncio.create_task(poll_reads(client, stop, interval))
+        await asyncio.sleep(baseline_sec)
+        stop.set()
+        baseline = await reader
+        
+        # 2. 동시 업로드 중 지연 시간
+        stop = asyncio.Event()
+        reader = asyncio.create_task(poll_reads(client, stop, interval))
+        upload_times = await asyncio.gather(*(upload(client, csv_path, i) for i in range(concurrency)))
+        stop.set()
+        under_load = await reader
+    
+    print(f"{'phase':<14} {'requests':>9} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+    for name, samples in (("idle", baseline), ("during upload", under_load)):
+        print(
+            f"{name:<14} {len(samples):>9} {percentile(samples, 50):>10.1f} "
+            f"{percentile(samples, 99):>10.1f} {max(samples) * 1000:>10.1f}"
+        )
+    print(f"업로드 {concurrency}건 소요 시간: 평균 {statistics.mean(upload_times):.1f}초, 최대 {max(upload_times):.1f}초")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업로드 중 조회 지연 시간 부하 테스트")
+    parser.add_argument("--url", default=None, help="실행 중인 서버 주소 (없으면 임시 서버 실행)")
+    parser.add_argument("--size-mb", type=int, default=200, help="업로드 파일 크기 (MB)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 업로드 수")
+    parser.add_argument("--baseline-sec", type=float, default=5.0, help="유휴 상태 측정 시간 (초)")
+    parser.add_argument("--interval", type=float, default=0.02, help="조회 요청 간격 (초)")
+    args = parser.parse_args()
+    
+    server: Optional[subprocess.Popen] = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "load.csv")
+        build_csv(csv_path, args.size_mb)
+        try:
+            base_url = args.url
+            if base_url is None:
+                port = free_port()
+                server = start_server(port)
+                base_url = f"http://127.0.0.1:{port}"
+            asyncio.run(run(base_url, csv_path, args.concurrency, args.baseline_sec, args.interval))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -115,5 +115,8 @@ export interface UploadDataResponse {
   mapping_df: Array<Record<string, any>>;
   /** RDF Graph (Turtle 형식) */
   g: string;
+  /** 매핑에 사용된 키워드 사전 버전 */
+  rule_version?: string | null;
+  /** 타겟 컬럼 값의 클래스별 행 수 (요청 시에만) */
+  target_class_counts?: Record<string, number> | null;
 }
-
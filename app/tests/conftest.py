@@ -3,10 +3,49 @@
 모든 테스트에서 공통으로 사용하는 fixtures 정의
 """
 
+import hashlib
+import os
+import re
+
+# 테스트는 영속화 없이 메모리 저장소 사용 (backend 모듈 import 전에 설정)
+os.environ.setdefault("ONTOLOGY_STORE_BACKEND", "memory")
+
+import numpy as np
 import pytest
 from pathlib import Path
 from fastapi.testclient import TestClient
 from backend.main import app
+from backend.services.upload_dedup import get_upload_result_cache
+from backend.services.ontology_services import disk_embedding_cache
+from backend.services.ontology_services.embedding_cache import get_class_embedding_cache
+from backend.services.ontology_services.model_registry import get_model_registry
+from backend.services.ontology_services.schema_mapping_cache import get_schema_mapping_cache
+
+
+FAKE_MODEL_NAME = "test/fake-hashing-encoder"
+
+
+class FakeSentenceModel:
+    """
+    문자 trigram 해싱 기반 결정적 인코더
+    모델 가중치를 내려받지 않고 매핑 경로를 검증하기 위해 사용
+    """
+    
+    dimension = 64
+    
+    def __init__(self):
+        self.encode_calls: list[list[str]] = []
+    
+    def encode(self, sentences, show_progress_bar: bool = False, **kwargs) -> np.ndarray:
+        sentences = list(sentences)
+        self.encode_calls.append(sentences)
+        vectors = np.zeros((len(sentences), self.dimension), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            text = f" {re.sub(r'[^a-z0-9]+', ' ', sentence.lower()).strip()} "
+            for i in range(len(text) - 2):
+                digest = hashlib.md5(text[i:i + 3].encode()).digest()
+                vectors[row, digest[0] % self.dimension] += 1.0
+        return vectors
 
 
 @pytest.fixture(scope="session")
@@ -17,8 +56,10 @@ def test_data_dir() -> Path:
 
 @pytest.fixture
 def client() -> TestClient:
-    """FastAPI 테스트 클라이언트"""
-    return TestClient(app)
+    """FastAPI 테스트 클라이언트 (중복 업로드 결과 캐시는 테스트마다 비움)"""
+    get_upload_result_cache().clear()
+    yield TestClient(app)
+    get_upload_result_cache().clear()
 
 
 @pytest.fixture
@@ -31,3 +72,27 @@ def sample_ontology_classes() -> list[str]:
         "Industrial_Pump"
     ]
 
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """레지스트리에 등록된 가짜 인코더 (테스트 후 제거, 디스크 캐시 비활성화)"""
+    monkeypatch.setattr(
+        disk_embedding_cache,
+        "_disk_embedding_cache_manager",
+        disk_embedding_cache.DiskEmbeddingCacheManager(enabled=False),
+    )
+    model = FakeSentenceModel()
+    registry = get_model_registry()
+    registry.register(FAKE_MODEL_NAME, model)
+    get_class_embedding_cache().clear()
+    get_schema_mapping_cache().clear()
+    yield model
+    registry.clear()
+    get_class_embedding_cache().clear()
+    get_schema_mapping_cache().clear()
+
+
+@pytest.fixture
+def fake_model_name(fake_model) -> str:
+    """가짜 인코더 모델명"""
+    return FAKE_MODEL_NAME
@@ -0,0 +1,222 @@
+"""
+데이터 업로드 라우터 테스트
+/api/v1/upload_data, /api/v1/upload_batch 엔드포인트 동작 검증
+"""
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+def _upload(client: TestClient, file_name: str, content: bytes, classes: list[str], **form):
+    """CSV 업로드 요청"""
+    data = {"ontology_classes": ",".join(classes), **form}
+    return client.post(
+        "/api/v1/upload_data",
+        files={"file": (file_name, content, "text/csv")},
+        data=data,
+    )
+
+
+def test_upload_data_endpoint_rule_mapping(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """파일명 규칙 매핑 업로드 테스트 (사전 버전 포함)"""
+    response = _upload(
+        client,
+        "welding_robot_line1.csv",
+        b"time,current\n1,0.5\n2,0.7\n",
+        sample_ontology_classes,
+        model_name=fake_model_name,
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["records_processed"] == 2
+    assert data["relations_added"] == 1
+    assert data["mapping_df"][0]["Target"] == "Welding_Robot"
+    assert data["mapping_df"][0]["Method"] == "rule"
+    assert data["rule_version"] == "builtin"
+    assert "Welding_Robot" in data["g"]
+
+
+def test_upload_data_endpoint_unsupported_type(client: TestClient, sample_ontology_classes: list[str]):
+    """지원하지 않는 파일 형식 테스트"""
+    response = client.post(
+        "/api/v1/upload_data",
+        files={"file": ("notes.txt", b"hello", "text/plain")},
+        data={"ontology_classes": ",".join(sample_ontology_classes)},
+    )
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_upload_data_endpoint_too_large(client: TestClient, monkeypatch, sample_ontology_classes: list[str]):
+    """크기 제한 초과 시 413 반환 테스트 (본문 수신 중 검사 및 파일 크기 검사)"""
+    from backend.router import data_upload
+    monkeypatch.setattr(data_upload, "MAX_FILE_SIZE", 64)
+    
+    # 파일 크기만 제한을 넘는 경우 (multipart 여유 크기 이내)
+    response = _upload(client, "welding_robot_line1.csv", b"time,current\n" + b"1,0.5\n" * 20, sample_ontology_classes)
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    
+    # 요청 본문 전체가 제한을 넘는 경우
+    monkeypatch.setattr(data_upload, "MULTIPART_OVERHEAD", 0)
+    response = _upload(client, "welding_robot_line1.csv", b"time,current\n" + b"1,0.5\n" * 20, sample_ontology_classes)
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_upload_data_endpoint_target_column_counts(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """타겟 컬럼 직접 매핑 및 클래스별 행 수 집계 테스트"""
+    response = _upload(
+        client,
+        "line1.csv",
+        b"time,machine\n1,CNC_Machine\n2,CNC_Machine\n3,Welding_Robot\n",
+        sample_ontology_classes,
+        target_column="machine",
+        count_target_classes="true",
+        model_name=fake_model_name,
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["mapping_df"][0]["Target"] == "CNC_Machine"
+    assert data["mapping_df"][0]["Method"] == "direct"
+    assert data["target_class_counts"] == {"CNC_Machine": 2, "Welding_Robot": 1}
+    
+    # 헤더는 ASCII이고 데이터 행이 CP949인 파일도 타겟 컬럼을 읽는 시점에 전체 파싱으로 전환하여 매핑
+    response = _upload(
+        client,
+        "line2.csv",
+        "time,machine\n1,용접기\n2,CNC_Machine\n3,Welding_Robot\n".encode("cp949"),
+        sample_ontology_classes,
+        target_column="machine",
+        count_target_classes="true",
+        model_name=fake_model_name,
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["mapping_df"][0]["Target"] == "CNC_Machine"
+    assert data["target_class_counts"] == {"CNC_Machine": 1, "Welding_Robot": 1}
+
+
+def test_upload_data_endpoint_job_mode(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """작업 모드 업로드가 즉시 202를 반환하고 작업 상태 조회로 단계별 진행 상황과 결과를 받는지 테스트"""
+    import time
+    
+    response = _upload(
+        client,
+        "welding_robot_line1.csv",
+        b"time,current\n1,0.5\n2,0.7\n",
+        sample_ontology_classes,
+        model_name=fake_model_name,
+        include_graph="false",
+        job="true",
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_url = response.headers["Location"]
+    assert job_url == f"/api/v1/jobs/{response.json()['job_id']}"
+    
+    deadline = time.monotonic() + 60
+    job = response.json()
+    while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.05)
+        job = client.get(job_url).json()
+    
+    assert job["status"] == "succeeded", job["error"]
+    assert job["stage"] == "done"
+    assert job["progress"]["parsed_rows"] == 2
+    assert job["progress"]["relations"] == 1
+    assert job["progress"]["triples_added"] >= 1
+    assert job["result"]["ontology_id"] == job["progress"]["ontology_id"]
+    assert job["result"]["mapping_df"][0]["Target"] == "Welding_Robot"
+    
+    metrics = client.get("/api/v1/metrics").json()["metrics"]["ingestion_jobs"]
+    assert metrics["succeeded"] >= 1
+    assert client.get("/api/v1/jobs/unknown-job").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_upload_data_endpoint_retry_is_deduplicated(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """같은 업로드 재시도는 새 온톨로지를 만들지 않고 저장된 결과를 반환하는지 테스트 (Idempotency-Key 재사용 충돌은 422)"""
+    content = b"time,current\n1,0.5\n2,0.7\n"
+    form = {"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name}
+    
+    def upload(body: bytes, key: str):
+        return client.post(
+            "/api/v1/upload_data",
+            files={"file": ("welding_robot_line1.csv", body, "text/csv")},
+            data=form,
+            headers={"Idempotency-Key": key},
+        )
+    
+    before = client.get("/api/v1/metrics").json()["metrics"]["upload_dedup"]
+    first = upload(content, "retry-1")
+    retry = upload(content, "retry-1")
+    same_content = upload(content, "retry-2")
+    
+    assert first.status_code == retry.status_code == same_content.status_code == status.HTTP_200_OK
+    assert not first.json()["deduplicated"]
+    assert retry.json()["deduplicated"]
+    assert same_content.json()["deduplicated"]
+    assert retry.json()["ontology_id"] == same_content.json()["ontology_id"] == first.json()["ontology_id"]
+    
+    conflict = upload(content + b"3,0.9\n", "retry-1")
+    assert conflict.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    metrics = client.get("/api/v1/metrics").json()["metrics"]["upload_dedup"]
+    assert metrics["hits"] - before["hits"] == 2
+    assert metrics["misses"] - before["misses"] == 1
+
+
+def test_upload_batch_endpoint_archive_and_files(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """ZIP 아카이브와 개별 파일을 함께 일괄 업로드하고 파일별 결과를 받는지 테스트"""
+    import io
+    import zipfile
+    
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("line1/welding_robot_a.csv", b"time,current\n1,0.5\n2,0.7\n")
+        zf.writestr("line1/readme.txt", b"hello")
+    
+    response = client.post(
+        "/api/v1/upload_batch",
+        files=[
+            ("files", ("plant.zip", archive.getvalue(), "application/zip")),
+            ("files", ("cnc_machine_b.csv", b"time,rpm\n1,1200\n", "text/csv")),
+        ],
+        data={"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name},
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["file_name"] for item in data["files"]] == ["line1/welding_robot_a.csv", "line1/readme.txt", "cnc_machine_b.csv"]
+    assert [item["status"] for item in data["files"]] == ["mapped", "skipped", "mapped"]
+    assert data["files"][0]["target"] == "Welding_Robot"
+    assert data["relations_added"] == 2
+    assert data["records_processed"] == 3
+    assert "CNC_Machine" in data["g"]
+    
+    response = client.post(
+        "/api/v1/upload_batch",
+        files=[("files", ("plant.zip", b"not an archive", "application/zip"))],
+        data={"ontology_classes": ",".join(sample_ontology_classes)},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_upload_batch_endpoint_total_size_limit(client: TestClient, monkeypatch, fake_model_name: str, sample_ontology_classes: list[str]):
+    """일괄 업로드는 파일별 제한 이내 파일의 합계가 파일 크기 제한을 넘어도 받고, 요청 전체 크기 제한만 적용하는지 테스트"""
+    from backend.router import data_upload
+    monkeypatch.setattr(data_upload, "MAX_FILE_SIZE", 4096)
+    monkeypatch.setattr(data_upload, "MULTIPART_OVERHEAD", 1024)
+    
+    content = b"time,current\n" + b"1,0.5\n" * 500  # 파일당 약 3KB, 5개 합계는 파일 크기 제한 + 여유 크기를 넘음
+    files = [("files", (f"welding_robot_{i}.csv", content, "text/csv")) for i in range(5)]
+    data = {"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name}
+    
+    response = client.post("/api/v1/upload_batch", files=files, data=data)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["relations_added"] == 5
+    
+    monkeypatch.setattr(data_upload, "BATCH_UPLOAD_MAX_REQUEST_SIZE", 8192)
+    response = client.post("/api/v1/upload_batch", files=files, data=data)
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "일괄 업로드 요청 전체 크기" in response.json()["detail"]
@@ -0,0 +1,109 @@
+"""
+파일명 매핑 라우터 테스트
+/api/v1/map_filenames 엔드포인트 동작 검증
+"""
+
+import json
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+def test_map_filenames_endpoint_json(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """파일명 일괄 매핑 JSON 응답 테스트"""
+    request_data = {
+        "file_names": ["injection_molding_data.csv", "line_a_log.csv"],
+        "ontology_classes": sample_ontology_classes,
+        "model_name": fake_model_name,
+    }
+    
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 2
+    assert [item["file_name"] for item in data["mappings"]] == request_data["file_names"]
+    assert data["mappings"][0]["mapped_class"] == "Injection_Molding_Machine"
+    assert data["mappings"][0]["method"] == "rule"
+    for item in data["mappings"]:
+        assert set(item) == {"file_name", "mapped_class", "confidence", "method", "interpreted_as"}
+
+
+def test_map_filenames_endpoint_ndjson_stream(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """stream=true일 때 NDJSON 스트리밍 응답 테스트"""
+    file_names = [f"welding_robot_{i:02d}.csv" for i in range(5)]
+    request_data = {
+        "file_names": file_names,
+        "ontology_classes": sample_ontology_classes,
+        "model_name": fake_model_name,
+        "stream": True,
+    }
+    
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [line["file_name"] for line in lines] == file_names
+    assert all(line["mapped_class"] == "Welding_Robot" for line in lines)
+
+
+def test_map_filenames_endpoint_stream_failures(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str], monkeypatch):
+    """스트리밍 전 모델 로드 실패는 500, 스트리밍 중 청크 매핑 실패는 마지막 줄 오류 레코드로 반환하는지 테스트"""
+    from backend.router import mapping_ontology
+    from backend.services.filename_mapping_service import FilenameMappingService
+    from backend.services.ontology_services.model_registry import get_model_registry
+    
+    def fail_to_load(model_name: str):
+        raise OSError(f"모델을 찾을 수 없습니다: {model_name}")
+    
+    monkeypatch.setattr(get_model_registry(), "_loader", fail_to_load)
+    request_data = {
+        "file_names": ["welding_robot_01.csv"],
+        "ontology_classes": sample_ontology_classes,
+        "model_name": "test/missing-model",
+        "stream": True,
+    }
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    
+    map_chunk = FilenameMappingService.map_chunk
+    
+    def fail_second_chunk(self, mapper, file_names):
+        if file_names[0].endswith("02.csv"):
+            raise RuntimeError("추론 실패")
+        return map_chunk(self, mapper, file_names)
+    
+    monkeypatch.setattr(mapping_ontology, "MAP_FILENAMES_CHUNK_SIZE", 2)
+    monkeypatch.setattr(FilenameMappingService, "map_chunk", fail_second_chunk)
+    request_data.update(model_name=fake_model_name, file_names=[f"welding_robot_{i:02d}.csv" for i in range(4)])
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    
+    assert response.status_code == status.HTTP_200_OK
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [line["file_name"] for line in lines[:-1]] == ["welding_robot_00.csv", "welding_robot_01.csv"]
+    assert lines[-1]["offset"] == 2
+    assert "추론 실패" in lines[-1]["error"]
+
+
+def test_map_filenames_endpoint_empty_classes(client: TestClient):
+    """공백 클래스만 전달한 경우 400 에러 테스트"""
+    request_data = {
+        "file_names": ["a.csv"],
+        "ontology_classes": [" "],
+    }
+    
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_map_filenames_endpoint_empty_file_names(client: TestClient, sample_ontology_classes: list[str]):
+    """빈 파일명 목록 검증 실패 테스트"""
+    request_data = {
+        "file_names": [],
+        "ontology_classes": sample_ontology_classes,
+    }
+    
+    response = client.post("/api/v1/map_filenames", json=request_data)
+    
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
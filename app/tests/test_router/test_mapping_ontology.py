@@ -71,3 +71,119 @@ def test_get_hybrid_ontology_endpoint_missing_param(client: TestClient):
     # 필수 파라미터 누락으로 422 에러 예상
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
+
+
+def test_get_ontology_graph_endpoint_etag(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """그래프 조회 ETag/304 및 업로드 후 새 버전 반영 테스트"""
+    def upload(file_name: str, **form):
+        return client.post(
+            "/api/v1/upload_data",
+            files={"file": (file_name, b"time,current\n1,0.5\n", "text/csv")},
+            data={"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name, **form},
+        ).json()["ontology_id"]
+    
+    ontology_id = upload("welding_robot_line1.csv")
+    url = f"/api/v1/get_ontology_graph/{ontology_id}"
+    
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first.headers["ETag"]
+    
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["ETag"] == etag
+    
+    upload("cnc_machine_spindle.csv", ontology_id=ontology_id)
+    updated = client.get(url, headers={"If-None-Match": etag})
+    assert updated.status_code == status.HTTP_200_OK
+    assert updated.headers["ETag"] != etag
+    assert "CNC_Machine" in {edge["target"] for edge in updated.json()["edges"]}
+    
+    metrics = client.get("/api/v1/metrics").json()["metrics"]["ontology_graph_cache"]
+    assert metrics["hits"] >= 1
+
+
+def test_get_hybrid_ontology_endpoint_does_not_block_event_loop(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """관계 추가가 온톨로지 lock을 잡고 있는 동안에도 조회 요청이 이벤트 루프를 막지 않는지 테스트"""
+    import asyncio
+    import threading
+    import httpx
+    from backend.main import app
+    from backend.services.ontology_storage import get_ontology_storage
+    
+    ontology_id = client.post(
+        "/api/v1/upload_data",
+        files={"file": ("welding_robot_line1.csv", b"time,current\n1,0.5\n", "text/csv")},
+        data={"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name},
+    ).json()["ontology_id"]
+    
+    # 다른 스레드의 관계 추가가 온톨로지 lock을 잡고 있는 상태 (최대 2초 후 해제)
+    locked, release, released = threading.Event(), threading.Event(), threading.Event()
+    
+    def hold_lock() -> None:
+        with get_ontology_storage()._ontology_lock(ontology_id):
+            locked.set()
+            release.wait(2)
+        released.set()
+    
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    locked.wait()
+    
+    async def scenario() -> tuple[bool, int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+            pending = asyncio.create_task(async_client.get("/api/v1/get_hybrid_ontology", params={"ontology_id": ontology_id}))
+            await asyncio.sleep(0.1)
+            await async_client.get("/api/v1/list_ontologies")
+            served_while_locked = not released.is_set()
+            release.set()
+            return served_while_locked, (await pending).status_code
+    
+    served_while_locked, status_code = asyncio.run(scenario())
+    holder.join()
+    assert served_while_locked
+    assert status_code == status.HTTP_200_OK
+
+
+def test_get_merged_ontology_graph_endpoint(client: TestClient, fake_model_name: str, sample_ontology_classes: list[str]):
+    """업로드한 온톨로지가 통합 그래프에 반영되는지 테스트"""
+    client.post(
+        "/api/v1/upload_data",
+        files={"file": ("industrial_pump_a.csv", b"time,current\n1,0.5\n", "text/csv")},
+        data={"ontology_classes": ",".join(sample_ontology_classes), "model_name": fake_model_name},
+    )
+    
+    response = client.get("/api/v1/get_merged_ontology_graph")
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {"source": "industrial_pump_a.csv", "target": "Industrial_Pump", "relation": "isDataOf"} in data["edges"]
+    assert len({node["id"] for node in data["nodes"]}) == len(data["nodes"])
+
+
+def test_list_ontologies_endpoint_pagination(client: TestClient, fake_model_name: str):
+    """목록 조회 커서 페이지네이션과 클래스 필터 테스트"""
+    classes = ["Pagination_Pump", "Pagination_Robot"]
+    uploaded = [
+        client.post(
+            "/api/v1/upload_data",
+            files={"file": (f"pagination_pump_{i}.csv", b"time,current\n1,0.5\n", "text/csv")},
+            data={"ontology_classes": ",".join(classes), "model_name": fake_model_name},
+        ).json()["ontology_id"]
+        for i in range(3)
+    ]
+    
+    first = client.get("/api/v1/list_ontologies", params={"limit": 2, "ontology_class": "Pagination_Pump"}).json()
+    assert first["total"] == 3
+    assert [item["ontology_id"] for item in first["ontologies"]] == uploaded[::-1][:2]
+    
+    second = client.get(
+        "/api/v1/list_ontologies",
+        params={"limit": 2, "ontology_class": "Pagination_Pump", "after": first["next_cursor"]},
+    ).json()
+    assert [item["ontology_id"] for item in second["ontologies"]] == [uploaded[0]]
+    assert second["next_cursor"] is None
+    
+    invalid = client.get("/api/v1/list_ontologies", params={"after": "not-a-cursor"})
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,95 @@
+"""
+아카이브 읽기 테스트
+ZIP/TAR 항목 스트리밍, 항목별 크기 제한, 건너뛸 항목 처리 검증
+"""
+
+import io
+import tarfile
+import zipfile
+import pytest
+from backend.services.archive_reader import ArchiveError, archive_type, read_archive
+
+
+CSV_CONTENT = b"time,current\n1,0.5\n2,0.7\n"
+
+
+def _accept_csv(name: str) -> bool:
+    return name.endswith(".csv")
+
+
+def _zip_bytes(entries: dict) -> bytes:
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("line1/", b"")
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return data.getvalue()
+
+
+def _tar_bytes(entries: dict) -> bytes:
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as archive:
+        for name, content in entries.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return data.getvalue()
+
+
+def test_archive_type():
+    """확장자별 아카이브 형식 판별 테스트"""
+    assert archive_type("plant.ZIP") == "zip"
+    assert archive_type("plant.tar.gz") == "tar"
+    assert archive_type("plant.tgz") == "tar"
+    assert archive_type("plant.csv") is None
+    assert archive_type(None) is None
+
+
+@pytest.mark.parametrize("build", [_zip_bytes, _tar_bytes], ids=["zip", "tar.gz"])
+def test_read_archive_entries(build):
+    """파일 항목만 순서대로 읽고 지원하지 않는 항목은 내용 없이 보고하는지 테스트"""
+    source = build({
+        "line1/welding_robot.csv": CSV_CONTENT,
+        "line1/notes.txt": b"hello",
+        "__MACOSX/line1/._welding_robot.csv": b"meta",
+        "./line2/cnc_machine.csv": CSV_CONTENT,
+    })
+    entries = read_archive(source, archive_type("x.zip" if build is _zip_bytes else "x.tgz"), _accept_csv, 1024, 4096, 10)
+    try:
+        assert [entry.name for entry in entries] == ["line1/welding_robot.csv", "line1/notes.txt", "line2/cnc_machine.csv"]
+        assert entries[0].buffer.source() == CSV_CONTENT
+        assert entries[1].buffer is None and entries[1].error is None
+        assert entries[2].size == len(CSV_CONTENT)
+    finally:
+        for entry in entries:
+            if entry.buffer:
+                entry.buffer.close()
+
+
+def test_read_archive_spills_large_entries():
+    """큰 항목은 메모리에 모으지 않고 임시 파일로 옮기는지 테스트"""
+    content = b"time,current\n" + b"1,0.5\n" * 1000
+    entries = read_archive(
+        _tar_bytes({"pump.csv": content}), "tar", _accept_csv, 1 << 20, 1 << 20, 10, chunk_size=256, spill_threshold=64
+    )
+    
+    path = entries[0].buffer.source()
+    assert isinstance(path, str)
+    with open(path, "rb") as f:
+        assert f.read() == content
+    entries[0].buffer.close()
+
+
+def test_read_archive_limits():
+    """항목 크기 초과는 항목 오류로, 항목 수 초과와 손상된 아카이브는 ArchiveError로 처리하는지 테스트"""
+    source = _zip_bytes({"big.csv": CSV_CONTENT * 10, "small.csv": CSV_CONTENT})
+    entries = read_archive(source, "zip", _accept_csv, len(CSV_CONTENT), 4096, 10)
+    
+    assert entries[0].buffer is None and "MB" in entries[0].error
+    assert entries[1].buffer.source() == CSV_CONTENT
+    entries[1].buffer.close()
+    
+    with pytest.raises(ArchiveError):
+        read_archive(source, "zip", _accept_csv, 4096, 4096, 1)
+    with pytest.raises(ArchiveError):
+        read_archive(b"not an archive", "zip", _accept_csv, 4096, 4096, 10)
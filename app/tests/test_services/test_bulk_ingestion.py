@@ -0,0 +1,111 @@
+"""
+일괄 수집 테스트
+입력 폴더 순회, 배치 매핑, 스트리밍 RDF 출력, 명령행 도구 검증
+"""
+
+from pathlib import Path
+import pytest
+from rdflib import Graph, URIRef
+from backend.ingest import main
+from backend.services.bulk_ingestion import BulkIngestion, discover_files
+from backend.services.ontology_services.config import FACT_URI
+from backend.services.ontology_services.rdf_parser import triples_to_nodes_edges
+
+
+CSV_CONTENT = "time,current\n1,0.5\n2,0.7\n"
+
+
+@pytest.fixture
+def input_folder(tmp_path: Path) -> Path:
+    """라인별 하위 폴더가 있는 입력 폴더"""
+    folder = tmp_path / "input"
+    (folder / "line1").mkdir(parents=True)
+    (folder / "line2").mkdir()
+    (folder / ".cache").mkdir()
+    (folder / "line1" / "welding_robot_a.csv").write_text(CSV_CONTENT)
+    (folder / "line1" / "cnc_machine_b.csv").write_text(CSV_CONTENT)
+    (folder / "line2" / "sensor.csv").write_text("time,machine\n1,Industrial_Pump\n2,Industrial_Pump\n3,x\n")
+    (folder / "line2" / "broken.json").write_text("{not json")
+    (folder / "line2" / "notes.txt").write_text("hello")
+    (folder / ".cache" / "welding_robot_old.csv").write_text(CSV_CONTENT)
+    return folder
+
+
+def test_discover_files(input_folder: Path):
+    """지원하는 파일만 상대 경로 순으로 찾고 숨김 폴더는 제외하는지 테스트"""
+    files = discover_files(str(input_folder))
+    
+    assert [f.name for f in files] == [
+        "line1/cnc_machine_b.csv", "line1/welding_robot_a.csv", "line2/broken.json", "line2/sensor.csv"
+    ]
+    assert [f.file_type for f in files] == ["csv", "csv", "json", "csv"]
+
+
+@pytest.mark.parametrize("workers", [0, 1], ids=["inline", "process"])
+def test_ingest_folder_writes_one_graph(
+    input_folder: Path, tmp_path: Path, workers: int, fake_model_name: str, sample_ontology_classes: list[str], monkeypatch
+):
+    """파일명을 batch_size개씩 매핑하고 하나의 그래프를 Turtle/N-Triples로 기록하는지 테스트"""
+    ingestion = BulkIngestion(
+        sample_ontology_classes, model_name=fake_model_name, target_column="machine", workers=workers, batch_size=1
+    )
+    calls = []
+    map_batch = ingestion.mapper.map_batch
+    monkeypatch.setattr(ingestion.mapper, "map_batch", lambda names, *args: calls.append(list(names)) or map_batch(names, *args))
+    
+    report = ingestion.ingest_folder(str(input_folder), str(tmp_path / "out" / "ontology.ttl"))
+    
+    assert calls == [["line1/cnc_machine_b.csv"], ["line1/welding_robot_a.csv"]]
+    assert (report.files_found, report.files_mapped, report.files_failed) == (4, 3, 1)
+    assert report.failures[0][0] == "line2/broken.json"
+    assert report.records == 7
+    assert report.triples == 3
+    assert report.files_per_second > 0
+    
+    graph = Graph().parse(report.output_path, format="turtle")
+    predicate = URIRef(FACT_URI + "isDataOf")
+    assert set(graph.objects(predicate=predicate)) == {
+        URIRef(FACT_URI + "CNC_Machine"), URIRef(FACT_URI + "Welding_Robot"), URIRef(FACT_URI + "Industrial_Pump")
+    }
+    assert URIRef(FACT_URI + "line2%2Fsensor.csv") in set(graph.subjects())
+    
+    nt_report = ingestion.ingest_folder(str(input_folder), str(tmp_path / "out" / "ontology.nt"))
+    nt_graph = Graph().parse(nt_report.output_path, format="nt")
+    assert set(nt_graph) == set(graph)
+
+
+def test_same_file_name_in_different_folders_stays_separate(tmp_path: Path, fake_model_name: str, sample_ontology_classes: list[str]):
+    """다른 하위 폴더의 같은 파일명이 그래프에서 하나의 노드로 합쳐지지 않는지 테스트"""
+    folder = tmp_path / "plants"
+    for plant, machine in (("plant_a", "CNC_Machine"), ("plant_b", "Welding_Robot")):
+        (folder / plant).mkdir(parents=True)
+        (folder / plant / "machine_data.csv").write_text(f"time,machine\n1,{machine}\n")
+    ingestion = BulkIngestion(sample_ontology_classes, model_name=fake_model_name, target_column="machine", workers=0)
+    
+    report = ingestion.ingest_folder(str(folder), str(tmp_path / "out" / "ontology.ttl"))
+    graph_data = triples_to_nodes_edges(Graph().parse(report.output_path, format="turtle"))
+    
+    assert {(edge["source"], edge["target"]) for edge in graph_data["edges"]} == {
+        ("plant_a%2Fmachine_data.csv", "CNC_Machine"), ("plant_b%2Fmachine_data.csv", "Welding_Robot")
+    }
+
+
+def test_ingest_cli(input_folder: Path, tmp_path: Path, fake_model_name: str, sample_ontology_classes: list[str], capsys):
+    """명령행 도구가 출력 파일을 만들고 처리량을 보고하는지 테스트"""
+    output = tmp_path / "metadata.nt"
+    exit_code = main([
+        "--classes", ",".join(sample_ontology_classes),
+        "--input", str(input_folder),
+        "--output", str(output),
+        "--workers", "0",
+        "--batch-size", "16",
+        "--model-name", fake_model_name,
+    ])
+    
+    printed = capsys.readouterr().out
+    assert exit_code == 0
+    assert "files/sec" in printed
+    assert "line2/broken.json" in printed
+    assert len(output.read_text().splitlines()) == 2
+    
+    assert main(["--classes", "A", "--input", str(tmp_path / "missing")]) == 1
@@ -0,0 +1,78 @@
+"""
+데이터 파서 테스트
+CSV 지연 파싱 요약이 전체 파싱 결과와 일치하는지 검증
+"""
+
+from pathlib import Path
+import polars as pl
+import pytest
+from backend.services.data_parser import CSVParser, DataParser
+from backend.services.pipeline_stages import scan_dataset
+
+
+WIDE_CSV = (
+    "time," + ",".join(f"voltage_{i}" for i in range(50)) + ",machine\n"
+    + "".join(
+        f"{row}," + ",".join(str(row * i) for i in range(50)) + f",{'Welding_Robot' if row % 2 else 'CNC_Machine'}\n"
+        for row in range(200)
+    )
+).encode()
+
+
+@pytest.mark.parametrize("as_path", [False, True], ids=["bytes", "path"])
+def test_csv_lazy_summary_matches_full_parse(tmp_path: Path, as_path: bool):
+    """지연 파싱 요약이 전체 파싱 결과와 같은지 테스트"""
+    source = WIDE_CSV
+    if as_path:
+        path = tmp_path / "wide.csv"
+        path.write_bytes(WIDE_CSV)
+        source = str(path)
+    
+    parser = CSVParser()
+    lazy = parser.parse_summary(source, "wide.csv", target_column="machine")
+    full = DataParser.parse_summary(parser, source, "wide.csv", target_column="machine")
+    
+    assert lazy.row_count == full.row_count == 200
+    assert lazy.columns == full.columns
+    assert isinstance(lazy.frame, pl.LazyFrame)
+    assert lazy.frame.collect().equals(full.frame)
+
+
+def test_csv_lazy_summary_without_target_column():
+    """타겟 컬럼이 없으면 데이터를 materialize하지 않는지 테스트"""
+    summary = CSVParser().parse_summary(WIDE_CSV, "wide.csv", target_column="missing")
+    
+    assert summary.row_count == 200
+    assert len(summary.columns) == 52
+    assert summary.frame.is_empty()
+
+
+def test_csv_lazy_summary_falls_back_for_cp949(tmp_path: Path):
+    """UTF-8이 아닌 파일 (헤더 또는 데이터 행)은 전체 파싱으로 처리되는지 테스트"""
+    content = "센서,설비\n1,용접\n2,압출\n".encode("cp949")
+    summary = CSVParser().parse_summary(content, "korean.csv", target_column="설비")
+    
+    assert summary.row_count == 2
+    assert summary.frame["설비"].to_list() == ["용접", "압출"]
+    
+    # 헤더는 ASCII이고 데이터 행만 CP949인 경우 (행 수는 값을 디코딩하지 않고 계산, 타겟 컬럼을 읽을 때 전환)
+    content = "sensor,machine\n1,용접\n2,압출\n".encode("cp949")
+    summary = CSVParser().parse_summary(content, "korean_rows.csv", target_column="machine")
+    
+    assert summary.row_count == 2
+    assert isinstance(summary.frame, pl.LazyFrame)
+    values = summary.read_target(lambda frame: frame.lazy().collect()["machine"].to_list(), "korean_rows.csv")
+    assert values == ["용접", "압출"]
+    assert isinstance(summary.frame, pl.DataFrame)
+    
+    # 일괄 수집 스캔의 직접 매핑도 전체 파싱으로 전환하여 찾음
+    path = tmp_path / "korean_rows.csv"
+    path.write_bytes(content)
+    scan = scan_dataset(str(path), "korean_rows.csv", "csv", ["압출"], target_column="machine")
+    assert (scan.row_count, scan.direct_target) == (2, "압출")
+
+
+def test_csv_lazy_summary_invalid_file():
+    """빈 파일은 ValueError를 발생시키는지 테스트"""
+    with pytest.raises(ValueError):
+        CSVParser().parse_summary(b"", "empty.csv")
@@ -0,0 +1,165 @@
+"""
+데이터 업로드 서비스 테스트
+실행기 기반 비동기 파이프라인 검증
+"""
+
+import asyncio
+import pytest
+from backend.services.data_upload_service import BatchFile, DataUploadService
+from backend.services.executors import PipelineExecutors
+from backend.services.ontology_storage import get_ontology_storage
+
+
+CSV_CONTENT = b"time,current\n1,0.5\n2,0.7\n3,0.9\n"
+
+
+@pytest.fixture(params=[0, 1], ids=["thread", "process"])
+def executors(request):
+    """스레드 실행과 프로세스 풀 실행 모두 검증"""
+    executors = PipelineExecutors(process_workers=request.param, inference_workers=1)
+    yield executors
+    executors.shutdown()
+
+
+def test_async_upload_matches_sync(executors: PipelineExecutors, fake_model_name: str, sample_ontology_classes: list[str]):
+    """비동기 파이프라인 결과가 동기 파이프라인과 같은지 테스트"""
+    service = DataUploadService()
+    sync_result = service.upload_and_build_ontology(
+        CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes, model_name=fake_model_name
+    )
+    async_result = asyncio.run(service.upload_and_build_ontology_async(
+        CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes,
+        model_name=fake_model_name, executors=executors
+    ))
+    
+    assert async_result.records_processed == sync_result.records_processed == 3
+    assert async_result.mapping_df == sync_result.mapping_df
+    assert async_result.g == sync_result.g
+    
+    stats = executors.stats()
+    assert stats["cpu_tasks"] == 1
+    assert stats["inference_tasks"] == 1
+
+
+def test_async_upload_appends_to_existing(executors: PipelineExecutors, fake_model_name: str, sample_ontology_classes: list[str]):
+    """기존 온톨로지에 관계가 추가되는지 테스트"""
+    service = DataUploadService()
+    first = asyncio.run(service.upload_and_build_ontology_async(
+        CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes,
+        model_name=fake_model_name, executors=executors
+    ))
+    second = asyncio.run(service.upload_and_build_ontology_async(
+        CSV_CONTENT, "cnc_machine_spindle.csv", "csv", sample_ontology_classes,
+        ontology_id=first.ontology_id, model_name=fake_model_name, executors=executors
+    ))
+    
+    stored = get_ontology_storage().get(first.ontology_id)
+    assert second.ontology_id == first.ontology_id
+    assert stored["mapping_count"] == 2
+    assert "CNC_Machine" in stored["rdf_graph"]
+    assert "Welding_Robot" in stored["rdf_graph"]
+
+
+def test_async_upload_unknown_ontology(executors: PipelineExecutors, fake_model_name: str, sample_ontology_classes: list[str]):
+    """존재하지 않는 온톨로지 ID 테스트"""
+    service = DataUploadService()
+    with pytest.raises(ValueError):
+        asyncio.run(service.upload_and_build_ontology_async(
+            CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes,
+            ontology_id="missing", model_name=fake_model_name, executors=executors
+        ))
+
+
+def test_upload_without_graph_skips_serialization(fake_model_name: str, sample_ontology_classes: list[str]):
+    """include_graph=False면 Turtle 직렬화 없이 관계만 추가되는지 테스트"""
+    service = DataUploadService()
+    storage = get_ontology_storage()
+    first = service.upload_and_build_ontology(
+        CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes,
+        model_name=fake_model_name, include_graph=False
+    )
+    serializations = storage.stats()["turtle_serializations"]
+    second = service.upload_and_build_ontology(
+        CSV_CONTENT, "cnc_machine_spindle.csv", "csv", sample_ontology_classes,
+        ontology_id=first.ontology_id, model_name=fake_model_name, include_graph=False
+    )
+    
+    assert first.g == second.g == ""
+    assert storage.stats()["turtle_serializations"] == serializations
+    assert "CNC_Machine" in storage.get_turtle(first.ontology_id)
+
+
+def test_duplicate_upload_returns_stored_result(executors: PipelineExecutors, fake_model_name: str, sample_ontology_classes: list[str], monkeypatch):
+    """같은 내용 해시의 재시도는 파이프라인 없이 저장된 결과를 반환하고, 온톨로지가 삭제되면 다시 실행하는지 테스트"""
+    import hashlib
+    from backend.services import upload_dedup
+    monkeypatch.setattr(upload_dedup, "_upload_result_cache", upload_dedup.UploadResultCache())
+    
+    service = DataUploadService()
+    storage = get_ontology_storage()
+    base = asyncio.run(service.upload_and_build_ontology_async(
+        CSV_CONTENT, "welding_robot_line1.csv", "csv", sample_ontology_classes,
+        model_name=fake_model_name, executors=executors
+    ))
+    
+    def upload():
+        return asyncio.run(service.upload_and_build_ontology_async(
+            CSV_CONTENT, "cnc_machine_spindle.csv", "csv", sample_ontology_classes,
+            ontology_id=base.ontology_id, model_name=fake_model_name, executors=executors,
+            content_sha256=hashlib.sha256(CSV_CONTENT).hexdigest()
+        ))
+    
+    first = upload()
+    cpu_tasks = executors.stats()["cpu_tasks"]
+    retry = upload()
+    
+    assert not first.deduplicated
+    assert retry.deduplicated
+    assert retry.mapping_df == first.mapping_df
+    assert executors.stats()["cpu_tasks"] == cpu_tasks
+    assert storage.get(base.ontology_id)["mapping_count"] == 2
+    
+    storage.delete(base.ontology_id)
+    with pytest.raises(ValueError):
+        upload()
+
+
+def test_batch_upload_single_write(executors: PipelineExecutors, fake_model_name: str, sample_ontology_classes: list[str], monkeypatch):
+    """일괄 업로드가 파일별 결과를 보고하고 저장소 쓰기와 직렬화를 한 번씩만 하는지 테스트"""
+    service = DataUploadService()
+    storage = get_ontology_storage()
+    existing = service.upload_and_build_ontology(
+        CSV_CONTENT, "injection_molding_machine.csv", "csv", sample_ontology_classes,
+        model_name=fake_model_name, include_graph=False
+    )
+    
+    writes = []
+    store_relations = service._store_relations
+    monkeypatch.setattr(service, "_store_relations", lambda *args: writes.append(len(args[2])) or store_relations(*args))
+    serializations = storage.stats()["turtle_serializations"]
+    
+    files = [
+        BatchFile("line1/welding_robot_a.csv", len(CSV_CONTENT), "csv", CSV_CONTENT),
+        BatchFile("line1/cnc_machine_b.csv", len(CSV_CONTENT), "csv", CSV_CONTENT),
+        BatchFile("line2/sensor.csv", 32, "csv", b"time,machine\n1,Industrial_Pump\n"),
+        BatchFile("line2/broken.json", 9, "json", b"{not json"),
+        BatchFile("line2/notes.txt", 5),
+        BatchFile("line2/huge.csv", 0, "csv", error="too large"),
+    ]
+    result = asyncio.run(service.upload_batch_async(
+        files, sample_ontology_classes, ontology_id=existing.ontology_id,
+        target_column="machine", model_name=fake_model_name, executors=executors
+    ))
+    
+    assert writes == [3]
+    assert storage.stats()["turtle_serializations"] == serializations + 1
+    assert result.ontology_id == existing.ontology_id
+    assert (result.files_received, result.files_mapped, result.files_failed, result.files_skipped) == (6, 3, 2, 1)
+    assert result.records_processed == 7
+    assert result.relations_added == 3
+    assert [item.status for item in result.files] == ["mapped", "mapped", "mapped", "failed", "skipped", "failed"]
+    assert [item.target for item in result.files[:3]] == ["Welding_Robot", "CNC_Machine", "Industrial_Pump"]
+    assert result.files[2].method == "direct"
+    assert result.files[5].error == "too large"
+    assert get_ontology_storage().get(existing.ontology_id)["mapping_count"] == 4
+    assert "Industrial_Pump" in result.g
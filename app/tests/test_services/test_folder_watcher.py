@@ -0,0 +1,171 @@
+"""
+폴더 감시 수집 테스트
+매니페스트 기반 변경 감지, 배치 기록, 재시작 후 재수집 방지 검증
+"""
+
+import os
+from pathlib import Path
+import pytest
+from backend.ingest import main
+from backend.services import folder_watcher
+from backend.services.bulk_ingestion import BulkIngestion
+from backend.services.folder_watcher import FolderWatcher
+from backend.services.ingestion_manifest import IngestionManifest
+from backend.services.ontology_storage import OntologyStorage
+
+
+CSV_CONTENT = "time,current\n1,0.5\n2,0.7\n"
+
+
+@pytest.fixture
+def input_folder(tmp_path: Path) -> Path:
+    """파일 세 개가 있는 입력 폴더"""
+    folder = tmp_path / "input"
+    (folder / "line1").mkdir(parents=True)
+    (folder / "line1" / "welding_robot_a.csv").write_text(CSV_CONTENT)
+    (folder / "line1" / "cnc_machine_b.csv").write_text(CSV_CONTENT)
+    (folder / "line1" / "industrial_pump_c.csv").write_text(CSV_CONTENT)
+    return folder
+
+
+@pytest.fixture
+def hash_calls(monkeypatch) -> list:
+    """내용 해시를 계산한 파일 경로 기록"""
+    calls = []
+    file_sha256 = folder_watcher.file_sha256
+    monkeypatch.setattr(folder_watcher, "file_sha256", lambda path: calls.append(path) or file_sha256(path))
+    return calls
+
+
+def _watcher(input_folder: Path, manifest_path: Path, storage: OntologyStorage, model_name: str, classes: list[str]) -> FolderWatcher:
+    ingestion = BulkIngestion(classes, model_name=model_name, workers=0)
+    return FolderWatcher(str(input_folder), ingestion, IngestionManifest(str(manifest_path), write_batch=2), storage=storage)
+
+
+def test_watch_ingests_only_new_and_changed_files(
+    input_folder: Path, tmp_path: Path, hash_calls: list, fake_model_name: str, sample_ontology_classes: list[str]
+):
+    """변경되지 않은 파일은 읽지 않고, 수정 시각만 바뀐 파일은 다시 수집하지 않는지 테스트"""
+    storage = OntologyStorage()
+    watcher = _watcher(input_folder, tmp_path / "manifest.db", storage, fake_model_name, sample_ontology_classes)
+    
+    first = watcher.scan_once()
+    assert (first.files_seen, first.files_ingested, first.relations_added) == (3, 3, 3)
+    assert storage.get(first.ontology_id)["mapping_count"] == 3
+    # 3개 항목을 2개씩 나누어 기록
+    assert watcher.manifest.stats() == {"entries": 3, "writes": 3, "transactions": 2}
+    
+    hash_calls.clear()
+    second = watcher.scan_once()
+    assert second.files_unchanged == 3 and not second.changed
+    assert hash_calls == []
+    
+    # 수정 시각만 바뀐 파일: 해시만 계산하고 수집하지 않음
+    touched = input_folder / "line1" / "welding_robot_a.csv"
+    os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+    third = watcher.scan_once()
+    assert (third.files_touched, third.files_ingested) == (1, 0)
+    assert hash_calls == [str(touched)]
+    
+    # 새 파일과 내용이 바뀐 파일만 수집, 삭제된 파일은 매니페스트에서 제거
+    (input_folder / "line1" / "cnc_machine_b.csv").write_text(CSV_CONTENT + "3,0.9\n")
+    (input_folder / "line2").mkdir()
+    (input_folder / "line2" / "welding_robot_d.csv").write_text(CSV_CONTENT)
+    (input_folder / "line1" / "industrial_pump_c.csv").unlink()
+    fourth = watcher.scan_once()
+    assert (fourth.files_ingested, fourth.files_removed) == (2, 1)
+    assert fourth.ontology_id == first.ontology_id
+    # 내용이 바뀐 파일은 기존 매핑 행을 교체하므로 새 파일 한 개만 늘어남
+    assert storage.get(first.ontology_id)["mapping_count"] == 4
+    assert sorted(watcher.manifest.names()) == ["line1/cnc_machine_b.csv", "line1/welding_robot_a.csv", "line2/welding_robot_d.csv"]
+
+
+def test_watch_reingested_file_replaces_previous_relation(
+    tmp_path: Path, monkeypatch, fake_model_name: str, sample_ontology_classes: list[str]
+):
+    """내용이 바뀐 파일은 이전 관계/매핑 행을 교체하고, 매니페스트 기록 전에 중단되어도 중복 행이 생기지 않는지 테스트"""
+    folder = tmp_path / "input"
+    folder.mkdir()
+    machine_file = folder / "machine_data.csv"
+    machine_file.write_text("time,machine\n1,CNC_Machine\n")
+    storage = OntologyStorage()
+    ingestion = BulkIngestion(sample_ontology_classes, model_name=fake_model_name, target_column="machine", workers=0)
+    watcher = FolderWatcher(str(folder), ingestion, IngestionManifest(str(tmp_path / "manifest.db")), storage=storage)
+    ontology_id = watcher.scan_once().ontology_id
+    
+    # 분류가 바뀌도록 내용 변경
+    machine_file.write_text("time,machine\n1,Welding_Robot\n2,Welding_Robot\n")
+    os.utime(machine_file, ns=(machine_file.stat().st_atime_ns, machine_file.stat().st_mtime_ns + 10**9))
+    assert watcher.scan_once().files_ingested == 1
+    
+    def edges() -> set:
+        return set(storage.read_graph(ontology_id, lambda store: {(str(s), str(o)) for s, _, o in store}))
+    
+    assert [row["Target"] for row in storage.get(ontology_id)["mapping_df"]] == ["Welding_Robot"]
+    assert edges() == {("http://factory.org/machine_data.csv", "http://factory.org/Welding_Robot")}
+    
+    # 저장 후 매니페스트 기록 전에 중단된 경우: 다음 스캔에서 다시 수집해도 행이 하나로 유지됨
+    machine_file.write_text("time,machine\n1,Industrial_Pump\n")
+    os.utime(machine_file, ns=(machine_file.stat().st_atime_ns, machine_file.stat().st_mtime_ns + 2 * 10**9))
+    with monkeypatch.context() as patch:
+        patch.setattr(watcher.manifest, "update", lambda entries: (_ for _ in ()).throw(OSError("crash")))
+        with pytest.raises(OSError):
+            watcher.scan_once()
+    assert watcher.scan_once().files_ingested == 1
+    assert storage.get(ontology_id)["mapping_count"] == 1
+    assert edges() == {("http://factory.org/machine_data.csv", "http://factory.org/Industrial_Pump")}
+
+
+def test_watch_manifest_survives_restart(
+    input_folder: Path, tmp_path: Path, hash_calls: list, fake_model_name: str, sample_ontology_classes: list[str]
+):
+    """재시작 후 같은 매니페스트로 스캔하면 파일을 읽지 않고 같은 온톨로지를 대상으로 하는지 테스트"""
+    storage = OntologyStorage()
+    watcher = _watcher(input_folder, tmp_path / "manifest.db", storage, fake_model_name, sample_ontology_classes)
+    first = watcher.scan_once()
+    watcher.manifest.close()
+    
+    hash_calls.clear()
+    restarted = _watcher(input_folder, tmp_path / "manifest.db", storage, fake_model_name, sample_ontology_classes)
+    report = restarted.scan_once()
+    
+    assert restarted.ontology_id == first.ontology_id
+    assert report.files_unchanged == 3
+    assert hash_calls == []
+
+
+def test_watch_failed_files_are_not_retried_until_changed(
+    input_folder: Path, tmp_path: Path, fake_model_name: str, sample_ontology_classes: list[str]
+):
+    """파싱에 실패한 파일은 내용이 바뀔 때까지 다시 시도하지 않고, 바뀌면 다시 수집하는지 테스트"""
+    broken = input_folder / "line1" / "broken.json"
+    broken.write_text("{not json")
+    watcher = _watcher(input_folder, tmp_path / "manifest.db", OntologyStorage(), fake_model_name, sample_ontology_classes)
+    
+    assert watcher.scan_once().files_failed == 1
+    assert watcher.manifest.get("line1/broken.json").status == "failed"
+    assert watcher.scan_once().files_failed == 0
+    
+    broken.write_text('[{"time": 1}]')
+    os.utime(broken, ns=(broken.stat().st_atime_ns, broken.stat().st_mtime_ns + 10**9))
+    assert watcher.scan_once().files_ingested == 1
+    assert watcher.manifest.get("line1/broken.json").status == "ingested"
+
+
+def test_watch_cli(input_folder: Path, tmp_path: Path, fake_model_name: str, sample_ontology_classes: list[str], capsys):
+    """감시 모드 명령행 도구가 스캔 결과를 출력하는지 테스트"""
+    exit_code = main([
+        "--classes", ",".join(sample_ontology_classes),
+        "--input", str(input_folder),
+        "--watch",
+        "--manifest", str(tmp_path / "manifest.db"),
+        "--max-scans", "2",
+        "--interval", "0",
+        "--workers", "0",
+        "--model-name", fake_model_name,
+    ])
+    
+    printed = capsys.readouterr().out
+    assert exit_code == 0
+    assert "수집 3개" in printed
+    assert len(printed.strip().splitlines()) == 2  # 시작 메시지 + 변경이 있었던 첫 스캔
@@ -0,0 +1,88 @@
+"""
+업로드 작업 큐 테스트
+대기 큐 제한(backpressure), 단계별 진행 상황, 실패 처리, 대기 시간 메트릭 검증
+"""
+
+import threading
+import time
+import pytest
+from backend.services.ingestion_jobs import IngestionJobQueue, IngestionQueueFullError
+from backend.services.upload_buffer import UploadBuffer
+
+
+class BlockingUploadService:
+    """release가 설정될 때까지 파이프라인을 멈추는 업로드 서비스"""
+    
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+    
+    async def upload_and_build_ontology_async(self, file_content, file_name, progress=None, **params):
+        progress("parsing", {})
+        progress("mapping", {"parsed_rows": len(file_content.splitlines()) - 1})
+        self.started.set()
+        self.release.wait(timeout=10)
+        if file_name.startswith("broken"):
+            raise ValueError("추출된 관계가 없습니다.")
+        progress("stored", {"ontology_id": "onto-1", "triples_added": 1})
+        return None
+
+
+def _buffer(content: bytes = b"time,current\n1,0.5\n") -> UploadBuffer:
+    buffer = UploadBuffer(1024)
+    buffer.write(content)
+    return buffer
+
+
+def _wait_done(job_queue: IngestionJobQueue, job_id: str):
+    deadline = time.monotonic() + 10
+    job = job_queue.get(job_id)
+    while job.status in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = job_queue.get(job_id)
+    return job
+
+
+def test_queue_rejects_when_full_and_reports_wait():
+    """대기 큐가 가득 차면 즉시 거부하고, 대기/실행 수와 대기 시간을 집계하는지 테스트"""
+    service = BlockingUploadService()
+    job_queue = IngestionJobQueue(workers=1, max_queue=1, service=service)
+    
+    running = job_queue.submit(_buffer(), "pump_a.csv", {})
+    assert service.started.wait(timeout=10)
+    queued = job_queue.submit(_buffer(), "pump_b.csv", {})
+    rejected_buffer = _buffer()
+    with pytest.raises(IngestionQueueFullError):
+        job_queue.submit(rejected_buffer, "pump_c.csv", {})
+    
+    stats = job_queue.stats()
+    assert (stats["running"], stats["queued"], stats["rejected"]) == (1, 1, 1)
+    assert job_queue.get(running.job_id).progress == {"parsed_rows": 1}
+    assert job_queue.get(queued.job_id).status == "queued"
+    
+    service.release.set()
+    for job in (running, queued):
+        assert _wait_done(job_queue, job.job_id).status == "succeeded"
+    
+    stats = job_queue.stats()
+    assert stats["succeeded"] == 2
+    assert stats["queued"] == 0
+    assert stats["max_wait_sec"] >= job_queue.get(queued.job_id).wait_seconds > 0
+    job_queue.shutdown()
+
+
+def test_failed_job_keeps_error_and_closes_buffer():
+    """파이프라인 오류가 작업 상태에 기록되고 업로드 버퍼가 닫히는지 테스트"""
+    service = BlockingUploadService()
+    service.release.set()
+    job_queue = IngestionJobQueue(workers=1, max_queue=2, service=service)
+    buffer = _buffer()
+    
+    job = _wait_done(job_queue, job_queue.submit(buffer, "broken.csv", {}).job_id)
+    
+    assert job.status == "failed"
+    assert job.stage == "done"
+    assert "추출된 관계가 없습니다" in job.error
+    assert buffer.source() == b""
+    assert job_queue.stats()["failed"] == 1
+    job_queue.shutdown()
@@ -0,0 +1,108 @@
+"""
+통합 그래프 인덱스 테스트
+저장/관계 추가/삭제 이벤트에 따른 노드 참조 카운트와 온톨로지별 엣지 유지 검증
+"""
+
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.merged_graph_index import MergedGraphIndex
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.ontology_builder import add_relations_to_graph, new_ontology_graph
+from backend.services.ontology_services.rdf_parser import graph_to_nodes_edges
+
+
+def _row(source: str, target: str) -> dict:
+    return {"Source": source, "Target": target, "Similarity": 1.0, "Method": "direct"}
+
+
+def _save(storage: OntologyStorage, ontology_id: str, rows: list[dict]) -> None:
+    graph = new_ontology_graph()
+    add_relations_to_graph(graph, rows, "isDataOf")
+    response = BuildHybridOntologyResponse(message="ok", ontology_id=ontology_id, mapping_df=rows, g="")
+    storage.save(response, ["Welding_Robot", "CNC_Machine"], graph=graph)
+
+
+def _full_rebuild(storage: OntologyStorage) -> tuple[set, list]:
+    """이전 방식: 모든 온톨로지를 순회하여 통합 그래프 재구성"""
+    node_ids, edges = set(), []
+    for ontology in storage.list_all():
+        graph_data = storage.read_graph(ontology["ontology_id"], graph_to_nodes_edges)
+        node_ids.update(node["id"] for node in graph_data["nodes"])
+        edges.extend(graph_data["edges"])
+    return node_ids, edges
+
+
+def _assert_matches_rebuild(index: MergedGraphIndex, storage: OntologyStorage) -> None:
+    _, nodes, edges, _ = index.snapshot()
+    expected_nodes, expected_edges = _full_rebuild(storage)
+    assert {node["id"] for node in nodes} == expected_nodes
+    assert sorted(edges, key=str) == sorted(expected_edges, key=str)
+
+
+def test_index_tracks_save_append_delete():
+    """저장/추가/삭제 후에도 전체 재구성 결과와 같은지 테스트"""
+    storage = OntologyStorage()
+    index = MergedGraphIndex()
+    storage.subscribe(index.on_storage_event)
+    
+    _save(storage, "onto-1", [_row("welding_robot_line1.csv", "Welding_Robot")])
+    _save(storage, "onto-2", [_row("welding_robot_line2.csv", "Welding_Robot")])
+    _assert_matches_rebuild(index, storage)
+    assert index.stats()["nodes"] == 3  # Welding_Robot은 두 온톨로지가 공유
+    
+    storage.append_relations("onto-1", [_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    # 이미 있는 관계는 엣지를 중복 추가하지 않음
+    storage.append_relations("onto-1", [_row("welding_robot_line1.csv", "Welding_Robot")], "isDataOf")
+    _assert_matches_rebuild(index, storage)
+    assert index.stats()["edges"] == 3
+    
+    storage.delete("onto-2")
+    _assert_matches_rebuild(index, storage)
+    node_ids = {node["id"] for node in index.snapshot()[1]}
+    assert "Welding_Robot" in node_ids  # onto-1이 아직 참조
+    assert "welding_robot_line2.csv" not in node_ids
+    
+    storage.delete("onto-1")
+    assert index.snapshot()[1:] == ([], [], 0)
+
+
+def test_index_subscribe_replays_existing_and_orders_newest_first():
+    """구독 시점의 온톨로지가 반영되고 최신 온톨로지 엣지가 먼저 나오는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage, "old", [_row("old.csv", "CNC_Machine")])
+    
+    index = MergedGraphIndex()
+    storage.subscribe(index.on_storage_event)
+    _save(storage, "new", [_row("new.csv", "Welding_Robot")])
+    
+    version, _, edges, ontology_count = index.snapshot()
+    assert ontology_count == 2
+    assert [edge["source"] for edge in edges] == ["new.csv", "old.csv"]
+    assert version == 2
+
+
+def test_index_orders_by_created_at_regardless_of_event_order():
+    """재시작 후 재생이나 다른 워커의 이벤트가 생성일시 순서와 다르게 도착해도 최신 온톨로지부터 나오는지 테스트"""
+    storage = OntologyStorage()
+    for ontology_id, rows in (
+        ("a", [_row("a.csv", "Welding_Robot")]),
+        ("b", [_row("b.csv", "CNC_Machine")]),
+        ("c", [_row("c.csv", "Welding_Robot")]),
+    ):
+        _save(storage, ontology_id, rows)
+    triples = {ontology_id: storage.read_graph(ontology_id, lambda store: store) for ontology_id in ("a", "b", "c")}
+    
+    index = MergedGraphIndex()
+    index.on_storage_event("save", "b", triples["b"], "2024-01-02T00:00:00")
+    index.on_storage_event("save", "c", triples["c"], "2024-01-03T00:00:00")
+    index.on_storage_event("save", "a", triples["a"], "2024-01-01T00:00:00")
+    # 기존 온톨로지에 관계 추가해도 위치는 생성일시 기준으로 유지
+    index.on_storage_event("append", "a", triples["b"], "2024-01-01T00:00:00")
+    
+    _, nodes, edges, ontology_count = index.snapshot()
+    assert ontology_count == 3
+    assert [edge["source"] for edge in edges] == ["c.csv", "b.csv", "a.csv", "b.csv"]
+    assert [node["id"] for node in nodes][:2] == ["c.csv", "Welding_Robot"]
+    
+    index.on_storage_event("delete", "c", triples["c"], "2024-01-03T00:00:00")
+    assert [edge["source"] for edge in index.snapshot()[2]] == ["b.csv", "a.csv", "b.csv"]
+    assert index.stats()["nodes"] == 4  # a.csv, b.csv, Welding_Robot, CNC_Machine
@@ -0,0 +1,207 @@
+"""
+온톨로지 저장소 테스트
+메모리 Graph 유지, 증분 관계 추가, 지연 Turtle 직렬화 캐시, 온톨로지별 동시성 검증
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from rdflib import Graph
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.ontology_builder import add_relations_to_graph, new_ontology_graph
+from backend.services.ontology_services.rdf_parser import graph_to_nodes_edges
+
+
+def _mapping_row(source: str, target: str) -> dict:
+    return {"Source": source, "Target": target, "Similarity": 1.0, "Method": "direct"}
+
+
+def _save(storage: OntologyStorage, ontology_id: str = "onto-1") -> None:
+    rows = [_mapping_row("welding_robot_line1.csv", "Welding_Robot")]
+    graph = new_ontology_graph()
+    add_relations_to_graph(graph, rows, "isDataOf")
+    response = BuildHybridOntologyResponse(message="ok", ontology_id=ontology_id, mapping_df=rows, g="")
+    storage.save(response, ["Welding_Robot", "CNC_Machine"], graph=graph)
+
+
+def test_turtle_serialized_lazily_and_cached():
+    """Turtle은 처음 요청될 때 한 번만 직렬화되는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage)
+    assert storage.stats()["turtle_serializations"] == 0
+    
+    first = storage.get_turtle("onto-1")
+    second = storage.get("onto-1")["rdf_graph"]
+    
+    assert first == second
+    assert "Welding_Robot" in first
+    stats = storage.stats()
+    assert stats["turtle_serializations"] == 1
+    assert stats["turtle_cache_hits"] == 1
+
+
+def test_append_relations_invalidates_cache():
+    """관계 추가 시 Graph에 증분 반영되고 캐시가 무효화되는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage)
+    before = storage.get_turtle("onto-1")
+    
+    count = storage.append_relations("onto-1", [_mapping_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    after = storage.get_turtle("onto-1")
+    
+    assert count == 2
+    assert "CNC_Machine" not in before
+    assert "CNC_Machine" in after
+    assert storage.stats()["turtle_serializations"] == 2
+    
+    # 직렬화 결과가 다시 같은 Graph로 파싱되는지 확인
+    reparsed = Graph().parse(data=after, format="turtle")
+    assert len(reparsed) == storage.stats()["triples"]
+
+
+def test_append_relations_unknown_ontology():
+    """존재하지 않는 온톨로지에 관계 추가 시 ValueError 테스트"""
+    storage = OntologyStorage()
+    with pytest.raises(ValueError):
+        storage.append_relations("missing", [_mapping_row("a.csv", "CNC_Machine")], "isDataOf")
+
+
+def test_read_graph_and_list_all_without_turtle():
+    """그래프 조회와 목록 조회가 Turtle 직렬화 없이 동작하는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage)
+    
+    graph_data = storage.read_graph("onto-1", graph_to_nodes_edges)
+    listed = storage.list_all()
+    
+    assert {"source": "welding_robot_line1.csv", "target": "Welding_Robot", "relation": "isDataOf"} in graph_data["edges"]
+    assert storage.read_graph("missing", graph_to_nodes_edges) is None
+    assert "rdf_graph" not in listed[0]
+    assert storage.stats()["turtle_serializations"] == 0
+
+
+def test_save_parses_turtle_when_graph_missing():
+    """Graph 없이 Turtle 문자열로 저장해도 관계 추가가 가능한지 테스트"""
+    source = OntologyStorage()
+    _save(source)
+    turtle = source.get_turtle("onto-1")
+    
+    storage = OntologyStorage()
+    storage.save(
+        BuildHybridOntologyResponse(message="ok", ontology_id="onto-2", mapping_df=[], g=turtle),
+        ["Welding_Robot"]
+    )
+    storage.append_relations("onto-2", [_mapping_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    
+    assert "Welding_Robot" in storage.get_turtle("onto-2")
+    assert "CNC_Machine" in storage.get_turtle("onto-2")
+
+
+def test_version_bumped_on_write():
+    """저장/관계 추가마다 버전이 증가하고 삭제 후 재저장 시 이전 버전과 겹치지 않는지 테스트"""
+    storage = OntologyStorage()
+    assert storage.version("onto-1") is None
+    
+    _save(storage)
+    assert storage.version("onto-1") == 1
+    assert storage.read_graph_versioned("onto-1", len) == (1, storage.stats()["triples"])
+    
+    storage.append_relations("onto-1", [_mapping_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    assert storage.version("onto-1") == 2
+    
+    storage.delete("onto-1")
+    assert storage.version("onto-1") is None
+    _save(storage)
+    assert storage.version("onto-1") == 3
+
+
+def test_concurrent_appends_to_same_ontology_are_atomic():
+    """한 온톨로지에 여러 스레드가 동시에 관계를 추가해도 트리플/매핑 수/버전이 어긋나지 않는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage)
+    events = []
+    storage.subscribe(lambda event, ontology_id, triples, created_at: events.append((event, len(triples))))
+    base_triples = storage.read_graph("onto-1", len)
+    threads, per_thread = 16, 25
+    
+    def append_many(worker: int) -> None:
+        for i in range(per_thread):
+            storage.append_relations("onto-1", [_mapping_row(f"w{worker}_sensor_{i}.csv", "CNC_Machine")], "isDataOf")
+    
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(append_many, range(threads)))
+    
+    appends = threads * per_thread
+    entry = storage.get("onto-1")
+    assert entry["mapping_count"] == len(entry["mapping_df"]) == 1 + appends
+    assert storage.version("onto-1") == 1 + appends
+    # 파일마다 isDataOf 트리플 하나가 추가됨 (CNC_Machine 클래스 트리플은 처음 한 번만)
+    added_triples = storage.read_graph("onto-1", len) - base_triples
+    assert added_triples == sum(count for event, count in events if event == "append")
+    assert len(Graph().parse(data=entry["rdf_graph"], format="turtle")) == storage.read_graph("onto-1", len)
+    assert len([event for event, _ in events if event == "append"]) == appends
+
+
+def test_writes_to_other_ontologies_not_blocked_by_reader():
+    """한 온톨로지를 읽는 동안 다른 온톨로지에는 쓰기가 진행되고 같은 온톨로지의 쓰기는 대기하는지 테스트"""
+    storage = OntologyStorage()
+    _save(storage, "onto-1")
+    _save(storage, "onto-2")
+    reading, release = threading.Event(), threading.Event()
+    
+    def slow_reader(store) -> int:
+        reading.set()
+        release.wait(timeout=10)
+        return len(store)
+    
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        reader = pool.submit(storage.read_graph, "onto-1", slow_reader)
+        assert reading.wait(timeout=10)
+        
+        same = pool.submit(storage.append_relations, "onto-1", [_mapping_row("a.csv", "CNC_Machine")], "isDataOf")
+        other = pool.submit(storage.append_relations, "onto-2", [_mapping_row("b.csv", "CNC_Machine")], "isDataOf")
+        assert other.result(timeout=10) == 2
+        assert not same.done()
+        
+        release.set()
+        before = reader.result(timeout=10)
+        assert same.result(timeout=10) == 2
+    
+    assert storage.read_graph("onto-1", len) > before
+
+
+def test_list_page_cursor_and_class_filter():
+    """정렬된 메타데이터 인덱스로 최신순 페이지, 클래스 필터, 삭제/재저장이 반영되는지 테스트"""
+    storage = OntologyStorage()
+    for i in range(5):
+        _save(storage, f"onto-{i}")
+    rows = [_mapping_row("pump_a.csv", "Industrial_Pump")]
+    storage.save(
+        BuildHybridOntologyResponse(message="ok", ontology_id="pump", mapping_df=rows, g=""), ["Industrial_Pump"], graph=[]
+    )
+    
+    page, total, cursor = storage.list_page(limit=2)
+    assert [item["ontology_id"] for item in page] == ["pump", "onto-4"]
+    assert total == 6
+    
+    # 커서 항목이 삭제되어도 다음 페이지는 이어서 조회
+    storage.delete("onto-4")
+    page, _, cursor = storage.list_page(limit=2, after=cursor)
+    assert [item["ontology_id"] for item in page] == ["onto-3", "onto-2"]
+    page, _, cursor = storage.list_page(limit=2, after=cursor)
+    assert [item["ontology_id"] for item in page] == ["onto-1", "onto-0"]
+    assert cursor is None
+    
+    page, total, _ = storage.list_page(ontology_class="Welding_Robot")
+    assert total == 4
+    assert "pump" not in {item["ontology_id"] for item in page}
+    assert storage.list_page(ontology_class="Unknown_Class") == ([], 0, None)
+    
+    # 재저장하면 최신 항목으로 이동
+    _save(storage, "onto-0")
+    assert storage.list_all()[0]["ontology_id"] == "onto-0"
+    assert len(storage.list_all()) == 5
+    
+    with pytest.raises(ValueError):
+        storage.list_page(after="@@not-a-cursor@@")
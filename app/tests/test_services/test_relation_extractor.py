@@ -0,0 +1,75 @@
+"""
+관계 추출기 테스트
+타겟 컬럼 직접 매핑의 조기 종료 스캔과 클래스별 집계 검증
+"""
+
+import polars as pl
+import pytest
+from backend.services.relation_extractor import RelationExtractor
+
+
+@pytest.fixture
+def extractor(fake_model_name: str, sample_ontology_classes: list[str]) -> RelationExtractor:
+    """가짜 모델을 사용하는 관계 추출기"""
+    return RelationExtractor(sample_ontology_classes, fake_model_name)
+
+
+def test_direct_mapping_returns_first_matching_value(extractor: RelationExtractor):
+    """파일 순서상 처음 일치하는 클래스로 직접 매핑되는지 테스트 (공백 제거 포함)"""
+    df = pl.DataFrame({"machine": [None, "unknown", " CNC_Machine ", "Welding_Robot"]})
+    relations = extractor.extract_relations(df, "line1.csv", target_column="machine")
+    
+    assert relations.to_dicts() == [{
+        "Source": "line1.csv",
+        "Target": "CNC_Machine",
+        "Relation": "isDataOf",
+        "Method": "direct",
+        "Confidence": 1.0,
+    }]
+
+
+def test_direct_mapping_stops_after_first_match(extractor: RelationExtractor):
+    """일치하는 값이 나오면 나머지 배치를 읽지 않는지 테스트"""
+    # 뒤쪽 행은 UTF-8이 아니어서 읽으면 오류가 발생함
+    content = b"time,machine\n" + b"1,Welding_Robot\n" * 100000 + b"2,\xff\xfe\n"
+    lazy_frame = pl.scan_csv(content).select("machine")
+    
+    assert extractor.find_direct_target(lazy_frame, "machine", batch_size=1000) == "Welding_Robot"
+    with pytest.raises(pl.exceptions.ComputeError):
+        lazy_frame.collect()
+
+
+def test_direct_mapping_without_match_uses_filename(extractor: RelationExtractor):
+    """타겟 컬럼에 일치하는 값이 없으면 파일명 매핑으로 넘어가는지 테스트"""
+    lazy_frame = pl.LazyFrame({"machine": [1, 2, 3]})
+    relations = extractor.extract_relations(lazy_frame, "welding_robot_line1.csv", target_column="machine")
+    
+    assert relations["Target"][0] == "Welding_Robot"
+    assert relations["Method"][0] == "rule"
+
+
+def test_count_target_classes(extractor: RelationExtractor):
+    """파일 전체의 클래스별 행 수 집계 테스트"""
+    df = pl.DataFrame({"machine": ["Welding_Robot", "CNC_Machine ", "other", None, "Welding_Robot"]})
+    
+    assert extractor.count_target_classes(df, "machine") == {"Welding_Robot": 2, "CNC_Machine": 1}
+    assert extractor.count_target_classes(df.lazy(), "machine") == {"Welding_Robot": 2, "CNC_Machine": 1}
+
+
+def test_extract_relations_batch_maps_filenames_in_one_call(extractor: RelationExtractor, monkeypatch):
+    """직접 매핑되지 않은 파일명만 모아 map_batch를 한 번 호출하는지 테스트 (입력 순서 유지)"""
+    calls = []
+    map_batch = extractor.mapper.map_batch
+    monkeypatch.setattr(extractor.mapper, "map_batch", lambda names: calls.append(list(names)) or map_batch(names))
+    
+    items = [
+        ("welding_robot_line1.csv", pl.DataFrame({"machine": ["other"]})),
+        ("line2.csv", pl.LazyFrame({"machine": ["CNC_Machine"]})),
+        ("cnc_machine_spindle.csv", pl.DataFrame({"time": [1]})),
+    ]
+    relations = extractor.extract_relations_batch(items, target_column="machine")
+    
+    assert calls == [["welding_robot_line1.csv", "cnc_machine_spindle.csv"]]
+    assert [row["Target"] for row in relations] == ["Welding_Robot", "CNC_Machine", "CNC_Machine"]
+    assert [row["Method"] for row in relations] == ["rule", "direct", "rule"]
+    assert relations[1]["Source"] == "line2.csv"
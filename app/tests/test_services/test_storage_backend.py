@@ -0,0 +1,289 @@
+"""
+저장소 영속화 백엔드 테스트
+SQLite 백엔드 재시작 복원, 지연 페이로드 로드, 배치 커밋, 청크 압축, 워커 간 공유 검증
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import polars as pl
+import pytest
+from backend.services import storage_backend
+from backend.services.merged_graph_index import MergedGraphIndex
+from backend.schmas.ontology_schma import BuildHybridOntologyResponse
+from backend.services.ontology_storage import OntologyStorage
+from backend.services.ontology_services.ontology_builder import relation_triples
+from backend.services.ontology_services.triple_store import CompactTripleStore
+from backend.services.storage_backend import SQLiteBackend, VersionConflictError, create_storage_backend
+
+
+def _row(source: str, target: str) -> dict:
+    return {"Source": source, "Target": target, "Similarity": 0.9, "Method": "rule"}
+
+
+def _save(storage: OntologyStorage, ontology_id: str, rows: list[dict]) -> None:
+    response = BuildHybridOntologyResponse(message="ok", ontology_id=ontology_id, mapping_df=rows, g="")
+    storage.save(response, ["Welding_Robot", "CNC_Machine"], graph=relation_triples(rows, "isDataOf"))
+
+
+def _worker(script: str, path: Path) -> str:
+    """다른 워커 프로세스에서 공유 저장소로 스크립트 실행 (storage 변수 사용)"""
+    code = (
+        "import sys\n"
+        "from backend.services.ontology_storage import OntologyStorage\n"
+        "from backend.services.storage_backend import SQLiteBackend\n"
+        "storage = OntologyStorage(SQLiteBackend(sys.argv[1], shared=True))\n"
+        + script
+    )
+    app_dir = Path(__file__).resolve().parents[2]
+    env = {**os.environ, "ONTOLOGY_STORE_BACKEND": "memory"}
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(path)], cwd=app_dir, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def _committed_ids(path: Path) -> list[str]:
+    """다른 연결에서 보이는(커밋된) 온톨로지 ID"""
+    with sqlite3.connect(path) as conn:
+        return sorted(row[0] for row in conn.execute("SELECT ontology_id FROM ontology_meta"))
+
+
+def test_sqlite_backend_survives_restart(tmp_path: Path):
+    """재시작 후 메타데이터는 바로, 페이로드는 처음 사용할 때 복원되는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    storage = OntologyStorage(SQLiteBackend(str(path)))
+    _save(storage, "onto-1", [_row("welding_robot_line1.csv", "Welding_Robot")])
+    _save(storage, "onto-2", [_row("pump_a.csv", "CNC_Machine")])
+    storage.append_relations("onto-1", [_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    storage.delete("onto-2")
+    before = storage.get("onto-1")
+    storage.close()
+    
+    restarted = OntologyStorage(SQLiteBackend(str(path)))
+    
+    assert [item["ontology_id"] for item in restarted.list_all()] == ["onto-1"]
+    assert restarted.stats()["loaded"] == 0
+    assert restarted.version("onto-1") == 2
+    
+    after = restarted.get("onto-1")
+    assert restarted.stats()["loaded"] == 1
+    assert after["mapping_df"] == before["mapping_df"]
+    assert after["mapping_count"] == 2
+    assert "CNC_Machine" in after["rdf_graph"]
+    assert restarted.read_graph("onto-1", len) == 2
+    
+    # 재시작 후 관계 추가도 이어서 기록
+    restarted.append_relations("onto-1", [_row("pump_b.csv", "Industrial_Pump")], "isDataOf")
+    restarted.close()
+    assert OntologyStorage(SQLiteBackend(str(path))).read_graph("onto-1", len) == 3
+
+
+def test_sqlite_backend_batches_commits(tmp_path: Path):
+    """commit_batch개가 쌓이거나 flush할 때만 커밋되는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    backend = SQLiteBackend(str(path), commit_batch=3, commit_interval=60)
+    storage = OntologyStorage(backend)
+    
+    _save(storage, "onto-1", [_row("a.csv", "Welding_Robot")])
+    _save(storage, "onto-2", [_row("b.csv", "Welding_Robot")])
+    assert _committed_ids(path) == []
+    
+    _save(storage, "onto-3", [_row("c.csv", "Welding_Robot")])
+    assert _committed_ids(path) == ["onto-1", "onto-2", "onto-3"]
+    
+    _save(storage, "onto-4", [_row("d.csv", "Welding_Robot")])
+    storage.flush()
+    assert _committed_ids(path) == ["onto-1", "onto-2", "onto-3", "onto-4"]
+    assert backend.stats()["commits"] == 2
+    storage.close()
+
+
+def test_sqlite_backend_compacts_chunks(tmp_path: Path):
+    """관계 추가 청크가 많으면 로드 시 하나로 압축되는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    storage = OntologyStorage(SQLiteBackend(str(path), max_chunks=4))
+    _save(storage, "onto-1", [_row("file_0.csv", "Welding_Robot")])
+    for i in range(1, 8):
+        storage.append_relations("onto-1", [_row(f"file_{i}.csv", "CNC_Machine")], "isDataOf")
+    storage.close()
+    
+    backend = SQLiteBackend(str(path), max_chunks=4)
+    payload = backend.load_payload("onto-1")
+    backend.close()
+    
+    assert len(payload.store) == 8
+    assert len(payload.mapping) == 8
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM ontology_chunks").fetchone()[0] == 1
+
+
+def test_create_storage_backend_unknown():
+    """지원하지 않는 백엔드 종류 테스트"""
+    with pytest.raises(ValueError):
+        create_storage_backend("segment-log")
+
+
+def test_shared_storage_applies_other_worker_changes(tmp_path: Path):
+    """한 워커의 저장/관계 추가/삭제가 다른 워커의 메타데이터, 버전, 구독 인덱스에 반영되는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    worker_a = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    worker_b = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    index_b = MergedGraphIndex()
+    worker_b.subscribe(index_b.on_storage_event)
+    
+    _save(worker_a, "onto-1", [_row("welding_robot_line1.csv", "Welding_Robot")])
+    assert worker_b.exists("onto-1")
+    assert worker_b.read_graph("onto-1", len) == 1
+    assert index_b.stats()["edges"] == 1
+    version = worker_b.version("onto-1")
+    
+    worker_a.append_relations("onto-1", [_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    assert worker_b.version("onto-1") > version
+    assert worker_b.get("onto-1")["mapping_count"] == 2
+    assert "cnc_machine_spindle.csv" in worker_b.get_turtle("onto-1")
+    assert index_b.stats()["edges"] == 2
+    
+    # 자신의 쓰기는 다시 반영하지 않음
+    worker_b.append_relations("onto-1", [_row("pump_a.csv", "Industrial_Pump")], "isDataOf")
+    assert worker_b.sync() == 0
+    assert worker_a.read_graph("onto-1", len) == 3
+    
+    worker_a.delete("onto-1")
+    assert worker_b.list_all() == []
+    assert index_b.stats()["ontologies"] == 0
+    assert index_b.stats()["edges"] == 0
+    worker_a.close()
+    worker_b.close()
+
+
+def test_shared_storage_resyncs_after_truncated_log(tmp_path: Path, monkeypatch):
+    """변경 로그가 잘릴 만큼 뒤처진 워커가 메타데이터 전체를 다시 비교하는지 테스트"""
+    monkeypatch.setattr(storage_backend, "ONTOLOGY_STORE_CHANGE_LOG_SIZE", 2)
+    path = tmp_path / "ontologies.db"
+    worker_a = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    worker_b = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    _save(worker_a, "onto-0", [_row("a.csv", "Welding_Robot")])
+    assert worker_b.count() == 1
+    
+    for i in range(1, 6):
+        _save(worker_a, f"onto-{i}", [_row(f"file_{i}.csv", "Welding_Robot")])
+    worker_a.delete("onto-0")
+    
+    assert sorted(item["ontology_id"] for item in worker_b.list_all()) == [f"onto-{i}" for i in range(1, 6)]
+    worker_a.close()
+    worker_b.close()
+
+
+def test_shared_storage_across_worker_processes(tmp_path: Path):
+    """다른 프로세스에서 업로드한 온톨로지를 이 프로세스에서 조회 (반대 방향 포함)"""
+    path = tmp_path / "ontologies.db"
+    local = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    
+    _worker(
+        "from backend.schmas.ontology_schma import BuildHybridOntologyResponse\n"
+        "from backend.services.ontology_services.ontology_builder import relation_triples\n"
+        "rows = [{'Source': 'welding_robot_line1.csv', 'Target': 'Welding_Robot', 'Similarity': 0.9, 'Method': 'rule'}]\n"
+        "response = BuildHybridOntologyResponse(message='ok', ontology_id='remote', mapping_df=rows, g='')\n"
+        "storage.save(response, ['Welding_Robot'], graph=relation_triples(rows, 'isDataOf'))\n"
+        "storage.close()\n",
+        path,
+    )
+    assert local.get("remote")["mapping_df"][0]["Source"] == "welding_robot_line1.csv"
+    
+    local.append_relations("remote", [_row("cnc_machine_spindle.csv", "CNC_Machine")], "isDataOf")
+    output = _worker("print(storage.version('remote'), storage.read_graph('remote', len))", path)
+    assert output == f"{local.version('remote')} 2"
+    local.close()
+
+
+def test_shared_storage_concurrent_appends_use_compare_and_swap(tmp_path: Path):
+    """두 워커가 같은 온톨로지에 동시에 관계를 추가해도 버전 비교로 추가가 유실되지 않는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    workers = [OntologyStorage(SQLiteBackend(str(path), shared=True)) for _ in range(2)]
+    _save(workers[0], "onto-1", [_row("seed.csv", "Welding_Robot")])
+    threads, per_thread = 8, 10
+    
+    def append_many(n: int) -> None:
+        storage = workers[n % 2]
+        for i in range(per_thread):
+            storage.append_relations("onto-1", [_row(f"w{n}_file_{i}.csv", "CNC_Machine")], "isDataOf")
+    
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(append_many, range(threads)))
+    for storage in workers:
+        storage.close()
+    
+    restarted = OntologyStorage(SQLiteBackend(str(path)))
+    entry = restarted.get("onto-1")
+    assert entry["mapping_count"] == len(entry["mapping_df"]) == 1 + threads * per_thread
+    assert restarted.version("onto-1") == 1 + threads * per_thread
+    assert restarted.read_graph("onto-1", len) == 1 + threads * per_thread
+    restarted.close()
+
+
+def test_sqlite_backend_rejects_stale_version(tmp_path: Path):
+    """기대 버전이 저장된 버전과 다르면 아무것도 기록하지 않는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    storage = OntologyStorage(SQLiteBackend(str(path), shared=True))
+    _save(storage, "onto-1", [_row("a.csv", "Welding_Robot")])
+    backend = SQLiteBackend(str(path), shared=True)
+    entry = backend.load_metadata()[0]
+    
+    with pytest.raises(VersionConflictError):
+        backend.write(entry, 5, CompactTripleStore(), pl.DataFrame(), replace=False, expected_version=4)
+    assert backend.load_entry("onto-1")["version"] == 1
+    assert not backend._conn.in_transaction
+    backend.close()
+    storage.close()
+
+
+def test_failed_append_is_not_kept_in_memory(tmp_path: Path, monkeypatch):
+    """백엔드 기록이 실패한 관계 추가는 메모리에도 반영되지 않고, 재시도하면 재시작 후에도 남는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    storage = OntologyStorage(SQLiteBackend(str(path)))
+    _save(storage, "onto-1", [_row("welding_robot_line1.csv", "Welding_Robot")])
+    rows = [_row("cnc_machine_spindle.csv", "CNC_Machine")]
+    
+    def failing_write(*args, **kwargs):
+        raise OSError("disk full")
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(storage._backend, "write", failing_write)
+        with pytest.raises(OSError):
+            storage.append_relations("onto-1", rows, "isDataOf")
+    assert storage.read_graph("onto-1", len) == 1
+    assert storage.version("onto-1") == 1
+    
+    assert storage.append_relations("onto-1", rows, "isDataOf") == 2
+    storage.close()
+    
+    restarted = OntologyStorage(SQLiteBackend(str(path)))
+    assert restarted.read_graph("onto-1", len) == 2
+    assert "CNC_Machine" in restarted.get_turtle("onto-1")
+
+
+def test_replaced_relations_survive_restart(tmp_path: Path):
+    """Source를 교체한 관계 추가가 기존 관계를 지운 상태로 기록되고 재시작 후에도 유지되는지 테스트"""
+    path = tmp_path / "ontologies.db"
+    storage = OntologyStorage(SQLiteBackend(str(path)))
+    _save(storage, "onto-1", [_row("line1/sensor.csv", "Welding_Robot"), _row("line2/pump.csv", "CNC_Machine")])
+    
+    count = storage.append_relations(
+        "onto-1", [_row("line1/sensor.csv", "CNC_Machine")], "isDataOf", replace_sources=["line1/sensor.csv"]
+    )
+    assert count == 2
+    storage.close()
+    
+    restarted = OntologyStorage(SQLiteBackend(str(path)))
+    assert restarted.read_graph("onto-1", lambda store: sorted(str(o) for _, _, o in store)) == [
+        "http://factory.org/CNC_Machine", "http://factory.org/CNC_Machine"
+    ]
+    assert {(row["Source"], row["Target"]) for row in restarted.get("onto-1")["mapping_df"]} == {
+        ("line1/sensor.csv", "CNC_Machine"), ("line2/pump.csv", "CNC_Machine")
+    }
+    assert restarted.version("onto-1") == 2
@@ -0,0 +1,149 @@
+"""
+업로드 버퍼 테스트
+크기 제한, 임시 파일 전환, 경로 기반 파싱, 업로드당 최대 RSS 검증
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from io import BytesIO
+from pathlib import Path
+import pytest
+from fastapi import UploadFile
+from backend.services.data_parser import CSVParser, JSONParser
+from backend.services.upload_buffer import UploadBuffer, UploadTooLargeError, read_upload_file
+
+
+APP_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_buffer_keeps_small_upload_in_memory():
+    """임계값 이하 데이터는 메모리에 유지되는지 테스트"""
+    with UploadBuffer(max_size=100, spill_threshold=10) as buffer:
+        buffer.write(b"abc")
+        buffer.write(b"def")
+        
+        assert not buffer.spilled
+        assert buffer.source() == b"abcdef"
+        assert buffer.size == 6
+
+
+def test_buffer_spills_to_temp_file(tmp_path: Path):
+    """임계값을 넘으면 임시 파일로 전환되고 close 시 삭제되는지 테스트 (내용 해시는 수신하면서 계산)"""
+    buffer = UploadBuffer(max_size=100, spill_threshold=4, temp_dir=str(tmp_path))
+    buffer.write(b"abc")
+    buffer.write(b"def")
+    buffer.write(b"ghi")
+    
+    assert buffer.spilled
+    path = buffer.source()
+    assert Path(path).read_bytes() == b"abcdefghi"
+    assert buffer.sha256 == hashlib.sha256(b"abcdefghi").hexdigest()
+    
+    buffer.close()
+    assert not Path(path).exists()
+
+
+def test_buffer_rejects_oversized_upload(tmp_path: Path):
+    """최대 크기를 넘는 청크가 들어오면 즉시 중단되는지 테스트"""
+    buffer = UploadBuffer(max_size=8, spill_threshold=4, temp_dir=str(tmp_path))
+    buffer.write(b"12345")
+    
+    with pytest.raises(UploadTooLargeError):
+        buffer.write(b"6789")
+    assert buffer.size == 5
+    buffer.close()
+
+
+def test_read_upload_file_in_chunks():
+    """UploadFile을 청크 단위로 읽는지 테스트"""
+    upload = UploadFile(file=BytesIO(b"x" * 100), filename="data.csv")
+    buffer = asyncio.run(read_upload_file(upload, max_size=1000, chunk_size=16, spill_threshold=40))
+    
+    with buffer:
+        assert buffer.spilled
+        assert buffer.size == 100
+        assert Path(buffer.source()).read_bytes() == b"x" * 100
+    
+    upload = UploadFile(file=BytesIO(b"x" * 100), filename="data.csv")
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(read_upload_file(upload, max_size=50, chunk_size=16, spill_threshold=40))
+
+
+def test_parsers_read_from_path(tmp_path: Path):
+    """bytes와 파일 경로 파싱 결과가 같은지 테스트 (CP949 포함)"""
+    csv_content = "센서,값\n온도,1\n압력,2\n".encode("cp949")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(csv_content)
+    
+    parser = CSVParser()
+    assert parser.parse(str(csv_path), "data.csv").equals(parser.parse(csv_content, "data.csv"))
+    assert parser.parse(str(csv_path), "data.csv")["센서"].to_list() == ["온도", "압력"]
+    
+    json_content = json.dumps({"rows": [{"a": 1}, {"a": 2}]}).encode()
+    json_path = tmp_path / "data.json"
+    json_path.write_bytes(json_content)
+    
+    assert JSONParser().parse(str(json_path), "data.json")["a"].to_list() == [1, 2]
+
+
+_RSS_SCRIPT = textwrap.dedent("""
+    import asyncio, json, resource, sys
+    import polars as pl
+    from io import StringIO
+    from fastapi import UploadFile
+    from backend.services.data_upload_service import DataUploadService
+    from backend.services.upload_buffer import read_upload_file
+    
+    mode, path = sys.argv[1], sys.argv[2]
+    pl.read_csv(b"a\\n1\\n")  # polars 초기화 비용 제외
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    
+    if mode == "buffered":
+        with open(path, "rb") as f:
+            buffer = asyncio.run(read_upload_file(UploadFile(file=f, filename="data.csv"), max_size=1 << 30))
+        with buffer:
+            DataUploadService().upload_and_build_ontology(
+                buffer.source(), "welding_robot_rss.csv", "csv", ["Welding_Robot", "CNC_Machine"]
+            )
+    else:
+        # 이전 방식: 전체 bytes -> str -> StringIO 사본
+        with open(path, "rb") as f:
+            content = f.read()
+        pl.read_csv(StringIO(content.decode("utf-8")))
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_delta_kb": peak - baseline}))
+""")
+
+
+def _peak_rss_delta_mb(mode: str, csv_path: Path) -> float:
+    """새 프로세스에서 업로드 처리 중 증가한 최대 RSS (MB)"""
+    result = subprocess.run(
+        [sys.executable, "-c", _RSS_SCRIPT, mode, str(csv_path)],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+        env={**os.environ, "UPLOAD_PROCESS_WORKERS": "0"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])["peak_delta_kb"] / 1024
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="ru_maxrss 단위(KB)는 Linux 기준")
+def test_upload_peak_rss(tmp_path: Path):
+    """청크 수신 + 임시 파일 파싱의 최대 RSS가 전체 복사 방식보다 작은지 측정"""
+    csv_path = tmp_path / "large.csv"
+    block = "".join(f"{i},{i * 0.5},{i % 7}\n" for i in range(50000)).encode()
+    with open(csv_path, "wb") as f:
+        f.write(b"time,current,state\n")
+        for _ in range(40):
+            f.write(block)
+    file_mb = csv_path.stat().st_size / 1024 / 1024
+    
+    buffered = _peak_rss_delta_mb("buffered", csv_path)
+    full_copy = _peak_rss_delta_mb("full_copy", csv_path)
+    print(f"file={file_mb:.1f}MB, buffered peak +{buffered:.1f}MB, full copy peak +{full_copy:.1f}MB")
+    
+    assert buffered < full_copy
@@ -0,0 +1,81 @@
+"""
+업로드 중복 제거 테스트
+업로드 지문, TTL/최대 항목 수 제한, Idempotency-Key 충돌, 처리 중인 같은 업로드 합류 검증
+"""
+
+import asyncio
+import time
+import pytest
+from backend.services.upload_dedup import IdempotencyKeyConflictError, UploadResultCache, upload_fingerprint
+
+
+class CountingUpload:
+    """호출 횟수를 세는 업로드 실행 함수"""
+    
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+    
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"result-{self.calls}"
+
+
+def test_upload_fingerprint():
+    """클래스 순서/중복은 무시하고 내용, 파일명, 대상 온톨로지가 다르면 지문이 달라지는지 테스트"""
+    base = upload_fingerprint("abc", "line1.csv", ["CNC_Machine", "Welding_Robot"], ontology_id=None)
+    
+    assert upload_fingerprint("abc", "line1.csv", ["Welding_Robot", "CNC_Machine", "CNC_Machine"], ontology_id=None) == base
+    assert upload_fingerprint("abd", "line1.csv", ["CNC_Machine", "Welding_Robot"], ontology_id=None) != base
+    assert upload_fingerprint("abc", "line2.csv", ["CNC_Machine", "Welding_Robot"], ontology_id=None) != base
+    assert upload_fingerprint("abc", "line1.csv", ["CNC_Machine", "Welding_Robot"], ontology_id="onto-1") != base
+
+
+def test_cache_ttl_and_max_entries():
+    """저장된 결과를 재사용하고, TTL이 지나거나 최대 항목 수를 넘으면 다시 실행하는지 테스트"""
+    cache = UploadResultCache(max_entries=2, ttl=0.2)
+    run = CountingUpload()
+    
+    assert asyncio.run(cache.get_or_run("a", run)) == ("result-1", False)
+    assert asyncio.run(cache.get_or_run("a", run)) == ("result-1", True)
+    asyncio.run(cache.get_or_run("b", run))
+    asyncio.run(cache.get_or_run("c", run))
+    assert asyncio.run(cache.get_or_run("a", run)) == ("result-4", False)
+    
+    time.sleep(0.3)
+    assert asyncio.run(cache.get_or_run("a", run)) == ("result-5", False)
+    assert asyncio.run(cache.get_or_run("a", run, is_valid=lambda result: False)) == ("result-6", False)
+    
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 6
+    assert stats["entries"] == 2
+    assert stats["evictions"] >= 1
+
+
+def test_idempotency_key_conflict():
+    """같은 Idempotency-Key로 다른 지문을 요청하면 거부하는지 테스트"""
+    cache = UploadResultCache()
+    run = CountingUpload()
+    asyncio.run(cache.get_or_run("a", run, idempotency_key="retry-1"))
+    
+    assert asyncio.run(cache.get_or_run("a", run, idempotency_key="retry-1")) == ("result-1", True)
+    with pytest.raises(IdempotencyKeyConflictError):
+        asyncio.run(cache.get_or_run("b", run, idempotency_key="retry-1"))
+    assert run.calls == 1
+
+
+def test_concurrent_duplicates_run_once():
+    """처리 중인 업로드와 같은 업로드는 새로 실행하지 않고 결과를 기다리는지 테스트"""
+    cache = UploadResultCache()
+    run = CountingUpload(delay=0.1)
+    
+    async def upload_twice():
+        return await asyncio.gather(cache.get_or_run("a", run), cache.get_or_run("a", run))
+    
+    first, second = asyncio.run(upload_twice())
+    assert first == ("result-1", False)
+    assert second == ("result-1", True)
+    assert run.calls == 1
+    assert cache.stats()["joined"] == 1
@@ -0,0 +1,118 @@
+"""
+디스크 임베딩 캐시 테스트
+memory-mapped 캐시 저장/조회, 재시작 후 재사용, 제거, 읽기 전용 공유 검증
+"""
+
+import numpy as np
+from backend.services.ontology_services import disk_embedding_cache
+from backend.services.ontology_services.disk_embedding_cache import (
+    DiskEmbeddingCache,
+    DiskEmbeddingCacheManager,
+)
+from backend.services.ontology_services.semantic_mapper import SemanticMapper
+
+
+def _vectors(count: int, dimension: int = 4) -> np.ndarray:
+    """테스트용 임베딩 생성"""
+    return np.arange(count * dimension, dtype=np.float32).reshape(count, dimension)
+
+
+def test_disk_cache_roundtrip_survives_reopen(tmp_path):
+    """저장한 임베딩이 캐시를 다시 열어도 조회되는지 테스트"""
+    cache = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8)
+    assert cache.get_many(["cnc data"]) == [None]
+    
+    cache.put_many(["cnc data", "pump data"], _vectors(2))
+    
+    reopened = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8)
+    assert reopened.warm_up() == 2
+    hits = reopened.get_many(["pump data", "unknown"])
+    assert np.allclose(hits[0], _vectors(2)[1])
+    assert hits[1] is None
+
+
+def test_disk_cache_key_includes_model(tmp_path):
+    """같은 텍스트라도 모델이 다르면 캐시를 공유하지 않는지 테스트"""
+    DiskEmbeddingCache(tmp_path, "model-a", max_entries=8).put_many(["cnc data"], _vectors(1))
+    
+    other = DiskEmbeddingCache(tmp_path, "model-b", max_entries=8)
+    assert other.get_many(["cnc data"]) == [None]
+
+
+def test_disk_cache_evicts_oldest_when_full(tmp_path):
+    """용량 초과 시 가장 오래 기록된 항목이 제거되는지 테스트"""
+    cache = DiskEmbeddingCache(tmp_path, "model-a", max_entries=2)
+    cache.put_many(["a", "b", "c"], _vectors(3))
+    
+    results = cache.get_many(["a", "b", "c"])
+    assert results[0] is None
+    assert results[1] is not None and results[2] is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_cache_readonly_sees_writer_updates(tmp_path):
+    """읽기 전용 캐시가 다른 인스턴스의 기록을 조회하는지 테스트"""
+    writer = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8)
+    writer.put_many(["a"], _vectors(1))
+    reader = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8, readonly=True)
+    
+    writer.put_many(["b"], _vectors(2)[1:])
+    reader.put_many(["c"], _vectors(1))  # 읽기 전용이므로 무시됨
+    
+    results = reader.get_many(["a", "b", "c"])
+    assert results[0] is not None
+    assert results[1] is not None
+    assert results[2] is None
+
+
+def test_semantic_mapper_uses_disk_cache(tmp_path, monkeypatch, fake_model, fake_model_name: str, sample_ontology_classes: list[str]):
+    """디스크 캐시에 있는 파일명은 모델 인코딩을 건너뛰는지 테스트"""
+    monkeypatch.setattr(
+        disk_embedding_cache,
+        "_disk_embedding_cache_manager",
+        DiskEmbeddingCacheManager(cache_dir=str(tmp_path), enabled=True, max_entries=16),
+    )
+    mapper = SemanticMapper(model_name=fake_model_name)
+    
+    first = mapper.map_semantic(["cnc_data_01.csv"], sample_ontology_classes)
+    calls_after_first = len(fake_model.encode_calls)
+    second = mapper.map_semantic(["cnc_data_01.csv"], sample_ontology_classes)
+    
+    assert len(fake_model.encode_calls) == calls_after_first
+    assert first.to_dicts() == second.to_dicts()
+    
+    warmed = DiskEmbeddingCacheManager(cache_dir=str(tmp_path), enabled=True, max_entries=16).warm_up()
+    assert warmed == {fake_model_name: 1}
+
+
+def test_disk_cache_does_not_truncate_shared_files(tmp_path):
+    """다른 워커가 만든 캐시를 용량 설정이 달라도 재생성하지 않고 그대로 사용하는지 테스트"""
+    late = DiskEmbeddingCache(tmp_path, "model-a", max_entries=4)  # 캐시 파일이 생기기 전에 열림
+    first = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8)
+    first.put_many(["a"], _vectors(1))
+    
+    late.put_many(["b"], _vectors(2)[1:])
+    resized = DiskEmbeddingCache(tmp_path, "model-a", max_entries=16)
+    resized.put_many(["c"], _vectors(3)[2:])
+    
+    # 먼저 매핑한 워커도 모든 기록을 조회 (파일이 잘리거나 교체되지 않음)
+    assert all(result is not None for result in first.get_many(["a", "b", "c"]))
+    assert resized.stats()["max_entries"] == 8
+
+
+def test_disk_cache_read_rechecks_key_after_copy(tmp_path):
+    """벡터를 복사하는 사이 다른 워커가 슬롯을 덮어쓰면 잘못된 벡터 대신 미스로 처리하는지 테스트"""
+    cache = DiskEmbeddingCache(tmp_path, "model-a", max_entries=8)
+    cache.put_many(["a"], _vectors(1))
+    vectors = cache._vectors
+    
+    class OverwrittenDuringCopy:
+        shape = vectors.shape
+        
+        def __getitem__(self, slot):
+            # 다른 워커의 기록: 키를 지우고 벡터를 쓴 뒤 새 키 기록
+            cache._keys[slot] = np.frombuffer(disk_embedding_cache.make_cache_key("model-a", "other"), dtype=np.uint8)
+            return vectors[slot]
+    
+    cache._vectors = OverwrittenDuringCopy()
+    assert cache.get_many(["a"]) == [None]
@@ -0,0 +1,74 @@
+"""
+클래스 임베딩 캐시 테스트
+클래스 집합 정규화, 캐시 히트/미스, 정규화 행렬 검증
+"""
+
+import numpy as np
+import pytest
+from backend.services.ontology_services.embedding_cache import (
+    ClassEmbeddingCache,
+    l2_normalize,
+    normalize_class_set,
+)
+from backend.services.ontology_services.semantic_mapper import SemanticMapper
+
+
+@pytest.fixture
+def class_cache() -> ClassEmbeddingCache:
+    """클래스 임베딩 캐시 인스턴스"""
+    return ClassEmbeddingCache(max_entries=2)
+
+
+def test_normalize_class_set():
+    """클래스 집합 정규화 테스트 (공백/중복 제거, 정렬)"""
+    assert normalize_class_set([" Welding_Robot", "CNC_Machine", "Welding_Robot", ""]) == (
+        "CNC_Machine",
+        "Welding_Robot",
+    )
+
+
+def test_l2_normalize_rows():
+    """행 단위 L2 정규화 테스트"""
+    matrix = l2_normalize(np.array([[3.0, 4.0], [0.0, 0.0]]))
+    assert matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix[0]), 1.0)
+    assert np.allclose(matrix[1], 0.0)
+
+
+def test_class_cache_hit_for_same_class_set(class_cache: ClassEmbeddingCache, fake_model, fake_model_name: str):
+    """순서/공백만 다른 클래스 집합은 캐시를 재사용하는지 테스트"""
+    first = class_cache.get(fake_model_name, fake_model, ["CNC_Machine", "Welding_Robot"])
+    second = class_cache.get(fake_model_name, fake_model, [" Welding_Robot ", "CNC_Machine"])
+    
+    assert first is second
+    assert len(fake_model.encode_calls) == 1
+    assert np.allclose(np.linalg.norm(first.matrix, axis=1), 1.0)
+    
+    stats = class_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_class_cache_evicts_oldest(class_cache: ClassEmbeddingCache, fake_model, fake_model_name: str):
+    """최대 항목 수 초과 시 가장 오래된 항목이 제거되는지 테스트"""
+    class_cache.get(fake_model_name, fake_model, ["A"])
+    class_cache.get(fake_model_name, fake_model, ["B"])
+    class_cache.get(fake_model_name, fake_model, ["C"])
+    class_cache.get(fake_model_name, fake_model, ["A"])
+    
+    assert class_cache.stats()["entries"] == 2
+    assert len(fake_model.encode_calls) == 4
+
+
+def test_semantic_mapper_reuses_class_embeddings(fake_model, fake_model_name: str, sample_ontology_classes: list[str]):
+    """map_semantic 반복 호출 시 클래스를 다시 인코딩하지 않는지 테스트"""
+    mapper = SemanticMapper(model_name=fake_model_name)
+    
+    first = mapper.map_semantic(["welding_robot_01.csv"], sample_ontology_classes)
+    second = mapper.map_semantic(["welding_robot_02.csv"], list(reversed(sample_ontology_classes)))
+    
+    # 클래스 인코딩 1회 + 파일명 인코딩 2회
+    assert len(fake_model.encode_calls) == 3
+    assert first["Mapped_Class"][0] == "Welding_Robot"
+    assert second["Mapped_Class"][0] == "Welding_Robot"
+    assert 0.0 <= second["Confidence"][0] <= 1.0
@@ -54,3 +54,38 @@ def test_hybrid_mapper_map_files(hybrid_mapper: HybridMapper):
     assert "Confidence" in mapping_df.columns
     assert "Method" in mapping_df.columns
 
+
+
+def test_hybrid_mapper_map_batch_encodes_leftovers_once(fake_model, fake_model_name: str, sample_ontology_classes: list[str]):
+    """배치 매핑 시 규칙 미매칭 파일명만 한 번에 인코딩하는지 테스트"""
+    mapper = HybridMapper(ontology_classes=sample_ontology_classes, model_name=fake_model_name)
+    test_filenames = [
+        "injection_molding_data.csv",
+        "line_a_log.csv",
+        "line_b_log.csv",
+        "line_a_log.csv",
+    ]
+    
+    results = mapper.map_batch(test_filenames)
+    
+    assert [result.filename for result in results] == test_filenames
+    assert results[0].method == "rule"
+    # 클래스 인코딩 1회 + 남은 파일명(중복 제거) 인코딩 1회
+    assert len(fake_model.encode_calls) == 2
+    assert sorted(fake_model.encode_calls[-1]) == ["line a log", "line b log"]
+    assert results[1] == results[3]
+
+
+def test_hybrid_mapper_map_files_matches_map_file(fake_model, fake_model_name: str, sample_ontology_classes: list[str]):
+    """배치 경로 결과가 단건 매핑 결과와 같은지 테스트"""
+    mapper = HybridMapper(ontology_classes=sample_ontology_classes, model_name=fake_model_name)
+    test_filenames = ["welding_robot_data.csv", "cnc_line_07.csv", "misc_export.csv"]
+    
+    mapping_df = mapper.map_files(test_filenames)
+    
+    assert mapping_df.columns == ["Filename", "Interpreted_As", "Mapped_Class", "Confidence", "Method"]
+    for row, filename in zip(mapping_df.iter_rows(named=True), test_filenames):
+        single = mapper.map_file(filename)
+        assert row["Mapped_Class"] == single.mapped_class
+        assert row["Method"] == single.method
+        assert row["Confidence"] == round(single.confidence, 3)
@@ -0,0 +1,97 @@
+"""
+키워드 오토마톤 테스트
+Aho-Corasick 매칭 결과가 기존 부분 문자열 검사와 같은지 검증
+"""
+
+import random
+import string
+import pytest
+from backend.services.ontology_services.keyword_automaton import KeywordAutomaton
+from backend.services.ontology_services.keyword_rules import DEFAULT_KEYWORD_RULES
+from backend.services.ontology_services.rule_based_mapper import RuleBasedMapper
+
+
+def _naive_match(keyword_rules: dict[str, list[str]], clean_name: str):
+    """기존 구현 (클래스 × 키워드 × 단어 부분 문자열 검사)"""
+    words = clean_name.split()
+    best_match = None
+    best_score = 0.0
+    for class_name, keywords in keyword_rules.items():
+        matches = sum(1 for kw in keywords if kw in clean_name or any(kw in word for word in words))
+        if matches > 0:
+            score = min(0.95, 0.7 + (matches * 0.1))
+            if score > best_score:
+                best_score = score
+                best_match = class_name
+    return (best_match, best_score) if best_match else None
+
+
+def _random_rules(rng: random.Random, class_count: int, keyword_count: int) -> dict[str, list[str]]:
+    """랜덤 키워드 사전 생성 (짧은 키워드 위주로 겹침 유도)"""
+    rules: dict[str, list[str]] = {f"Class_{i}": [] for i in range(class_count)}
+    for _ in range(keyword_count):
+        keyword = "".join(rng.choice("abcde") for _ in range(rng.randint(1, 4)))
+        rules[f"Class_{rng.randrange(class_count)}"].append(keyword)
+    return rules
+
+
+def test_automaton_counts_overlapping_keywords():
+    """겹치는 키워드(접두/접미)가 모두 집계되는지 테스트"""
+    automaton = KeywordAutomaton({"A": ["he", "she", "hers"], "B": ["his", "e"]})
+    
+    counts = automaton.count_matches("ushers")
+    
+    assert counts == {0: 3, 1: 1}
+
+
+def test_automaton_counts_keyword_once_per_text():
+    """같은 키워드가 여러 번 등장해도 한 번만 집계되는지 테스트"""
+    automaton = KeywordAutomaton({"Motor": ["motor", "volt"]})
+    
+    assert automaton.count_matches("motor motor volt") == {0: 2}
+
+
+def test_rule_mapper_default_rules_match_naive():
+    """기본 사전에서 기존 구현과 같은 결과를 내는지 테스트"""
+    mapper = RuleBasedMapper()
+    filenames = [
+        "injection_molding_data.csv",
+        "welding_robot_data.csv",
+        "cnc_machine_data.csv",
+        "motor_current_voltage.csv",
+        "사출기_데이터.csv",
+        "unknown_data.csv",
+    ]
+    
+    for filename in filenames:
+        clean_name = mapper.preprocess_filename(filename)
+        assert mapper.match_by_keywords(filename) == _naive_match(DEFAULT_KEYWORD_RULES, clean_name)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rule_mapper_random_rules_match_naive(seed: int):
+    """랜덤 사전/파일명에서 기존 구현과 같은 결과를 내는지 테스트"""
+    rng = random.Random(seed)
+    rules = _random_rules(rng, class_count=8, keyword_count=60)
+    mapper = RuleBasedMapper(keyword_rules=rules)
+    
+    for _ in range(50):
+        filename = "".join(rng.choice("abcde_ -") for _ in range(rng.randint(0, 20))) + ".csv"
+        clean_name = mapper.preprocess_filename(filename)
+        assert mapper.match_by_keywords(filename) == _naive_match(rules, clean_name)
+
+
+def test_automaton_large_dictionary():
+    """10k+ 키워드 사전 컴파일 및 매칭 테스트"""
+    rng = random.Random(0)
+    rules: dict[str, list[str]] = {f"Class_{i}": [] for i in range(500)}
+    for i in range(12000):
+        keyword = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        rules[f"Class_{i % 500}"].append(keyword)
+    rules["Class_42"].append("spindle")
+    
+    mapper = RuleBasedMapper(keyword_rules=rules)
+    
+    assert mapper.automaton.keyword_count >= 10000
+    clean_name = mapper.preprocess_filename("line_3_spindle_load.csv")
+    assert mapper.match_by_keywords("line_3_spindle_load.csv") == _naive_match(rules, clean_name)
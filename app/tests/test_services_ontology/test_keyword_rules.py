@@ -0,0 +1,108 @@
+"""
+키워드 규칙 사전 테스트
+외부 사전 로드, 변경 시 무중단 교체, 잘못된 사전 처리 검증
+"""
+
+import json
+import os
+import pytest
+from backend.services.ontology_services import keyword_rules
+from backend.services.ontology_services.keyword_rules import (
+    BUILTIN_RULE_VERSION,
+    KeywordRuleStore,
+    load_rule_file,
+)
+from backend.services.ontology_services.rule_based_mapper import RuleBasedMapper
+
+
+def _write_rules(path, version: str, rules: dict[str, list[str]]) -> None:
+    """사전 파일 기록 (mtime 변경 보장)"""
+    path.write_text(json.dumps({"version": version, "rules": rules}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_load_rule_file_json(tmp_path):
+    """JSON 사전 로드 테스트"""
+    rules_path = tmp_path / "rules.json"
+    _write_rules(rules_path, "v1", {"Press": ["press", "Stamping"]})
+    
+    index = load_rule_file(str(rules_path))
+    
+    assert index.version == "v1"
+    assert index.rules["Press"] == ("press", "stamping")
+    assert index.source == str(rules_path)
+
+
+def test_load_rule_file_yaml(tmp_path):
+    """YAML 사전 로드 테스트"""
+    pytest.importorskip("yaml")
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text("version: '2'\nrules:\n  Press:\n    - press\n", encoding="utf-8")
+    
+    index = load_rule_file(str(rules_path))
+    
+    assert index.version == "2"
+    assert index.rules["Press"] == ("press",)
+
+
+def test_load_rule_file_invalid(tmp_path):
+    """형식이 잘못된 사전 테스트"""
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps({"rules": {"Press": ["press"]}}), encoding="utf-8")
+    
+    with pytest.raises(ValueError):
+        load_rule_file(str(rules_path))
+
+
+def test_store_without_file_uses_builtin_rules():
+    """사전 파일이 없으면 기본 사전을 사용하는지 테스트"""
+    store = KeywordRuleStore(path=None)
+    
+    assert store.current().version == BUILTIN_RULE_VERSION
+    assert "CNC_Machine" in store.current().rules
+
+
+def test_store_swaps_index_when_file_changes(tmp_path):
+    """파일 변경 시 새 인덱스로 교체되는지 테스트"""
+    rules_path = tmp_path / "rules.json"
+    _write_rules(rules_path, "v1", {"Press": ["press"]})
+    store = KeywordRuleStore(path=str(rules_path), reload_interval=0.0)
+    first = store.current()
+    
+    _write_rules(rules_path, "v2", {"Press": ["press"], "Lathe": ["lathe"]})
+    second = store.current()
+    
+    assert first.version == "v1"
+    assert second.version == "v2"
+    assert "Lathe" in second.rules
+    assert "Lathe" not in first.rules  # 이전 인덱스는 변경되지 않음
+    assert store.stats()["reload_count"] == 2
+
+
+def test_store_keeps_index_on_invalid_file(tmp_path):
+    """잘못된 사전으로 바뀌면 기존 인덱스를 유지하는지 테스트"""
+    rules_path = tmp_path / "rules.json"
+    _write_rules(rules_path, "v1", {"Press": ["press"]})
+    store = KeywordRuleStore(path=str(rules_path), reload_interval=0.0)
+    
+    rules_path.write_text("{not json", encoding="utf-8")
+    os.utime(rules_path, ns=(0, rules_path.stat().st_mtime_ns + 1_000_000))
+    
+    assert store.current().version == "v1"
+    assert store.stats()["last_error"] is not None
+
+
+def test_rule_mapper_pins_rule_version(tmp_path, monkeypatch):
+    """매퍼는 생성 시점의 사전 버전을 계속 사용하는지 테스트"""
+    rules_path = tmp_path / "rules.json"
+    _write_rules(rules_path, "v1", {"Press": ["press"]})
+    store = KeywordRuleStore(path=str(rules_path), reload_interval=0.0)
+    monkeypatch.setattr(keyword_rules, "_keyword_rule_store", store)
+    
+    mapper = RuleBasedMapper()
+    _write_rules(rules_path, "v2", {"Lathe": ["press"]})
+    
+    assert mapper.rule_version == "v1"
+    assert mapper.match_by_keywords("press_line_01.csv")[0] == "Press"
+    assert RuleBasedMapper().match_by_keywords("press_line_01.csv")[0] == "Lathe"
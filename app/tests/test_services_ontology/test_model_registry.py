@@ -0,0 +1,98 @@
+"""
+모델 레지스트리 테스트
+모델 공유, LRU 제거, 통계 검증
+"""
+
+import threading
+import pytest
+from backend.services.ontology_services.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def load_calls() -> list[str]:
+    """로더 호출 기록"""
+    return []
+
+
+@pytest.fixture
+def registry(load_calls: list[str]) -> ModelRegistry:
+    """가짜 로더를 사용하는 레지스트리 인스턴스"""
+    def loader(model_name: str) -> object:
+        load_calls.append(model_name)
+        return object()
+    
+    return ModelRegistry(max_models=2, loader=loader)
+
+
+def test_registry_loads_model_once(registry: ModelRegistry, load_calls: list[str]):
+    """같은 모델은 한 번만 로드되는지 테스트"""
+    first = registry.get("model-a")
+    second = registry.get("model-a")
+    
+    assert first is second
+    assert load_calls == ["model-a"]
+    
+    stats = registry.stats()
+    assert stats["load_count"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert "model-a" in stats["last_load_time_sec"]
+
+
+def test_registry_evicts_least_recently_used(registry: ModelRegistry, load_calls: list[str]):
+    """최대 개수 초과 시 LRU 모델이 제거되는지 테스트"""
+    registry.get("model-a")
+    registry.get("model-b")
+    registry.get("model-a")  # model-b가 가장 오래된 모델이 됨
+    registry.get("model-c")
+    
+    assert registry.is_loaded("model-a")
+    assert not registry.is_loaded("model-b")
+    assert registry.is_loaded("model-c")
+    assert registry.stats()["evictions"] == 1
+    
+    registry.get("model-b")
+    assert load_calls == ["model-a", "model-b", "model-c", "model-b"]
+
+
+def test_registry_concurrent_get_loads_once(registry: ModelRegistry, load_calls: list[str]):
+    """동시 요청에서도 모델이 한 번만 로드되는지 테스트"""
+    results = []
+    
+    def worker():
+        results.append(registry.get("model-a"))
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert load_calls == ["model-a"]
+    assert all(result is results[0] for result in results)
+
+
+def test_registry_invalid_max_models():
+    """잘못된 최대 모델 수 테스트"""
+    with pytest.raises(ValueError):
+        ModelRegistry(max_models=0)
+
+
+def test_registry_drops_load_locks_of_evicted_models():
+    """제거된 모델과 로드에 실패한 모델의 로드 락이 남지 않는지 테스트"""
+    def loader(model_name: str) -> object:
+        if model_name == "broken":
+            raise OSError("load failed")
+        return object()
+    
+    registry = ModelRegistry(max_models=1, loader=loader)
+    for index in range(5):
+        registry.get(f"model-{index}")
+    with pytest.raises(OSError):
+        registry.get("broken")
+    
+    assert list(registry._load_locks) == ["model-4"]
+    assert registry._load_waiters == {}
+    
+    registry.clear()
+    assert registry._load_locks == {}
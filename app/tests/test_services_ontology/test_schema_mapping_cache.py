@@ -0,0 +1,57 @@
+"""
+스키마 지문 매핑 캐시 테스트
+스키마 지문 계산, 같은 컬럼 구성 파일의 추론 생략(schema_cache), 엇갈린 결정 처리, 히트율 검증
+"""
+
+from backend.services.data_parser import CSVParser
+from backend.services.ontology_services.hybrid_mapper import HybridMapper
+from backend.services.ontology_services import schema_mapping_cache
+from backend.services.ontology_services.schema_mapping_cache import SchemaMappingCache
+
+
+def test_schema_fingerprint_ignores_file_name():
+    """컬럼명/dtype이 같으면 파일명과 값이 달라도 지문이 같고, 순서나 dtype이 다르면 달라지는지 테스트"""
+    parser = CSVParser()
+    base = parser.parse_summary(b"time,current\n1,0.5\n", "line1.csv").schema_fingerprint
+    
+    assert base is not None
+    assert parser.parse_summary(b"time,current\n7,0.9\n8,1.2\n", "export_2.csv").schema_fingerprint == base
+    assert parser.parse_summary(b"current,time\n0.5,1\n", "line1.csv").schema_fingerprint != base
+    assert parser.parse_summary(b"time,current\n1,high\n", "line1.csv").schema_fingerprint != base
+
+
+def test_schema_cache_skips_inference(fake_model, fake_model_name: str, sample_ontology_classes: list[str], monkeypatch):
+    """규칙으로 매핑한 형식과 같은 지문의 파일은 추론 없이 schema_cache로 매핑되는지 테스트"""
+    cache = SchemaMappingCache()
+    monkeypatch.setattr(schema_mapping_cache, "_schema_mapping_cache", cache)
+    mapper = HybridMapper(sample_ontology_classes, fake_model_name)
+    mapper.map_batch(["welding_robot_line1.csv"], ["fp-welding"])
+    encode_calls = len(fake_model.encode_calls)
+    
+    hit, other = mapper.map_batch(["export_0001.csv", "export_0002.csv"], ["fp-welding", "fp-other"])
+    
+    assert hit.method == "schema_cache"
+    assert hit.mapped_class == "Welding_Robot"
+    assert other.method != "schema_cache"
+    assert [call for call in fake_model.encode_calls[encode_calls:] if "export 0001" in call] == []
+    
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_schema_cache_conflicting_decisions():
+    """같은 지문에 다른 클래스가 결정되면 재사용하지 않고, 범위가 다르면 따로 보관하는지 테스트"""
+    cache = SchemaMappingCache(max_entries=2)
+    cache.record("scope", [("fp", "Welding_Robot", 0.9)])
+    assert cache.lookup("scope", "fp") == ("Welding_Robot", 0.9)
+    assert cache.lookup("other-scope", "fp") is None
+    
+    cache.record("scope", [("fp", "CNC_Machine", 0.9)])
+    cache.record("scope", [("fp", "Welding_Robot", 0.9)])
+    assert cache.lookup("scope", "fp") is None
+    assert cache.stats()["conflicts"] == 1
+    
+    cache.record("scope", [("fp-2", "CNC_Machine", 0.9), ("fp-3", "Industrial_Pump", 0.9)])
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,77 @@
+"""
+사전 인코딩 트리플 저장소 테스트
+rdflib Graph와 같은 집합 의미, 패턴 조회, 노드/엣지 투영 결과 검증
+"""
+
+import random
+import pytest
+from rdflib import Graph, Literal, Namespace
+from backend.services.ontology_services.rdf_parser import store_to_nodes_edges, triples_to_nodes_edges
+from backend.services.ontology_services.triple_store import CompactTripleStore, TermDictionary
+
+
+FACT = Namespace("http://example.org/fact#")
+
+
+def _random_triples(rng: random.Random, count: int) -> list[tuple]:
+    """파일 -> 클래스 관계 위주 랜덤 트리플 (리터럴 일부 포함, 중복 포함)"""
+    triples = []
+    for _ in range(count):
+        subject = FACT[f"file_{rng.randint(0, count // 4)}.csv"]
+        predicate = FACT[rng.choice(["isDataOf", "hasSensor"])]
+        obj = FACT[f"Class_{rng.randint(0, 9)}"] if rng.random() < 0.9 else Literal(rng.randint(0, 5))
+        triples.append((subject, predicate, obj))
+    return triples
+
+
+@pytest.fixture
+def rng() -> random.Random:
+    return random.Random(7)
+
+
+def test_store_matches_rdflib_graph(rng: random.Random):
+    """배치 추가(중복 포함) 후 트리플 집합과 패턴 조회가 rdflib Graph와 같은지 테스트"""
+    triples = _random_triples(rng, 5000)
+    store = CompactTripleStore(TermDictionary())
+    graph = Graph()
+    for start in range(0, len(triples), 250):
+        batch = triples[start:start + 250]
+        added = store.add(batch)
+        before = len(graph)
+        for triple in batch:
+            graph.add(triple)
+        assert len(added) == len(graph) - before
+    
+    assert len(store) == len(graph)
+    assert set(store) == set(graph)
+    
+    subject, predicate, obj = triples[0]
+    patterns = [
+        (subject, None, None), (None, predicate, None), (None, None, obj),
+        (subject, predicate, None), (None, predicate, obj), (subject, None, obj),
+        (subject, predicate, obj), (FACT["missing"], None, None),
+    ]
+    for pattern in patterns:
+        assert set(store.triples(*pattern)) == set(graph.triples(pattern)), pattern
+    
+    assert triples[1] in store
+    assert (FACT["missing"], predicate, obj) not in store
+
+
+def test_store_projection_matches_triple_walk(rng: random.Random):
+    """ID 배열 기반 노드/엣지 투영이 트리플 순회 결과와 같은지 테스트"""
+    store = CompactTripleStore.from_triples(_random_triples(rng, 2000), TermDictionary())
+    
+    assert store_to_nodes_edges(store) == triples_to_nodes_edges(store)
+    assert store_to_nodes_edges(CompactTripleStore(TermDictionary())) == {"nodes": [], "edges": []}
+
+
+def test_dictionary_shared_between_stores():
+    """같은 사전을 쓰는 저장소끼리 용어를 한 번만 저장하는지 테스트"""
+    dictionary = TermDictionary()
+    first = CompactTripleStore.from_triples([(FACT["a.csv"], FACT["isDataOf"], FACT["CNC_Machine"])], dictionary)
+    second = CompactTripleStore.from_triples([(FACT["b.csv"], FACT["isDataOf"], FACT["CNC_Machine"])], dictionary)
+    
+    assert len(dictionary) == 4
+    assert first.objects[0] == second.objects[0]
+    assert dictionary.local_name(int(first.subjects[0])) == "a.csv"